@@ -0,0 +1,110 @@
+"""
+Module: bench_serialization
+Description:
+    Benchmark of the /analyze response serialization.
+    Compares, for a synthetic analysis of a large document:
+        - validated: DTOs built with validation, then dumped, re-validated and encoded with
+          the json module, as FastAPI does for a response_model.
+        - fast: DTOs built with model_construct and encoded once by FastJSONResponse.
+
+Usage:
+    python -m benchmarks.bench_serialization [--sentences 2000] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from src.application.dto.analysis_response import AnalysisResponse, CategoryContradictionDTO, ContradictionDTO
+from src.application.use_cases.analyse_text_use_case import AnalyzeTextUseCase
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.sentence_table import SentenceTable
+from src.presentation.api.fast_json_response import FastJSONResponse
+
+
+def build_result(sentence_count: int, category_size: int = 40) -> AnalysisContradictionResult:
+    """
+    Builds an analysis result with one contradiction per pair of consecutive sentences.
+    """
+    table = SentenceTable.of([
+        f"الجملة رقم {i}: أوصي باعتماد المقترح مع البدء بتطبيقه على نطاق محدود لمدة 3 أشهر لقياس الأثر."
+        for i in range(sentence_count)
+    ])
+    categories = []
+    for start in range(0, sentence_count, category_size):
+        indices = tuple(range(start, min(start + category_size, sentence_count)))
+        contradictions = tuple(
+            Contradiction((indices[i], indices[i + 1]), "متوسط", "تعارض في نطاق التنفيذ.", table)
+            for i in range(0, len(indices) - 1, 2)
+        )
+        categories.append(CategoryContradictionResult(f"الفئة {start}", indices, contradictions, table))
+    return AnalysisContradictionResult(categories=categories)
+
+
+def validated_path(result: AnalysisContradictionResult) -> bytes:
+    """
+    Validated DTO construction followed by FastAPI's response_model serialization.
+    """
+    response = AnalysisResponse(categories=[
+        CategoryContradictionDTO(
+            category_name=c.category_name,
+            statements=c.statements,
+            contradictions=[
+                ContradictionDTO(statements=x.statements, severity=x.severity, comment=x.comment)
+                for x in c.contradictions
+            ]
+        )
+        for c in result.categories
+    ])
+    adapter = TypeAdapter(AnalysisResponse)
+    content = adapter.validate_python(response.model_dump())
+    encoded = adapter.dump_python(content, mode="json", exclude_none=True)
+    return json.dumps(encoded, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(result: AnalysisContradictionResult) -> bytes:
+    """
+    Trusted DTO construction encoded in one pass.
+    """
+    return FastJSONResponse(AnalyzeTextUseCase._map_full(result)).body
+
+
+def measure(func: Callable[[AnalysisContradictionResult], bytes], result, repeat: int) -> float:
+    """
+    Returns the median CPU time in milliseconds of one call.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        func(result)
+        timings.append((time.process_time() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /analyze response serialization.")
+    parser.add_argument("--sentences", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    result = build_result(args.sentences)
+    assert json.loads(validated_path(result)) == json.loads(fast_path(result))
+
+    validated_ms = measure(validated_path, result, args.repeat)
+    fast_ms = measure(fast_path, result, args.repeat)
+    size_kb = len(fast_path(result)) / 1024
+
+    print(f"sentences: {args.sentences}, response: {size_kb:.0f} KB")
+    print(f"validated: {validated_ms:8.2f} ms CPU per response")
+    print(f"fast:      {fast_ms:8.2f} ms CPU per response")
+    print(f"saved:     {validated_ms - fast_ms:8.2f} ms CPU per response ({validated_ms / fast_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Module: bench_startup
+Description:
+    Cold start benchmark of the API.
+    Each run starts a fresh interpreter and measures:
+        - import: time to import src.presentation.api.main_api (what the server pays before binding).
+        - startup: time until the lifespan hook has built the container (/health answers).
+        - ready: time until the warmup has succeeded (/ready answers 200).
+    Deployments are served by the local stub of benchmarks.stub_deployment, so the
+    network part of the warmup is a loopback round trip. The run also checks that importing the
+    API module does not load the packages deferred to the lifespan hook.
+    Exits with status 1 when a median exceeds its threshold, so it can gate CI.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--max-import-ms 1000] [--max-ready-ms 4000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.stub_deployment import create_server
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Packages loaded by the lifespan hook; importing the API module must not load them
+DEFERRED_MODULES = ("openai", "jinja2", "yaml", "dotenv", "src.insfrastructure.di.container")
+
+CHILD = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+import src.presentation.api.main_api as main_api
+imported = time.perf_counter()
+eager = [name for name in %r if name in sys.modules]
+
+async def run():
+    async with main_api.lifespan(main_api.app):
+        started = time.perf_counter()
+        while not main_api.container.warmup.ready:
+            await asyncio.sleep(0.002)
+        return started, time.perf_counter()
+
+started, ready = asyncio.run(run())
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (started - start) * 1000,
+    "ready_ms": (ready - start) * 1000,
+    "eager": eager,
+}))
+""" % (DEFERRED_MODULES,)
+
+
+def run_once(endpoint: str) -> Dict[str, float]:
+    """
+    Starts a fresh interpreter, imports the API and runs its lifespan until ready.
+
+    Returns:
+        Dict[str, float]: Timings in milliseconds, and the deferred modules loaded at import.
+    """
+    env = dict(
+        os.environ,
+        AZURE_OPENAI_ENDPOINT=endpoint,
+        AZURE_OPENAI_API_KEY="stub-key",
+        AZURE_OPENAI_API_VERSION="2024-08-01-preview",
+        AZURE_OPENAI_DEPLOYMENT_NAME="stub",
+        AZURE_OPENAI_DEPLOYMENTS="",
+        PYTHONPATH=str(ROOT),
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    if output.returncode != 0:
+        raise RuntimeError(f"Startup failed:\n{output.stderr}")
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def median(values: List[float]) -> float:
+    """
+    Returns the median of the values.
+    """
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the API cold start.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float, default=1000.0)
+    parser.add_argument("--max-ready-ms", type=float, default=4000.0)
+    args = parser.parse_args()
+
+    server = create_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    try:
+        runs = [run_once(endpoint) for _ in range(args.runs)]
+    finally:
+        server.shutdown()
+
+    import_ms = median([run["import_ms"] for run in runs])
+    startup_ms = median([run["startup_ms"] for run in runs])
+    ready_ms = median([run["ready_ms"] for run in runs])
+    eager = sorted({name for run in runs for name in run["eager"]})
+
+    print(f"runs: {args.runs} (medians)")
+    print(f"import:  {import_ms:8.1f} ms (threshold {args.max_import_ms:.0f} ms)")
+    print(f"startup: {startup_ms:8.1f} ms")
+    print(f"ready:   {ready_ms:8.1f} ms (threshold {args.max_ready_ms:.0f} ms)")
+
+    failures = []
+    if eager:
+        failures.append(f"importing the API loads {', '.join(eager)}")
+    if import_ms > args.max_import_ms:
+        failures.append(f"import took {import_ms:.0f} ms")
+    if ready_ms > args.max_ready_ms:
+        failures.append(f"ready took {ready_ms:.0f} ms")
+    if failures:
+        print("REGRESSION: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,574 @@
+"""
+Module: load_test
+Description:
+    HTTP load generator for the analysis API, reporting latency percentiles, error rates,
+    throughput and the saturation point.
+    Each request analyzes a synthetic document whose size is drawn from a weighted mix
+    (--mix "5:6,30:3,200:1" sends 5-sentence documents 60% of the time). Sentences carry a
+    request serial, so no request is answered from the result cache.
+
+    Load is applied in steps of --step-seconds, either:
+        - closed loop (--concurrency 1,2,4,8): each step runs that many clients sending their
+          next request as soon as the previous one is answered.
+        - open loop (--rate 5,10,20): each step starts requests at that many per second, at a
+          constant pace or with Poisson arrivals, whether or not earlier ones were answered.
+          Latencies are measured from the scheduled start of a request, so a server falling
+          behind shows in the percentiles instead of slowing the generator down.
+
+    A step violates the SLO when its p95 latency or its error rate exceeds the thresholds. The
+    saturation point is the first step that violates the SLO, gains less than 10% throughput over
+    the best previous step (closed loop), or completes less than 90% of the offered rate (open
+    loop). The capacity is the best throughput of the steps before it, also reported per worker.
+
+    With --serve, the generator starts the stub deployment of benchmarks.stub_deployment and
+    uvicorn with --workers processes of the API pointed at it, so the numbers measure the
+    service itself; --latency-ms and --ms-per-token give the stub a realistic LLM latency.
+
+    Exits with status 1 when the first step already violates the SLO, so a single-step run
+    can gate CI.
+
+Usage:
+    python -m benchmarks.load_test --serve --workers 2 --concurrency 1,2,4,8,16 --step-seconds 20
+    python -m benchmarks.load_test --url http://localhost:8000 --rate 2,4,8 --arrivals poisson
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Throughput gain below which a higher concurrency is considered saturated
+MIN_THROUGHPUT_GAIN = 0.10
+
+# Share of the offered rate below which an open loop step is considered saturated
+MIN_ACHIEVED_RATE = 0.90
+
+# Pieces of the synthetic sentences
+SUBJECTS = ("المشروع", "التقرير", "الفريق", "العقد", "النظام", "المنصة", "الميزانية", "الخطة")
+ACTIONS = ("يوصي باعتماد", "يقترح تأجيل", "يؤكد ضرورة", "يرفض", "يدعم توسيع", "يطالب بمراجعة")
+OBJECTS = ("المرحلة الأولى", "التطبيق التجريبي", "التوظيف الجديد", "التحديث الأمني", "خطة التدريب")
+DURATIONS = ("لمدة شهر", "لمدة 3 أشهر", "حتى نهاية العام", "بشكل فوري", "على مراحل")
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    """
+    Outcome of one request.
+
+    Attributes:
+        latency (float): Seconds from the scheduled start of the request to its response.
+        status (str): HTTP status code, or "timeout" / "connection" when no response was received.
+        sentences (int): Sentences of the analyzed document.
+    """
+    latency: float
+    status: str
+    sentences: int
+
+    @property
+    def ok(self) -> bool:
+        return self.status.startswith("2")
+
+
+@dataclass(slots=True)
+class StepReport:
+    """
+    Results of one load step.
+
+    Attributes:
+        load (float): Concurrency (closed loop) or offered requests per second (open loop).
+        duration (float): Seconds from the first request to the last response.
+        sent (int): Requests sent.
+        ok (int): Requests answered with a 2xx status.
+        errors (Dict[str, int]): Failed requests by status.
+        error_rate (float): Share of failed requests.
+        throughput (float): Successful requests per second.
+        sentences_per_second (float): Sentences of the successful requests per second.
+        latency_ms (Dict[str, float]): p50, p90, p95, p99, max and mean latency of the successful requests.
+        slo_violations (List[str]): SLO thresholds exceeded by the step.
+    """
+    load: float
+    duration: float
+    sent: int
+    ok: int
+    errors: Dict[str, int]
+    error_rate: float
+    throughput: float
+    sentences_per_second: float
+    latency_ms: Dict[str, float]
+    slo_violations: List[str] = field(default_factory=list)
+
+
+def parse_mix(value: str) -> List[Tuple[int, float]]:
+    """
+    Parses a document size mix, "size:weight,size:weight"; a size without weight weighs 1.
+
+    Args:
+        value (str): The mix.
+
+    Returns:
+        List[Tuple[int, float]]: Sizes in sentences with their weights.
+
+    Raises:
+        ValueError: If a size or weight is not positive.
+    """
+    mix = []
+    for item in value.split(","):
+        size, _, weight = item.strip().partition(":")
+        mix.append((int(size), float(weight or 1)))
+        if mix[-1][0] <= 0 or mix[-1][1] <= 0:
+            raise ValueError(f"Invalid mix entry {item!r}: size and weight must be positive.")
+    return mix
+
+
+def make_document(rng: random.Random, size: int, serial: int) -> List[str]:
+    """
+    Builds a synthetic document, distinct for each serial.
+    """
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(ACTIONS)} {rng.choice(OBJECTS)} {rng.choice(DURATIONS)} "
+        f"(الطلب {serial}، البند {i + 1})."
+        for i in range(size)
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Returns the nearest-rank percentile q (0-100) of sorted values, 0 when there are none.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(
+        load: float,
+        samples: List[Sample],
+        duration: float,
+        slo_p95_ms: Optional[float] = None,
+        slo_error_rate: Optional[float] = None
+) -> StepReport:
+    """
+    Aggregates the samples of a step and checks them against the SLO.
+
+    Args:
+        load (float): Concurrency or offered rate of the step.
+        samples (List[Sample]): Outcomes of the requests of the step.
+        duration (float): Seconds the step took.
+        slo_p95_ms (Optional[float]): Maximum p95 latency. Defaults to no latency objective.
+        slo_error_rate (Optional[float]): Maximum error rate. Defaults to no error objective.
+
+    Returns:
+        StepReport: The step results.
+    """
+    successes = [sample for sample in samples if sample.ok]
+    latencies = sorted(sample.latency * 1000 for sample in successes)
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if not sample.ok:
+            errors[sample.status] = errors.get(sample.status, 0) + 1
+    duration = max(duration, 1e-9)
+
+    report = StepReport(
+        load=load,
+        duration=duration,
+        sent=len(samples),
+        ok=len(successes),
+        errors=errors,
+        error_rate=(len(samples) - len(successes)) / len(samples) if samples else 0.0,
+        throughput=len(successes) / duration,
+        sentences_per_second=sum(sample.sentences for sample in successes) / duration,
+        latency_ms={
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        }
+    )
+    if slo_p95_ms is not None and report.latency_ms["p95"] > slo_p95_ms:
+        report.slo_violations.append(f"p95 {report.latency_ms['p95']:.0f} ms > {slo_p95_ms:.0f} ms")
+    if slo_error_rate is not None and report.error_rate > slo_error_rate:
+        report.slo_violations.append(f"error rate {report.error_rate:.1%} > {slo_error_rate:.1%}")
+    return report
+
+
+def find_saturation(steps: List[StepReport], open_loop: bool) -> Optional[Tuple[int, str]]:
+    """
+    Returns the first saturated step and the reason, or None if no step is saturated.
+
+    Args:
+        steps (List[StepReport]): Steps in order of increasing load.
+        open_loop (bool): Whether the loads are offered rates rather than concurrencies.
+
+    Returns:
+        Optional[Tuple[int, str]]: Index of the step and why it is considered saturated.
+    """
+    best = 0.0
+    for index, step in enumerate(steps):
+        if step.slo_violations:
+            return index, "SLO violated: " + "; ".join(step.slo_violations)
+        if open_loop and step.throughput < MIN_ACHIEVED_RATE * step.load:
+            return index, f"{step.throughput:.2f} req/s achieved of {step.load:g} req/s offered"
+        if not open_loop and index > 0 and step.throughput < (1 + MIN_THROUGHPUT_GAIN) * best:
+            return index, f"throughput {step.throughput:.2f} req/s, less than {MIN_THROUGHPUT_GAIN:.0%} above " \
+                          f"{best:.2f} req/s"
+        best = max(best, step.throughput)
+    return None
+
+
+class HttpClient:
+    """
+    Minimal HTTP/1.1 client over asyncio streams, reusing keep-alive connections.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        """
+        Initializes the client.
+
+        Args:
+            url (str): Base URL of the API (http only).
+            timeout (float): Seconds allowed per request.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "http":
+            raise ValueError(f"Only http URLs are supported, got {url!r}.")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def post_json(self, path: str, payload: dict, headers: Dict[str, str]) -> int:
+        """
+        Posts a JSON body and reads the whole response.
+
+        Returns:
+            int: The response status.
+
+        Raises:
+            asyncio.TimeoutError: If the response takes longer than the timeout.
+            OSError: If the connection fails.
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        request = (
+            f"POST {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n{head}\r\n"
+        ).encode("latin-1") + body
+        return await asyncio.wait_for(self._exchange(request), self.timeout)
+
+    async def _exchange(self, request: bytes) -> int:
+        """
+        Sends a request on an idle connection, or a new one, and reads the response.
+        """
+        reader, writer = self._idle.pop() if self._idle else await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await HttpClient._read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return status
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+        """
+        Reads a response; returns its status and whether the connection can be reused.
+        """
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by the server.")
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                await reader.readexactly(size + 2)
+            await reader.readline()
+        elif "content-length" in headers:
+            await reader.readexactly(int(headers["content-length"]))
+        else:
+            await reader.read()
+            return status, False
+        return status, headers.get("connection") != "close"
+
+    def close(self) -> None:
+        """
+        Closes the idle connections.
+        """
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class LoadGenerator:
+    """
+    Sends the analysis requests of the load steps and collects their outcomes.
+    """
+
+    def __init__(self, client: HttpClient, path: str, mix: List[Tuple[int, float]], headers: Dict[str, str], seed: int):
+        self.client = client
+        self.path = path
+        self.sizes = [size for size, _ in mix]
+        self.weights = [weight for _, weight in mix]
+        self.headers = headers
+        self.rng = random.Random(seed)
+        self.serial = 0
+
+    async def send(self, scheduled: float) -> Sample:
+        """
+        Sends one request of the mix; its latency counts from the scheduled start.
+        """
+        self.serial += 1
+        size = self.rng.choices(self.sizes, self.weights)[0]
+        document = make_document(self.rng, size, self.serial)
+        try:
+            status = str(await self.client.post_json(self.path, {"sentences": document}, self.headers))
+        except asyncio.TimeoutError:
+            status = "timeout"
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+            status = "connection"
+        return Sample(time.perf_counter() - scheduled, status, size)
+
+    async def closed_loop(self, concurrency: int, seconds: float) -> Tuple[List[Sample], float]:
+        """
+        Runs clients that each send their next request when the previous one is answered.
+        """
+        samples: List[Sample] = []
+        start = time.perf_counter()
+        deadline = start + seconds
+
+        async def client():
+            while time.perf_counter() < deadline:
+                samples.append(await self.send(time.perf_counter()))
+
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return samples, time.perf_counter() - start
+
+    async def open_loop(self, rate: float, seconds: float, poisson: bool) -> Tuple[List[Sample], float]:
+        """
+        Starts requests at the given rate, independently of the responses.
+        """
+        start = time.perf_counter()
+        scheduled = start
+        tasks = []
+        while True:
+            scheduled += self.rng.expovariate(rate) if poisson else 1 / rate
+            if scheduled >= start + seconds:
+                break
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            tasks.append(asyncio.create_task(self.send(scheduled)))
+        samples = list(await asyncio.gather(*tasks))
+        return samples, time.perf_counter() - start
+
+
+def free_port() -> int:
+    """
+    Returns a TCP port free on the loopback interface.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until(url: str, timeout: float, process: subprocess.Popen) -> None:
+    """
+    Polls a URL until it answers 200.
+
+    Raises:
+        RuntimeError: If the process exits or the URL does not answer 200 within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(process.args)} exited with status {process.returncode}.")
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} did not answer 200 within {timeout:.0f} s.")
+
+
+def serve(workers: int, latency_ms: float, ms_per_token: float) -> Tuple[str, List[subprocess.Popen]]:
+    """
+    Starts the stub deployment and the API with the given number of worker processes.
+
+    Returns:
+        Tuple[str, List[subprocess.Popen]]: URL of the API and the processes to terminate.
+    """
+    stub_port, api_port = free_port(), free_port()
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.stub_deployment", "--port", str(stub_port),
+         "--latency-ms", str(latency_ms), "--ms-per-token", str(ms_per_token)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL
+    )
+    env.update(
+        AZURE_OPENAI_ENDPOINT=f"http://127.0.0.1:{stub_port}/",
+        AZURE_OPENAI_API_KEY="stub-key",
+        AZURE_OPENAI_API_VERSION="2024-08-01-preview",
+        AZURE_OPENAI_DEPLOYMENT_NAME="stub",
+        AZURE_OPENAI_DEPLOYMENTS="",
+        LLM_REPLAY_MODE="",
+    )
+    api = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.presentation.api.main_api:app", "--host", "127.0.0.1",
+         "--port", str(api_port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env
+    )
+    processes = [stub, api]
+    try:
+        wait_until(f"http://127.0.0.1:{stub_port}/", 30, stub)
+        wait_until(f"http://127.0.0.1:{api_port}/ready", 60, api)
+    except BaseException:
+        stop(processes)
+        raise
+    return f"http://127.0.0.1:{api_port}", processes
+
+
+def stop(processes: List[subprocess.Popen]) -> None:
+    """
+    Terminates the processes started by serve().
+    """
+    for process in reversed(processes):
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def parse_loads(value: str) -> List[float]:
+    """
+    Parses a comma separated list of positive loads.
+    """
+    loads = [float(item) for item in value.split(",")]
+    if any(load <= 0 for load in loads):
+        raise argparse.ArgumentTypeError(f"Loads must be positive, got {value!r}.")
+    return loads
+
+
+def print_report(steps: List[StepReport], open_loop: bool, workers: int) -> None:
+    """
+    Prints the steps, the saturation point and the capacity.
+    """
+    unit = "rate" if open_loop else "conc"
+    print(f"{unit:>6} {'sent':>6} {'ok':>6} {'err%':>6} {'req/s':>8} {'sents/s':>8} "
+          f"{'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}  (latencies in ms)")
+    for step in steps:
+        latency = step.latency_ms
+        errors = ", ".join(f"{status}: {count}" for status, count in sorted(step.errors.items()))
+        print(f"{step.load:>6g} {step.sent:>6} {step.ok:>6} {step.error_rate * 100:>6.1f} {step.throughput:>8.2f} "
+              f"{step.sentences_per_second:>8.1f} {latency['p50']:>8.0f} {latency['p90']:>8.0f} "
+              f"{latency['p95']:>8.0f} {latency['p99']:>8.0f} {latency['max']:>8.0f}"
+              + (f"  [{errors}]" if errors else "")
+              + (f"  SLO: {'; '.join(step.slo_violations)}" if step.slo_violations else ""))
+
+    saturation = find_saturation(steps, open_loop)
+    healthy = steps[:saturation[0]] if saturation else steps
+    if saturation:
+        print(f"saturation: {unit} {steps[saturation[0]].load:g} ({saturation[1]})")
+    else:
+        print("saturation: not reached")
+    if healthy:
+        best = max(healthy, key=lambda step: step.throughput)
+        print(f"capacity: {best.throughput:.2f} req/s, {best.sentences_per_second:.1f} sentences/s at {unit} "
+              f"{best.load:g} ({best.throughput / workers:.2f} req/s per worker, {workers} worker(s))")
+    else:
+        print("capacity: no step met the SLO")
+
+
+async def run_steps(args: argparse.Namespace, url: str) -> List[StepReport]:
+    """
+    Runs every load step against the API.
+    """
+    client = HttpClient(url, args.timeout)
+    headers = {"X-Priority": args.priority} if args.priority else {}
+    generator = LoadGenerator(client, args.path, parse_mix(args.mix), headers, args.seed)
+    steps = []
+    try:
+        for load in args.rate or args.concurrency:
+            if args.rate:
+                samples, duration = await generator.open_loop(load, args.step_seconds, args.arrivals == "poisson")
+            else:
+                samples, duration = await generator.closed_loop(int(load), args.step_seconds)
+            steps.append(summarize(load, samples, duration, args.slo_p95_ms, args.slo_error_rate))
+    finally:
+        client.close()
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the analysis API and report its SLO and capacity.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of a running API.")
+    parser.add_argument("--path", default="/analyze")
+    parser.add_argument("--mix", default="5:6,30:3,200:1", help="Document sizes with weights, size:weight,...")
+    loads = parser.add_mutually_exclusive_group()
+    loads.add_argument("--concurrency", type=parse_loads, default=[1.0, 2.0, 4.0, 8.0],
+                       help="Closed loop concurrencies, one step each.")
+    loads.add_argument("--rate", type=parse_loads, help="Open loop request rates per second, one step each.")
+    parser.add_argument("--arrivals", choices=("constant", "poisson"), default="constant")
+    parser.add_argument("--step-seconds", type=float, default=20.0)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds allowed per request.")
+    parser.add_argument("--priority", default="", help="X-Priority header of the requests.")
+    parser.add_argument("--slo-p95-ms", type=float, default=2000.0)
+    parser.add_argument("--slo-error-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="", help="Writes the step reports to this file.")
+    parser.add_argument("--serve", action="store_true", help="Starts the API on the stub deployment.")
+    parser.add_argument("--workers", type=int, default=1, help="API worker processes, for --serve and per worker capacity.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub latency per call, with --serve.")
+    parser.add_argument("--ms-per-token", type=float, default=0.0, help="Stub latency per completion token, with --serve.")
+    args = parser.parse_args()
+
+    processes = []
+    url = args.url
+    if args.serve:
+        url, processes = serve(args.workers, args.latency_ms, args.ms_per_token)
+    try:
+        steps = asyncio.run(run_steps(args, url))
+    finally:
+        stop(processes)
+
+    print_report(steps, bool(args.rate), args.workers)
+    if args.json:
+        saturation = find_saturation(steps, bool(args.rate))
+        Path(args.json).write_text(json.dumps({
+            "mode": "open" if args.rate else "closed",
+            "workers": args.workers,
+            "steps": [asdict(step) for step in steps],
+            "saturation": {"load": steps[saturation[0]].load, "reason": saturation[1]} if saturation else None,
+        }, indent=2), encoding="utf-8")
+    if steps and steps[0].slo_violations:
+        print("SLO FAILED: " + "; ".join(steps[0].slo_violations))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
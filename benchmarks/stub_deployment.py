@@ -0,0 +1,239 @@
+"""
+Module: stub_deployment
+Description:
+    Local stand-in for an Azure OpenAI deployment, used by the benchmarks.
+    It answers the models list, embeddings and chat completions (parsed or streamed) with
+    responses valid for the response format requested by the agents:
+        - classification: consecutive sentences grouped in categories of CATEGORY_SIZE.
+        - contradiction detection and screening: the first two sentences contradict each other.
+        - fused analysis: both of the above in one response.
+    Calls without a response format (the warmup probe) get "pong".
+    Each call takes latency_ms plus ms_per_token per completion token, so a benchmark can reproduce
+    the LLM latency without its cost or variability.
+
+Usage:
+    python -m benchmarks.stub_deployment [--port 8100] [--latency-ms 0] [--ms-per-token 0]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+# Sentences per category of the generated classifications
+CATEGORY_SIZE = 6
+
+# Lines of a prompt holding a numbered sentence ("12. text")
+NUMBERED_LINE = re.compile(r"^(\d+)\. ", re.MULTILINE)
+
+# Dimensions of the generated embeddings
+EMBEDDING_DIMENSIONS = 8
+
+
+def sentence_count(messages: List[Dict[str, Any]]) -> int:
+    """
+    Returns the number of numbered sentences in the last user message.
+    """
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            numbers = [int(number) for number in NUMBERED_LINE.findall(str(message.get("content", "")))]
+            return max(numbers, default=0)
+    return 0
+
+
+def _groups(count: int) -> List[List[int]]:
+    """
+    Returns the 1-based indices of the sentences, by consecutive groups of CATEGORY_SIZE.
+    """
+    return [list(range(start, min(start + CATEGORY_SIZE, count + 1))) for start in range(1, count + 1, CATEGORY_SIZE)]
+
+
+def _contradictions(indices: List[int]) -> List[Dict[str, Any]]:
+    """
+    Returns a contradiction between the first two sentences, if there are two.
+    """
+    if len(indices) < 2:
+        return []
+    return [{"إفادات": indices[:2], "مستوى_التعارض": "متوسط", "تعليق": "تعارض في المدة المقترحة."}]
+
+
+def completion_content(schema_name: Optional[str], count: int) -> str:
+    """
+    Returns the message content answering a call with the given response format.
+
+    Args:
+        schema_name (Optional[str]): Name of the JSON schema of the response format, None for free text.
+        count (int): Number of numbered sentences in the prompt.
+
+    Returns:
+        str: The content, valid JSON for the schema.
+    """
+    if schema_name == "ClassificationLLMResponse":
+        payload = {"categories": [
+            {"name": f"الفئة {n + 1}", "phrases": group} for n, group in enumerate(_groups(count))
+        ]}
+    elif schema_name == "ContradictionLLMResponse":
+        payload = {"التناقضات": _contradictions(list(range(1, count + 1)))}
+    elif schema_name == "ScreeningLLMResponse":
+        payload = {"التناقضات": _contradictions(list(range(1, count + 1))), "الثقة": 0.95}
+    elif schema_name == "FusedAnalysisLLMResponse":
+        payload = {"categories": [
+            {"name": f"الفئة {n + 1}", "phrases": group, "التناقضات": _contradictions(group)}
+            for n, group in enumerate(_groups(count))
+        ]}
+    else:
+        return "pong"
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def embedding(text: str) -> List[float]:
+    """
+    Returns a deterministic vector for a text.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return [byte / 255.0 for byte in digest[:EMBEDDING_DIMENSIONS]]
+
+
+class StubDeploymentHandler(BaseHTTPRequestHandler):
+    """
+    Answers the Azure OpenAI calls of the agents and the warmup.
+    """
+
+    # Fixed latency of a call, and added latency per completion token, in milliseconds
+    latency_ms = 0.0
+    ms_per_token = 0.0
+
+    def do_GET(self):
+        self._reply({"object": "list", "data": []})
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path.split("?")[0].endswith("/embeddings"):
+            inputs = request.get("input", [])
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            time.sleep(self.latency_ms / 1000)
+            self._reply({
+                "object": "list", "model": "stub",
+                "data": [{"object": "embedding", "index": i, "embedding": embedding(str(text))}
+                         for i, text in enumerate(inputs)],
+                "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+            })
+            return
+
+        messages = request.get("messages", [])
+        schema_name = ((request.get("response_format") or {}).get("json_schema") or {}).get("name")
+        content = completion_content(schema_name, sentence_count(messages))
+        usage = {
+            "prompt_tokens": sum(len(str(message.get("content", ""))) for message in messages) // 4 + 1,
+            "completion_tokens": len(content) // 4 + 1,
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        # The warmup probe is cut by its token limit, the structured responses are complete
+        finish_reason = "stop" if schema_name else "length"
+        delay = (self.latency_ms + self.ms_per_token * usage["completion_tokens"]) / 1000
+
+        if request.get("stream"):
+            self._stream(content, finish_reason, usage, delay)
+            return
+        time.sleep(delay)
+        self._reply({
+            "id": "stub", "object": "chat.completion", "created": 0, "model": "stub",
+            "choices": [{"index": 0, "finish_reason": finish_reason,
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": usage,
+        })
+
+    def _stream(self, content: str, finish_reason: str, usage: Dict[str, int], delay: float):
+        """
+        Sends the content as server-sent chunks spread over the delay, then the usage.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)] or [""]
+        chunks = [{"index": 0, "delta": {"role": "assistant", "content": piece}, "finish_reason": None}
+                  for piece in pieces]
+        chunks.append({"index": 0, "delta": {}, "finish_reason": finish_reason})
+        for choice in chunks:
+            time.sleep(delay / len(chunks))
+            self._event({"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+                         "choices": [choice]})
+        self._event({"id": "stub", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+                     "choices": [], "usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _event(self, payload: dict):
+        self.wfile.write(b"data: " + json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n\n")
+        self.wfile.flush()
+
+    def _reply(self, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubDeploymentServer(ThreadingHTTPServer):
+    """
+    Threaded server of the stub, with a listen backlog sized for load tests.
+    """
+
+    daemon_threads = True
+    request_queue_size = 512
+
+
+def create_server(
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        ms_per_token: float = 0.0
+) -> StubDeploymentServer:
+    """
+    Creates a stub server; the caller runs serve_forever() and shutdown().
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 for any free port (read it from server_address).
+        latency_ms (float): Fixed latency of each call.
+        ms_per_token (float): Added latency per completion token.
+
+    Returns:
+        StubDeploymentServer: The bound server.
+    """
+    handler = type("ConfiguredStubDeploymentHandler", (StubDeploymentHandler,), {
+        "latency_ms": latency_ms, "ms_per_token": ms_per_token
+    })
+    return StubDeploymentServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a stub Azure OpenAI deployment.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--ms-per-token", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.latency_ms, args.ms_per_token)
+    print(f"stub deployment on http://{args.host}:{server.server_address[1]}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
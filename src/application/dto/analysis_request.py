@@ -6,7 +6,7 @@ Description:
         - AnalysisRequest: DTO containing sentences to be analyzed for classification or contradiction detection.
 """
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -16,5 +16,14 @@ class AnalysisRequest(BaseModel):
 
     Attributes:
         sentences (List[str]): A list of sentences to be analyzed.
+        include_usage (bool): Whether to return the LLM token usage of the analysis. Defaults to False.
+        max_cost (Optional[float]): Maximum estimated LLM cost of the analysis. Defaults to the server budget.
+        explain (bool): Whether to return the chosen execution plan. Defaults to False.
+        sentence_ids (Optional[List[str]]): Client ids of the sentences, one per sentence, used by the
+                                            compact response format instead of sentence indices.
     """
     sentences: List[str]
+    include_usage: bool = False
+    max_cost: Optional[float] = None
+    explain: bool = False
+    sentence_ids: Optional[List[str]] = None
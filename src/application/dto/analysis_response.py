@@ -4,7 +4,7 @@ Description:
     DTOs for the response of a text analysis request with category-based contradictions.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Union
 from pydantic import BaseModel
 
 
@@ -36,11 +36,135 @@ class CategoryContradictionDTO(BaseModel):
     contradictions: List[ContradictionDTO]
 
 
+class StageUsageDTO(BaseModel):
+    """
+    LLM token usage of one analysis stage, or of the whole request.
+
+    Attributes:
+        llm_calls (int): Number of LLM calls.
+        prompt_tokens (int): Input tokens.
+        completion_tokens (int): Output tokens.
+        cached_tokens (int): Prompt tokens served from the prompt cache.
+        total_tokens (int): Prompt + completion tokens.
+        estimated_cost (float): Estimated cost from the configured deployment prices.
+    """
+    llm_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    cached_tokens: int
+    total_tokens: int
+    estimated_cost: float
+
+
+class UsageDTO(StageUsageDTO):
+    """
+    LLM token usage of a request, in total and per stage.
+
+    Attributes:
+        stages (Dict[str, StageUsageDTO]): Usage per stage (e.g., "classification", "detection").
+    """
+    stages: Dict[str, StageUsageDTO]
+
+
+class StrategyEstimateDTO(BaseModel):
+    """
+    Predicted cost of one execution strategy.
+
+    Attributes:
+        strategy (str): Strategy name (e.g., "fused", "two_stage").
+        llm_calls (int): Predicted number of LLM calls.
+        prompt_tokens (int): Predicted input tokens.
+        completion_tokens (int): Predicted output tokens.
+        predicted_latency_ms (float): Predicted latency.
+        estimated_cost (float): Predicted cost.
+        feasible (bool): Whether the strategy applies to the input.
+        reason (str): Why the strategy was not applicable or not affordable, if applicable.
+    """
+    strategy: str
+    llm_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    predicted_latency_ms: float
+    estimated_cost: float
+    feasible: bool
+    reason: str
+
+
+class ExecutionPlanDTO(BaseModel):
+    """
+    Explanation of how the analysis was executed.
+
+    Attributes:
+        strategy (str): The chosen strategy.
+        cost_budget (Optional[float]): Cost budget applied to the request, None when unlimited.
+        predicted_latency_ms (float): Predicted latency of the chosen strategy.
+        actual_latency_ms (Optional[float]): Measured latency of the analysis.
+        predicted_llm_calls (int): Predicted LLM calls of the chosen strategy.
+        actual_llm_calls (Optional[int]): LLM calls actually made, when usage is tracked.
+        candidates (List[StrategyEstimateDTO]): Estimates of every candidate strategy.
+    """
+    strategy: str
+    cost_budget: Optional[float] = None
+    predicted_latency_ms: float
+    actual_latency_ms: Optional[float] = None
+    predicted_llm_calls: int
+    actual_llm_calls: Optional[int] = None
+    candidates: List[StrategyEstimateDTO]
+
+
 class AnalysisResponse(BaseModel):
     """
     Response DTO for text analysis.
 
     Attributes:
         categories (List[CategoryContradictionDTO]): List of categories with their contradictions.
+        usage (Optional[UsageDTO]): LLM token usage and estimated cost, when requested.
+        plan (Optional[ExecutionPlanDTO]): Chosen execution plan with predicted and actual figures, when requested.
     """
     categories: List[CategoryContradictionDTO]
+    usage: Optional[UsageDTO] = None
+    plan: Optional[ExecutionPlanDTO] = None
+
+
+class CompactContradictionDTO(BaseModel):
+    """
+    Contradiction of the compact response format, referencing sentences instead of repeating them.
+
+    Attributes:
+        statement_ids (List[Union[int, str]]): Ids of the sentences involved (client ids, or 0-based
+                                               indices in the request when no ids were sent).
+        severity (str): Severity level ("حاد" or "متوسط").
+        comment (str): Explanation of the contradiction in Arabic.
+    """
+    statement_ids: List[Union[int, str]]
+    severity: str
+    comment: str
+
+
+class CompactCategoryDTO(BaseModel):
+    """
+    Category of the compact response format.
+
+    Attributes:
+        category_name (str): Name of the category.
+        statement_ids (List[Union[int, str]]): Ids of all sentences in this category.
+        contradictions (List[CompactContradictionDTO]): Contradictions within this category.
+    """
+    category_name: str
+    statement_ids: List[Union[int, str]]
+    contradictions: List[CompactContradictionDTO]
+
+
+class CompactAnalysisResponse(BaseModel):
+    """
+    Compact response of a text analysis, returned when requested with ?format=compact or
+    an Accept header of application/vnd.contradiction.compact+json.
+
+    Attributes:
+        categories (List[CompactCategoryDTO]): Categories referencing sentences by id.
+        usage (Optional[UsageDTO]): LLM token usage and estimated cost, when requested.
+        plan (Optional[ExecutionPlanDTO]): Chosen execution plan, when requested.
+    """
+    categories: List[CompactCategoryDTO]
+    usage: Optional[UsageDTO] = None
+    plan: Optional[ExecutionPlanDTO] = None
@@ -0,0 +1,92 @@
+"""
+Module: corpus_dto
+Description:
+    DTOs of the corpus endpoints: adding approved documents to the corpus and checking
+    new documents against it.
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class CorpusDocumentRequest(BaseModel):
+    """
+    Approved document to add to the corpus.
+
+    Attributes:
+        document_id (str): Id of the document; a document with the same id is replaced.
+        sentences (List[str]): Sentences of the document.
+    """
+    document_id: str
+    sentences: List[str]
+
+
+class CorpusDocumentResponse(BaseModel):
+    """
+    Result of adding a document to the corpus.
+
+    Attributes:
+        document_id (str): Id of the document.
+        sentence_count (int): Sentences stored.
+        corpus_size (int): Sentences in the corpus after the addition.
+    """
+    document_id: str
+    sentence_count: int
+    corpus_size: int
+
+
+class CorpusCheckRequest(BaseModel):
+    """
+    New document to check against the corpus.
+
+    Attributes:
+        sentences (List[str]): Sentences of the document.
+        exclude_document_id (Optional[str]): Corpus document not to compare with, e.g. the
+                                             approved version of the document being revised.
+    """
+    sentences: List[str]
+    exclude_document_id: Optional[str] = None
+
+
+class CorpusMatchDTO(BaseModel):
+    """
+    Corpus sentence involved in a contradiction.
+
+    Attributes:
+        document_id (str): Id of the approved document of the sentence.
+        statement (str): The sentence.
+        category_name (str): Category of the sentence in the corpus.
+    """
+    document_id: str
+    statement: str
+    category_name: str
+
+
+class CorpusContradictionDTO(BaseModel):
+    """
+    Contradiction between sentences of the checked document and corpus sentences.
+
+    Attributes:
+        statements (List[str]): Sentences of the checked document involved.
+        matches (List[CorpusMatchDTO]): Corpus sentences involved.
+        severity (str): Severity level ("حاد" or "متوسط").
+        comment (str): Explanation of the contradiction in Arabic.
+    """
+    statements: List[str]
+    matches: List[CorpusMatchDTO]
+    severity: str
+    comment: str
+
+
+class CorpusCheckResponse(BaseModel):
+    """
+    Contradictions between a document and the corpus.
+
+    Attributes:
+        contradictions (List[CorpusContradictionDTO]): Contradictions found.
+        candidate_count (int): Corpus sentences retrieved and sent to the detector.
+        corpus_size (int): Sentences in the corpus.
+    """
+    contradictions: List[CorpusContradictionDTO]
+    candidate_count: int
+    corpus_size: int
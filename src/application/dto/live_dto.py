@@ -0,0 +1,63 @@
+"""
+Module: live_dto
+Description:
+    DTOs of the live analysis WebSocket: the sentence edits sent by the client and the
+    incremental updates and errors pushed back.
+"""
+
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+from src.application.dto.analysis_response import CompactCategoryDTO
+
+
+class LiveEditRequest(BaseModel):
+    """
+    Batch of sentence edits sent by the client.
+
+    Attributes:
+        sentences (Dict[str, Optional[str]]): New text of each edited sentence, by client id;
+                                              null or "" removes the sentence.
+    """
+    sentences: Dict[str, Optional[str]]
+
+
+class LiveUpdateResponse(BaseModel):
+    """
+    Categories changed by the edits applied since the previous update.
+
+    Attributes:
+        type (str): "update".
+        version (int): Version of the analysis, incremented by each applied batch of edits.
+        categories (List[CompactCategoryDTO]): Full content of the changed categories, referencing
+                                               sentences by client id.
+        removed_categories (List[str]): Names of the categories left without sentences.
+    """
+    type: str = "update"
+    version: int
+    categories: List[CompactCategoryDTO]
+    removed_categories: List[str]
+
+
+class LiveErrorDTO(BaseModel):
+    """
+    Error of a live analysis.
+
+    Attributes:
+        code (str): Application error code (e.g., "QUEUE_FULL").
+        message (str): Description of the error.
+    """
+    code: str
+    message: str
+
+
+class LiveErrorResponse(BaseModel):
+    """
+    Error pushed to the client; the edits that could not be applied are retried with the next ones.
+
+    Attributes:
+        type (str): "error".
+        error (LiveErrorDTO): The error.
+    """
+    type: str = "error"
+    error: LiveErrorDTO
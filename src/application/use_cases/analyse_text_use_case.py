@@ -6,11 +6,18 @@ Description:
         - Detect contradictions via the detector agent
 """
 
-from typing import List
+from typing import List, Optional, Union
 from src.application.dto.analysis_request import AnalysisRequest
-from src.application.dto.analysis_response import AnalysisResponse, ContradictionDTO, CategoryContradictionDTO
+from src.application.dto.analysis_response import (
+    AnalysisResponse, CompactAnalysisResponse, CompactCategoryDTO, CompactContradictionDTO, ContradictionDTO,
+    CategoryContradictionDTO, ExecutionPlanDTO, StageUsageDTO, StrategyEstimateDTO, UsageDTO
+)
 from src.domain.exceptions.app_exception import AppException
 from src.domain.models.contradiction_result import AnalysisContradictionResult
+from src.domain.models.execution_plan import ExecutionPlan
+from src.domain.models.token_usage import TokenUsage, UsageReport
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.ports.input.usage_tracker_port import NullUsageTracker, UsageTrackerPort
 from src.domain.ports.output.analyze_text_port import AnalyzeTextPort
 from src.domain.services.text_analysis_service import TextAnalysisService
 
@@ -21,31 +28,91 @@ class AnalyzeTextUseCase(AnalyzeTextPort):
     Orchestrates classification and contradiction detection.
     """
 
-    def __init__(self, text_analysis_service: TextAnalysisService):
+    def __init__(
+            self,
+            text_analysis_service: TextAnalysisService,
+            tracer: Optional[TracerPort] = None,
+            usage_tracker: Optional[UsageTrackerPort] = None,
+            default_cost_budget: Optional[float] = None
+    ):
         self.service = text_analysis_service
+        self.tracer = tracer or NullTracer()
+        self.usage_tracker = usage_tracker or NullUsageTracker()
+        self.default_cost_budget = default_cost_budget
 
-    def execute(self, request: AnalysisRequest) -> AnalysisResponse:
+    def execute(
+            self,
+            request: AnalysisRequest,
+            compact: bool = False
+    ) -> Union[AnalysisResponse, CompactAnalysisResponse]:
         """
         Executes the use case: classify sentences and detect contradictions.
 
         Args:
             request (AnalysisRequest): Sentences to be analyzed.
+            compact (bool): Whether to reference sentences by id (request.sentence_ids, or their
+                            0-based index) instead of repeating their text. Defaults to False.
 
         Returns:
-            AnalysisResponse: Response DTO with categories and contradictions.
+            Union[AnalysisResponse, CompactAnalysisResponse]: Response DTO with categories and contradictions.
         """
         if not request.sentences:
             raise AppException("The list of sentences is empty.", code="EMPTY_TEXT")
+        if request.sentence_ids is not None:
+            if len(request.sentence_ids) != len(request.sentences):
+                raise AppException("'sentence_ids' must contain one id per sentence.", code="INVALID_SENTENCE_IDS")
+            if len(set(request.sentence_ids)) != len(request.sentence_ids):
+                raise AppException("'sentence_ids' must be unique.", code="INVALID_SENTENCE_IDS")
+
+        with self.tracer.span("use_case.execute", sentence_count=len(request.sentences)):
+            with self.usage_tracker.track() as usage_report:
+                analysis_result = self._execute(request)
+
+            if compact:
+                response = AnalyzeTextUseCase._map_compact(analysis_result, request.sentence_ids)
+            else:
+                response = AnalyzeTextUseCase._map_full(analysis_result)
+
+        if request.include_usage:
+            response.usage = AnalyzeTextUseCase._map_usage(usage_report)
+        if request.explain and getattr(analysis_result, "plan", None) is not None:
+            response.plan = AnalyzeTextUseCase._map_plan(analysis_result.plan, usage_report)
+
+        return response
+
+    def _execute(self, request: AnalysisRequest) -> AnalysisContradictionResult:
+        """
+        Runs the analysis.
+
+        Args:
+            request (AnalysisRequest): Non-empty sentences to be analyzed.
+
+        Returns:
+            AnalysisContradictionResult: Domain result, indexed by position in the request.
+        """
+        cost_budget = request.max_cost if request.max_cost is not None else self.default_cost_budget
 
         # Call the domain service
-        analysis_result: AnalysisContradictionResult = self.service.analyze_text(request.sentences)
+        return self.service.analyze_text(request.sentences, cost_budget=cost_budget)
 
+    @staticmethod
+    def _map_full(analysis_result: AnalysisContradictionResult) -> AnalysisResponse:
+        """
+        Maps the domain result to the response DTO repeating the sentence texts.
+
+        Args:
+            analysis_result (AnalysisContradictionResult): Result of the analysis.
+
+        Returns:
+            AnalysisResponse: Response DTO with categories and contradictions.
+        """
         categories_dto: List[CategoryContradictionDTO] = []
 
-        # Map domain results to DTOs
+        # Map domain results to DTOs; sentence texts are only materialized from the table here.
+        # The domain models are trusted, so the DTOs are constructed without re-validation.
         for category_result in analysis_result.categories:
             contradictions_dto: List[ContradictionDTO] = [
-                ContradictionDTO(
+                ContradictionDTO.model_construct(
                     statements=c.statements,
                     severity=c.severity,
                     comment=c.comment
@@ -54,11 +121,105 @@ class AnalyzeTextUseCase(AnalyzeTextPort):
             ]
 
             categories_dto.append(
-                CategoryContradictionDTO(
+                CategoryContradictionDTO.model_construct(
                     category_name=category_result.category_name,
                     statements=category_result.statements,
                     contradictions=contradictions_dto
                 )
             )
 
-        return AnalysisResponse(categories=categories_dto)
+        return AnalysisResponse.model_construct(categories=categories_dto)
+
+    @staticmethod
+    def _map_compact(
+            analysis_result: AnalysisContradictionResult,
+            sentence_ids: Optional[List[str]]
+    ) -> CompactAnalysisResponse:
+        """
+        Maps the domain result to the compact response DTO, referencing sentences by id.
+
+        Args:
+            analysis_result (AnalysisContradictionResult): Result of the analysis.
+            sentence_ids (Optional[List[str]]): Client ids of the sentences; 0-based indices are used when None.
+
+        Returns:
+            CompactAnalysisResponse: Response DTO without sentence texts.
+        """
+        def ids(indices) -> list:
+            if sentence_ids is None:
+                return list(indices)
+            return [sentence_ids[i] for i in indices]
+
+        return CompactAnalysisResponse.model_construct(categories=[
+            CompactCategoryDTO.model_construct(
+                category_name=category_result.category_name,
+                statement_ids=ids(category_result.indices),
+                contradictions=[
+                    CompactContradictionDTO.model_construct(
+                        statement_ids=ids(c.indices), severity=c.severity, comment=c.comment
+                    )
+                    for c in category_result.contradictions
+                ]
+            )
+            for category_result in analysis_result.categories
+        ])
+
+    @staticmethod
+    def _map_usage(report: UsageReport) -> UsageDTO:
+        """
+        Maps the usage report of the request to its DTO.
+
+        Args:
+            report (UsageReport): Token usage collected during the analysis.
+
+        Returns:
+            UsageDTO: Totals and per-stage usage.
+        """
+        def _stage_dto(usage: TokenUsage) -> StageUsageDTO:
+            return StageUsageDTO(
+                llm_calls=usage.calls,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                cached_tokens=usage.cached_tokens,
+                total_tokens=usage.total_tokens,
+                estimated_cost=round(usage.estimated_cost, 6)
+            )
+
+        return UsageDTO(
+            **_stage_dto(report.total).model_dump(),
+            stages={stage: _stage_dto(usage) for stage, usage in report.stages.items()}
+        )
+
+    @staticmethod
+    def _map_plan(plan: ExecutionPlan, report: UsageReport) -> ExecutionPlanDTO:
+        """
+        Maps the execution plan of the analysis to its DTO.
+
+        Args:
+            plan (ExecutionPlan): Plan chosen by the service, with the measured latency.
+            report (UsageReport): Token usage collected during the analysis.
+
+        Returns:
+            ExecutionPlanDTO: Chosen strategy with predicted and actual figures.
+        """
+        return ExecutionPlanDTO(
+            strategy=plan.strategy.value,
+            cost_budget=plan.cost_budget,
+            predicted_latency_ms=plan.chosen.predicted_latency_ms,
+            actual_latency_ms=plan.actual_latency_ms,
+            predicted_llm_calls=plan.chosen.llm_calls,
+            actual_llm_calls=report.total.calls if report.total.calls else None,
+            candidates=[
+                StrategyEstimateDTO(
+                    strategy=e.strategy.value,
+                    llm_calls=e.llm_calls,
+                    prompt_tokens=e.prompt_tokens,
+                    completion_tokens=e.completion_tokens,
+                    predicted_latency_ms=e.predicted_latency_ms,
+                    estimated_cost=e.estimated_cost,
+                    feasible=e.feasible,
+                    reason=e.reason
+                )
+                for e in plan.estimates
+            ]
+        )
@@ -0,0 +1,85 @@
+"""
+Module: corpus_use_case
+Description:
+    Use cases of the corpus of approved documents:
+        - Add an approved document to the corpus
+        - Check a new document for contradictions with the corpus
+"""
+
+from typing import Optional
+
+from src.application.dto.corpus_dto import (
+    CorpusCheckRequest, CorpusCheckResponse, CorpusContradictionDTO, CorpusDocumentRequest,
+    CorpusDocumentResponse, CorpusMatchDTO
+)
+from src.domain.exceptions.app_exception import AppException
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.services.corpus_check_service import CorpusCheckService
+
+
+class CorpusUseCase:
+    """
+    Use cases adding approved documents to the corpus and checking new documents against it.
+    """
+
+    def __init__(self, corpus_check_service: CorpusCheckService, tracer: Optional[TracerPort] = None):
+        self.service = corpus_check_service
+        self.tracer = tracer or NullTracer()
+
+    def add_document(self, request: CorpusDocumentRequest) -> CorpusDocumentResponse:
+        """
+        Classifies an approved document and stores its sentences in the corpus.
+
+        Args:
+            request (CorpusDocumentRequest): The approved document.
+
+        Returns:
+            CorpusDocumentResponse: Number of sentences stored and size of the corpus.
+        """
+        if not request.sentences:
+            raise AppException("The list of sentences is empty.", code="EMPTY_TEXT")
+
+        with self.tracer.span("use_case.add_corpus_document", sentence_count=len(request.sentences)):
+            sentence_count = self.service.add_document(request.document_id, request.sentences)
+            return CorpusDocumentResponse(
+                document_id=request.document_id,
+                sentence_count=sentence_count,
+                corpus_size=self.service.corpus_index.size()
+            )
+
+    def check(self, request: CorpusCheckRequest) -> CorpusCheckResponse:
+        """
+        Detects contradictions between a new document and the corpus.
+
+        Args:
+            request (CorpusCheckRequest): The document to check.
+
+        Returns:
+            CorpusCheckResponse: Contradictions with corpus sentences.
+        """
+        if not request.sentences:
+            raise AppException("The list of sentences is empty.", code="EMPTY_TEXT")
+
+        with self.tracer.span("use_case.check_corpus", sentence_count=len(request.sentences)):
+            result = self.service.check(request.sentences, exclude_document=request.exclude_document_id)
+
+        return CorpusCheckResponse.model_construct(
+            contradictions=[
+                CorpusContradictionDTO.model_construct(
+                    statements=[request.sentences[i] for i in contradiction.indices],
+                    matches=[
+                        CorpusMatchDTO.model_construct(
+                            document_id=match.document_id,
+                            statement=match.text,
+                            category_name=match.category
+                        )
+                        for match in contradiction.matches
+                    ],
+                    severity=contradiction.severity,
+                    comment=contradiction.comment
+                )
+                for contradiction in result.contradictions
+            ],
+            candidate_count=result.candidate_count,
+            corpus_size=result.corpus_size
+        )
@@ -0,0 +1,87 @@
+"""
+Module: live_analysis_use_case
+Description:
+    Use case of the live analysis of a document being edited:
+        - Open a session holding the analysis state of one client
+        - Apply a batch of sentence edits and return the changed categories
+"""
+
+from typing import Dict, Optional
+
+from src.application.dto.analysis_response import CompactCategoryDTO, CompactContradictionDTO
+from src.application.dto.live_dto import LiveUpdateResponse
+from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
+from src.domain.ports.input.detector_agent_port import DetectorAgentPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.services.live_analysis_service import CancellationToken, LiveAnalysisSession
+
+
+class LiveAnalysisUseCase:
+    """
+    Use case opening live analysis sessions and applying edits to them.
+    """
+
+    def __init__(
+            self,
+            classifier_agent: ClassifierAgentPort,
+            detector_agent: DetectorAgentPort,
+            tracer: Optional[TracerPort] = None,
+            max_workers: int = 4
+    ):
+        self.classifier_agent = classifier_agent
+        self.detector_agent = detector_agent
+        self.tracer = tracer or NullTracer()
+        self.max_workers = max_workers
+
+    def open_session(self) -> LiveAnalysisSession:
+        """
+        Opens an empty session.
+
+        Returns:
+            LiveAnalysisSession: The session.
+        """
+        return LiveAnalysisSession(self.classifier_agent, self.detector_agent, self.tracer, self.max_workers)
+
+    def apply(
+            self,
+            session: LiveAnalysisSession,
+            edits: Dict[str, Optional[str]],
+            token: CancellationToken
+    ) -> Optional[LiveUpdateResponse]:
+        """
+        Applies a batch of edits to a session.
+
+        Args:
+            session (LiveAnalysisSession): The session.
+            edits (Dict[str, Optional[str]]): New text of each edited sentence id; None or "" removes it.
+            token (CancellationToken): Token through which the batch can be cancelled.
+
+        Returns:
+            Optional[LiveUpdateResponse]: The changed categories, or None if the batch was cancelled
+                                          or changed nothing.
+        """
+        with self.tracer.span("use_case.live_update", edit_count=len(edits)):
+            update = session.apply(edits, token)
+
+        if update is None:
+            return None
+        return LiveUpdateResponse.model_construct(
+            type="update",
+            version=update.version,
+            categories=[
+                CompactCategoryDTO.model_construct(
+                    category_name=category.name,
+                    statement_ids=list(category.sentence_ids),
+                    contradictions=[
+                        CompactContradictionDTO.model_construct(
+                            statement_ids=list(contradiction.sentence_ids),
+                            severity=contradiction.severity,
+                            comment=contradiction.comment
+                        )
+                        for contradiction in category.contradictions
+                    ]
+                )
+                for category in update.categories
+            ],
+            removed_categories=update.removed_categories
+        )
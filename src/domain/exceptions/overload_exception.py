@@ -0,0 +1,47 @@
+"""
+Module: overload_exception
+Description:
+    This module defines the exceptions raised by admission control when a request
+    cannot be accepted: it is too large, or the service is saturated.
+"""
+
+from src.domain.exceptions.app_exception import AppException
+
+
+class RequestTooLargeException(AppException):
+    """
+    Exception raised when a request exceeds the size limits of a single analysis.
+
+    Inherits from AppException and uses the error code "REQUEST_TOO_LARGE".
+    """
+
+    def __init__(self, message: str):
+        """
+        Initializes the RequestTooLargeException with a custom error message.
+
+        Args:
+            message (str): Description of the exceeded limit.
+        """
+        super().__init__(message, code="REQUEST_TOO_LARGE")
+
+
+class OverloadException(AppException):
+    """
+    Exception raised when the service is saturated and the request is shed.
+
+    Attributes:
+        retry_after (int): Seconds after which the client may retry.
+    """
+
+    def __init__(self, message: str, code: str = "SERVER_OVERLOADED", retry_after: int = 1):
+        """
+        Initializes the OverloadException.
+
+        Args:
+            message (str): Description of the saturation.
+            code (str, optional): "QUEUE_FULL" when rejected on arrival, "QUEUE_TIMEOUT" when the
+                                  request waited too long for a slot. Defaults to "SERVER_OVERLOADED".
+            retry_after (int, optional): Seconds after which the client may retry. Defaults to 1.
+        """
+        super().__init__(message, code=code)
+        self.retry_after = retry_after
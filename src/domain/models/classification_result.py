@@ -2,28 +2,55 @@
 Module: classification_models
 Description:
     This module defines data structures for text classification results.
+    Categories reference sentences by index in a shared SentenceTable.
     It includes:
         - Category: a semantic category with associated phrases.
         - ClassificationResult: result of a classification process containing multiple categories.
 """
 
-from typing import List
+from typing import List, Sequence, Tuple
 from dataclasses import dataclass
 
+from src.domain.models.sentence_table import SentenceTable
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Category:
     """
     Represents a semantic category with associated phrases.
 
     Attributes:
         name (str): The name of the category.
-        phrases (List[str]): List of phrases belonging to this category.
+        indices (Tuple[int, ...]): 0-based indices, in the table, of the phrases belonging to this category.
+        table (SentenceTable): Table holding the sentences of the analysis.
     """
     name: str
-    phrases: List[str]
+    indices: Tuple[int, ...]
+    table: SentenceTable
+
+    @classmethod
+    def from_phrases(cls, name: str, phrases: Sequence[str]) -> "Category":
+        """
+        Builds a category holding the given phrases in a table of its own.
+
+        Args:
+            name (str): The name of the category.
+            phrases (Sequence[str]): Phrases belonging to the category.
+
+        Returns:
+            Category: The category.
+        """
+        return cls(name=name, indices=tuple(range(len(phrases))), table=SentenceTable.of(phrases))
+
+    @property
+    def phrases(self) -> List[str]:
+        """
+        List[str]: Phrases belonging to this category, materialized from the table.
+        """
+        return self.table.texts(self.indices)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     """
     Represents the result of a classification process.
@@ -3,6 +3,7 @@ Module: contradiction_llm_response
 Description:
     Defines Pydantic models representing the LLM response for detected contradictions.
     Each contradiction references sentences by 1-based indices.
+    The screening response adds the confidence of the fast first pass of the detection cascade.
 """
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -40,3 +41,13 @@ class ContradictionLLMResponse(BaseModel):
         populate_by_name=True,
         use_enum_values=True
     )
+
+
+class ScreeningLLMResponse(ContradictionLLMResponse):
+    """
+    Contradiction detection response of the fast first pass of the detection cascade.
+
+    Attributes:
+        confidence (float): Confidence of the LLM, between 0 and 1, that the contradictions are complete and correct.
+    """
+    confidence: float = Field(alias="الثقة")
@@ -2,50 +2,108 @@
 Module: contradiction_result
 Description:
     Domain models representing contradictions detected in sentences,
-    organized per category. Each Contradiction contains the sentences involved,
-    a severity level, and an explanatory comment.
+    organized per category. Each Contradiction references the sentences involved
+    by index in a shared SentenceTable, with a severity level and an explanatory comment.
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
+from src.domain.models.execution_plan import ExecutionPlan
+from src.domain.models.sentence_table import SentenceTable
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Contradiction:
     """
     Represents a single contradiction between sentences.
 
     Attributes:
-        statements (List[str]): List of sentences involved in the contradiction.
+        indices (Tuple[int, ...]): 0-based indices, in the table, of the sentences involved in the contradiction.
         severity (str): Severity level of the contradiction ("حاد" or "متوسط").
         comment (str): Explanation or comment about the contradiction.
+        table (SentenceTable): Table holding the sentences of the analysis.
     """
-    statements: List[str]
+    indices: Tuple[int, ...]
     severity: str
     comment: str
+    table: SentenceTable
+
+    @classmethod
+    def from_statements(cls, statements: Sequence[str], severity: str, comment: str) -> "Contradiction":
+        """
+        Builds a contradiction between the given sentences, held in a table of its own.
+
+        Args:
+            statements (Sequence[str]): Sentences involved in the contradiction.
+            severity (str): Severity level of the contradiction.
+            comment (str): Explanation or comment about the contradiction.
+
+        Returns:
+            Contradiction: The contradiction.
+        """
+        return cls(tuple(range(len(statements))), severity, comment, SentenceTable.of(statements))
+
+    @property
+    def statements(self) -> List[str]:
+        """
+        List[str]: Sentences involved in the contradiction, materialized from the table.
+        """
+        return self.table.texts(self.indices)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryContradictionResult:
     """
     Represents contradictions detected within a specific category.
 
     Attributes:
         category_name (str): Name of the category.
-        statements (List[str]): All sentences in this category.
-        contradictions (List[Contradiction]): List of contradictions within this category.
+        indices (Tuple[int, ...]): 0-based indices, in the table, of all sentences in this category.
+        contradictions (Tuple[Contradiction, ...]): Contradictions within this category.
+        table (SentenceTable): Table holding the sentences of the analysis.
     """
     category_name: str
-    statements: List[str]
-    contradictions: List[Contradiction]
+    indices: Tuple[int, ...]
+    contradictions: Tuple[Contradiction, ...]
+    table: SentenceTable
+
+    @classmethod
+    def from_statements(
+            cls,
+            category_name: str,
+            statements: Sequence[str],
+            contradictions: Sequence[Contradiction]
+    ) -> "CategoryContradictionResult":
+        """
+        Builds a category result holding the given sentences in a table of its own.
+
+        Args:
+            category_name (str): Name of the category.
+            statements (Sequence[str]): All sentences in this category.
+            contradictions (Sequence[Contradiction]): Contradictions within this category.
+
+        Returns:
+            CategoryContradictionResult: The category result.
+        """
+        return cls(category_name, tuple(range(len(statements))), tuple(contradictions), SentenceTable.of(statements))
+
+    @property
+    def statements(self) -> List[str]:
+        """
+        List[str]: All sentences in this category, materialized from the table.
+        """
+        return self.table.texts(self.indices)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisContradictionResult:
     """
     Represents the full analysis result across all categories.
 
     Attributes:
         categories (List[CategoryContradictionResult]): List of categories with their contradictions.
+        plan (Optional[ExecutionPlan]): How the analysis was executed, when planned by the service.
     """
     categories: List[CategoryContradictionResult]
+    plan: Optional[ExecutionPlan] = None
@@ -0,0 +1,62 @@
+"""
+Module: corpus
+Description:
+    Domain models of the corpus of approved sentences and of the contradictions found
+    between a new document and that corpus.
+    It includes:
+        - CorpusSentence: a sentence stored in the corpus, with its document and category.
+        - CorpusContradiction: a contradiction between sentences of a new document and corpus sentences.
+        - CorpusCheckResult: the contradictions found for a new document.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusSentence:
+    """
+    A sentence of an approved document stored in the corpus.
+
+    Attributes:
+        sentence_id (int): Id of the sentence in the corpus.
+        document_id (str): Id of the document the sentence belongs to.
+        text (str): The sentence.
+        category (str): Category the sentence was classified in when its document was added.
+    """
+    sentence_id: int
+    document_id: str
+    text: str
+    category: str
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusContradiction:
+    """
+    A contradiction between sentences of a new document and sentences of the corpus.
+
+    Attributes:
+        indices (Tuple[int, ...]): 0-based indices of the sentences of the new document involved.
+        matches (Tuple[CorpusSentence, ...]): Corpus sentences involved.
+        severity (str): Severity level of the contradiction ("حاد" or "متوسط").
+        comment (str): Explanation of the contradiction.
+    """
+    indices: Tuple[int, ...]
+    matches: Tuple[CorpusSentence, ...]
+    severity: str
+    comment: str
+
+
+@dataclass(slots=True)
+class CorpusCheckResult:
+    """
+    Contradictions between a new document and the corpus.
+
+    Attributes:
+        contradictions (List[CorpusContradiction]): Contradictions found.
+        candidate_count (int): Corpus sentences retrieved and sent to the detector.
+        corpus_size (int): Sentences in the corpus when the document was checked.
+    """
+    contradictions: List[CorpusContradiction]
+    candidate_count: int
+    corpus_size: int
@@ -0,0 +1,80 @@
+"""
+Module: execution_plan
+Description:
+    Domain models describing how an analysis is executed.
+    It includes:
+        - ExecutionStrategy: the available execution strategies.
+        - StrategyEstimate: predicted LLM calls, tokens, latency and cost of one strategy.
+        - ExecutionPlan: the chosen strategy, every candidate estimate and the measured latency.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional
+
+
+class ExecutionStrategy(str, Enum):
+    """
+    Execution strategies of an analysis.
+
+    Values:
+        FUSED: one LLM call classifying and detecting contradictions together.
+        TWO_STAGE: one classification call, then one detection call per category.
+        CHUNKED_CLASSIFICATION: parallel classification of sentence chunks, merged by category name.
+        BLOCKWISE_DETECTION: one classification call, then parallel detection on blocks of large categories.
+        LOCAL_ONLY: no LLM call; all sentences in one unnamed category without contradictions.
+    """
+    FUSED = "fused"
+    TWO_STAGE = "two_stage"
+    CHUNKED_CLASSIFICATION = "chunked_classification"
+    BLOCKWISE_DETECTION = "blockwise_detection"
+    LOCAL_ONLY = "local_only"
+
+
+@dataclass
+class StrategyEstimate:
+    """
+    Predicted cost of executing an analysis with one strategy.
+
+    Attributes:
+        strategy (ExecutionStrategy): The estimated strategy.
+        llm_calls (int): Predicted number of LLM calls.
+        prompt_tokens (int): Predicted input tokens.
+        completion_tokens (int): Predicted output tokens.
+        predicted_latency_ms (float): Predicted end-to-end latency.
+        estimated_cost (float): Predicted cost from the configured token prices.
+        feasible (bool): Whether the strategy applies to this input.
+        reason (str): Why the strategy is not feasible or was not chosen, if applicable.
+    """
+    strategy: ExecutionStrategy
+    llm_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    predicted_latency_ms: float
+    estimated_cost: float
+    feasible: bool = True
+    reason: str = ""
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    Strategy chosen for an analysis, with the estimates it was chosen from.
+
+    Attributes:
+        strategy (ExecutionStrategy): The chosen strategy.
+        estimates (List[StrategyEstimate]): Estimates of every candidate strategy.
+        cost_budget (Optional[float]): Cost budget of the request, None when unlimited.
+        actual_latency_ms (Optional[float]): Measured latency, set once the analysis has run.
+    """
+    strategy: ExecutionStrategy
+    estimates: List[StrategyEstimate] = field(default_factory=list)
+    cost_budget: Optional[float] = None
+    actual_latency_ms: Optional[float] = None
+
+    @property
+    def chosen(self) -> Optional[StrategyEstimate]:
+        """
+        Estimate of the chosen strategy.
+        """
+        return next((e for e in self.estimates if e.strategy == self.strategy), None)
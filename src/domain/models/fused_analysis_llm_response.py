@@ -0,0 +1,41 @@
+"""
+Module: fused_analysis_llm_response
+Description:
+    Defines the Pydantic models representing the LLM response of the fused analysis,
+    which classifies sentences and detects contradictions in a single call.
+    Categories and contradictions reference sentences by 1-based indices of the full input.
+"""
+
+from pydantic import BaseModel, Field, ConfigDict
+from typing import List
+
+from src.domain.models.contradiction_llm_response import ContradictionLLM
+
+
+class FusedCategoryLLM(BaseModel):
+    """
+    Represents a category returned by the fused analysis, with its contradictions.
+
+    Attributes:
+        name (str): Name of the category.
+        phrases (List[int]): 1-based indices of the sentences belonging to this category.
+        contradictions (List[ContradictionLLM]): Contradictions between sentences of this category.
+    """
+    name: str
+    phrases: List[int]
+    contradictions: List[ContradictionLLM] = Field(alias="التناقضات")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        use_enum_values=True
+    )
+
+
+class FusedAnalysisLLMResponse(BaseModel):
+    """
+    Represents the full fused analysis response returned by the LLM.
+
+    Attributes:
+        categories (List[FusedCategoryLLM]): Categories with their sentence indices and contradictions.
+    """
+    categories: List[FusedCategoryLLM]
@@ -0,0 +1,60 @@
+"""
+Module: live_analysis
+Description:
+    Domain models of a live analysis, in which a client edits its sentences one by one and
+    receives the categories and contradictions changed by each batch of edits.
+    Sentences are referenced by the ids the client gave them.
+    It includes:
+        - LiveContradiction: a contradiction between sentences of the live analysis.
+        - LiveCategory: a category of the live analysis with its contradictions.
+        - LiveUpdate: the categories changed or removed by a batch of edits.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class LiveContradiction:
+    """
+    A contradiction between sentences of a live analysis.
+
+    Attributes:
+        sentence_ids (Tuple[str, ...]): Ids of the sentences involved.
+        severity (str): Severity level of the contradiction ("حاد" or "متوسط").
+        comment (str): Explanation of the contradiction.
+    """
+    sentence_ids: Tuple[str, ...]
+    severity: str
+    comment: str
+
+
+@dataclass(frozen=True, slots=True)
+class LiveCategory:
+    """
+    A category of a live analysis.
+
+    Attributes:
+        name (str): Name of the category.
+        sentence_ids (Tuple[str, ...]): Ids of the sentences of the category.
+        contradictions (Tuple[LiveContradiction, ...]): Contradictions within the category.
+    """
+    name: str
+    sentence_ids: Tuple[str, ...]
+    contradictions: Tuple[LiveContradiction, ...]
+
+
+@dataclass(slots=True)
+class LiveUpdate:
+    """
+    Changes of a live analysis after a batch of edits.
+
+    Attributes:
+        version (int): Version of the analysis after the batch, incremented by each applied batch.
+        categories (List[LiveCategory]): Categories whose sentences or contradictions may have changed,
+                                         with their full content.
+        removed_categories (List[str]): Names of the categories left without sentences.
+    """
+    version: int
+    categories: List[LiveCategory]
+    removed_categories: List[str]
@@ -0,0 +1,53 @@
+"""
+Module: sentence_table
+Description:
+    Defines the SentenceTable, the single store of the sentences of an analysis.
+    Domain models reference sentences by their 0-based index in the table instead of
+    holding copies of the strings; texts are only materialized when they are needed
+    (prompts and API responses).
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class SentenceTable:
+    """
+    Immutable table of the sentences of an analysis.
+
+    Attributes:
+        sentences (Tuple[str, ...]): The sentences, addressed by 0-based index.
+    """
+    sentences: Tuple[str, ...]
+
+    @classmethod
+    def of(cls, sentences: Sequence[str]) -> "SentenceTable":
+        """
+        Returns a table over the given sentences, reusing it if it already is a table.
+
+        Args:
+            sentences (Sequence[str]): Sentences or an existing table.
+
+        Returns:
+            SentenceTable: The table.
+        """
+        if isinstance(sentences, SentenceTable):
+            return sentences
+        return cls(tuple(sentences))
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    def texts(self, indices: Iterable[int]) -> List[str]:
+        """
+        Materializes the sentences at the given indices.
+
+        Args:
+            indices (Iterable[int]): 0-based sentence indices.
+
+        Returns:
+            List[str]: The sentences, in the order of the indices.
+        """
+        sentences = self.sentences
+        return [sentences[i] for i in indices]
@@ -0,0 +1,77 @@
+"""
+Module: token_usage
+Description:
+    Domain models for LLM token accounting.
+    It includes:
+        - TokenUsage: token counts, call count and estimated cost of one or more LLM calls.
+        - UsageReport: usage of one request, in total and per analysis stage.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class TokenUsage:
+    """
+    Token counts and estimated cost of one or more LLM calls.
+
+    Attributes:
+        prompt_tokens (int): Input tokens billed by the LLM.
+        completion_tokens (int): Output tokens generated by the LLM.
+        cached_tokens (int): Part of the prompt tokens served from the prompt cache.
+        calls (int): Number of LLM calls.
+        estimated_cost (float): Estimated cost based on the configured deployment prices.
+    """
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    calls: int = 0
+    estimated_cost: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        """
+        Total number of tokens (prompt + completion).
+        """
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "TokenUsage") -> None:
+        """
+        Adds another usage to this one.
+
+        Args:
+            other (TokenUsage): Usage to add.
+        """
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cached_tokens += other.cached_tokens
+        self.calls += other.calls
+        self.estimated_cost += other.estimated_cost
+
+
+@dataclass
+class UsageReport:
+    """
+    LLM usage of one request.
+
+    Attributes:
+        total (TokenUsage): Usage summed over every stage.
+        stages (Dict[str, TokenUsage]): Usage per stage (e.g., "classification", "detection").
+    """
+    total: TokenUsage = field(default_factory=TokenUsage)
+    stages: Dict[str, TokenUsage] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, stage: str, usage: TokenUsage) -> None:
+        """
+        Records the usage of one LLM call. Safe to call from worker threads.
+
+        Args:
+            stage (str): Stage that made the call.
+            usage (TokenUsage): Usage of the call.
+        """
+        with self._lock:
+            self.total.add(usage)
+            self.stages.setdefault(stage, TokenUsage()).add(usage)
@@ -6,9 +6,9 @@ Description:
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
-from src.domain.models.classification_result import ClassificationResult
+from src.domain.models.classification_result import ClassificationResult, Category
 
 
 class ClassifierAgentPort(ABC):
@@ -30,3 +30,36 @@ class ClassifierAgentPort(ABC):
             ClassificationResult: The classification results for the given sentences.
         """
         pass
+
+    def iter_categories(self, sentences: List[str]) -> Iterator[Category]:
+        """
+        Classifies a list of sentences and yields each category as soon as it is known.
+
+        Agents able to stream their output override this method so that callers can start
+        working on the first categories while the next ones are still being produced.
+        The default implementation yields the categories of classify_sentences().
+
+        Args:
+            sentences (List[str]): A list of sentences to classify.
+
+        Yields:
+            Category: The categories of the classification, in order.
+        """
+        yield from self.classify_sentences(sentences).categories
+
+    def assign_sentences(self, sentences: List[str], category_names: List[str]) -> ClassificationResult:
+        """
+        Classifies sentences into existing categories, creating new categories only when none fits.
+
+        Used to classify sentences added to an already classified text without classifying it again.
+        Agents able to reuse category names override this method; the default implementation
+        classifies the sentences on their own, so categories only match existing ones by exact name.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+            category_names (List[str]): Names of the existing categories.
+
+        Returns:
+            ClassificationResult: The classification of the given sentences.
+        """
+        return self.classify_sentences(sentences)
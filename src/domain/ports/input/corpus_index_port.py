@@ -0,0 +1,101 @@
+"""
+Module: corpus_index_port
+Description:
+    This module defines the abstract interface (port) for the index of approved sentences.
+    The index stores the sentences of approved documents with their category, and retrieves
+    the few stored sentences most related to a query sentence.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.models.classification_result import ClassificationResult
+from src.domain.models.corpus import CorpusSentence
+
+
+class CorpusIndexPort(ABC):
+    """
+    Port for storing approved sentences and retrieving candidate sentences for a query.
+    """
+
+    @abstractmethod
+    def add_document(self, document_id: str, sentences: List[str], classification: ClassificationResult) -> int:
+        """
+        Stores the sentences of a document, replacing any previous version of the document.
+
+        Args:
+            document_id (str): Id of the document.
+            sentences (List[str]): Sentences of the document.
+            classification (ClassificationResult): Categories of the sentences; sentences outside
+                                                   every category are stored without category.
+
+        Returns:
+            int: Number of sentences stored.
+        """
+        pass
+
+    @abstractmethod
+    def remove_document(self, document_id: str) -> int:
+        """
+        Removes the sentences of a document.
+
+        Returns:
+            int: Number of sentences removed.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+            self,
+            sentence: str,
+            limit: int,
+            category: Optional[str] = None,
+            exclude_document: Optional[str] = None
+    ) -> List[CorpusSentence]:
+        """
+        Retrieves the stored sentences most related to a sentence.
+
+        Args:
+            sentence (str): Query sentence.
+            limit (int): Maximum number of sentences returned.
+            category (Optional[str]): Category of the query; sentences of that category rank higher.
+            exclude_document (Optional[str]): Document whose sentences are not returned.
+
+        Returns:
+            List[CorpusSentence]: Candidate sentences, most related first.
+        """
+        pass
+
+    def search_many(
+            self,
+            sentences: List[str],
+            limit: int,
+            category: Optional[str] = None,
+            exclude_document: Optional[str] = None
+    ) -> List[List[CorpusSentence]]:
+        """
+        Retrieves the stored sentences most related to each of several sentences.
+
+        Implementations may share work between the queries (e.g. one embedding call for all
+        of them); the default searches each sentence in turn.
+
+        Args:
+            sentences (List[str]): Query sentences.
+            limit (int): Maximum number of sentences returned per query.
+            category (Optional[str]): Category of the queries; sentences of that category rank higher.
+            exclude_document (Optional[str]): Document whose sentences are not returned.
+
+        Returns:
+            List[List[CorpusSentence]]: Candidate sentences of each query, most related first.
+        """
+        return [
+            self.search(sentence, limit, category=category, exclude_document=exclude_document)
+            for sentence in sentences
+        ]
+
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Returns the number of stored sentences.
+        """
+        pass
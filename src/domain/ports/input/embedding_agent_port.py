@@ -0,0 +1,30 @@
+"""
+Module: embedding_agent_port
+Description:
+    This module defines the abstract interface for an embedding agent.
+    Any concrete implementation of an embedding agent must implement this interface.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class EmbeddingAgentPort(ABC):
+    """
+    Abstract interface for an embedding agent.
+
+    Defines the methods that the domain layer can call on any embedding agent.
+    """
+
+    @abstractmethod
+    def embed_sentences(self, sentences: List[str]) -> List[List[float]]:
+        """
+        Computes the embedding vector of each sentence.
+
+        Args:
+            sentences (List[str]): A list of sentences to embed.
+
+        Returns:
+            List[List[float]]: One vector per sentence, in the order of the sentences.
+        """
+        pass
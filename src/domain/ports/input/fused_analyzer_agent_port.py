@@ -0,0 +1,33 @@
+"""
+Module: fused_analyzer_agent_port
+Description:
+    This module defines the abstract interface for a fused analyzer agent, which classifies
+    sentences and detects contradictions in a single LLM call.
+    Any concrete implementation of a fused analyzer agent must implement this interface.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.models.contradiction_result import AnalysisContradictionResult
+
+
+class FusedAnalyzerAgentPort(ABC):
+    """
+    Abstract interface for a fused analyzer agent.
+
+    Defines the methods that the domain layer can call on any fused analyzer agent.
+    """
+
+    @abstractmethod
+    def analyze_sentences(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies sentences and detects contradictions within each category in one pass.
+
+        Args:
+            sentences (List[str]): A list of sentences to analyze.
+
+        Returns:
+            AnalysisContradictionResult: Categories with their detected contradictions.
+        """
+        pass
@@ -0,0 +1,44 @@
+"""
+Module: llm_scheduler_port
+Description:
+    This module defines the abstract interface (port) for scheduling LLM calls.
+    Agents hold a slot for the duration of each LLM call; the scheduler decides which
+    waiting call gets the next free slot. A no-op implementation is provided for callers
+    that are built without a scheduler.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import ContextManager, Iterator
+
+
+class LlmSchedulerPort(ABC):
+    """
+    Port for LLM call scheduling.
+    """
+
+    @abstractmethod
+    def slot(self) -> ContextManager[None]:
+        """
+        Waits for an LLM call slot and holds it until the context manager exits.
+
+        Returns:
+            ContextManager[None]: Context manager holding the slot.
+        """
+        pass
+
+
+class NullLlmScheduler(LlmSchedulerPort):
+    """
+    Scheduler granting every call immediately. Used when no scheduler is injected.
+    """
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Grants the call immediately.
+
+        Yields:
+            None
+        """
+        yield
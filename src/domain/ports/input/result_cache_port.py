@@ -0,0 +1,98 @@
+"""
+Module: result_cache_port
+Description:
+    This module defines the abstract interface (port) for caching analysis results.
+    Classifications are cached per sentence list, contradiction detections per category and
+    whole analyses per sentence list and execution strategy. A no-op implementation is provided for
+    callers that are built without a cache.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
+from src.domain.models.execution_plan import ExecutionStrategy
+
+
+class ResultCachePort(ABC):
+    """
+    Port for caching classification, detection and analysis results.
+
+    Cached results are rebuilt on the sentence table of the caller, so a result computed for
+    one request can be reused by another one containing the same sentences.
+    """
+
+    @abstractmethod
+    def get_classification(self, sentences: List[str]) -> Optional[ClassificationResult]:
+        """
+        Returns the cached classification of the sentences, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def put_classification(self, sentences: List[str], result: ClassificationResult) -> None:
+        """
+        Caches the classification of the sentences.
+        """
+        pass
+
+    @abstractmethod
+    def get_detection(self, category: Category) -> Optional[CategoryContradictionResult]:
+        """
+        Returns the cached contradictions of the category's sentences, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def put_detection(self, result: CategoryContradictionResult) -> None:
+        """
+        Caches the contradictions of a category.
+        """
+        pass
+
+    @abstractmethod
+    def get_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy
+    ) -> Optional[AnalysisContradictionResult]:
+        """
+        Returns the cached analysis of the sentences with the strategy, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def put_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy, result: AnalysisContradictionResult
+    ) -> None:
+        """
+        Caches the analysis of the sentences with the strategy.
+        """
+        pass
+
+
+class NullResultCache(ResultCachePort):
+    """
+    Cache that never stores anything. Used when no cache is injected.
+    """
+
+    def get_classification(self, sentences: List[str]) -> Optional[ClassificationResult]:
+        return None
+
+    def put_classification(self, sentences: List[str], result: ClassificationResult) -> None:
+        pass
+
+    def get_detection(self, category: Category) -> Optional[CategoryContradictionResult]:
+        return None
+
+    def put_detection(self, result: CategoryContradictionResult) -> None:
+        pass
+
+    def get_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy
+    ) -> Optional[AnalysisContradictionResult]:
+        return None
+
+    def put_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy, result: AnalysisContradictionResult
+    ) -> None:
+        pass
@@ -0,0 +1,52 @@
+"""
+Module: sentence_grouper_port
+Description:
+    This module defines the abstract interface (port) splitting the sentences of an analysis
+    into bounded groups: the chunks classified in parallel and the blocks checked for
+    contradictions. A positional implementation, keeping consecutive sentences together,
+    is provided for callers that are built without a grouper.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+
+class SentenceGrouperPort(ABC):
+    """
+    Port for partitioning sentences into groups of bounded size.
+    """
+
+    @abstractmethod
+    def group(self, sentences: Sequence[str], max_group_size: int) -> List[List[int]]:
+        """
+        Partitions sentences into groups of at most max_group_size sentences.
+
+        Args:
+            sentences (Sequence[str]): Sentences to partition.
+            max_group_size (int): Maximum number of sentences per group.
+
+        Returns:
+            List[List[int]]: Positions of the sentences of each group, in ascending order.
+                             Every position appears in exactly one group.
+        """
+        pass
+
+
+class PositionalSentenceGrouper(SentenceGrouperPort):
+    """
+    Grouper cutting the sentences into consecutive runs. Used when no grouper is injected.
+    """
+
+    def group(self, sentences: Sequence[str], max_group_size: int) -> List[List[int]]:
+        """
+        Cuts the sentences into consecutive groups of max_group_size sentences.
+
+        Args:
+            sentences (Sequence[str]): Sentences to partition.
+            max_group_size (int): Maximum number of sentences per group.
+
+        Returns:
+            List[List[int]]: Positions of the sentences of each group.
+        """
+        size = max(max_group_size, 1)
+        return [list(range(start, min(start + size, len(sentences)))) for start in range(0, len(sentences), size)]
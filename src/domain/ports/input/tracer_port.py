@@ -0,0 +1,88 @@
+"""
+Module: tracer_port
+Description:
+    This module defines the abstract interface (port) for request tracing.
+    The domain and application layers open spans through this port without depending
+    on a concrete tracing backend. A no-op implementation is provided for callers
+    that are built without a tracer.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator
+
+
+class SpanPort(ABC):
+    """
+    Abstract interface for an open tracing span.
+    """
+
+    @abstractmethod
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Attaches an attribute to the span.
+
+        Args:
+            key (str): Attribute name (e.g., "sentence_count").
+            value (Any): Attribute value (str, int, float or bool).
+        """
+        pass
+
+
+class TracerPort(ABC):
+    """
+    Port for request tracing.
+    Defines the abstract method to open a span around a unit of work.
+    """
+
+    @abstractmethod
+    def span(self, name: str, **attributes: Any) -> ContextManager[SpanPort]:
+        """
+        Opens a span that is closed when the context manager exits.
+
+        Args:
+            name (str): Name of the span (e.g., "classifier.classify").
+            **attributes: Initial attributes of the span.
+
+        Returns:
+            ContextManager[SpanPort]: Context manager yielding the open span.
+        """
+        pass
+
+
+class NullSpan(SpanPort):
+    """
+    Span that discards every attribute.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Ignores the attribute.
+
+        Args:
+            key (str): Attribute name.
+            value (Any): Attribute value.
+        """
+        return None
+
+
+class NullTracer(TracerPort):
+    """
+    Tracer that records nothing. Used when no tracer is injected.
+    """
+
+    _span = NullSpan()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[SpanPort]:
+        """
+        Opens a span that records nothing.
+
+        Args:
+            name (str): Name of the span.
+            **attributes: Ignored attributes.
+
+        Yields:
+            SpanPort: A shared no-op span.
+        """
+        yield self._span
@@ -0,0 +1,69 @@
+"""
+Module: usage_tracker_port
+Description:
+    This module defines the abstract interface (port) for LLM token accounting.
+    Agents record the usage of each LLM call; the application layer collects the
+    usage of a whole request. A no-op implementation is provided for callers that are
+    built without a usage tracker.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import ContextManager, Iterator
+
+from src.domain.models.token_usage import TokenUsage, UsageReport
+
+
+class UsageTrackerPort(ABC):
+    """
+    Port for LLM token accounting.
+    """
+
+    @abstractmethod
+    def track(self) -> ContextManager[UsageReport]:
+        """
+        Collects the usage of every LLM call made inside the block.
+
+        Returns:
+            ContextManager[UsageReport]: Context manager yielding the report being filled.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, stage: str, model: str, usage: TokenUsage) -> None:
+        """
+        Records the usage of one LLM call in the current report.
+
+        Args:
+            stage (str): Stage that made the call (e.g., "classification").
+            model (str): Deployment used for the call, used to estimate the cost.
+            usage (TokenUsage): Token counts of the call.
+        """
+        pass
+
+
+class NullUsageTracker(UsageTrackerPort):
+    """
+    Usage tracker that records nothing. Used when no tracker is injected.
+    """
+
+    @contextmanager
+    def track(self) -> Iterator[UsageReport]:
+        """
+        Yields an empty report that is never filled.
+
+        Yields:
+            UsageReport: An empty report.
+        """
+        yield UsageReport()
+
+    def record(self, stage: str, model: str, usage: TokenUsage) -> None:
+        """
+        Ignores the usage.
+
+        Args:
+            stage (str): Stage that made the call.
+            model (str): Deployment used for the call.
+            usage (TokenUsage): Token counts of the call.
+        """
+        return None
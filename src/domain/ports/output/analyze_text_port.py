@@ -6,9 +6,10 @@ Description:
 """
 
 from abc import ABC, abstractmethod
+from typing import Union
 
 from src.application.dto.analysis_request import AnalysisRequest
-from src.application.dto.analysis_response import AnalysisResponse
+from src.application.dto.analysis_response import AnalysisResponse, CompactAnalysisResponse
 
 
 class AnalyzeTextPort(ABC):
@@ -18,14 +19,19 @@ class AnalyzeTextPort(ABC):
     """
 
     @abstractmethod
-    def execute(self, request: AnalysisRequest) -> AnalysisResponse:
+    def execute(
+            self,
+            request: AnalysisRequest,
+            compact: bool = False
+    ) -> Union[AnalysisResponse, CompactAnalysisResponse]:
         """
         Executes the text analysis use case.
 
         Args:
             request (AnalysisRequest): The request containing sentences to analyze.
+            compact (bool): Whether to reference sentences by id instead of repeating them.
 
         Returns:
-            AnalysisResponse: The response containing detected contradictions.
+            Union[AnalysisResponse, CompactAnalysisResponse]: The response containing detected contradictions.
         """
         pass
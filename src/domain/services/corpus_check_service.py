@@ -0,0 +1,157 @@
+"""
+Module: corpus_check_service
+Description:
+    This module defines the CorpusCheckService, a domain service checking new documents against
+    the corpus of approved documents. For every sentence of a new document, a small set of
+    candidate sentences is retrieved locally from the corpus index; only those candidates are
+    sent to the contradiction detector, one call per category of the new document.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.corpus import CorpusCheckResult, CorpusContradiction, CorpusSentence
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
+from src.domain.ports.input.corpus_index_port import CorpusIndexPort
+from src.domain.ports.input.detector_agent_port import DetectorAgentPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.services.parallel import map_parallel
+
+
+class CorpusCheckService:
+    """
+    Domain service adding approved documents to the corpus and checking new documents against it.
+    """
+
+    def __init__(
+            self,
+            classifier_agent: ClassifierAgentPort,
+            detector_agent: DetectorAgentPort,
+            corpus_index: CorpusIndexPort,
+            tracer: Optional[TracerPort] = None,
+            candidates_per_sentence: int = 5,
+            max_candidates_per_category: int = 20,
+            max_workers: int = 4
+    ):
+        """
+        Initializes the CorpusCheckService.
+
+        Args:
+            classifier_agent (ClassifierAgentPort): Agent classifying the sentences of documents.
+            detector_agent (DetectorAgentPort): Agent detecting contradictions within a group of sentences.
+            corpus_index (CorpusIndexPort): Index of the approved sentences.
+            tracer (Optional[TracerPort]): Tracer used to record the check stages. Defaults to no tracing.
+            candidates_per_sentence (int): Corpus sentences retrieved per sentence of the new document.
+            max_candidates_per_category (int): Corpus sentences sent to the detector per category.
+            max_workers (int): Categories checked in parallel.
+        """
+        self.classifier_agent = classifier_agent
+        self.detector_agent = detector_agent
+        self.corpus_index = corpus_index
+        self.tracer = tracer or NullTracer()
+        self.candidates_per_sentence = candidates_per_sentence
+        self.max_candidates_per_category = max_candidates_per_category
+        self.max_workers = max_workers
+
+    def add_document(self, document_id: str, sentences: List[str]) -> int:
+        """
+        Classifies the sentences of an approved document and stores them in the corpus.
+
+        Args:
+            document_id (str): Id of the document; a document with the same id is replaced.
+            sentences (List[str]): Sentences of the document.
+
+        Returns:
+            int: Number of sentences stored.
+        """
+        with self.tracer.span("corpus.add_document", sentence_count=len(sentences)):
+            classification = self.classifier_agent.classify_sentences(sentences)
+            return self.corpus_index.add_document(document_id, sentences, classification)
+
+    def check(self, sentences: List[str], exclude_document: Optional[str] = None) -> CorpusCheckResult:
+        """
+        Detects contradictions between a new document and the corpus.
+
+        Args:
+            sentences (List[str]): Sentences of the new document.
+            exclude_document (Optional[str]): Corpus document not to compare with (e.g. a previous
+                                              version of the document being checked).
+
+        Returns:
+            CorpusCheckResult: Contradictions between the document's sentences and corpus sentences.
+                               Contradictions within the new document are not reported.
+        """
+        with self.tracer.span("corpus.check", sentence_count=len(sentences)) as span:
+            corpus_size = self.corpus_index.size()
+            if not sentences or corpus_size == 0:
+                return CorpusCheckResult(contradictions=[], candidate_count=0, corpus_size=corpus_size)
+
+            classification = self.classifier_agent.classify_sentences(sentences)
+            groups = [
+                (category, self._retrieve(category, exclude_document))
+                for category in classification.categories
+            ]
+            groups = [(category, candidates) for category, candidates in groups if candidates]
+            candidate_count = sum(len(candidates) for _, candidates in groups)
+            span.set_attribute("candidate_count", candidate_count)
+
+            contradictions: List[CorpusContradiction] = []
+            detected = map_parallel(lambda group: self._detect(*group), groups, self.max_workers)
+            for group_contradictions in detected:
+                contradictions.extend(group_contradictions)
+            span.set_attribute("contradiction_count", len(contradictions))
+
+        return CorpusCheckResult(contradictions, candidate_count, corpus_size)
+
+    def _retrieve(self, category: Category, exclude_document: Optional[str]) -> List[CorpusSentence]:
+        """
+        Retrieves the corpus candidates of the sentences of a category, best ranked first.
+        """
+        with self.tracer.span("corpus.retrieve", category_size=len(category.indices)):
+            per_sentence = self.corpus_index.search_many(
+                category.phrases, self.candidates_per_sentence,
+                category=category.name, exclude_document=exclude_document
+            )
+
+        # Interleave the rankings so that every sentence gets its best candidates in first
+        candidates: Dict[int, CorpusSentence] = {}
+        for rank in range(self.candidates_per_sentence):
+            for ranking in per_sentence:
+                if rank < len(ranking):
+                    candidates.setdefault(ranking[rank].sentence_id, ranking[rank])
+        return list(candidates.values())[:self.max_candidates_per_category]
+
+    def _detect(self, category: Category, candidates: List[CorpusSentence]) -> List[CorpusContradiction]:
+        """
+        Detects the contradictions between the sentences of a category and their corpus candidates.
+        """
+        new_count = len(category.indices)
+        table = SentenceTable.of(category.phrases + [candidate.text for candidate in candidates])
+        group = Category(category.name, tuple(range(len(table))), table)
+
+        result = self.detector_agent.detect_contradiction(ClassificationResult(categories=[group]))
+
+        contradictions: List[CorpusContradiction] = []
+        for category_result in result.categories:
+            for contradiction in category_result.contradictions:
+                new_indices, matches = self._split(contradiction.indices, category.indices, candidates, new_count)
+                if new_indices and matches:
+                    contradictions.append(CorpusContradiction(
+                        new_indices, matches, contradiction.severity, contradiction.comment
+                    ))
+        return contradictions
+
+    @staticmethod
+    def _split(
+            indices: Tuple[int, ...],
+            category_indices: Tuple[int, ...],
+            candidates: List[CorpusSentence],
+            new_count: int
+    ) -> Tuple[Tuple[int, ...], Tuple[CorpusSentence, ...]]:
+        """
+        Splits group indices into document sentence indices and corpus sentences.
+        """
+        new_indices = tuple(category_indices[i] for i in indices if i < new_count)
+        matches = tuple(candidates[i - new_count] for i in indices if new_count <= i < new_count + len(candidates))
+        return new_indices, matches
@@ -0,0 +1,261 @@
+"""
+Module: live_analysis_service
+Description:
+    This module defines the LiveAnalysisSession, a domain service holding the analysis state of
+    a document being edited. Each batch of sentence edits is applied incrementally: only the
+    edited sentences are classified, into the existing categories, and only the categories whose
+    sentences changed are sent to the contradiction detector again.
+
+    A batch is computed on a copy of the state and committed at the end, unless it was cancelled
+    in between, so a batch made stale by newer edits can be abandoned at any stage and its edits
+    applied again together with the newer ones.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.live_analysis import LiveCategory, LiveContradiction, LiveUpdate
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
+from src.domain.ports.input.detector_agent_port import DetectorAgentPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.services.parallel import map_parallel
+from src.domain.services.text_analysis_service import UNNAMED_CATEGORY
+
+
+class CancellationToken:
+    """
+    Cancellation state of one batch of a live session, shared by the caller and the worker applying it.
+
+    Attributes:
+        cancelled (bool): Set by LiveAnalysisSession.cancel(); the batch stops at its next stage.
+        committed (bool): Set when the batch has been applied to the session.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.committed = False
+
+
+class LiveAnalysisSession:
+    """
+    Incrementally maintained analysis of the sentences of one client, identified by client ids.
+
+    Batches must be applied one at a time: a batch is cancelled before the next one is started.
+    """
+
+    def __init__(
+            self,
+            classifier_agent: ClassifierAgentPort,
+            detector_agent: DetectorAgentPort,
+            tracer: Optional[TracerPort] = None,
+            max_workers: int = 4
+    ):
+        """
+        Initializes an empty session.
+
+        Args:
+            classifier_agent (ClassifierAgentPort): Agent assigning edited sentences to categories.
+            detector_agent (DetectorAgentPort): Agent detecting the contradictions of changed categories.
+            tracer (Optional[TracerPort]): Tracer used to record a span per batch. Defaults to no tracing.
+            max_workers (int): Categories detected in parallel.
+        """
+        self.classifier_agent = classifier_agent
+        self.detector_agent = detector_agent
+        self.tracer = tracer or NullTracer()
+        self.max_workers = max_workers
+
+        self.version = 0
+        self._texts: Dict[str, str] = {}
+        self._category_of: Dict[str, str] = {}
+        self._categories: Dict[str, LiveCategory] = {}
+        self._lock = threading.Lock()
+
+    def categories(self) -> List[LiveCategory]:
+        """
+        Returns the current categories, in order of creation.
+
+        Returns:
+            List[LiveCategory]: The categories with their contradictions.
+        """
+        with self._lock:
+            return list(self._categories.values())
+
+    def texts_after(self, edits: Dict[str, Optional[str]]) -> List[str]:
+        """
+        Returns the sentences the session would hold once the edits are applied.
+
+        Args:
+            edits (Dict[str, Optional[str]]): New text of each edited sentence id; None or "" removes it.
+
+        Returns:
+            List[str]: The sentences.
+        """
+        with self._lock:
+            texts = dict(self._texts)
+        for sentence_id, text in edits.items():
+            if text:
+                texts[sentence_id] = text
+            else:
+                texts.pop(sentence_id, None)
+        return list(texts.values())
+
+    def cancel(self, token: CancellationToken) -> bool:
+        """
+        Cancels a batch, unless it has already been applied.
+
+        Args:
+            token (CancellationToken): Token of the batch.
+
+        Returns:
+            bool: True if the batch will not be applied (its edits must be submitted again),
+                  False if it was already applied.
+        """
+        with self._lock:
+            if token.committed:
+                return False
+            token.cancelled = True
+            return True
+
+    def apply(self, edits: Dict[str, Optional[str]], token: Optional[CancellationToken] = None) -> Optional[LiveUpdate]:
+        """
+        Applies a batch of edits: classifies the new and changed sentences into the existing
+        categories, then detects the contradictions of the categories that gained or lost sentences.
+
+        Args:
+            edits (Dict[str, Optional[str]]): New text of each edited sentence id; None or "" removes it.
+            token (Optional[CancellationToken]): Token through which the batch can be cancelled.
+
+        Returns:
+            Optional[LiveUpdate]: The changed and removed categories, or None if the batch was
+                                  cancelled or changed nothing.
+        """
+        token = token or CancellationToken()
+        with self._lock:
+            texts = dict(self._texts)
+            category_of = dict(self._category_of)
+            members = {name: list(category.sentence_ids) for name, category in self._categories.items()}
+
+        changed = {sentence_id: text for sentence_id, text in edits.items() if text and texts.get(sentence_id) != text}
+        removed = [sentence_id for sentence_id, text in edits.items() if not text and sentence_id in texts]
+        if not changed and not removed:
+            return None
+
+        # Names of the categories whose sentences change, in order of first change
+        dirty: Dict[str, None] = {}
+        for sentence_id in [*changed, *removed]:
+            name = category_of.pop(sentence_id, None)
+            if name is not None:
+                members[name].remove(sentence_id)
+                dirty[name] = None
+        for sentence_id in removed:
+            del texts[sentence_id]
+        texts.update(changed)
+
+        with self.tracer.span("live.apply", edited_count=len(changed), removed_count=len(removed)) as span:
+            if changed:
+                if token.cancelled:
+                    return None
+                self._assign(list(changed), texts, members, category_of, dirty)
+
+            detected = map_parallel(
+                lambda name: self._detect(name, members[name], texts, token),
+                [name for name in dirty if members.get(name)],
+                self.max_workers
+            )
+            if token.cancelled or any(category is None for category in detected):
+                return None
+
+            with self._lock:
+                if token.cancelled:
+                    return None
+                token.committed = True
+                self._texts = texts
+                self._category_of = category_of
+                self._categories = LiveAnalysisSession._merge(self._categories, detected, dirty)
+                self.version += 1
+                update = LiveUpdate(
+                    version=self.version,
+                    categories=detected,
+                    removed_categories=[name for name in dirty if not members.get(name)]
+                )
+            span.set_attribute("category_count", len(detected))
+
+        return update
+
+    def _assign(
+            self,
+            sentence_ids: List[str],
+            texts: Dict[str, str],
+            members: Dict[str, List[str]],
+            category_of: Dict[str, str],
+            dirty: Dict[str, None]
+    ) -> None:
+        """
+        Classifies sentences into the existing categories, updating the copies of the state in place.
+        Sentences left out by the classifier go to the unnamed category.
+        """
+        names = [name for name, category_members in members.items() if category_members]
+        classification = self.classifier_agent.assign_sentences([texts[i] for i in sentence_ids], names)
+
+        for category in classification.categories:
+            for index in category.indices:
+                sentence_id = sentence_ids[index]
+                if sentence_id not in category_of:
+                    category_of[sentence_id] = category.name
+                    members.setdefault(category.name, []).append(sentence_id)
+                    dirty[category.name] = None
+        for sentence_id in sentence_ids:
+            if sentence_id not in category_of:
+                category_of[sentence_id] = UNNAMED_CATEGORY
+                members.setdefault(UNNAMED_CATEGORY, []).append(sentence_id)
+                dirty[UNNAMED_CATEGORY] = None
+
+    def _detect(
+            self,
+            name: str,
+            sentence_ids: List[str],
+            texts: Dict[str, str],
+            token: CancellationToken
+    ) -> Optional[LiveCategory]:
+        """
+        Detects the contradictions of one category, unless the batch has been cancelled.
+        """
+        if token.cancelled:
+            return None
+
+        table = SentenceTable.of([texts[sentence_id] for sentence_id in sentence_ids])
+        category = Category(name, tuple(range(len(sentence_ids))), table)
+        result = self.detector_agent.detect_contradiction(ClassificationResult(categories=[category]))
+
+        return LiveCategory(
+            name=name,
+            sentence_ids=tuple(sentence_ids),
+            contradictions=tuple(
+                LiveContradiction(tuple(sentence_ids[i] for i in contradiction.indices),
+                                  contradiction.severity, contradiction.comment)
+                for category_result in result.categories
+                for contradiction in category_result.contradictions
+            )
+        )
+
+    @staticmethod
+    def _merge(
+            categories: Dict[str, LiveCategory],
+            detected: List[LiveCategory],
+            dirty: Dict[str, None]
+    ) -> Dict[str, LiveCategory]:
+        """
+        Returns the categories with the changed ones replaced in place, the emptied ones
+        removed and the new ones appended.
+        """
+        updated = {category.name: category for category in detected}
+        merged = {
+            name: updated.get(name, category)
+            for name, category in categories.items()
+            if name not in dirty or name in updated
+        }
+        for name, category in updated.items():
+            merged.setdefault(name, category)
+        return merged
@@ -0,0 +1,36 @@
+"""
+Module: parallel
+Description:
+    Thread pool helper shared by the analysis services.
+    Work items run in a copy of the caller's context, so request-scoped state such as the
+    current trace and usage report follows the LLM calls made on the worker threads.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_parallel(func: Callable[[T], R], items: List[T], max_workers: int) -> List[R]:
+    """
+    Applies a function to every item on a thread pool, keeping the input order.
+
+    Each task runs in a copy of the caller's context. A single item runs on the calling thread.
+
+    Args:
+        func (Callable[[T], R]): Function to apply.
+        items (List[T]): Items to process.
+        max_workers (int): Items processed at the same time.
+
+    Returns:
+        List[R]: Results in the order of the items.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
@@ -0,0 +1,338 @@
+"""
+Module: strategy_planner
+Description:
+    This module defines the StrategyPlanner, a domain service that estimates the LLM calls,
+    tokens, latency and cost of each execution strategy for a given input and picks the
+    fastest strategy that fits the request's cost budget.
+    It includes:
+        - CostModel: tunable token, latency and price assumptions.
+        - StrategyPlanner: builds an ExecutionPlan for a list of sentences.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.models.execution_plan import ExecutionPlan, ExecutionStrategy, StrategyEstimate
+
+
+@dataclass
+class CostModel:
+    """
+    Assumptions used to estimate the cost of a strategy.
+
+    Attributes:
+        chars_per_token (float): Average characters per token for the input language.
+        classification_prompt_tokens (int): Fixed prompt overhead of a classification call.
+        detection_prompt_tokens (int): Fixed prompt overhead of a detection call.
+        fused_prompt_tokens (int): Fixed prompt overhead of a fused call.
+        classification_output_tokens_per_sentence (float): Output tokens per classified sentence.
+        classification_output_tokens_per_category (float): Output tokens per category name.
+        detection_output_tokens_per_sentence (float): Output tokens per sentence checked for contradictions.
+        category_factor (float): Expected categories ~ category_factor * sqrt(sentences).
+        largest_category_skew (float): Size of the largest category relative to the average one.
+        call_latency_ms (float): Fixed latency of one LLM call.
+        output_token_ms (float): Generation time per output token.
+        input_token_ms (float): Processing time per input token.
+        prompt_price_per_1k (float): Price of 1,000 prompt tokens.
+        completion_price_per_1k (float): Price of 1,000 completion tokens.
+        stage_prices (Dict[str, Tuple[float, float]]): Prompt and completion prices per 1,000 tokens of the
+            stages ("classification", "detection", "fused") served by a deployment priced differently;
+            other stages use the prices above.
+    """
+    chars_per_token: float = 3.0
+    classification_prompt_tokens: int = 450
+    detection_prompt_tokens: int = 450
+    fused_prompt_tokens: int = 650
+    classification_output_tokens_per_sentence: float = 3.0
+    classification_output_tokens_per_category: float = 15.0
+    detection_output_tokens_per_sentence: float = 12.0
+    category_factor: float = 1.0
+    largest_category_skew: float = 2.0
+    call_latency_ms: float = 400.0
+    output_token_ms: float = 20.0
+    input_token_ms: float = 0.05
+    prompt_price_per_1k: float = 0.0
+    completion_price_per_1k: float = 0.0
+    stage_prices: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    def call_latency(self, prompt_tokens: float, completion_tokens: float) -> float:
+        """
+        Predicts the latency of one LLM call.
+
+        Args:
+            prompt_tokens (float): Input tokens of the call.
+            completion_tokens (float): Output tokens of the call.
+
+        Returns:
+            float: Predicted latency in milliseconds.
+        """
+        return self.call_latency_ms + prompt_tokens * self.input_token_ms + completion_tokens * self.output_token_ms
+
+    def cost(self, prompt_tokens: float, completion_tokens: float, stage: str = "") -> float:
+        """
+        Predicts the cost of a number of tokens.
+
+        Args:
+            prompt_tokens (float): Input tokens.
+            completion_tokens (float): Output tokens.
+            stage (str): Stage the tokens are spent in, selecting its prices. Defaults to the default prices.
+
+        Returns:
+            float: Predicted cost.
+        """
+        prompt_price, completion_price = self.stage_prices.get(
+            stage, (self.prompt_price_per_1k, self.completion_price_per_1k)
+        )
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1000
+
+
+class StrategyPlanner:
+    """
+    Domain service choosing the execution strategy of an analysis.
+
+    Every strategy is estimated from the input size; the fastest feasible strategy whose
+    estimated cost fits the budget is chosen. LOCAL_ONLY is only chosen when no LLM
+    strategy fits the budget, since it does not classify nor detect anything.
+    """
+
+    def __init__(
+            self,
+            cost_model: Optional[CostModel] = None,
+            fused_max_sentences: int = 0,
+            classification_chunk_size: int = 150,
+            detection_block_size: int = 40,
+            max_workers: int = 4,
+            pipelined_detection: bool = False
+    ):
+        """
+        Initializes the planner.
+
+        Args:
+            cost_model (Optional[CostModel]): Estimation assumptions. Defaults to CostModel().
+            fused_max_sentences (int): Largest input handled by the fused strategy (0 disables it).
+            classification_chunk_size (int): Sentences per chunk in chunked classification.
+            detection_block_size (int): Sentences per block in block-wise detection.
+            max_workers (int): LLM calls run in parallel by the parallel strategies.
+            pipelined_detection (bool): Whether the two-stage strategy streams the classification and
+                                        detects each category as soon as it is classified.
+        """
+        self.cost_model = cost_model or CostModel()
+        self.fused_max_sentences = fused_max_sentences
+        self.classification_chunk_size = max(classification_chunk_size, 1)
+        self.detection_block_size = max(detection_block_size, 2)
+        self.max_workers = max(max_workers, 1)
+        self.pipelined_detection = pipelined_detection
+
+    def plan(self, sentences: List[str], cost_budget: Optional[float] = None) -> ExecutionPlan:
+        """
+        Estimates every strategy and chooses one.
+
+        Args:
+            sentences (List[str]): Sentences to analyze.
+            cost_budget (Optional[float]): Maximum estimated cost of the request. None or 0 means unlimited.
+
+        Returns:
+            ExecutionPlan: The chosen strategy with every candidate estimate.
+        """
+        if not cost_budget:
+            cost_budget = None
+
+        n = len(sentences)
+        sentence_tokens = sum(len(s) for s in sentences) / self.cost_model.chars_per_token + 3 * n
+        category_sizes = self._expected_category_sizes(n)
+
+        estimates = [
+            self._estimate_fused(n, sentence_tokens),
+            self._estimate_two_stage(n, sentence_tokens, category_sizes),
+            self._estimate_chunked_classification(n, sentence_tokens, category_sizes),
+            self._estimate_blockwise_detection(n, sentence_tokens, category_sizes),
+            StrategyEstimate(ExecutionStrategy.LOCAL_ONLY, 0, 0, 0, 0.0, 0.0),
+        ]
+
+        llm_candidates = [
+            e for e in estimates
+            if e.feasible and e.strategy != ExecutionStrategy.LOCAL_ONLY
+        ]
+        within_budget = [
+            e for e in llm_candidates
+            if cost_budget is None or e.estimated_cost <= cost_budget
+        ]
+        for estimate in llm_candidates:
+            if estimate not in within_budget:
+                estimate.reason = "over cost budget"
+
+        if within_budget:
+            chosen = min(within_budget, key=lambda e: (e.predicted_latency_ms, e.estimated_cost))
+        else:
+            chosen = estimates[-1]
+
+        return ExecutionPlan(strategy=chosen.strategy, estimates=estimates, cost_budget=cost_budget)
+
+    def _expected_category_sizes(self, n: int) -> List[int]:
+        """
+        Predicts the category sizes of an input, largest first.
+
+        Args:
+            n (int): Number of sentences.
+
+        Returns:
+            List[int]: Expected sizes of the categories.
+        """
+        if n == 0:
+            return []
+        categories = max(1, min(n, round(self.cost_model.category_factor * math.sqrt(n))))
+        largest = min(n, math.ceil(self.cost_model.largest_category_skew * n / categories))
+        remaining = n - largest
+        others = categories - 1
+        sizes = [largest]
+        for i in range(others):
+            size = remaining // others + (1 if i < remaining % others else 0)
+            if size:
+                sizes.append(size)
+        return sizes
+
+    def _classification(self, n: int, sentence_tokens: float, categories: int):
+        """
+        Predicts the tokens, latency and cost of classifying n sentences in one call.
+
+        Returns:
+            tuple: (prompt_tokens, completion_tokens, latency_ms, cost).
+        """
+        model = self.cost_model
+        prompt = model.classification_prompt_tokens + sentence_tokens
+        completion = (
+            n * model.classification_output_tokens_per_sentence
+            + categories * model.classification_output_tokens_per_category
+        )
+        latency = model.call_latency(prompt, completion)
+        return prompt, completion, latency, model.cost(prompt, completion, "classification")
+
+    def _detection(self, size: int, tokens_per_sentence: float):
+        """
+        Predicts the tokens, latency and cost of a detection call on a group of sentences.
+
+        Returns:
+            tuple: (prompt_tokens, completion_tokens, latency_ms, cost).
+        """
+        model = self.cost_model
+        prompt = model.detection_prompt_tokens + size * tokens_per_sentence
+        completion = size * model.detection_output_tokens_per_sentence
+        latency = model.call_latency(prompt, completion)
+        return prompt, completion, latency, model.cost(prompt, completion, "detection")
+
+    def _waves(self, calls: int) -> int:
+        """
+        Number of sequential rounds needed to run calls with max_workers in parallel.
+        """
+        return math.ceil(calls / self.max_workers) if calls else 0
+
+    def _estimate(
+            self, strategy, calls, prompt, completion, latency, cost, feasible=True, reason=""
+    ) -> StrategyEstimate:
+        """
+        Builds a StrategyEstimate with rounded figures.
+        """
+        return StrategyEstimate(
+            strategy=strategy,
+            llm_calls=calls,
+            prompt_tokens=round(prompt),
+            completion_tokens=round(completion),
+            predicted_latency_ms=round(latency, 1),
+            estimated_cost=round(cost, 6),
+            feasible=feasible,
+            reason=reason,
+        )
+
+    def _estimate_fused(self, n: int, sentence_tokens: float) -> StrategyEstimate:
+        """
+        Estimates the fused single-call strategy.
+        """
+        model = self.cost_model
+        prompt = model.fused_prompt_tokens + sentence_tokens
+        completion = n * (model.classification_output_tokens_per_sentence + model.detection_output_tokens_per_sentence)
+        feasible = 0 < n <= self.fused_max_sentences
+        reason = "" if feasible else f"input larger than {self.fused_max_sentences} sentences or fused mode disabled"
+        return self._estimate(
+            ExecutionStrategy.FUSED, 1, prompt, completion,
+            model.call_latency(prompt, completion), model.cost(prompt, completion, "fused"), feasible, reason
+        )
+
+    def _estimate_two_stage(self, n: int, sentence_tokens: float, sizes: List[int]) -> StrategyEstimate:
+        """
+        Estimates classification followed by detection per category.
+
+        Without pipelining, detections run one after the other once classification is done.
+        With pipelining, detections run on parallel workers while the next categories are still
+        being generated, so only the longest detection is assumed to add to the classification latency.
+        """
+        tokens_per_sentence = sentence_tokens / n if n else 0
+        prompt, completion, latency, cost = self._classification(n, sentence_tokens, len(sizes))
+        calls = 1
+        detection_latencies = []
+        for size in sizes:
+            if size < 2:
+                continue
+            p, c, l, k = self._detection(size, tokens_per_sentence)
+            prompt, completion, cost, calls = prompt + p, completion + c, cost + k, calls + 1
+            detection_latencies.append(l)
+        if detection_latencies:
+            latency += max(detection_latencies) if self.pipelined_detection else sum(detection_latencies)
+        return self._estimate(ExecutionStrategy.TWO_STAGE, calls, prompt, completion, latency, cost, n > 0)
+
+    def _estimate_chunked_classification(self, n: int, sentence_tokens: float, sizes: List[int]) -> StrategyEstimate:
+        """
+        Estimates parallel classification of chunks followed by sequential detection per category.
+        """
+        chunk_size = self.classification_chunk_size
+        chunks = math.ceil(n / chunk_size) if n else 0
+        tokens_per_sentence = sentence_tokens / n if n else 0
+        chunk_categories = max(1, round(self.cost_model.category_factor * math.sqrt(min(n, chunk_size))))
+
+        p, c, chunk_latency, k = self._classification(min(n, chunk_size), tokens_per_sentence * min(n, chunk_size),
+                                                      chunk_categories)
+        prompt, completion, cost = p * chunks, c * chunks, k * chunks
+        latency = chunk_latency * self._waves(chunks)
+        calls = chunks
+        for size in sizes:
+            if size < 2:
+                continue
+            p, c, l, k = self._detection(size, tokens_per_sentence)
+            prompt, completion, latency, cost, calls = prompt + p, completion + c, latency + l, cost + k, calls + 1
+
+        feasible = n > chunk_size
+        reason = "" if feasible else f"input fits in one classification chunk of {chunk_size} sentences"
+        return self._estimate(
+            ExecutionStrategy.CHUNKED_CLASSIFICATION, calls, prompt, completion, latency, cost, feasible, reason
+        )
+
+    def _estimate_blockwise_detection(self, n: int, sentence_tokens: float, sizes: List[int]) -> StrategyEstimate:
+        """
+        Estimates classification followed by parallel detection on blocks of the categories.
+        """
+        block_size = self.detection_block_size
+        tokens_per_sentence = sentence_tokens / n if n else 0
+        prompt, completion, latency, cost = self._classification(n, sentence_tokens, len(sizes))
+
+        blocks: List[int] = []
+        for size in sizes:
+            if size < 2:
+                continue
+            full, rest = divmod(size, block_size)
+            blocks.extend([block_size] * full)
+            if rest >= 2:
+                blocks.append(rest)
+
+        block_latencies = []
+        for size in blocks:
+            p, c, l, k = self._detection(size, tokens_per_sentence)
+            prompt, completion, cost = prompt + p, completion + c, cost + k
+            block_latencies.append(l)
+        if block_latencies:
+            latency += max(block_latencies) * self._waves(len(blocks))
+
+        feasible = bool(sizes) and sizes[0] > block_size
+        reason = "" if feasible else f"no category expected above {block_size} sentences"
+        return self._estimate(
+            ExecutionStrategy.BLOCKWISE_DETECTION, 1 + len(blocks), prompt, completion, latency, cost, feasible, reason
+        )
@@ -3,14 +3,33 @@ Module: text_analysis_service
 Description:
     This module defines the TextAnalysisService, a domain service responsible for
     orchestrating the classification of sentences and the detection of logical
-    contradictions between them.
+    contradictions between them. The execution strategy of each analysis is chosen
+    by the StrategyPlanner. Whole analyses can be served from a result cache. The chunks
+    classified in parallel and the blocks checked for contradictions are formed by a
+    sentence grouper, positional by default.
 """
 
-from typing import List
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
-from src.domain.models.contradiction_result import AnalysisContradictionResult
+from src.domain.models.classification_result import ClassificationResult, Category
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.execution_plan import ExecutionStrategy
+from src.domain.models.sentence_table import SentenceTable
 from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
 from src.domain.ports.input.detector_agent_port import DetectorAgentPort
+from src.domain.ports.input.fused_analyzer_agent_port import FusedAnalyzerAgentPort
+from src.domain.ports.input.result_cache_port import NullResultCache, ResultCachePort
+from src.domain.ports.input.sentence_grouper_port import PositionalSentenceGrouper, SentenceGrouperPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.services.parallel import map_parallel
+from src.domain.services.strategy_planner import StrategyPlanner
+
+UNNAMED_CATEGORY = "بدون اسم"
 
 
 class TextAnalysisService:
@@ -18,38 +37,224 @@ class TextAnalysisService:
     Domain service that orchestrates sentence classification and contradiction detection.
 
     This service uses a classifier agent to categorize sentences and a detector agent
-    to identify contradictions among the classified sentences.
+    to identify contradictions among the classified sentences. Small inputs can instead be
+    analyzed by a fused agent that does both in a single LLM call. A StrategyPlanner picks,
+    for every input, the fastest execution strategy within the request's cost budget.
     """
 
-    def __init__(self, classifier_agent: ClassifierAgentPort, detector_agent: DetectorAgentPort):
+    def __init__(
+            self,
+            classifier_agent: ClassifierAgentPort,
+            detector_agent: DetectorAgentPort,
+            tracer: Optional[TracerPort] = None,
+            fused_agent: Optional[FusedAnalyzerAgentPort] = None,
+            fused_max_sentences: int = 0,
+            planner: Optional[StrategyPlanner] = None,
+            cache: Optional[ResultCachePort] = None,
+            grouper: Optional[SentenceGrouperPort] = None
+    ):
         """
         Initializes the TextAnalysisService with the required agents.
 
         Args:
             classifier_agent (ClassifierAgentPort): Agent responsible for sentence classification.
             detector_agent (DetectorAgentPort): Agent responsible for contradiction detection.
+            tracer (Optional[TracerPort]): Tracer used to record the analysis stages. Defaults to no tracing.
+            fused_agent (Optional[FusedAnalyzerAgentPort]): Agent classifying and detecting in one call.
+            fused_max_sentences (int): Inputs with at most this many sentences may use the fused agent.
+                                       0 disables the fused mode, as does a missing fused agent.
+                                       Ignored when a planner is given.
+            planner (Optional[StrategyPlanner]): Planner choosing the execution strategy.
+                                                 Defaults to a planner with the default cost model.
+                                                 Must disable the fused mode when there is no fused agent.
+            cache (Optional[ResultCachePort]): Cache of whole analyses, keyed by sentences and strategy.
+                                               Defaults to no caching.
+            grouper (Optional[SentenceGrouperPort]): Forms the classification chunks and detection blocks.
+                                                     Defaults to runs of consecutive sentences.
         """
         self.classifier_agent = classifier_agent
         self.detector_agent = detector_agent
+        self.tracer = tracer or NullTracer()
+        self.fused_agent = fused_agent
+        if planner is not None and planner.fused_max_sentences > 0 and fused_agent is None:
+            raise ValueError("The planner enables the fused mode but no fused agent is given")
+        self.planner = planner or StrategyPlanner(
+            fused_max_sentences=fused_max_sentences if fused_agent is not None else 0
+        )
+        self.cache = cache or NullResultCache()
+        self.grouper = grouper or PositionalSentenceGrouper()
 
-    def analyze_text(self, sentences: List[str]) -> AnalysisContradictionResult:
+    def analyze_text(self, sentences: List[str], cost_budget: Optional[float] = None) -> AnalysisContradictionResult:
         """
         Analyzes a list of sentences by performing classification and contradiction detection.
 
         The analysis is performed in two steps:
             1. Classification: Sentences are categorized by the classifier agent.
             2. Contradiction Detection: Contradictions are identified among the classified sentences.
+        How these steps are executed (fused, two-stage, chunked classification, block-wise
+        detection or local-only) is decided by the planner.
 
         Args:
             sentences (List[str]): List of sentences to analyze.
+            cost_budget (Optional[float]): Maximum estimated LLM cost of the analysis. None means unlimited.
 
         Returns:
-            AnalysisContradictionResult: Object containing classification results and
-                                         a list of detected contradictions.
+            AnalysisContradictionResult: Object containing classification results,
+                                         a list of detected contradictions and the execution plan.
+                                         Sentence indices are positions in the given list.
+        """
+        plan = self.planner.plan(sentences, cost_budget=cost_budget)
+        strategies: Dict[ExecutionStrategy, Callable[[List[str]], AnalysisContradictionResult]] = {
+            ExecutionStrategy.FUSED: self._analyze_fused,
+            ExecutionStrategy.TWO_STAGE: self._analyze_two_stage,
+            ExecutionStrategy.CHUNKED_CLASSIFICATION: self._analyze_chunked_classification,
+            ExecutionStrategy.BLOCKWISE_DETECTION: self._analyze_blockwise_detection,
+            ExecutionStrategy.LOCAL_ONLY: self._analyze_local_only,
+        }
+
+        with self.tracer.span("service.analyze_text", sentence_count=len(sentences)) as span:
+            span.set_attribute("strategy", plan.strategy.value)
+            span.set_attribute("predicted_latency_ms", plan.chosen.predicted_latency_ms)
+
+            start = time.perf_counter()
+            contradictions_result = None
+            if plan.strategy != ExecutionStrategy.LOCAL_ONLY:
+                contradictions_result = self.cache.get_analysis(sentences, plan.strategy)
+                span.set_attribute("cache_hit", contradictions_result is not None)
+            if contradictions_result is None:
+                contradictions_result = strategies[plan.strategy](sentences)
+                if plan.strategy != ExecutionStrategy.LOCAL_ONLY:
+                    self.cache.put_analysis(sentences, plan.strategy, contradictions_result)
+            plan.actual_latency_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            span.set_attribute("category_count", len(contradictions_result.categories))
+
+        contradictions_result.plan = plan
+        return contradictions_result
+
+    def _analyze_fused(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies and detects contradictions with a single fused call.
+        """
+        return self.fused_agent.analyze_sentences(sentences)
+
+    def _analyze_two_stage(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies all sentences in one call, then detects contradictions per category.
         """
+        if self.planner.pipelined_detection:
+            return self._analyze_pipelined(sentences)
+
         # Classification
         classification_result = self.classifier_agent.classify_sentences(sentences)
+
         # Contradiction detection
-        contradictions_result = self.detector_agent.detect_contradiction(classification_result)
+        with self.tracer.span("service.detect_contradictions"):
+            return self.detector_agent.detect_contradiction(classification_result)
 
-        return contradictions_result
+    def _analyze_pipelined(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Streams the classification and dispatches the detection of each category to a worker
+        as soon as the category is classified, so classification output and detection overlap.
+
+        Categories keep the order in which the classifier produced them.
+        """
+        with self.tracer.span("service.pipelined_detection") as span:
+            # Detection tasks run in the context of this span, not of the streaming classifier span
+            parent_context = contextvars.copy_context()
+
+            with ThreadPoolExecutor(max_workers=self.planner.max_workers) as executor:
+                futures = [
+                    executor.submit(parent_context.copy().run, self._detect_category, category)
+                    for category in self.classifier_agent.iter_categories(sentences)
+                ]
+                categories = [future.result() for future in futures]
+
+            span.set_attribute("category_count", len(categories))
+
+        return AnalysisContradictionResult(categories=categories)
+
+    def _detect_category(self, category: Category) -> CategoryContradictionResult:
+        """
+        Detects the contradictions of a single category.
+        """
+        result = self.detector_agent.detect_contradiction(ClassificationResult(categories=[category]))
+        if result.categories:
+            return result.categories[0]
+        return CategoryContradictionResult(category.name, category.indices, (), category.table)
+
+    def _analyze_chunked_classification(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies chunks of sentences in parallel, merges categories sharing a name,
+        then detects contradictions per category.
+
+        Chunks are formed by the grouper. Categories are merged by exact name, so a domain
+        named differently in two chunks stays split in two categories.
+        """
+        groups = self.grouper.group(sentences, self.planner.classification_chunk_size)
+        chunks = [[sentences[position] for position in group] for group in groups]
+
+        with self.tracer.span("service.chunked_classification", chunk_count=len(chunks)):
+            chunk_results = map_parallel(self.classifier_agent.classify_sentences, chunks, self.planner.max_workers)
+
+        # Chunk indices are local to each chunk; map them onto one table of the whole input
+        table = SentenceTable.of(sentences)
+        merged: Dict[str, List[int]] = {}
+        for group, chunk_result in zip(groups, chunk_results):
+            for category in chunk_result.categories:
+                merged.setdefault(category.name, []).extend(group[i] for i in category.indices)
+
+        categories = [Category(name, tuple(sorted(indices)), table) for name, indices in merged.items()]
+
+        with self.tracer.span("service.detect_contradictions"):
+            return self.detector_agent.detect_contradiction(ClassificationResult(categories=categories))
+
+    def _analyze_blockwise_detection(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies all sentences in one call, then detects contradictions in parallel on
+        blocks of at most detection_block_size sentences per category, formed by the grouper.
+
+        Contradictions between sentences of different blocks of the same category are not detected.
+        """
+        classification_result = self.classifier_agent.classify_sentences(sentences)
+        block_size = self.planner.detection_block_size
+
+        blocks: List[Category] = []
+        block_owners: List[int] = []
+        for index, category in enumerate(classification_result.categories):
+            for group in self.grouper.group(category.phrases, block_size) or [[]]:
+                block_indices = tuple(category.indices[position] for position in group)
+                blocks.append(Category(category.name, block_indices, category.table))
+                block_owners.append(index)
+
+        def detect_block(block: Category) -> AnalysisContradictionResult:
+            return self.detector_agent.detect_contradiction(ClassificationResult(categories=[block]))
+
+        with self.tracer.span("service.blockwise_detection", block_count=len(blocks)):
+            block_results = map_parallel(detect_block, blocks, self.planner.max_workers)
+
+        contradictions: List[List[Contradiction]] = [[] for _ in classification_result.categories]
+        for owner, block_result in zip(block_owners, block_results):
+            for category_result in block_result.categories:
+                contradictions[owner].extend(category_result.contradictions)
+
+        return AnalysisContradictionResult(categories=[
+            CategoryContradictionResult(category.name, category.indices, tuple(category_contradictions), category.table)
+            for category, category_contradictions in zip(classification_result.categories, contradictions)
+        ])
+
+    @staticmethod
+    def _analyze_local_only(sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Returns every sentence in one unnamed category without calling any LLM.
+        """
+        if not sentences:
+            return AnalysisContradictionResult(categories=[])
+        return AnalysisContradictionResult(categories=[
+            CategoryContradictionResult(
+                category_name=UNNAMED_CATEGORY,
+                indices=tuple(range(len(sentences))),
+                contradictions=(),
+                table=SentenceTable.of(sentences)
+            )
+        ])
@@ -5,19 +5,59 @@ Description:
     Provides:
         - A list of sentences involved in each contradiction
         - A brief explanation for each contradiction
+    In cascade mode, each category is first screened by a fast deployment reporting its confidence;
+    only low-confidence or severe screenings are escalated to the detector's deployment.
 """
 
-from typing import List
-from openai import AzureOpenAI
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import List, Optional, Type, TypeVar
+from openai import NOT_GIVEN, AzureOpenAI
 from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 
-from src.domain.models.classification_result import ClassificationResult
-from src.domain.models.contradiction_llm_response import ContradictionLLMResponse
+from src.domain.models.classification_result import ClassificationResult, Category
+from src.domain.models.contradiction_llm_response import ContradictionLLMResponse, ScreeningLLMResponse
 from src.domain.models.contradiction_result import AnalysisContradictionResult, Contradiction, CategoryContradictionResult
 from src.domain.ports.input.detector_agent_port import DetectorAgentPort
-from src.insfrastructure.config.app_settings import AppSettings
+from src.domain.ports.input.llm_scheduler_port import LlmSchedulerPort, NullLlmScheduler
+from src.domain.ports.input.tracer_port import NullTracer, SpanPort, TracerPort
+from src.domain.ports.input.usage_tracker_port import NullUsageTracker, UsageTrackerPort
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.agents.llm_recorder import LlmRecorder
+from src.insfrastructure.config.app_settings import AgentSettings, AppSettings, CascadeSettings
+from src.insfrastructure.observability.usage_tracker import usage_from_completion
 from src.insfrastructure.prompts.prompt_loader import PromptyLoader
 
+T = TypeVar("T")
+
+# Severity of the contradictions escalated when CascadeSettings.escalate_severe is set
+SEVERE = "حاد"
+
+
+@dataclass
+class CascadeStats:
+    """
+    Counters of the detection cascade.
+
+    Attributes:
+        screened (int): Categories screened by the fast deployment.
+        escalated (int): Screened categories sent to the detector's deployment.
+        low_confidence (int): Escalations caused by a confidence below the threshold.
+        severe (int): Escalations caused by a severe contradiction.
+    """
+    screened: int = 0
+    escalated: int = 0
+    low_confidence: int = 0
+    severe: int = 0
+
+    @property
+    def escalation_rate(self) -> float:
+        """
+        Share of the screened categories that were escalated.
+        """
+        return self.escalated / self.screened if self.screened else 0.0
+
 
 class ContradictionDetector(DetectorAgentPort):
     """
@@ -25,25 +65,75 @@ class ContradictionDetector(DetectorAgentPort):
     and detecting contradictions between them.
     """
 
-    def __init__(self, azure_settings: AppSettings, prompt_provider: PromptyLoader):
+    def __init__(
+            self,
+            azure_settings: AppSettings,
+            prompt_provider: PromptyLoader,
+            tracer: Optional[TracerPort] = None,
+            usage_tracker: Optional[UsageTrackerPort] = None,
+            scheduler: Optional[LlmSchedulerPort] = None,
+            router: Optional[DeploymentRouter] = None,
+            agent_settings: Optional[AgentSettings] = None,
+            cascade: Optional[CascadeSettings] = None,
+            cascade_router: Optional[DeploymentRouter] = None,
+            recorder: Optional[LlmRecorder] = None
+    ):
         """
         Initializes the contradiction detector agent.
 
         Args:
             azure_settings (AppSettings): Application configuration.
             prompt_provider (PromptyLoader): Provider for system and user prompts.
+            tracer (Optional[TracerPort]): Tracer used to record a span per category. Defaults to no tracing.
+            usage_tracker (Optional[UsageTrackerPort]): Tracker receiving the token usage of each LLM call.
+            scheduler (Optional[LlmSchedulerPort]): Scheduler granting a slot to each LLM call. Defaults to no limit.
+            router (Optional[DeploymentRouter]): Router balancing the LLM calls across deployments.
+                                                 Defaults to a client of the single configured deployment.
+            agent_settings (Optional[AgentSettings]): Deployment, timeout, max tokens and concurrency of the
+                                                      agent's calls. Defaults to the configured deployment,
+                                                      1024 max tokens and no timeout or concurrency limit.
+            cascade (Optional[CascadeSettings]): Enables the cascade: categories are screened by the cascade
+                                                 deployment first. Defaults to no cascade.
+            cascade_router (Optional[DeploymentRouter]): Router of the cascade deployment. Defaults to the
+                                                         detector's client.
+            recorder (Optional[LlmRecorder]): Records the LLM calls, or replays recorded calls instead
+                                              of calling the LLM. Defaults to live calls.
         """
         self.endpoint = azure_settings.endpoint
         self.api_key = azure_settings.api_key
         self.api_version = azure_settings.api_version
-        self.model = azure_settings.model
 
-        self.client = AzureOpenAI(
-            api_key=self.api_key,
-            azure_endpoint=self.endpoint,
-            api_version=self.api_version
+        agent_settings = agent_settings or AgentSettings(deployment=azure_settings.model, max_tokens=1024)
+        self.model = agent_settings.deployment
+        self.max_tokens = agent_settings.max_tokens
+        self.timeout = agent_settings.timeout_seconds or NOT_GIVEN
+        # Limits this agent's concurrent calls before they compete for a scheduler slot
+        self.call_limiter = (
+            threading.BoundedSemaphore(agent_settings.max_concurrency)
+            if agent_settings.max_concurrency else nullcontext()
         )
+
+        if router is not None:
+            self.client = router.client
+        else:
+            self.client = AzureOpenAI(
+                api_key=self.api_key,
+                azure_endpoint=self.endpoint,
+                api_version=self.api_version
+            )
+        if recorder is not None:
+            self.client = recorder.wrap(self.client)
         self.prompt_provider = prompt_provider
+        self.tracer = tracer or NullTracer()
+        self.usage_tracker = usage_tracker or NullUsageTracker()
+        self.scheduler = scheduler or NullLlmScheduler()
+
+        self.cascade = cascade
+        self.cascade_client = self.client
+        if cascade_router is not None:
+            self.cascade_client = recorder.wrap(cascade_router.client) if recorder else cascade_router.client
+        self.cascade_stats = CascadeStats()
+        self._stats_lock = threading.Lock()
 
     def detect_contradiction(
             self,
@@ -62,21 +152,31 @@ class ContradictionDetector(DetectorAgentPort):
 
         for category in classification_result.categories:
             # Skip categories with fewer than 2 sentences
-            if len(category.phrases) < 2:
+            if len(category.indices) < 2:
                 all_results.append(
                     CategoryContradictionResult(
                         category_name=category.name,
-                        statements=category.phrases,
-                        contradictions=[]
+                        indices=category.indices,
+                        contradictions=(),
+                        table=category.table
                     )
                 )
                 continue
 
-            # Get LLM response
-            llm_response = self._detect_contradictions_per_category(category.phrases)
+            with self.tracer.span(
+                    "detector.detect_category",
+                    category_name=category.name,
+                    category_size=len(category.indices)
+            ) as span:
+                # Get LLM response
+                if self.cascade is not None:
+                    llm_response = self._detect_with_cascade(category.phrases, span)
+                else:
+                    llm_response = self._detect_contradictions_per_category(category.phrases)
 
-            # Map to domain model
-            contradiction_result = ContradictionDetector._map_llm_to_domain(llm_response, category.phrases, category.name)
+                # Map to domain model
+                contradiction_result = ContradictionDetector._map_llm_to_domain(llm_response, category)
+                span.set_attribute("contradiction_count", len(contradiction_result.contradictions))
 
             all_results.append(contradiction_result)
 
@@ -92,67 +192,149 @@ class ContradictionDetector(DetectorAgentPort):
         Returns:
             ContradictionLLMResponse: Parsed LLM response with detected contradictions.
         """
+        messages = self._build_messages("prompt_contradiction", sentences)
+        return self._parse(self.client, self.model, messages, ContradictionLLMResponse, "detection")
+
+    def _detect_with_cascade(self, sentences: List[str], span: SpanPort) -> ContradictionLLMResponse:
+        """
+        Screens the sentences with the cascade deployment, and escalates them to the detector's
+        deployment when the screening is not confident enough or reports a severe contradiction.
+
+        Args:
+            sentences (List[str]): List of sentences in the category.
+            span (SpanPort): Span of the category, receiving the screening confidence and outcome.
+
+        Returns:
+            ContradictionLLMResponse: The screening, or the escalated detection.
+        """
+        messages = self._build_messages("prompt_contradiction_screening", sentences)
+        screening = self._parse(
+            self.cascade_client, self.cascade.deployment, messages, ScreeningLLMResponse, "detection_screening"
+        )
+
+        low_confidence = screening.confidence < self.cascade.confidence_threshold
+        severe = self.cascade.escalate_severe and any(
+            contradiction.severity_level == SEVERE for contradiction in screening.contradictions
+        )
+        with self._stats_lock:
+            self.cascade_stats.screened += 1
+            self.cascade_stats.escalated += low_confidence or severe
+            self.cascade_stats.low_confidence += low_confidence
+            self.cascade_stats.severe += severe
+
+        span.set_attribute("screening_confidence", screening.confidence)
+        if not (low_confidence or severe):
+            span.set_attribute("cascade", "screened")
+            return screening
+
+        span.set_attribute("cascade", "escalated_low_confidence" if low_confidence else "escalated_severe")
+        return self._detect_contradictions_per_category(sentences)
+
+    def _build_messages(self, prompt_name: str, sentences: List[str]) -> list:
+        """
+        Builds the chat messages of a detection prompt.
+
+        Args:
+            prompt_name (str): Name of the prompt template.
+            sentences (List[str]): List of sentences in the category.
+
+        Returns:
+            list: System and user messages.
+        """
         # Number sentences for clarity in prompts
         numbered_sentences = "\n".join(f"{i+1}. {s}" for i, s in enumerate(sentences))
 
         system_prompt = self.prompt_provider.get_system_prompt(
-            prompt_name="prompt_contradiction"
+            prompt_name=prompt_name
         )
         user_prompt = self.prompt_provider.get_user_prompt(
-            prompt_name="prompt_contradiction",
+            prompt_name=prompt_name,
             numbered_sentences=numbered_sentences
         )
 
-        messages = [
+        return [
             ChatCompletionSystemMessageParam(role="system", content=system_prompt),
             ChatCompletionUserMessageParam(role="user", content=user_prompt)
         ]
 
-        completion = self.client.beta.chat.completions.parse(
-            model=self.model,
-            messages=messages,
-            response_format=ContradictionLLMResponse,
-            max_tokens=1024,
-            temperature=0,
-        )
+    def _parse(self, client, model: str, messages: list, response_format: Type[T], stage: str) -> T:
+        """
+        Runs one detection LLM call and parses its structured response.
+
+        Args:
+            client: Client of the deployment (AzureOpenAI or RoutedClient).
+            model (str): Deployment name.
+            messages (list): Chat messages.
+            response_format (Type[T]): Pydantic model of the response.
+            stage (str): Usage stage the call is accounted to.
+
+        Returns:
+            T: The parsed response.
+        """
+        with self.tracer.span("detector.llm_call", model=model) as span:
+            with self.call_limiter, self.scheduler.slot():
+                completion = client.beta.chat.completions.parse(
+                    model=model,
+                    messages=messages,
+                    response_format=response_format,
+                    max_tokens=self.max_tokens,
+                    timeout=self.timeout,
+                    temperature=0,
+                )
+            self._record_usage(span, completion, stage, model)
 
         return completion.choices[0].message.parsed
 
+    def _record_usage(self, span: SpanPort, completion, stage: str = "detection", model: Optional[str] = None) -> None:
+        """
+        Records the token usage reported by the LLM on the span and in the usage tracker.
+
+        Args:
+            span (SpanPort): Span of the LLM call.
+            completion: Completion returned by the Azure OpenAI client.
+            stage (str): Usage stage of the call.
+            model (Optional[str]): Deployment of the call. Defaults to the detector's deployment.
+        """
+        usage = usage_from_completion(completion)
+        span.set_attribute("prompt_tokens", usage.prompt_tokens)
+        span.set_attribute("completion_tokens", usage.completion_tokens)
+        span.set_attribute("cached_tokens", usage.cached_tokens)
+        self.usage_tracker.record(stage, model or self.model, usage)
+
     @staticmethod
     def _map_llm_to_domain(
             llm_response: ContradictionLLMResponse,
-            sentences: List[str],
-            category_name: str
+            category: Category
     ) -> CategoryContradictionResult:
         """
         Maps the LLM contradiction response to the domain model.
 
+        The LLM numbers the sentences of the category from 1; these numbers are
+        translated to indices in the category's sentence table. Out-of-range numbers are discarded.
+
         Args:
             llm_response (ContradictionLLMResponse): LLM output with sentence indices.
-            sentences (List[str]): Original sentences in the category.
+            category (Category): The category the sentences were taken from.
 
         Returns:
-            ContradictionResult: Domain object containing contradictions with full sentences.
+            CategoryContradictionResult: Domain object containing the contradictions of the category.
         """
         contradictions_list: List[Contradiction] = []
+        category_indices = category.indices
 
         for c in llm_response.contradictions:
-            sentences_texts = [
-                sentences[i - 1]
-                for i in c.statements
-                if 0 < i <= len(sentences)
-            ]
-
             contradictions_list.append(
                 Contradiction(
-                    statements=sentences_texts,
+                    indices=tuple(category_indices[i - 1] for i in c.statements if 0 < i <= len(category_indices)),
                     severity=c.severity_level,
-                    comment=c.comment
+                    comment=c.comment,
+                    table=category.table
                 )
             )
 
         return CategoryContradictionResult(
-            category_name=category_name,
-            statements=sentences,
-            contradictions=contradictions_list
+            category_name=category.name,
+            indices=category_indices,
+            contradictions=tuple(contradictions_list),
+            table=category.table
         )
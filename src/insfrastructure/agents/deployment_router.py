@@ -0,0 +1,495 @@
+"""
+Module: deployment_router
+Description:
+    Balances the LLM calls of the agents across several Azure OpenAI deployments.
+    Each call goes to the deployment with the lowest expected wait, estimated from its
+    outstanding calls and observed latency. Deployments answering 429 or failing are put
+    in cooldown, and the call fails over to the next deployment. Optionally, a call still
+    running after a percentile of the recent latency is hedged with a duplicate call.
+
+    RoutedClient exposes the subset of the OpenAI client used by the agents
+    (client.beta.chat.completions.parse / stream), so agents use it like an AzureOpenAI client.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+import openai
+from openai import AzureOpenAI
+
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.insfrastructure.config.app_settings import DeploymentSettings
+
+T = TypeVar("T")
+
+# Errors another deployment may not have: throttling, timeouts, connection and server errors
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+# Weight of the latest call in the latency average
+LATENCY_SMOOTHING = 0.2
+
+# Successful call latencies kept to compute the hedging delay
+LATENCY_WINDOW = 500
+
+# Hedges that can be saved up while calls are fast
+MAX_HEDGE_TOKENS = 10.0
+
+# Threads running hedged calls (each hedged call uses one or two)
+HEDGE_MAX_WORKERS = 64
+
+
+@dataclass
+class DeploymentState:
+    """
+    Routing state of one deployment.
+
+    Attributes:
+        settings (DeploymentSettings): Connection settings.
+        client (AzureOpenAI): Client of the deployment's endpoint.
+        outstanding (int): Calls currently running.
+        latency_ms (Optional[float]): Moving average of the call latency, None before the first call.
+        cooldown_until (float): Monotonic time before which the deployment receives no traffic.
+        failures (int): Consecutive failed calls.
+    """
+    settings: DeploymentSettings
+    client: AzureOpenAI
+    outstanding: int = 0
+    latency_ms: Optional[float] = None
+    cooldown_until: float = 0.0
+    failures: int = 0
+
+
+@dataclass
+class HedgeStats:
+    """
+    Counters of hedged calls.
+
+    Attributes:
+        calls (int): Calls eligible for hedging.
+        hedged (int): Calls for which a duplicate was sent.
+        hedge_wins (int): Hedged calls answered first by the duplicate.
+        budget_denied (int): Calls that reached the hedging delay but exceeded the hedging budget.
+    """
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+
+class DeploymentRouter:
+    """
+    Least-outstanding-requests balancer with cooldown and failover.
+
+    A deployment's score is (outstanding + 1) x average latency: the expected time for a new
+    call to complete if calls are served in parallel at the observed speed. Deployments in
+    cooldown are skipped while any other deployment is available.
+
+    Hedging is opt-in. When enabled, a parsed call not answered after the configured percentile
+    of the recent latency is sent again, to another deployment when there is one, and the first
+    successful answer is returned. A running HTTP call cannot be aborted from another thread: the
+    slower call completes in the background and its answer is discarded. Each call earns
+    hedge_budget_ratio of a hedge, which caps the extra load at that fraction of the calls.
+    """
+
+    def __init__(
+            self,
+            deployments: Sequence[DeploymentSettings],
+            failover_attempts: int = 3,
+            cooldown_seconds: float = 10.0,
+            tracer: Optional[TracerPort] = None,
+            client_factory: Optional[Callable[[DeploymentSettings], AzureOpenAI]] = None,
+            hedge_percentile: float = 0.0,
+            hedge_budget_ratio: float = 0.05,
+            hedge_min_samples: int = 20,
+            embeddings: bool = False
+    ):
+        """
+        Initializes the router.
+
+        Args:
+            deployments (Sequence[DeploymentSettings]): Deployments to balance across.
+            failover_attempts (int): Deployments tried per call before the last error is raised.
+            cooldown_seconds (float): Cooldown of a failing deployment, and of a throttled one
+                                      when the 429 response has no Retry-After header.
+            tracer (Optional[TracerPort]): Tracer recording failovers. Defaults to no tracing.
+            client_factory (Optional[Callable]): Creates the client of a deployment.
+                                                 Defaults to an AzureOpenAI client.
+            hedge_percentile (float): Percentile of the recent latency after which a call is hedged,
+                                      e.g. 95. 0 disables hedging.
+            hedge_budget_ratio (float): Maximum hedges per call, e.g. 0.05 for at most 5% extra calls.
+            hedge_min_samples (int): Latencies observed before hedging starts.
+            embeddings (bool): Whether the deployments serve embeddings; the warmup probe then
+                               embeds one word instead of requesting a completion.
+        """
+        if not deployments:
+            raise ValueError("At least one deployment is required")
+
+        # With several deployments, fail over at once instead of letting the SDK retry the same one
+        max_retries = 2 if len(deployments) == 1 else 0
+        factory = client_factory or (lambda settings: AzureOpenAI(
+            api_key=settings.api_key,
+            azure_endpoint=settings.endpoint,
+            api_version=settings.api_version,
+            max_retries=max_retries
+        ))
+
+        self.deployments: List[DeploymentState] = [
+            DeploymentState(settings=settings, client=factory(settings)) for settings in deployments
+        ]
+        self.failover_attempts = max(1, failover_attempts)
+        self.cooldown_seconds = cooldown_seconds
+        self.tracer = tracer or NullTracer()
+        self.embeddings = embeddings
+        self._lock = threading.Lock()
+
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget_ratio = hedge_budget_ratio
+        self.hedge_min_samples = max(1, hedge_min_samples)
+        self.hedge_stats = HedgeStats()
+        self._hedge_tokens = 1.0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if hedge_percentile > 0:
+            self._executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge")
+
+    def warm_up(self, llm_probe: bool = False, timeout_seconds: float = 5.0) -> Dict[str, bool]:
+        """
+        Opens a connection to every deployment and checks that it is reachable.
+
+        Each deployment lists its models, which sets up the TLS connection kept in the client's
+        pool; with llm_probe, it also answers a one-token completion (or embeds one word).
+        Unreachable deployments are put in cooldown so traffic starts on the reachable ones.
+
+        Args:
+            llm_probe (bool): Whether to also send a one-token completion to each deployment.
+            timeout_seconds (float): Timeout of each warmup call.
+
+        Returns:
+            Dict[str, bool]: Whether each deployment, by name, is reachable.
+        """
+        def probe(deployment: DeploymentState) -> bool:
+            client = deployment.client.with_options(timeout=timeout_seconds, max_retries=0)
+            try:
+                client.models.list()
+                if llm_probe and self.embeddings:
+                    client.embeddings.create(model=deployment.settings.deployment, input="ping")
+                elif llm_probe:
+                    client.chat.completions.create(
+                        model=deployment.settings.deployment,
+                        messages=[{"role": "user", "content": "ping"}],
+                        max_tokens=1,
+                    )
+                return True
+            except openai.OpenAIError:
+                with self._lock:
+                    deployment.cooldown_until = time.monotonic() + self.cooldown_seconds
+                return False
+
+        # Deployments are probed in parallel, so one unreachable endpoint does not delay the others
+        with ThreadPoolExecutor(max_workers=len(self.deployments)) as executor:
+            results = list(executor.map(probe, self.deployments))
+        reachable: Dict[str, bool] = {
+            deployment.settings.name: result for deployment, result in zip(self.deployments, results)
+        }
+        return reachable
+
+    @property
+    def client(self) -> "RoutedClient":
+        """
+        Client routing every call through this router.
+        """
+        return RoutedClient(self)
+
+    def call(self, operation: Callable[[AzureOpenAI, str], T]) -> T:
+        """
+        Runs an LLM call on the best deployment, failing over on retryable errors, and hedging
+        it when hedging is enabled.
+
+        Args:
+            operation (Callable[[AzureOpenAI, str], T]): Call to run, given the client and the
+                                                         deployment name to send as model.
+
+        Returns:
+            T: Result of the operation.
+
+        Raises:
+            openai.OpenAIError: The error of the last attempt when every attempt failed,
+                                or any non-retryable error.
+        """
+        delay_ms = self._hedge_delay_ms()
+        if delay_ms is None:
+            return self._call_with_failover(operation)
+        return self._call_hedged(operation, delay_ms)
+
+    def _call_hedged(self, operation: Callable[[AzureOpenAI, str], T], delay_ms: float) -> T:
+        """
+        Runs a call and, if it has not completed after delay_ms, a duplicate on another deployment.
+
+        Returns the first successful result; raises the last error when both attempts fail.
+        """
+        primary_deployments: List[DeploymentState] = []
+        primary = self._executor.submit(
+            contextvars.copy_context().run, self._call_with_failover, operation, attempted=primary_deployments
+        )
+        done, _ = wait([primary], timeout=delay_ms / 1000)
+        if done:
+            return primary.result()
+
+        with self._lock:
+            if self._hedge_tokens < 1:
+                self.hedge_stats.budget_denied += 1
+                hedge_allowed = False
+            else:
+                self._hedge_tokens -= 1
+                self.hedge_stats.hedged += 1
+                hedge_allowed = True
+        if not hedge_allowed:
+            return primary.result()
+
+        with self.tracer.span("router.hedge", delay_ms=round(delay_ms, 1)) as span:
+            hedge = self._executor.submit(
+                contextvars.copy_context().run, self._call_with_failover, operation, avoid=list(primary_deployments)
+            )
+            pending = {primary, hedge}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        won = future is hedge
+                        span.set_attribute("winner", "hedge" if won else "primary")
+                        if won:
+                            with self._lock:
+                                self.hedge_stats.hedge_wins += 1
+                        return future.result()
+                    error = future.exception()
+            raise error
+
+    def _hedge_delay_ms(self) -> Optional[float]:
+        """
+        Counts an eligible call and returns its hedging delay, or None when hedging is off
+        or not enough latencies were observed.
+        """
+        if self._executor is None:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            self.hedge_stats.calls += 1
+            self._hedge_tokens = min(self._hedge_tokens + self.hedge_budget_ratio, MAX_HEDGE_TOKENS)
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))
+        return latencies[index]
+
+    def _call_with_failover(
+            self,
+            operation: Callable[[AzureOpenAI, str], T],
+            avoid: Optional[List[DeploymentState]] = None,
+            attempted: Optional[List[DeploymentState]] = None
+    ) -> T:
+        """
+        Runs a call on the best deployment, failing over on retryable errors.
+
+        Args:
+            operation (Callable[[AzureOpenAI, str], T]): Call to run.
+            avoid (Optional[List[DeploymentState]]): Deployments to use only if no other one is left.
+            attempted (Optional[List[DeploymentState]]): Receives every deployment the call is sent to.
+
+        Returns:
+            T: Result of the operation.
+        """
+        tried: List[DeploymentState] = []
+        while True:
+            deployment = self._acquire(tried + (avoid or []))
+            if attempted is not None:
+                attempted.append(deployment)
+            start = time.perf_counter()
+            try:
+                result = operation(deployment.client, deployment.settings.deployment)
+            except RETRYABLE_ERRORS as exc:
+                self._release_failed(deployment, exc)
+                tried.append(deployment)
+                if len(tried) >= min(self.failover_attempts, len(self.deployments)):
+                    raise
+                self._trace_failover(deployment, exc)
+                continue
+            except BaseException:
+                self._release(deployment, None)
+                raise
+            self._release(deployment, (time.perf_counter() - start) * 1000)
+            return result
+
+    @contextmanager
+    def stream(self, open_stream: Callable[[AzureOpenAI, str], object]) -> Iterator[object]:
+        """
+        Opens a streamed LLM call on the best deployment.
+
+        The deployment fails over only while the stream is being opened (where throttling and
+        connection errors surface); once events flow, errors propagate. The deployment counts
+        the call as outstanding until the stream is closed.
+
+        Args:
+            open_stream (Callable[[AzureOpenAI, str], object]): Returns the stream manager, given the
+                                                                client and the deployment name.
+
+        Yields:
+            object: The opened stream.
+        """
+        tried: List[DeploymentState] = []
+        while True:
+            deployment = self._acquire(tried)
+            start = time.perf_counter()
+            stack = ExitStack()
+            try:
+                stream = stack.enter_context(open_stream(deployment.client, deployment.settings.deployment))
+            except RETRYABLE_ERRORS as exc:
+                self._release_failed(deployment, exc)
+                tried.append(deployment)
+                if len(tried) >= min(self.failover_attempts, len(self.deployments)):
+                    raise
+                self._trace_failover(deployment, exc)
+                continue
+            except BaseException:
+                self._release(deployment, None)
+                raise
+            break
+
+        completed = False
+        try:
+            with stack:
+                yield stream
+            completed = True
+        finally:
+            self._release(deployment, (time.perf_counter() - start) * 1000 if completed else None)
+
+    def _acquire(self, excluded: List[DeploymentState]) -> DeploymentState:
+        """
+        Picks the deployment of the next attempt and counts the call as outstanding.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [d for d in self.deployments if d not in excluded] or self.deployments
+            available = [d for d in candidates if d.cooldown_until <= now]
+            if available:
+                known = [d.latency_ms for d in self.deployments if d.latency_ms is not None]
+                default_latency = sum(known) / len(known) if known else 1.0
+                deployment = min(
+                    available,
+                    key=lambda d: (d.outstanding + 1) * (d.latency_ms if d.latency_ms is not None else default_latency)
+                )
+            else:
+                # Everything is cooling down: try the deployment that recovers first
+                deployment = min(candidates, key=lambda d: d.cooldown_until)
+            deployment.outstanding += 1
+            return deployment
+
+    def _release(self, deployment: DeploymentState, latency_ms: Optional[float]) -> None:
+        """
+        Ends a call. A measured latency marks the call as successful.
+        """
+        with self._lock:
+            deployment.outstanding -= 1
+            if latency_ms is None:
+                return
+            deployment.failures = 0
+            self._latencies.append(latency_ms)
+            if deployment.latency_ms is None:
+                deployment.latency_ms = latency_ms
+            else:
+                deployment.latency_ms += LATENCY_SMOOTHING * (latency_ms - deployment.latency_ms)
+
+    def _release_failed(self, deployment: DeploymentState, error: Exception) -> None:
+        """
+        Ends a failed call and puts the deployment in cooldown.
+
+        Throttled deployments cool down for the Retry-After of the response; failing ones for
+        the configured cooldown, doubled for each consecutive failure up to 8 times.
+        """
+        cooldown = None
+        if isinstance(error, openai.RateLimitError):
+            cooldown = DeploymentRouter._retry_after(error)
+        with self._lock:
+            deployment.outstanding -= 1
+            deployment.failures += 1
+            if cooldown is None:
+                cooldown = self.cooldown_seconds * min(2 ** (deployment.failures - 1), 8)
+            deployment.cooldown_until = max(deployment.cooldown_until, time.monotonic() + cooldown)
+
+    def _trace_failover(self, deployment: DeploymentState, error: Exception) -> None:
+        """
+        Records a failover away from a deployment.
+        """
+        with self.tracer.span("router.failover", deployment=deployment.settings.name) as span:
+            span.set_attribute("error", type(error).__name__)
+
+    @staticmethod
+    def _retry_after(error: openai.APIStatusError) -> Optional[float]:
+        """
+        Reads the Retry-After header (in seconds) of a throttled response.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        for header in ("retry-after-ms", "retry-after"):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                seconds = float(value)
+            except ValueError:
+                continue
+            return seconds / 1000 if header == "retry-after-ms" else seconds
+        return None
+
+
+class RoutedCompletions:
+    """
+    Chat completions routed through a DeploymentRouter.
+
+    The model argument is replaced by the deployment name of the chosen deployment.
+    """
+
+    def __init__(self, router: DeploymentRouter):
+        """
+        Initializes the routed completions.
+
+        Args:
+            router (DeploymentRouter): Router choosing the deployment of each call.
+        """
+        self.router = router
+
+    def parse(self, **kwargs):
+        """
+        Routed equivalent of client.beta.chat.completions.parse.
+        """
+        return self.router.call(
+            lambda client, deployment: client.beta.chat.completions.parse(**{**kwargs, "model": deployment})
+        )
+
+    def stream(self, **kwargs):
+        """
+        Routed equivalent of client.beta.chat.completions.stream.
+        """
+        return self.router.stream(
+            lambda client, deployment: client.beta.chat.completions.stream(**{**kwargs, "model": deployment})
+        )
+
+
+class RoutedClient:
+    """
+    Client exposing client.beta.chat.completions over a DeploymentRouter.
+    """
+
+    def __init__(self, router: DeploymentRouter):
+        """
+        Initializes the routed client.
+
+        Args:
+            router (DeploymentRouter): Router choosing the deployment of each call.
+        """
+        self.beta = SimpleNamespace(chat=SimpleNamespace(completions=RoutedCompletions(router)))
@@ -0,0 +1,96 @@
+"""
+Module: embedding_agent
+Description:
+    Agent computing sentence embeddings with an Azure OpenAI embeddings deployment.
+    It uses the same client configuration and deployment routing as the chat agents,
+    and sends the sentences in batches.
+"""
+
+from typing import List, Optional
+from openai import AzureOpenAI
+
+from src.domain.ports.input.embedding_agent_port import EmbeddingAgentPort
+from src.domain.ports.input.llm_scheduler_port import LlmSchedulerPort, NullLlmScheduler
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.domain.ports.input.usage_tracker_port import NullUsageTracker, UsageTrackerPort
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.config.app_settings import AppSettings
+from src.insfrastructure.observability.usage_tracker import usage_from_completion
+
+
+class AzureEmbeddingAgent(EmbeddingAgentPort):
+    """
+    Agent embedding sentences with an Azure OpenAI embeddings deployment.
+    """
+
+    def __init__(
+            self,
+            azure_settings: AppSettings,
+            deployment: str,
+            tracer: Optional[TracerPort] = None,
+            usage_tracker: Optional[UsageTrackerPort] = None,
+            scheduler: Optional[LlmSchedulerPort] = None,
+            router: Optional[DeploymentRouter] = None,
+            batch_size: int = 256
+    ):
+        """
+        Initializes the embedding agent.
+
+        Args:
+            azure_settings (AppSettings): Application configuration.
+            deployment (str): Name of the embeddings deployment.
+            tracer (Optional[TracerPort]): Tracer used to record a span per call. Defaults to no tracing.
+            usage_tracker (Optional[UsageTrackerPort]): Tracker receiving the token usage of each call.
+            scheduler (Optional[LlmSchedulerPort]): Scheduler granting a slot to each call. Defaults to no limit.
+            router (Optional[DeploymentRouter]): Router balancing the calls across deployments.
+                                                 Defaults to a client of the single configured endpoint.
+            batch_size (int): Sentences sent per call.
+        """
+        self.model = deployment
+        self.batch_size = max(1, batch_size)
+        self.router = router
+        self.client = None
+        if router is None:
+            self.client = AzureOpenAI(
+                api_key=azure_settings.api_key,
+                azure_endpoint=azure_settings.endpoint,
+                api_version=azure_settings.api_version
+            )
+        self.tracer = tracer or NullTracer()
+        self.usage_tracker = usage_tracker or NullUsageTracker()
+        self.scheduler = scheduler or NullLlmScheduler()
+
+    def embed_sentences(self, sentences: List[str]) -> List[List[float]]:
+        """
+        Embeds sentences, one call per batch of batch_size sentences.
+
+        Args:
+            sentences (List[str]): Sentences to embed.
+
+        Returns:
+            List[List[float]]: One vector per sentence, in the order of the sentences.
+        """
+        vectors: List[List[float]] = []
+        for start in range(0, len(sentences), self.batch_size):
+            vectors.extend(self._embed_batch(sentences[start:start + self.batch_size]))
+        return vectors
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embeds one batch of sentences with a single call.
+        """
+        with self.tracer.span("embedder.embed", sentence_count=len(batch), model=self.model) as span:
+            with self.scheduler.slot():
+                if self.router is not None:
+                    response = self.router.call(
+                        lambda client, deployment: client.embeddings.create(model=deployment, input=batch)
+                    )
+                else:
+                    response = self.client.embeddings.create(model=self.model, input=batch)
+
+            usage = usage_from_completion(response)
+            span.set_attribute("prompt_tokens", usage.prompt_tokens)
+            self.usage_tracker.record("embedding", self.model, usage)
+
+        # The service may return the vectors out of order; each one carries its input position
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -0,0 +1,225 @@
+"""
+Module: fused_analyzer
+Description:
+    Agent that classifies sentences and detects contradictions within each category
+    in a single Azure OpenAI call. Used for small inputs, where one round-trip replaces
+    a classification call followed by one detection call per category.
+"""
+
+import threading
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Set
+from openai import NOT_GIVEN, AzureOpenAI
+from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
+
+from src.domain.models.contradiction_llm_response import ContradictionLLM
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, Contradiction, CategoryContradictionResult
+)
+from src.domain.models.fused_analysis_llm_response import FusedAnalysisLLMResponse
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.ports.input.fused_analyzer_agent_port import FusedAnalyzerAgentPort
+from src.domain.ports.input.llm_scheduler_port import LlmSchedulerPort, NullLlmScheduler
+from src.domain.ports.input.tracer_port import NullTracer, SpanPort, TracerPort
+from src.domain.ports.input.usage_tracker_port import NullUsageTracker, UsageTrackerPort
+from src.domain.services.text_analysis_service import UNNAMED_CATEGORY
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.agents.llm_recorder import LlmRecorder
+from src.insfrastructure.config.app_settings import AgentSettings, AppSettings
+from src.insfrastructure.observability.usage_tracker import usage_from_completion
+from src.insfrastructure.prompts.prompt_loader import PromptyLoader
+
+
+class FusedAnalyzer(FusedAnalyzerAgentPort):
+    """
+    Agent for classifying sentences and detecting their contradictions with one LLM call.
+    """
+
+    def __init__(
+            self,
+            azure_settings: AppSettings,
+            prompt_provider: PromptyLoader,
+            tracer: Optional[TracerPort] = None,
+            usage_tracker: Optional[UsageTrackerPort] = None,
+            scheduler: Optional[LlmSchedulerPort] = None,
+            router: Optional[DeploymentRouter] = None,
+            agent_settings: Optional[AgentSettings] = None,
+            recorder: Optional[LlmRecorder] = None
+    ):
+        """
+        Initializes the fused analyzer agent.
+
+        Args:
+            azure_settings (AppSettings): Application configuration.
+            prompt_provider (PromptyLoader): Provider for system and user prompts.
+            tracer (Optional[TracerPort]): Tracer used to record a span per LLM call. Defaults to no tracing.
+            usage_tracker (Optional[UsageTrackerPort]): Tracker receiving the token usage of each LLM call.
+            scheduler (Optional[LlmSchedulerPort]): Scheduler granting a slot to each LLM call. Defaults to no limit.
+            router (Optional[DeploymentRouter]): Router balancing the LLM calls across deployments.
+                                                 Defaults to a client of the single configured deployment.
+            agent_settings (Optional[AgentSettings]): Deployment, timeout, max tokens and concurrency of the
+                                                      agent's calls. Defaults to the configured deployment,
+                                                      2048 max tokens and no timeout or concurrency limit.
+            recorder (Optional[LlmRecorder]): Records the LLM calls, or replays recorded calls instead
+                                              of calling the LLM. Defaults to live calls.
+        """
+        self.endpoint = azure_settings.endpoint
+        self.api_key = azure_settings.api_key
+        self.api_version = azure_settings.api_version
+
+        agent_settings = agent_settings or AgentSettings(deployment=azure_settings.model, max_tokens=2048)
+        self.model = agent_settings.deployment
+        self.max_tokens = agent_settings.max_tokens
+        self.timeout = agent_settings.timeout_seconds or NOT_GIVEN
+        # Limits this agent's concurrent calls before they compete for a scheduler slot
+        self.call_limiter = (
+            threading.BoundedSemaphore(agent_settings.max_concurrency)
+            if agent_settings.max_concurrency else nullcontext()
+        )
+
+        if router is not None:
+            self.client = router.client
+        else:
+            self.client = AzureOpenAI(
+                api_key=self.api_key,
+                azure_endpoint=self.endpoint,
+                api_version=self.api_version
+            )
+        if recorder is not None:
+            self.client = recorder.wrap(self.client)
+        self.prompt_provider = prompt_provider
+        self.tracer = tracer or NullTracer()
+        self.usage_tracker = usage_tracker or NullUsageTracker()
+        self.scheduler = scheduler or NullLlmScheduler()
+
+    def analyze_sentences(self, sentences: List[str]) -> AnalysisContradictionResult:
+        """
+        Classifies sentences and detects contradictions, then maps the LLM response to the domain model.
+
+        Args:
+            sentences (List[str]): Sentences to analyze.
+
+        Returns:
+            AnalysisContradictionResult: Categories with their detected contradictions.
+        """
+        with self.tracer.span("fused.analyze", sentence_count=len(sentences), model=self.model) as span:
+            llm_response = self._analyze_sentences(sentences)
+            result = FusedAnalyzer._map_llm_to_domain(llm_response, sentences)
+            span.set_attribute("category_count", len(result.categories))
+
+        return result
+
+    def _analyze_sentences(self, sentences: List[str]) -> FusedAnalysisLLMResponse:
+        """
+        Sends sentences to the LLM for classification and contradiction detection.
+
+        Args:
+            sentences (List[str]): Sentences to analyze.
+
+        Returns:
+            FusedAnalysisLLMResponse: Parsed LLM response.
+        """
+        # Number sentences for clarity in prompts
+        numbered_sentences = "\n".join(f"{i+1}. {s}" for i, s in enumerate(sentences))
+
+        system_prompt = self.prompt_provider.get_system_prompt(
+            prompt_name="prompt_fused_analysis"
+        )
+        user_prompt = self.prompt_provider.get_user_prompt(
+            prompt_name="prompt_fused_analysis",
+            numbered_sentences=numbered_sentences
+        )
+
+        messages = [
+            ChatCompletionSystemMessageParam(role="system", content=system_prompt),
+            ChatCompletionUserMessageParam(role="user", content=user_prompt)
+        ]
+
+        with self.tracer.span("fused.llm_call", model=self.model) as span:
+            with self.call_limiter, self.scheduler.slot():
+                completion = self.client.beta.chat.completions.parse(
+                    model=self.model,
+                    messages=messages,
+                    response_format=FusedAnalysisLLMResponse,
+                    temperature=0,
+                    max_tokens=self.max_tokens,
+                    timeout=self.timeout,
+                )
+            self._record_usage(span, completion)
+
+        return completion.choices[0].message.parsed
+
+    def _record_usage(self, span: SpanPort, completion) -> None:
+        """
+        Records the token usage reported by the LLM on the span and in the usage tracker.
+
+        Args:
+            span (SpanPort): Span of the LLM call.
+            completion: Completion returned by the Azure OpenAI client.
+        """
+        usage = usage_from_completion(completion)
+        span.set_attribute("prompt_tokens", usage.prompt_tokens)
+        span.set_attribute("completion_tokens", usage.completion_tokens)
+        span.set_attribute("cached_tokens", usage.cached_tokens)
+        self.usage_tracker.record("fused", self.model, usage)
+
+    @staticmethod
+    def _map_llm_to_domain(
+            llm_response: FusedAnalysisLLMResponse,
+            sentences: List[str]
+    ) -> AnalysisContradictionResult:
+        """
+        Maps the fused LLM response to the domain model.
+
+        The categories are normalized like a repaired classification: every sentence ends up in
+        exactly one category. Out-of-range indices are discarded, a sentence listed several times
+        stays in the first category holding it, categories sharing a name are merged and sentences
+        left out go to the unnamed category. Contradictions keep only the sentences of their own
+        category and are dropped when fewer than two distinct sentences remain.
+
+        Args:
+            llm_response (FusedAnalysisLLMResponse): LLM output with sentence indices.
+            sentences (List[str]): Original list of sentences.
+
+        Returns:
+            AnalysisContradictionResult: Domain object whose categories reference the sentences by index.
+        """
+        table = SentenceTable.of(sentences)
+        size = len(table)
+
+        assigned: Set[int] = set()
+        merged: Dict[str, List[int]] = {}
+        reported: Dict[str, List[ContradictionLLM]] = {}
+        for cat in llm_response.categories:
+            indices = merged.setdefault(cat.name, [])
+            for i in cat.phrases:
+                if 0 < i <= size and i - 1 not in assigned:
+                    assigned.add(i - 1)
+                    indices.append(i - 1)
+            reported.setdefault(cat.name, []).extend(cat.contradictions)
+        missing = [i for i in range(size) if i not in assigned]
+        if missing:
+            merged.setdefault(UNNAMED_CATEGORY, []).extend(missing)
+
+        categories: List[CategoryContradictionResult] = []
+        for name, indices in merged.items():
+            if not indices:
+                continue
+            members = set(indices)
+            contradictions: List[Contradiction] = []
+            for c in reported.get(name, []):
+                statements = tuple(dict.fromkeys(i - 1 for i in c.statements if i - 1 in members))
+                if len(statements) >= 2:
+                    contradictions.append(
+                        Contradiction(indices=statements, severity=c.severity_level, comment=c.comment, table=table)
+                    )
+            categories.append(
+                CategoryContradictionResult(
+                    category_name=name,
+                    indices=tuple(indices),
+                    contradictions=tuple(contradictions),
+                    table=table
+                )
+            )
+
+        return AnalysisContradictionResult(categories=categories)
@@ -0,0 +1,76 @@
+"""
+Module: incremental_json
+Description:
+    Incremental scanner extracting the objects of a JSON array while the JSON document
+    is still being streamed by the LLM.
+    Used to hand each classification category to the detector as soon as its object closes.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class ArrayObjectScanner:
+    """
+    Extracts the complete objects of the arrays held by a top-level JSON object.
+
+    The scanner is fed text fragments in order. Every time an object directly inside an
+    array of the top-level object (e.g. {"categories": [{...}, {...}]}) closes, it is
+    decoded and returned by feed(). Braces and brackets inside strings are ignored.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty scanner.
+        """
+        self._buffer: List[str] = []
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._object_start: Optional[int] = None
+
+    def feed(self, fragment: str) -> List[Dict[str, Any]]:
+        """
+        Consumes a text fragment and returns the objects it completed.
+
+        Args:
+            fragment (str): Next piece of the streamed JSON document.
+
+        Returns:
+            List[Dict[str, Any]]: Objects closed by this fragment, in order.
+        """
+        completed: List[Dict[str, Any]] = []
+
+        for char in fragment:
+            self._buffer.append(char)
+            index = self._position
+            self._position += 1
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "{" and self._stack == ["{", "["]:
+                    self._object_start = index
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if char == "}" and self._stack == ["{", "["] and self._object_start is not None:
+                    text = "".join(self._buffer[self._object_start:index + 1])
+                    self._object_start = None
+                    try:
+                        completed.append(json.loads(text))
+                    except ValueError:
+                        pass
+
+        return completed
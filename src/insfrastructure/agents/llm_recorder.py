@@ -0,0 +1,391 @@
+"""
+Module: llm_recorder
+Description:
+    Record/replay layer for the LLM calls of the agents, used to reproduce production
+    traffic offline and deterministically.
+
+    In record mode, every parsed or streamed chat completion is sent to the real client and
+    appended to a JSON Lines file with its request fingerprint, latency and raw response
+    (and, for streams, the content deltas with their arrival times). In replay mode, calls are
+    answered from the file, after waiting the recorded latency; replay-fast answers at once.
+
+    RecordReplayClient exposes the subset of the OpenAI client used by the agents
+    (client.beta.chat.completions.parse / stream), like RoutedClient.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from openai.types.chat import ParsedChatCompletion
+from pydantic import BaseModel
+
+from src.domain.exceptions.app_exception import AppException
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay", "replay-fast")
+
+# Request arguments that do not change the response
+IGNORED_PARAMS = ("model", "messages", "response_format", "timeout", "stream_options")
+
+
+class LlmCallStore:
+    """
+    Append-only JSON Lines file of recorded LLM calls, indexed by request fingerprint.
+
+    Each line holds one call: fingerprint, request, kind ("parse" or "stream"), latency_ms,
+    events ([offset_ms, delta] pairs of a stream) and response (the completion, without the
+    parsed object, which is rebuilt from the content on replay). A last line left incomplete
+    by a recording killed mid-write is skipped, and cut from the file by the next recorded call.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens the store and loads the calls already recorded.
+
+        Args:
+            path (str): Path of the JSON Lines file; created on the first recorded call.
+
+        Raises:
+            ValueError: If a line other than the last one is not valid JSON.
+        """
+        self.path = Path(path)
+        self._calls: Dict[str, List[Dict[str, Any]]] = {}
+        self._replayed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Size of the file without its incomplete last line, cut before the next record
+        self._valid_size: Optional[int] = None
+
+        if self.path.exists():
+            with self.path.open("rb") as file:
+                lines = file.readlines()
+            offset = 0
+            for number, line in enumerate(lines, start=1):
+                if line.strip():
+                    try:
+                        call = json.loads(line)
+                    except ValueError:
+                        if number < len(lines):
+                            raise
+                        logger.warning("Skipping the incomplete last line of %s", self.path)
+                        self._valid_size = offset
+                        break
+                    self._calls.setdefault(call["fingerprint"], []).append(call)
+                offset += len(line)
+
+    def __len__(self) -> int:
+        return sum(len(calls) for calls in self._calls.values())
+
+    def append(self, call: Dict[str, Any]) -> None:
+        """
+        Records a call.
+
+        Args:
+            call (Dict[str, Any]): The recorded call.
+        """
+        line = json.dumps(call, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._calls.setdefault(call["fingerprint"], []).append(call)
+            with self.path.open("a", encoding="utf-8") as file:
+                if self._valid_size is not None:
+                    file.truncate(self._valid_size)
+                    self._valid_size = None
+                file.write(line)
+
+    def next_call(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the next recorded call of a fingerprint.
+
+        Identical requests recorded several times are replayed in recording order, then cyclically.
+
+        Args:
+            fingerprint (str): Request fingerprint.
+
+        Returns:
+            Optional[Dict[str, Any]]: The call, or None if the request was never recorded.
+        """
+        with self._lock:
+            calls = self._calls.get(fingerprint)
+            if not calls:
+                return None
+            position = self._replayed.get(fingerprint, 0)
+            self._replayed[fingerprint] = position + 1
+            return calls[position % len(calls)]
+
+
+class LlmRecorder:
+    """
+    Records the LLM calls of the agents, or replays them from an LlmCallStore.
+    """
+
+    def __init__(self, store: LlmCallStore, mode: str):
+        """
+        Initializes the recorder.
+
+        Args:
+            store (LlmCallStore): Storage of the recorded calls.
+            mode (str): "record", "replay" (with the recorded latencies) or "replay-fast".
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown record/replay mode '{mode}', expected one of: {', '.join(MODES)}")
+        self.store = store
+        self.mode = mode
+
+    @property
+    def replaying(self) -> bool:
+        """
+        bool: Whether calls are answered from the store instead of the LLM.
+        """
+        return self.mode != "record"
+
+    def wrap(self, client: Any) -> "RecordReplayClient":
+        """
+        Wraps an agent's client.
+
+        Args:
+            client (Any): AzureOpenAI or RoutedClient used for live calls.
+
+        Returns:
+            RecordReplayClient: Client recording or replaying the calls.
+        """
+        return RecordReplayClient(self, client)
+
+    @staticmethod
+    def request(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the part of a call's arguments that determines its response.
+
+        Args:
+            kwargs (Dict[str, Any]): Arguments of the parse or stream call.
+
+        Returns:
+            Dict[str, Any]: Model, messages, response format name and schema, and sampling parameters.
+        """
+        response_format = kwargs.get("response_format")
+        schema = None
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            schema = response_format.model_json_schema()
+        return {
+            "model": kwargs.get("model"),
+            "messages": kwargs.get("messages"),
+            "response_format": getattr(response_format, "__name__", None),
+            "schema": schema,
+            "params": {
+                name: value for name, value in kwargs.items()
+                if name not in IGNORED_PARAMS and isinstance(value, (str, int, float, bool, type(None)))
+            },
+        }
+
+    @staticmethod
+    def fingerprint(request: Dict[str, Any]) -> str:
+        """
+        Returns the fingerprint of a request.
+
+        Args:
+            request (Dict[str, Any]): Request, as returned by request().
+
+        Returns:
+            str: SHA-256 of the canonical JSON of the request.
+        """
+        canonical = json.dumps(request, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the recorded call answering a request.
+
+        Raises:
+            AppException: REPLAY_MISS if the request was never recorded.
+        """
+        request = LlmRecorder.request(kwargs)
+        call = self.store.next_call(LlmRecorder.fingerprint(request))
+        if call is None:
+            raise AppException(
+                f"No recorded LLM call matches this {request['response_format'] or 'chat'} request "
+                f"to {request['model']} in {self.store.path}.",
+                code="REPLAY_MISS"
+            )
+        return call
+
+    def record(self, kwargs: Dict[str, Any], kind: str, latency_ms: float, completion: Any,
+               events: Optional[List[List[Any]]] = None) -> None:
+        """
+        Stores a completed call.
+        """
+        request = LlmRecorder.request(kwargs)
+        response = completion.model_dump(mode="json", exclude_none=True)
+        for choice in response.get("choices", []):
+            choice.get("message", {}).pop("parsed", None)
+        self.store.append({
+            "fingerprint": LlmRecorder.fingerprint(request),
+            "request": {name: request[name] for name in ("model", "messages", "response_format", "params")},
+            "kind": kind,
+            "latency_ms": round(latency_ms, 1),
+            "events": events or [],
+            "response": response,
+        })
+
+    def wait(self, delay_ms: float) -> None:
+        """
+        Sleeps for a recorded delay, except in replay-fast mode.
+        """
+        if self.mode == "replay" and delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    @staticmethod
+    def completion(call: Dict[str, Any], response_format: Any) -> ParsedChatCompletion:
+        """
+        Rebuilds the parsed completion of a recorded call.
+
+        The parsed object is validated again from the message content, as the SDK does.
+        """
+        response = json.loads(json.dumps(call["response"]))
+        for choice in response.get("choices", []):
+            message = choice.setdefault("message", {})
+            content = message.get("content")
+            message["parsed"] = response_format.model_validate_json(content) if content else None
+        return ParsedChatCompletion[response_format].model_validate(response)
+
+
+class RecordingStream:
+    """
+    Live stream recording the content deltas and the final completion.
+    """
+
+    def __init__(self, stream: Any, start: float):
+        """
+        Initializes the recording stream.
+
+        Args:
+            stream (Any): The live stream.
+            start (float): perf_counter() when the call was started.
+        """
+        self.stream = stream
+        self.start = start
+        self.events: List[List[Any]] = []
+        self.final: Any = None
+
+    def __iter__(self) -> Iterator[Any]:
+        for event in self.stream:
+            if event.type == "content.delta":
+                self.events.append([round((time.perf_counter() - self.start) * 1000, 1), event.delta])
+            yield event
+
+    def get_final_completion(self) -> Any:
+        """
+        Returns the final completion of the live stream.
+        """
+        self.final = self.stream.get_final_completion()
+        return self.final
+
+
+class ReplayStream:
+    """
+    Stream replaying the content deltas of a recorded call.
+
+    A call recorded without streaming is replayed as one delta holding the whole content.
+    """
+
+    def __init__(self, recorder: LlmRecorder, call: Dict[str, Any], response_format: Any):
+        """
+        Initializes the replayed stream.
+
+        Args:
+            recorder (LlmRecorder): Recorder pacing the deltas.
+            call (Dict[str, Any]): The recorded call.
+            response_format (Any): Response format of the request.
+        """
+        self.recorder = recorder
+        self.call = call
+        self.final = LlmRecorder.completion(call, response_format)
+        self.start = time.perf_counter()
+
+    def __iter__(self) -> Iterator[SimpleNamespace]:
+        events = self.call.get("events") or [
+            [self.call.get("latency_ms", 0.0), choice.message.content or ""] for choice in self.final.choices[:1]
+        ]
+        for offset_ms, delta in events:
+            self.recorder.wait(offset_ms - (time.perf_counter() - self.start) * 1000)
+            yield SimpleNamespace(type="content.delta", delta=delta)
+
+    def get_final_completion(self) -> ParsedChatCompletion:
+        """
+        Returns the recorded final completion.
+        """
+        return self.final
+
+
+class RecordReplayCompletions:
+    """
+    Chat completions recorded to, or replayed from, an LlmRecorder.
+    """
+
+    def __init__(self, recorder: LlmRecorder, client: Any):
+        """
+        Initializes the completions.
+
+        Args:
+            recorder (LlmRecorder): Recorder of the calls.
+            client (Any): Client used for live calls in record mode.
+        """
+        self.recorder = recorder
+        self.client = client
+
+    def parse(self, **kwargs):
+        """
+        Recorded or replayed equivalent of client.beta.chat.completions.parse.
+        """
+        if self.recorder.replaying:
+            call = self.recorder.lookup(kwargs)
+            self.recorder.wait(call.get("latency_ms", 0.0))
+            return LlmRecorder.completion(call, kwargs.get("response_format"))
+
+        start = time.perf_counter()
+        completion = self.client.beta.chat.completions.parse(**kwargs)
+        self.recorder.record(kwargs, "parse", (time.perf_counter() - start) * 1000, completion)
+        return completion
+
+    @contextmanager
+    def stream(self, **kwargs):
+        """
+        Recorded or replayed equivalent of client.beta.chat.completions.stream.
+        """
+        if self.recorder.replaying:
+            yield ReplayStream(self.recorder, self.recorder.lookup(kwargs), kwargs.get("response_format"))
+            return
+
+        start = time.perf_counter()
+        with self.client.beta.chat.completions.stream(**kwargs) as stream:
+            recording = RecordingStream(stream, start)
+            yield recording
+            if recording.final is None:
+                recording.final = stream.get_final_completion()
+        self.recorder.record(
+            kwargs, "stream", (time.perf_counter() - start) * 1000, recording.final, events=recording.events
+        )
+
+
+class RecordReplayClient:
+    """
+    Client exposing client.beta.chat.completions over an LlmRecorder.
+    """
+
+    def __init__(self, recorder: LlmRecorder, client: Any):
+        """
+        Initializes the client.
+
+        Args:
+            recorder (LlmRecorder): Recorder of the calls.
+            client (Any): Client used for live calls in record mode.
+        """
+        self.beta = SimpleNamespace(chat=SimpleNamespace(completions=RecordReplayCompletions(recorder, client)))
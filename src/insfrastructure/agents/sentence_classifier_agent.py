@@ -3,16 +3,35 @@ Module: sentence_classifier
 Description:
     Agent responsible for classifying sentences using Azure OpenAI.
     It converts the LLM output into domain-level classification results.
+
+    The LLM may leave sentences out of every category or put one in several. Such sentences
+    are sent, with the category names, in a small repair call and merged into the result,
+    so the classification covers every sentence exactly once without a second full call.
 """
 
-from typing import List
-from openai import AzureOpenAI
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Optional
+
+import openai
+from openai import NOT_GIVEN, AzureOpenAI
 from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 
-from src.domain.models.classification_llm_response import ClassificationLLMResponse
+from src.domain.models.classification_llm_response import CategoryLLM, ClassificationLLMResponse
 from src.domain.models.classification_result import ClassificationResult, Category
+from src.domain.models.sentence_table import SentenceTable
 from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
-from src.insfrastructure.config.app_settings import AppSettings
+from src.domain.ports.input.llm_scheduler_port import LlmSchedulerPort, NullLlmScheduler
+from src.domain.ports.input.tracer_port import NullTracer, SpanPort, TracerPort
+from src.domain.ports.input.usage_tracker_port import NullUsageTracker, UsageTrackerPort
+from src.domain.services.text_analysis_service import UNNAMED_CATEGORY
+from src.insfrastructure.agents.incremental_json import ArrayObjectScanner
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.agents.llm_recorder import LlmRecorder
+from src.insfrastructure.config.app_settings import AgentSettings, AppSettings
+from src.insfrastructure.observability.usage_tracker import usage_from_completion
 from src.insfrastructure.prompts.prompt_loader import PromptyLoader
 
 
@@ -22,25 +41,62 @@ class SentenceClassifier(ClassifierAgentPort):
     Converts the LLM response into domain-level ClassificationResult objects.
     """
 
-    def __init__(self, azure_settings: AppSettings, prompt_provider: PromptyLoader):
+    def __init__(
+            self,
+            azure_settings: AppSettings,
+            prompt_provider: PromptyLoader,
+            tracer: Optional[TracerPort] = None,
+            usage_tracker: Optional[UsageTrackerPort] = None,
+            scheduler: Optional[LlmSchedulerPort] = None,
+            router: Optional[DeploymentRouter] = None,
+            agent_settings: Optional[AgentSettings] = None,
+            recorder: Optional[LlmRecorder] = None
+    ):
         """
         Initializes the sentence classifier agent.
 
         Args:
             azure_settings (AppSettings): Application configuration.
             prompt_provider (PromptyLoader): Provider for system and user prompts.
+            tracer (Optional[TracerPort]): Tracer used to record a span per LLM call. Defaults to no tracing.
+            usage_tracker (Optional[UsageTrackerPort]): Tracker receiving the token usage of each LLM call.
+            scheduler (Optional[LlmSchedulerPort]): Scheduler granting a slot to each LLM call. Defaults to no limit.
+            router (Optional[DeploymentRouter]): Router balancing the LLM calls across deployments.
+                                                 Defaults to a client of the single configured deployment.
+            agent_settings (Optional[AgentSettings]): Deployment, timeout, max tokens and concurrency of the
+                                                      agent's calls. Defaults to the configured deployment,
+                                                      1024 max tokens and no timeout or concurrency limit.
+            recorder (Optional[LlmRecorder]): Records the LLM calls, or replays recorded calls instead
+                                              of calling the LLM. Defaults to live calls.
         """
         self.endpoint = azure_settings.endpoint
         self.api_key = azure_settings.api_key
         self.api_version = azure_settings.api_version
-        self.model = azure_settings.model
 
-        self.client = AzureOpenAI(
-            api_key=self.api_key,
-            azure_endpoint=self.endpoint,
-            api_version=self.api_version
+        agent_settings = agent_settings or AgentSettings(deployment=azure_settings.model, max_tokens=1024)
+        self.model = agent_settings.deployment
+        self.max_tokens = agent_settings.max_tokens
+        self.timeout = agent_settings.timeout_seconds or NOT_GIVEN
+        # Limits this agent's concurrent calls before they compete for a scheduler slot
+        self.call_limiter = (
+            threading.BoundedSemaphore(agent_settings.max_concurrency)
+            if agent_settings.max_concurrency else nullcontext()
         )
+
+        if router is not None:
+            self.client = router.client
+        else:
+            self.client = AzureOpenAI(
+                api_key=self.api_key,
+                azure_endpoint=self.endpoint,
+                api_version=self.api_version
+            )
+        if recorder is not None:
+            self.client = recorder.wrap(self.client)
         self.prompt_provider = prompt_provider
+        self.tracer = tracer or NullTracer()
+        self.usage_tracker = usage_tracker or NullUsageTracker()
+        self.scheduler = scheduler or NullLlmScheduler()
 
     def classify_sentences(self, sentences: List[str]) -> ClassificationResult:
         """
@@ -52,18 +108,114 @@ class SentenceClassifier(ClassifierAgentPort):
         Returns:
             ClassificationResult: Domain-level classification result.
         """
-        llm_response = self._classify_sentences(sentences)
-        return SentenceClassifier._map_llm_to_domain(llm_response, sentences)
+        with self.tracer.span("classifier.classify", sentence_count=len(sentences), model=self.model) as span:
+            llm_response = self._classify_sentences(sentences)
+            result = SentenceClassifier._map_llm_to_domain(llm_response, sentences)
+            result = self._ensure_coverage(result, sentences)
+            span.set_attribute("category_count", len(result.categories))
 
-    def _classify_sentences(self, sentences: List[str]) -> ClassificationLLMResponse:
+        return result
+
+    def iter_categories(self, sentences: List[str]) -> Iterator[Category]:
         """
-        Sends sentences to the LLM for classification and parses the response.
+        Streams the classification and yields each category as soon as its JSON object closes.
+
+        A sentence already yielded is dropped from later categories. Sentences the stream left
+        unassigned are repaired after it ends and yielded as extra categories, even when the
+        repair puts them under the name of a category already yielded.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Yields:
+            Category: Domain categories, in the order produced by the LLM.
+        """
+        with self.tracer.span("classifier.stream", sentence_count=len(sentences), model=self.model) as span:
+            category_count = 0
+            scanner = ArrayObjectScanner()
+            table = SentenceTable.of(sentences)
+            assigned = set()
+            names: List[str] = []
+            start = time.perf_counter()
+
+            # The slot is held until the stream is fully read
+            with self.call_limiter, self.scheduler.slot(), self.client.beta.chat.completions.stream(
+                model=self.model,
+                messages=self._build_messages(sentences),
+                response_format=ClassificationLLMResponse,
+                temperature=0,
+                max_tokens=self.max_tokens,
+                timeout=self.timeout,
+                stream_options={"include_usage": True},
+            ) as stream:
+                for event in stream:
+                    if event.type != "content.delta":
+                        continue
+                    for raw_category in scanner.feed(event.delta):
+                        category = SentenceClassifier._map_category(CategoryLLM.model_validate(raw_category), table)
+                        indices = tuple(i for i in category.indices if i not in assigned)
+                        names.append(category.name)
+                        if category.indices and not indices:
+                            continue
+                        assigned.update(indices)
+                        category_count += 1
+                        if category_count == 1:
+                            span.set_attribute("first_category_ms", round((time.perf_counter() - start) * 1000, 1))
+                        yield Category(category.name, indices, table)
+
+                self._record_usage(span, stream.get_final_completion())
+
+            missing = [i for i in range(len(sentences)) if i not in assigned]
+            if missing:
+                assignments = self._repair(missing, names, sentences)
+                repaired: Dict[str, List[int]] = {}
+                for i in missing:
+                    repaired.setdefault(assignments.get(i, UNNAMED_CATEGORY), []).append(i)
+                for name, indices in repaired.items():
+                    category_count += 1
+                    yield Category(name, tuple(indices), table)
+
+            span.set_attribute("category_count", category_count)
+
+    def assign_sentences(self, sentences: List[str], category_names: List[str]) -> ClassificationResult:
+        """
+        Classifies sentences into existing categories with the repair prompt, creating new
+        categories only when none fits. Sentences the LLM leaves out go to the unnamed category.
 
         Args:
             sentences (List[str]): Sentences to classify.
+            category_names (List[str]): Names of the existing categories; without any, the
+                                        sentences are classified from scratch.
 
         Returns:
-            ClassificationLLMResponse: Parsed LLM response.
+            ClassificationResult: The classification of the given sentences.
+        """
+        if not category_names:
+            return self.classify_sentences(sentences)
+
+        with self.tracer.span("classifier.assign", sentence_count=len(sentences), model=self.model) as span:
+            pending = list(range(len(sentences)))
+            assignments = self._repair(pending, category_names, sentences, stage="classification")
+            grouped: Dict[str, List[int]] = {}
+            for i in pending:
+                grouped.setdefault(assignments.get(i, UNNAMED_CATEGORY), []).append(i)
+            table = SentenceTable.of(sentences)
+            result = ClassificationResult(categories=[
+                Category(name, tuple(indices), table) for name, indices in grouped.items()
+            ])
+            span.set_attribute("category_count", len(result.categories))
+
+        return result
+
+    def _build_messages(self, sentences: List[str]) -> list:
+        """
+        Builds the system and user messages of a classification call.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Returns:
+            list: Chat messages for the Azure OpenAI client.
         """
         # Number sentences for clarity in prompts
         numbered_sentences = "\n".join(f"{i+1}. {s}" for i, s in enumerate(sentences))
@@ -76,21 +228,153 @@ class SentenceClassifier(ClassifierAgentPort):
             numbered_sentences=numbered_sentences
         )
 
-        messages = [
+        return [
             ChatCompletionSystemMessageParam(role="system", content=system_prompt),
             ChatCompletionUserMessageParam(role="user", content=user_prompt)
         ]
 
-        completion = self.client.beta.chat.completions.parse(
-            model=self.model,
-            messages=messages,
-            response_format=ClassificationLLMResponse,
-            temperature=0,
-            max_tokens=1024,
-        )
+    def _classify_sentences(self, sentences: List[str]) -> ClassificationLLMResponse:
+        """
+        Sends sentences to the LLM for classification and parses the response.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Returns:
+            ClassificationLLMResponse: Parsed LLM response.
+        """
+        messages = self._build_messages(sentences)
+
+        with self.tracer.span("classifier.llm_call", model=self.model) as span:
+            with self.call_limiter, self.scheduler.slot():
+                completion = self.client.beta.chat.completions.parse(
+                    model=self.model,
+                    messages=messages,
+                    response_format=ClassificationLLMResponse,
+                    temperature=0,
+                    max_tokens=self.max_tokens,
+                    timeout=self.timeout,
+                )
+            self._record_usage(span, completion)
 
         return completion.choices[0].message.parsed
 
+    def _ensure_coverage(self, result: ClassificationResult, sentences: List[str]) -> ClassificationResult:
+        """
+        Assigns every sentence to exactly one category.
+
+        Sentences missing from every category or present in several are repaired with one
+        LLM call and merged in: into the existing category of the name given by the repair,
+        or into a new category. A duplicated sentence the repair leaves out stays in the first
+        category holding it; a missing one goes to the unnamed category.
+
+        Args:
+            result (ClassificationResult): Classification mapped from the LLM response.
+            sentences (List[str]): Classified sentences.
+
+        Returns:
+            ClassificationResult: The classification, with each sentence in exactly one category.
+        """
+        counts = Counter(i for category in result.categories for i in category.indices)
+        missing = [i for i in range(len(sentences)) if i not in counts]
+        duplicated = [i for i, count in counts.items() if count > 1]
+        if not missing and not duplicated:
+            return result
+
+        table = result.categories[0].table if result.categories else SentenceTable.of(sentences)
+        pending = sorted(missing + duplicated)
+        assignments = self._repair(pending, [category.name for category in result.categories], sentences)
+
+        merged: Dict[str, List[int]] = {}
+        first_category: Dict[int, str] = {}
+        for category in result.categories:
+            indices = merged.setdefault(category.name, [])
+            for i in category.indices:
+                first_category.setdefault(i, category.name)
+                if counts[i] == 1:
+                    indices.append(i)
+        for i in pending:
+            merged.setdefault(assignments.get(i) or first_category.get(i, UNNAMED_CATEGORY), []).append(i)
+
+        return ClassificationResult(categories=[
+            Category(name, tuple(indices), table) for name, indices in merged.items() if indices
+        ])
+
+    def _repair(
+            self,
+            pending: List[int],
+            category_names: List[str],
+            sentences: List[str],
+            stage: str = "classification_repair"
+    ) -> Dict[int, str]:
+        """
+        Asks the LLM to assign the given sentences to the existing categories or to new ones.
+
+        A failed repair call assigns nothing, so the caller's fallbacks apply.
+
+        Args:
+            pending (List[int]): 0-based indices of the sentences to assign.
+            category_names (List[str]): Names of the categories of the classification.
+            sentences (List[str]): Classified sentences.
+            stage (str): Usage stage of the call.
+
+        Returns:
+            Dict[int, str]: Category name of each assigned sentence, by 0-based index.
+        """
+        numbered_sentences = "\n".join(f"{n + 1}. {sentences[i]}" for n, i in enumerate(pending))
+        names = "\n".join(f"- {name}" for name in dict.fromkeys(category_names)) or "-"
+        messages = [
+            ChatCompletionSystemMessageParam(
+                role="system",
+                content=self.prompt_provider.get_system_prompt(prompt_name="prompt_classification_repair")
+            ),
+            ChatCompletionUserMessageParam(role="user", content=self.prompt_provider.get_user_prompt(
+                prompt_name="prompt_classification_repair",
+                category_names=names,
+                numbered_sentences=numbered_sentences
+            ))
+        ]
+
+        with self.tracer.span("classifier.repair", model=self.model, sentence_count=len(pending)) as span:
+            try:
+                with self.call_limiter, self.scheduler.slot():
+                    completion = self.client.beta.chat.completions.parse(
+                        model=self.model,
+                        messages=messages,
+                        response_format=ClassificationLLMResponse,
+                        temperature=0,
+                        max_tokens=self.max_tokens,
+                        timeout=self.timeout,
+                    )
+            except openai.OpenAIError as exc:
+                span.set_attribute("fallback", type(exc).__name__)
+                return {}
+            self._record_usage(span, completion, stage=stage)
+
+            assignments: Dict[int, str] = {}
+            for category in completion.choices[0].message.parsed.categories:
+                for number in category.phrases:
+                    if 0 < int(number) <= len(pending):
+                        assignments.setdefault(pending[int(number) - 1], category.name)
+            span.set_attribute("repaired_count", len(assignments))
+
+        return assignments
+
+    def _record_usage(self, span: SpanPort, completion, stage: str = "classification") -> None:
+        """
+        Records the token usage reported by the LLM on the span and in the usage tracker.
+
+        Args:
+            span (SpanPort): Span of the LLM call.
+            completion: Completion returned by the Azure OpenAI client.
+            stage (str): Usage stage of the call.
+        """
+        usage = usage_from_completion(completion)
+        span.set_attribute("prompt_tokens", usage.prompt_tokens)
+        span.set_attribute("completion_tokens", usage.completion_tokens)
+        span.set_attribute("cached_tokens", usage.cached_tokens)
+        self.usage_tracker.record(stage, self.model, usage)
+
     @staticmethod
     def _map_llm_to_domain(
         llm_response: ClassificationLLMResponse,
@@ -106,21 +390,30 @@ class SentenceClassifier(ClassifierAgentPort):
         Returns:
             ClassificationResult: Domain classification result.
         """
-        categories: List[Category] = []
+        table = SentenceTable.of(sentences)
+        categories: List[Category] = [
+            SentenceClassifier._map_category(cat, table)
+            for cat in llm_response.categories
+        ]
 
-        for cat in llm_response.categories:
-            phrases: List[str] = []
+        return ClassificationResult(categories=categories)
 
-            for i in cat.phrases:
-                index: int = int(i)
-                if 0 < index <= len(sentences):
-                    phrases.append(sentences[index - 1])
+    @staticmethod
+    def _map_category(cat: CategoryLLM, table: SentenceTable) -> Category:
+        """
+        Maps one LLM category to a domain Category, discarding out-of-range and repeated indices.
 
-            categories.append(
-                Category(
-                    name=cat.name,
-                    phrases=phrases
-                )
-            )
+        Args:
+            cat (CategoryLLM): Category with 1-based sentence indices.
+            table (SentenceTable): Table of the classified sentences.
 
-        return ClassificationResult(categories=categories)
+        Returns:
+            Category: Domain category referencing the sentences by 0-based index.
+        """
+        size = len(table)
+
+        return Category(
+            name=cat.name,
+            indices=tuple(dict.fromkeys(int(i) - 1 for i in cat.phrases if 0 < int(i) <= size)),
+            table=table
+        )
@@ -0,0 +1,47 @@
+"""
+Module: cache_backend
+Description:
+    Defines the CacheBackend interface implemented by the result cache storages.
+    Backends store opaque byte values under string keys with a time-to-live, and treat
+    any storage failure as a miss: a cache outage slows analyses down but never fails them.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackend(ABC):
+    """
+    Byte-oriented key/value storage with per-entry TTLs and size limits.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value stored under the key.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[bytes]: The value, or None when it is missing, expired or unreadable.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Stores a value under the key. Values larger than the backend's entry limit are dropped.
+
+        Args:
+            key (str): Cache key.
+            value (bytes): Value to store.
+            ttl_seconds (float): Lifetime of the entry (0 = no expiry).
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases the connections held by the backend, those of every thread included.
+        """
+        pass
@@ -0,0 +1,138 @@
+"""
+Module: caching_agents
+Description:
+    Decorators adding a result cache in front of the classifier and detector agents.
+    They implement the same ports as the agents they wrap, so the domain service uses them
+    unchanged: a hit skips the LLM call, a miss is forwarded and its result stored.
+"""
+
+from typing import Iterator, List
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
+from src.domain.ports.input.classifier_agent_port import ClassifierAgentPort
+from src.domain.ports.input.detector_agent_port import DetectorAgentPort
+from src.domain.ports.input.result_cache_port import ResultCachePort
+
+
+class CachingClassifierAgent(ClassifierAgentPort):
+    """
+    Classifier agent answering from the cache when the same sentences were already classified.
+    """
+
+    def __init__(self, inner: ClassifierAgentPort, cache: ResultCachePort):
+        """
+        Initializes the caching classifier.
+
+        Args:
+            inner (ClassifierAgentPort): Agent classifying the sentences on a miss.
+            cache (ResultCachePort): Cache of the classifications.
+        """
+        self.inner = inner
+        self.cache = cache
+
+    def classify_sentences(self, sentences: List[str]) -> ClassificationResult:
+        """
+        Returns the cached classification of the sentences, or classifies them with the inner
+        agent and caches the result.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Returns:
+            ClassificationResult: The classification.
+        """
+        cached = self.cache.get_classification(sentences)
+        if cached is not None:
+            return cached
+        result = self.inner.classify_sentences(sentences)
+        self.cache.put_classification(sentences, result)
+        return result
+
+    def iter_categories(self, sentences: List[str]) -> Iterator[Category]:
+        """
+        Yields the cached categories, or streams them from the inner agent and caches the
+        classification once the stream is complete.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Yields:
+            Category: The categories of the classification.
+        """
+        cached = self.cache.get_classification(sentences)
+        if cached is not None:
+            yield from cached.categories
+            return
+
+        categories: List[Category] = []
+        for category in self.inner.iter_categories(sentences):
+            categories.append(category)
+            yield category
+        self.cache.put_classification(sentences, ClassificationResult(categories=categories))
+
+    def assign_sentences(self, sentences: List[str], category_names: List[str]) -> ClassificationResult:
+        """
+        Forwards to the inner agent: assignments depend on the existing categories and are not cached.
+
+        Args:
+            sentences (List[str]): Sentences to assign.
+            category_names (List[str]): Names of the existing categories.
+
+        Returns:
+            ClassificationResult: Categories of the sentences, indices relative to the given sentences.
+        """
+        return self.inner.assign_sentences(sentences, category_names)
+
+
+class CachingDetectorAgent(DetectorAgentPort):
+    """
+    Detector agent answering from the cache, category by category.
+
+    Categories with the same sentences have the same contradictions whatever their name, so a
+    category is a hit even when it was classified in another analysis. Missed categories are
+    sent to the inner agent in a single call; results keep the order of the categories.
+    """
+
+    def __init__(self, inner: DetectorAgentPort, cache: ResultCachePort):
+        """
+        Initializes the caching detector.
+
+        Args:
+            inner (DetectorAgentPort): Agent detecting the contradictions of missed categories.
+            cache (ResultCachePort): Cache of the detections.
+        """
+        self.inner = inner
+        self.cache = cache
+
+    def detect_contradiction(self, classification_result: ClassificationResult) -> AnalysisContradictionResult:
+        """
+        Answers the cached categories from the cache and sends the others to the inner agent,
+        caching their results.
+
+        Args:
+            classification_result (ClassificationResult): Categories to check.
+
+        Returns:
+            AnalysisContradictionResult: The contradictions of every category, in the input order.
+        """
+        results: List[CategoryContradictionResult] = []
+        missed: List[Category] = []
+        missed_positions: List[int] = []
+
+        for category in classification_result.categories:
+            # Categories of fewer than 2 sentences are answered by the agent without an LLM call
+            cached = self.cache.get_detection(category) if len(category.indices) >= 2 else None
+            if cached is None:
+                missed.append(category)
+                missed_positions.append(len(results))
+            results.append(cached)
+
+        if missed:
+            detected = self.inner.detect_contradiction(ClassificationResult(categories=missed))
+            for position, category, result in zip(missed_positions, missed, detected.categories):
+                if len(category.indices) >= 2:
+                    self.cache.put_detection(result)
+                results[position] = result
+
+        return AnalysisContradictionResult(categories=results)
@@ -0,0 +1,58 @@
+"""
+Module: memory_cache
+Description:
+    In-process cache backend: a thread-safe LRU dictionary bounded in entries and entry size.
+    Entries are private to the worker process; use the SQLite or Redis backend to share
+    results between the workers of a host or the nodes of a fleet.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.insfrastructure.cache.cache_backend import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    LRU cache held in the memory of the current process.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_entry_bytes: int = 1024 * 1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): Entries kept before the least recently used ones are evicted.
+            max_entry_bytes (int): Values larger than this are not cached (0 = unlimited).
+        """
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if self.max_entry_bytes and len(value) > self.max_entry_bytes:
+            return
+        expires_at = time.time() + ttl_seconds if ttl_seconds > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,235 @@
+"""
+Module: redis_cache
+Description:
+    Cache backend speaking the Redis protocol (RESP2), shared by every node of the fleet.
+    Works with Redis, Valkey, KeyDB, Azure Cache for Redis and any other server implementing
+    GET and SET with PX. Only these commands (plus AUTH and SELECT) are needed, so a minimal
+    socket client is used instead of a Redis client dependency.
+"""
+
+import logging
+import socket
+import time
+from typing import BinaryIO, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+from src.domain.exceptions.configuration_exception import ConfigurationException
+from src.insfrastructure.cache.cache_backend import CacheBackend
+from src.insfrastructure.concurrency.thread_connections import ThreadConnections
+
+logger = logging.getLogger(__name__)
+
+Reply = Union[bytes, int, str, None, List["Reply"]]
+
+# Socket of a connection and the buffered reader of its replies
+Connection = Tuple[socket.socket, BinaryIO]
+
+
+class RedisProtocolError(Exception):
+    """
+    Raised when the server replies with an error or a malformed reply.
+    """
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache stored on a Redis-protocol server.
+
+    Each thread keeps a connection of its own; close() closes those of every thread. A failing
+    command closes the connection of its thread and is treated as a miss. After a connection
+    failure (server down, unreachable or timing out), every thread skips the server for
+    cooldown_seconds, so an outage degrades to misses instead of adding a connect timeout to each
+    lookup; the first command after the cooldown reconnects. Expiry and eviction are left to the
+    server (SET ... PX and its maxmemory policy); values over max_entry_bytes are not sent.
+    """
+
+    def __init__(
+            self,
+            url: str = "redis://localhost:6379/0",
+            max_entry_bytes: int = 1024 * 1024,
+            timeout_seconds: float = 0.5,
+            cooldown_seconds: float = 5.0
+    ):
+        """
+        Initializes the backend. Connections are opened on first use.
+
+        Args:
+            url (str): Server URL, redis://[[user]:password@]host[:port][/db].
+            max_entry_bytes (int): Values larger than this are not cached (0 = unlimited).
+            timeout_seconds (float): Connect and read timeout of every command.
+            cooldown_seconds (float): Time the server is skipped after a connection failure.
+
+        Raises:
+            ConfigurationException: If the URL is not a redis:// URL.
+        """
+        parsed = urlparse(url)
+        if parsed.scheme != "redis" or not parsed.hostname:
+            raise ConfigurationException(f"CACHE_REDIS_URL must be a redis://host:port/db URL, got '{url}'")
+        self.host = parsed.hostname
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.strip("/") or 0)
+        self.max_entry_bytes = max_entry_bytes
+        self.timeout_seconds = timeout_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._connections: ThreadConnections[Connection] = ThreadConnections(
+            self._connect, RedisCacheBackend._disconnect
+        )
+        # Monotonic time before which the server is not contacted
+        self._retry_at = 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the value of a key, or None when it is missing or the server is unavailable.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[bytes]: The value.
+        """
+        if self._cooling_down():
+            return None
+        try:
+            reply = self._command(b"GET", key.encode("utf-8"))
+        except (OSError, ValueError, RedisProtocolError) as error:
+            self._fail("read", error)
+            return None
+        return reply if isinstance(reply, bytes) else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Stores a value, unless it is too large or the server is unavailable.
+
+        Args:
+            key (str): Cache key.
+            value (bytes): Value to store.
+            ttl_seconds (float): Lifetime of the entry (0 = no expiry).
+        """
+        if self.max_entry_bytes and len(value) > self.max_entry_bytes:
+            return
+        if self._cooling_down():
+            return
+        args = [b"SET", key.encode("utf-8"), value]
+        if ttl_seconds > 0:
+            args += [b"PX", str(max(int(ttl_seconds * 1000), 1)).encode("ascii")]
+        try:
+            self._command(*args)
+        except (OSError, ValueError, RedisProtocolError) as error:
+            self._fail("write", error)
+
+    def close(self) -> None:
+        """
+        Closes the connections of every thread.
+        """
+        self._connections.close_all()
+
+    def _cooling_down(self) -> bool:
+        """
+        Returns whether the server is being skipped after a connection failure.
+        """
+        return time.monotonic() < self._retry_at
+
+    def _fail(self, operation: str, error: Exception) -> None:
+        """
+        Closes the connection after a failed command; connection failures start a cooldown.
+        """
+        self._connections.discard()
+        if isinstance(error, OSError):
+            self._retry_at = time.monotonic() + self.cooldown_seconds
+            logger.warning("Redis cache %s failed, skipping the cache for %.1f s: %s",
+                           operation, self.cooldown_seconds, error)
+        else:
+            logger.warning("Redis cache %s failed: %s", operation, error)
+
+    def _command(self, *args: bytes) -> Reply:
+        """
+        Sends a command on the connection of the current thread and reads its reply.
+        """
+        return self._send(self._connections.get(), args)
+
+    def _send(self, connection: Connection, args) -> Reply:
+        """
+        Sends a command on a connection and reads its reply.
+        """
+        sock, reader = connection
+        sock.sendall(self._encode(args))
+        return self._read_reply(reader)
+
+    def _connect(self) -> Connection:
+        """
+        Opens a connection, authenticating and selecting the database; it is closed if that fails.
+        """
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout_seconds)
+        connection = (sock, sock.makefile("rb"))
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.password is not None:
+                credentials = [self.username, self.password] if self.username else [self.password]
+                self._send(connection, [b"AUTH", *(part.encode("utf-8") for part in credentials)])
+            if self.db:
+                self._send(connection, [b"SELECT", str(self.db).encode("ascii")])
+        except (OSError, ValueError, RedisProtocolError):
+            RedisCacheBackend._disconnect(connection)
+            raise
+        return connection
+
+    @staticmethod
+    def _disconnect(connection: Connection) -> None:
+        """
+        Closes a connection, ignoring errors of a connection already broken.
+        """
+        sock, reader = connection
+        try:
+            reader.close()
+            sock.close()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        """
+        Encodes a command as a RESP array of bulk strings.
+        """
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            parts.append(b"$%d\r\n" % len(arg))
+            parts.append(arg)
+            parts.append(b"\r\n")
+        return b"".join(parts)
+
+    @classmethod
+    def _read_reply(cls, reader) -> Reply:
+        """
+        Reads one RESP2 reply.
+
+        Raises:
+            RedisProtocolError: If the server replied with an error or the reply is malformed.
+            OSError: If the connection is closed or times out.
+        """
+        line = reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise OSError("Connection closed by the cache server")
+        kind, payload = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise RedisProtocolError(payload.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                raise OSError("Connection closed by the cache server")
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [cls._read_reply(reader) for _ in range(length)]
+        raise RedisProtocolError(f"Unexpected reply type {kind!r}")
@@ -0,0 +1,293 @@
+"""
+Module: result_cache
+Description:
+    Implementation of the ResultCachePort on top of a CacheBackend.
+    Results are keyed by a SHA-256 digest of their sentences and stored as compact JSON
+    arrays of names, sentence positions, severities and comments (the sentences themselves
+    are never stored), compressed with zlib when large. Keys are prefixed with a namespace
+    identifying the prompts and models, so changing either invalidates the cache.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.execution_plan import ExecutionStrategy
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.ports.input.result_cache_port import ResultCachePort
+from src.insfrastructure.cache.cache_backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Encoded values larger than this are compressed
+COMPRESS_MIN_BYTES = 512
+RAW_PREFIX = b"j"
+ZLIB_PREFIX = b"z"
+
+T = TypeVar("T")
+
+
+def _positions(values, size: int) -> Tuple[int, ...]:
+    """
+    Returns cached sentence positions as a tuple, checking they are positions among size sentences.
+
+    Raises:
+        IndexError: If a value is not an integer in [0, size).
+    """
+    positions = tuple(values)
+    for position in positions:
+        if type(position) is not int or not 0 <= position < size:
+            raise IndexError(f"Sentence position {position!r} out of range for {size} sentences")
+    return positions
+
+
+@dataclass
+class CacheStats:
+    """
+    Lookup counters of a result cache, per result kind.
+
+    Attributes:
+        hits (Dict[str, int]): Lookups answered by the cache.
+        misses (Dict[str, int]): Lookups not found in the cache.
+    """
+    hits: Dict[str, int]
+    misses: Dict[str, int]
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        float: Share of all lookups answered by the cache.
+        """
+        hits = sum(self.hits.values())
+        total = hits + sum(self.misses.values())
+        return hits / total if total else 0.0
+
+
+class ResultCache(ResultCachePort):
+    """
+    Result cache storing classification, detection and analysis results in a backend.
+
+    Cached sentence positions are relative to the sentences of the key, so a hit is rebuilt on
+    the sentence table of the caller. Entries that cannot be decoded or rebuilt (wrong shape,
+    positions out of range) are logged and treated as misses.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str = "", ttl_seconds: float = 86400.0):
+        """
+        Initializes the result cache.
+
+        Args:
+            backend (CacheBackend): Storage of the encoded results.
+            namespace (str): Prefix of the keys; entries of other namespaces are never read.
+            ttl_seconds (float): Lifetime of the cached results (0 = no expiry).
+        """
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats(hits={}, misses={})
+        self._stats_lock = threading.Lock()
+
+    def get_classification(self, sentences: List[str]) -> Optional[ClassificationResult]:
+        """
+        Returns the cached classification of the sentences, or None on a miss.
+
+        Args:
+            sentences (List[str]): Sentences to classify.
+
+        Returns:
+            Optional[ClassificationResult]: The classification, on a table of the given sentences.
+        """
+        table = SentenceTable.of(sentences)
+        return self._get("classification", sentences, lambda payload: ClassificationResult(categories=[
+            Category(name, _positions(indices, len(sentences)), table) for name, indices in payload
+        ]))
+
+    def put_classification(self, sentences: List[str], result: ClassificationResult) -> None:
+        """
+        Caches the classification of the sentences.
+
+        Args:
+            sentences (List[str]): Sentences that were classified.
+            result (ClassificationResult): Their classification.
+        """
+        self._put("classification", sentences, [
+            [category.name, list(category.indices)] for category in result.categories
+        ])
+
+    def get_detection(self, category: Category) -> Optional[CategoryContradictionResult]:
+        """
+        Returns the cached contradictions of the category's sentences, or None on a miss.
+
+        Args:
+            category (Category): Category to check; its name does not take part in the lookup.
+
+        Returns:
+            Optional[CategoryContradictionResult]: The contradictions, on the category's table.
+        """
+        indices = category.indices
+        return self._get("detection", category.phrases, lambda payload: CategoryContradictionResult(
+            category.name,
+            indices,
+            tuple(
+                Contradiction(
+                    tuple(indices[i] for i in _positions(positions, len(indices))), severity, comment, category.table
+                )
+                for positions, severity, comment in payload
+            ),
+            category.table
+        ))
+
+    def put_detection(self, result: CategoryContradictionResult) -> None:
+        """
+        Caches the contradictions of a category, with sentence positions relative to the category.
+        Results citing sentences outside their category are not cached.
+
+        Args:
+            result (CategoryContradictionResult): Contradictions of the category.
+        """
+        positions = {}
+        for position, index in enumerate(result.indices):
+            positions.setdefault(index, position)
+        payload = []
+        for contradiction in result.contradictions:
+            if any(index not in positions for index in contradiction.indices):
+                return
+            payload.append([
+                [positions[index] for index in contradiction.indices], contradiction.severity, contradiction.comment
+            ])
+        self._put("detection", result.statements, payload)
+
+    def get_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy
+    ) -> Optional[AnalysisContradictionResult]:
+        """
+        Returns the cached analysis of the sentences with the strategy, or None on a miss.
+
+        Args:
+            sentences (List[str]): Sentences to analyze.
+            strategy (ExecutionStrategy): Strategy the analysis is run with.
+
+        Returns:
+            Optional[AnalysisContradictionResult]: The analysis, on a table of the given sentences.
+        """
+        table = SentenceTable.of(sentences)
+        return self._get(f"analysis.{strategy.value}", sentences, lambda payload: AnalysisContradictionResult(
+            categories=[
+                CategoryContradictionResult(
+                    name,
+                    _positions(indices, len(sentences)),
+                    tuple(
+                        Contradiction(_positions(contradiction_indices, len(sentences)), severity, comment, table)
+                        for contradiction_indices, severity, comment in contradictions
+                    ),
+                    table
+                )
+                for name, indices, contradictions in payload
+            ]
+        ))
+
+    def put_analysis(
+            self, sentences: List[str], strategy: ExecutionStrategy, result: AnalysisContradictionResult
+    ) -> None:
+        """
+        Caches the analysis of the sentences with the strategy.
+
+        Args:
+            sentences (List[str]): Sentences that were analyzed.
+            strategy (ExecutionStrategy): Strategy the analysis was run with.
+            result (AnalysisContradictionResult): The analysis.
+        """
+        self._put(f"analysis.{strategy.value}", sentences, [
+            [
+                category.category_name,
+                list(category.indices),
+                [
+                    [list(contradiction.indices), contradiction.severity, contradiction.comment]
+                    for contradiction in category.contradictions
+                ]
+            ]
+            for category in result.categories
+        ])
+
+    def key(self, kind: str, sentences: List[str]) -> str:
+        """
+        Returns the backend key of a result.
+
+        Args:
+            kind (str): Kind of result (classification, detection or analysis.<strategy>).
+            sentences (List[str]): Sentences the result was computed on.
+
+        Returns:
+            str: The key, "<namespace>:<kind>:<sha256 of the sentences>".
+        """
+        digest = hashlib.sha256(
+            json.dumps(list(sentences), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+        return f"{self.namespace}:{kind}:{digest}"
+
+    @staticmethod
+    def encode(payload) -> bytes:
+        """
+        Serializes a payload to compact JSON, compressed when it is large.
+
+        Args:
+            payload: JSON-compatible payload.
+
+        Returns:
+            bytes: The value, prefixed with one byte telling whether it is compressed.
+        """
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if len(data) >= COMPRESS_MIN_BYTES:
+            return ZLIB_PREFIX + zlib.compress(data)
+        return RAW_PREFIX + data
+
+    @staticmethod
+    def decode(value: bytes):
+        """
+        Deserializes a value produced by encode().
+
+        Raises:
+            ValueError: If the value is not a valid encoded payload.
+        """
+        prefix, data = value[:1], value[1:]
+        if prefix == ZLIB_PREFIX:
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as error:
+                raise ValueError(str(error)) from error
+        elif prefix != RAW_PREFIX:
+            raise ValueError(f"Unknown cache value prefix {prefix!r}")
+        return json.loads(data)
+
+    def _get(self, kind: str, sentences: List[str], rebuild: Callable[[Any], T]) -> Optional[T]:
+        """
+        Reads, decodes and rebuilds a result, counting the hit or miss. An entry that cannot be
+        decoded, or whose payload does not have the shape of the result, is logged and is a miss.
+        """
+        value = self.backend.get(self.key(kind, sentences))
+        result = None
+        if value is not None:
+            try:
+                result = rebuild(self.decode(value))
+            except (ValueError, TypeError, IndexError, KeyError) as error:
+                logger.warning("Discarding unreadable %s cache entry: %s", kind, error)
+
+        counters = self.stats.hits if result is not None else self.stats.misses
+        stat = kind.split(".")[0]
+        with self._stats_lock:
+            counters[stat] = counters.get(stat, 0) + 1
+        return result
+
+    def _put(self, kind: str, sentences: List[str], payload) -> None:
+        """
+        Encodes and stores a payload.
+        """
+        self.backend.set(self.key(kind, sentences), self.encode(payload), self.ttl_seconds)
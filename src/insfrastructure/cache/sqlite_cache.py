@@ -0,0 +1,141 @@
+"""
+Module: sqlite_cache
+Description:
+    Cache backend stored in a local SQLite database in WAL mode.
+    All the uvicorn workers of a host open the same file, so a result computed by one
+    worker is a hit for the others. WAL lets readers proceed while a worker writes, and
+    each thread keeps a connection of its own; close() closes those of every thread.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from src.insfrastructure.cache.cache_backend import CacheBackend
+from src.insfrastructure.concurrency.thread_connections import ThreadConnections
+
+logger = logging.getLogger(__name__)
+
+# Expired and excess rows are pruned once every PRUNE_INTERVAL writes
+PRUNE_INTERVAL = 100
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Cache shared by the processes of a host through a SQLite WAL file.
+
+    Reads and writes failing because the database is locked or unreadable are treated as
+    misses. Rows over max_entries are pruned oldest first, so the file size stays bounded.
+    """
+
+    def __init__(
+            self,
+            path: str = "cache.sqlite3",
+            max_entries: int = 10000,
+            max_entry_bytes: int = 1024 * 1024,
+            busy_timeout_ms: int = 2000
+    ):
+        """
+        Opens (and creates if needed) the cache database.
+
+        Args:
+            path (str): Path of the database file, shared by the workers of the host.
+            max_entries (int): Rows kept after pruning (0 = unlimited).
+            max_entry_bytes (int): Values larger than this are not cached (0 = unlimited).
+            busy_timeout_ms (int): Time a connection waits for a lock held by another worker.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.busy_timeout_ms = busy_timeout_ms
+        self._connections = ThreadConnections(self._open_connection, sqlite3.Connection.close)
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, created_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_created_at ON cache_entries (created_at)")
+        connection.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current thread, opening it on first use.
+        """
+        return self._connections.get()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Opens a connection in WAL mode.
+        """
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as error:
+            logger.warning("SQLite cache read failed: %s", error)
+            return None
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at and expires_at <= time.time():
+            return None
+        return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if self.max_entry_bytes and len(value) > self.max_entry_bytes:
+            return
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds > 0 else 0.0
+        connection = self._connection()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), expires_at, now)
+            )
+            connection.commit()
+        except sqlite3.Error as error:
+            logger.warning("SQLite cache write failed: %s", error)
+            return
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_INTERVAL == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Deletes the expired rows and the oldest rows over max_entries.
+        """
+        connection = self._connection()
+        try:
+            connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at > 0 AND expires_at <= ?", (time.time(),)
+            )
+            if self.max_entries:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    "SELECT key FROM cache_entries ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            connection.commit()
+        except sqlite3.Error as error:
+            logger.warning("SQLite cache pruning failed: %s", error)
+
+    def close(self) -> None:
+        """
+        Closes the connections of every thread; the last one checkpoints the WAL into the database.
+        """
+        self._connections.close_all()
@@ -0,0 +1,165 @@
+"""
+Module: admission_controller
+Description:
+    Admission control in front of the analysis use case.
+    Rejects oversized requests, bounds the number of concurrent analyses and the
+    queue of analyses waiting for a slot, and sheds load with a Retry-After hint
+    when the queue is full or a request waited too long. Accepted requests keep a
+    stable latency instead of all slowing down together under bursts.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+
+from src.application.dto.analysis_request import AnalysisRequest
+from src.domain.exceptions.overload_exception import OverloadException, RequestTooLargeException
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    Bounded-concurrency gate with a bounded FIFO wait queue.
+
+    Must be used from the event loop (the analysis itself runs on worker threads).
+    A limit of 0 disables the corresponding check.
+    """
+
+    def __init__(
+            self,
+            max_concurrent: int = 8,
+            max_queue: int = 32,
+            max_wait_seconds: float = 10.0,
+            max_sentences: int = 5000,
+            max_text_bytes: int = 2 * 1024 * 1024
+    ):
+        """
+        Initializes the admission controller.
+
+        Args:
+            max_concurrent (int): Analyses running at the same time (0 = unlimited).
+            max_queue (int): Analyses waiting for a slot; further requests get 429.
+            max_wait_seconds (float): Maximum wait for a slot; waiting requests get 503 after it.
+            max_sentences (int): Maximum sentences per request (0 = unlimited).
+            max_text_bytes (int): Maximum UTF-8 size of the sentences of a request (0 = unlimited).
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.max_sentences = max_sentences
+        self.max_text_bytes = max_text_bytes
+
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Moving average of the analysis duration, used for Retry-After hints
+        self._average_seconds = 5.0
+
+    @property
+    def queued(self) -> int:
+        """
+        int: Number of analyses waiting for a slot.
+        """
+        return len(self._waiters)
+
+    def check_request(self, request: AnalysisRequest) -> None:
+        """
+        Rejects requests above the size limits.
+
+        Args:
+            request (AnalysisRequest): The incoming request.
+
+        Raises:
+            RequestTooLargeException: If the request has too many sentences or too much text.
+        """
+        if self.max_sentences and len(request.sentences) > self.max_sentences:
+            raise RequestTooLargeException(
+                f"The request has {len(request.sentences)} sentences; the limit is {self.max_sentences}."
+            )
+        if self.max_text_bytes:
+            size = sum(len(sentence.encode("utf-8")) for sentence in request.sentences)
+            if size > self.max_text_bytes:
+                raise RequestTooLargeException(
+                    f"The request has {size} bytes of text; the limit is {self.max_text_bytes}."
+                )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Holds an analysis slot for the duration of the context.
+
+        Raises:
+            OverloadException: "QUEUE_FULL" when the wait queue is full,
+                               "QUEUE_TIMEOUT" when no slot was freed within max_wait_seconds.
+        """
+        await self._acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._average_seconds = 0.8 * self._average_seconds + 0.2 * (time.perf_counter() - start)
+            self._release()
+
+    async def _acquire(self) -> None:
+        if not self.max_concurrent or (self.active < self.max_concurrent and not self._waiters):
+            self.active += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            logger.warning("Analysis rejected: %d running, %d queued", self.active, len(self._waiters))
+            raise OverloadException(
+                "The service is saturated, please retry later.",
+                code="QUEUE_FULL",
+                retry_after=self._retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # The slot is handed over by _release, which resolves the future
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as the wait expired: give it back
+                self._release()
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            raise OverloadException(
+                "No analysis slot became available in time, please retry later.",
+                code="QUEUE_TIMEOUT",
+                retry_after=self._retry_after()
+            )
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot over to the oldest waiter still waiting, without decrementing active
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _remove(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _retry_after(self) -> int:
+        """
+        Estimates the seconds until the current queue is drained.
+        """
+        slots = self.max_concurrent or 1
+        return max(1, math.ceil((len(self._waiters) + 1) * self._average_seconds / slots))
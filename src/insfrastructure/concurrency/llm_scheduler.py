@@ -0,0 +1,191 @@
+"""
+Module: llm_scheduler
+Description:
+    Weighted fair scheduler of LLM call slots implementing the LlmSchedulerPort.
+    Requests are tagged with a priority class (e.g., "interactive", "bulk") and run as
+    flows. A bounded number of LLM calls run at the same time; when a slot frees up it is
+    granted by weighted fair queuing between the priority classes, then round-robin between
+    the flows of the chosen class. A flow also never holds more than a fixed number of slots,
+    so one large document cannot monopolize the LLM capacity.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, Optional
+
+from src.domain.ports.input.llm_scheduler_port import LlmSchedulerPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+
+
+@dataclass
+class _Flow:
+    """
+    LLM calls of one request.
+    """
+    flow_id: int
+    priority: str
+    running: int = 0
+    waiting: Deque[threading.Event] = field(default_factory=deque)
+
+
+_current_flow: ContextVar[Optional[_Flow]] = ContextVar("current_llm_flow", default=None)
+
+
+class LlmScheduler(LlmSchedulerPort):
+    """
+    Weighted fair queuing of LLM call slots across priority classes and requests.
+
+    Each priority class has a virtual time advanced by 1/weight for every slot it is
+    granted; the waiting class with the lowest virtual time is served next, so under
+    contention classes receive slots in proportion to their weights. A class becoming
+    busy again starts at the current virtual time instead of reclaiming unused share.
+    """
+
+    def __init__(
+            self,
+            max_concurrent_calls: int = 16,
+            max_calls_per_request: int = 4,
+            weights: Optional[Dict[str, float]] = None,
+            default_priority: str = "interactive",
+            tracer: Optional[TracerPort] = None
+    ):
+        """
+        Initializes the scheduler.
+
+        Args:
+            max_concurrent_calls (int): LLM calls running at the same time (0 = unlimited).
+            max_calls_per_request (int): LLM calls one request may run at the same time (0 = unlimited).
+            weights (Optional[Dict[str, float]]): Share of each priority class. Defaults to
+                                                  {"interactive": 8, "bulk": 1}.
+            default_priority (str): Class of requests without priority.
+            tracer (Optional[TracerPort]): Tracer recording the wait for a slot. Defaults to no tracing.
+        """
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_calls_per_request = max_calls_per_request
+        self.weights = dict(weights or {"interactive": 8.0, "bulk": 1.0})
+        self.default_priority = default_priority
+        self.tracer = tracer or NullTracer()
+
+        self._lock = threading.Lock()
+        self._running = 0
+        self._flow_ids = itertools.count(1)
+        self._virtual_time: Dict[str, float] = {priority: 0.0 for priority in self.weights}
+        # Virtual time of the class served last
+        self._system_virtual_time = 0.0
+        # Flows with waiting calls, per class, in round-robin order
+        self._waiting_flows: Dict[str, "OrderedDict[int, _Flow]"] = {p: OrderedDict() for p in self.weights}
+
+    @property
+    def priorities(self):
+        """
+        Priority classes known to the scheduler.
+        """
+        return list(self.weights)
+
+    @contextmanager
+    def flow(self, priority: Optional[str] = None) -> Iterator[None]:
+        """
+        Runs the block as one request of the given priority class.
+
+        LLM calls made inside the block, including from worker threads running a copy of
+        the context, share the request's fair share.
+
+        Args:
+            priority (Optional[str]): Priority class. Defaults to default_priority.
+
+        Raises:
+            ValueError: If the priority class is unknown.
+        """
+        priority = priority or self.default_priority
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority '{priority}'")
+
+        token = _current_flow.set(_Flow(flow_id=next(self._flow_ids), priority=priority))
+        try:
+            yield
+        finally:
+            _current_flow.reset(token)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Waits for an LLM call slot of the current flow and holds it.
+
+        Calls made outside of flow() form a flow of their own in the default class.
+        """
+        flow = _current_flow.get()
+        if flow is None:
+            flow = _Flow(flow_id=next(self._flow_ids), priority=self.default_priority)
+
+        event = self._enqueue(flow)
+        if not event.is_set():
+            start = time.perf_counter()
+            with self.tracer.span("scheduler.wait", priority=flow.priority) as span:
+                event.wait()
+                span.set_attribute("wait_ms", round((time.perf_counter() - start) * 1000, 1))
+        try:
+            yield
+        finally:
+            self._release(flow)
+
+    def _enqueue(self, flow: _Flow) -> threading.Event:
+        event = threading.Event()
+        with self._lock:
+            flow.waiting.append(event)
+            flows = self._waiting_flows[flow.priority]
+            if not flows:
+                # Class becoming busy: start at the current virtual time
+                self._virtual_time[flow.priority] = max(self._virtual_time[flow.priority], self._system_virtual_time)
+            flows[flow.flow_id] = flow
+            self._dispatch()
+        return event
+
+    def _release(self, flow: _Flow) -> None:
+        with self._lock:
+            flow.running -= 1
+            self._running -= 1
+            if flow.waiting and flow.flow_id not in self._waiting_flows[flow.priority]:
+                self._waiting_flows[flow.priority][flow.flow_id] = flow
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Grants free slots to waiting calls. Must be called with the lock held.
+        """
+        while not self.max_concurrent_calls or self._running < self.max_concurrent_calls:
+            flow = self._next_flow()
+            if flow is None:
+                return
+            flow.waiting.popleft().set()
+            flow.running += 1
+            self._running += 1
+            self._system_virtual_time = self._virtual_time[flow.priority]
+            self._virtual_time[flow.priority] += 1.0 / self.weights[flow.priority]
+
+    def _next_flow(self) -> Optional[_Flow]:
+        """
+        Picks the flow served next: the busy class with the lowest virtual time, then the
+        first flow of that class in round-robin order that is under its per-request cap.
+        """
+        classes = sorted(
+            (priority for priority, flows in self._waiting_flows.items() if flows),
+            key=lambda priority: self._virtual_time[priority]
+        )
+        for priority in classes:
+            flows = self._waiting_flows[priority]
+            for flow_id, flow in list(flows.items()):
+                if self.max_calls_per_request and flow.running >= self.max_calls_per_request:
+                    # Parked until one of its calls completes
+                    del flows[flow_id]
+                    continue
+                del flows[flow_id]
+                if len(flow.waiting) > 1:
+                    # Back of the round-robin
+                    flows[flow_id] = flow
+                return flow
+        return None
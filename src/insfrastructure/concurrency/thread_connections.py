@@ -0,0 +1,89 @@
+"""
+Module: thread_connections
+Description:
+    Connections opened once per thread and closed together.
+    The SQLite databases and the Redis-protocol cache keep one connection per thread (request
+    worker threads run concurrently and a connection is not shared between them). Every
+    connection is registered when opened, so close_all() on any thread, e.g. the shutdown of
+    the API, releases the connections of all the threads.
+"""
+
+import threading
+from typing import Callable, Generic, List, Optional, TypeVar
+
+C = TypeVar("C")
+
+
+class ThreadConnections(Generic[C]):
+    """
+    One connection per thread, opened on first use and registered for close_all().
+
+    A thread using its connection after close_all() opens a new one.
+    """
+
+    def __init__(self, open_connection: Callable[[], C], close_connection: Callable[[C], None]):
+        """
+        Initializes the registry. No connection is opened yet.
+
+        Args:
+            open_connection (Callable[[], C]): Opens a connection; an exception leaves nothing to close.
+            close_connection (Callable[[C], None]): Closes a connection.
+        """
+        self._open_connection = open_connection
+        self._close_connection = close_connection
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[C] = []
+        # Incremented by close_all(), so threads drop the connections it closed
+        self._generation = 0
+
+    def get(self) -> C:
+        """
+        Returns the connection of the current thread, opening it on first use.
+
+        Returns:
+            C: The connection.
+        """
+        connection = self.current()
+        if connection is None:
+            connection = self._open_connection()
+            with self._lock:
+                self._connections.append(connection)
+                self._local.generation = self._generation
+            self._local.connection = connection
+        return connection
+
+    def current(self) -> Optional[C]:
+        """
+        Returns the open connection of the current thread, if any.
+
+        Returns:
+            Optional[C]: The connection, None when the thread has none.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.generation != self._generation:
+            return None
+        return connection
+
+    def discard(self) -> None:
+        """
+        Closes the connection of the current thread, e.g. after it failed.
+        """
+        connection = self.current()
+        if connection is None:
+            return
+        self._local.connection = None
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        self._close_connection(connection)
+
+    def close_all(self) -> None:
+        """
+        Closes the connections of every thread.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for connection in connections:
+            self._close_connection(connection)
@@ -6,12 +6,67 @@ Description:
     Includes configuration for CORS (Cross-Origin Resource Sharing) to control which origins can access the API.
 """
 
+import json
 import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
 from dotenv import load_dotenv
 
 from src.domain.exceptions.configuration_exception import ConfigurationException
 
 
+@dataclass(frozen=True)
+class DeploymentSettings:
+    """
+    Connection settings of one Azure OpenAI deployment.
+
+    Attributes:
+        name (str): Label of the deployment in traces and logs.
+        endpoint (str): Azure OpenAI endpoint URL.
+        api_key (str): API key of the endpoint.
+        api_version (str): Version of the Azure OpenAI API.
+        deployment (str): Deployment name sent as the model of each request.
+    """
+    name: str
+    endpoint: str
+    api_key: str
+    api_version: str
+    deployment: str
+
+
+@dataclass(frozen=True)
+class AgentSettings:
+    """
+    LLM call settings of one agent.
+
+    Attributes:
+        deployment (str): Deployment name the agent sends its calls to.
+        timeout_seconds (float): Timeout of each LLM call (0 = client default).
+        max_tokens (int): Maximum completion tokens of each LLM call.
+        max_concurrency (int): LLM calls of this agent running at the same time (0 = unlimited).
+    """
+    deployment: str
+    timeout_seconds: float = 0.0
+    max_tokens: int = 1024
+    max_concurrency: int = 0
+
+
+@dataclass(frozen=True)
+class CascadeSettings:
+    """
+    Settings of the contradiction detection cascade.
+
+    Attributes:
+        deployment (str): Fast, cheap deployment screening every category first.
+        confidence_threshold (float): Screenings below this confidence are escalated to the detector deployment.
+        escalate_severe (bool): Whether screenings reporting a severe contradiction are escalated.
+    """
+    deployment: str
+    confidence_threshold: float = 0.8
+    escalate_severe: bool = True
+
+
 class AppSettings:
     """
     Centralized configuration for Azure OpenAI.
@@ -23,6 +78,62 @@ class AppSettings:
         - api_key (str): API key for Azure OpenAI.
         - api_version (str): Version of the Azure OpenAI API.
         - model (str): Deployment/model name used for OpenAI requests.
+        - tracing_exporter (str): Span exporter ("", "jsonl" or "otlp"). Empty disables export.
+        - tracing_jsonl_path (str): File receiving spans when the "jsonl" exporter is used.
+        - tracing_otlp_endpoint (str): OTLP/HTTP collector URL when the "otlp" exporter is used.
+        - tracing_service_name (str): Service name reported with exported spans.
+        - llm_prices (Dict[str, Dict[str, float]]): Prices per 1,000 tokens keyed by deployment name.
+        - fused_max_sentences (int): Inputs up to this size are analyzed with one fused LLM call (0 disables).
+        - cost_budget_per_request (float): Default maximum estimated LLM cost per request (0 = unlimited).
+        - classification_chunk_size (int): Sentences per chunk when classification is split into parallel calls.
+        - detection_block_size (int): Sentences per block when detection of a large category is split.
+        - analysis_max_workers (int): LLM calls run in parallel within one request.
+        - planner_call_latency_ms (float): Fixed latency per LLM call assumed by the strategy planner.
+        - planner_output_token_ms (float): Generation time per output token assumed by the strategy planner.
+        - pipelined_detection (bool): Stream the classification and detect each category as soon as it is classified.
+        - compression_min_size (int): Responses of at least this many bytes are compressed (0 compresses all).
+        - max_request_body_bytes (int): Maximum decompressed size of a compressed request body.
+        - max_concurrent_analyses (int): Analyses running at the same time (0 = unlimited).
+        - max_queued_analyses (int): Analyses waiting for a slot before new requests are rejected with 429.
+        - max_queue_wait_seconds (float): Maximum wait for a slot before a request is rejected with 503.
+        - max_sentences_per_request (int): Maximum sentences per request (0 = unlimited).
+        - max_text_bytes_per_request (int): Maximum UTF-8 size of the sentences of a request (0 = unlimited).
+        - llm_max_concurrent_calls (int): LLM calls running at the same time (0 = unlimited).
+        - llm_max_calls_per_request (int): LLM calls one request may run at the same time (0 = unlimited).
+        - priority_weights (Dict[str, float]): Share of the LLM call slots of each priority class.
+        - default_priority (str): Priority class of requests that do not set one.
+        - api_key_priorities (Dict[str, str]): Priority class of each client API key.
+        - deployments (List[DeploymentSettings]): Azure OpenAI deployments LLM calls are balanced across.
+          Defaults to the single deployment above.
+        - router_failover_attempts (int): Deployments tried per LLM call before the error is raised.
+        - router_cooldown_seconds (float): Time a throttled or failing deployment receives no traffic.
+        - hedge_after_percentile (float): Percentile of the recent LLM latency after which a call is
+          duplicated (0 disables hedging).
+        - hedge_budget_ratio (float): Maximum duplicated calls per LLM call.
+        - hedge_min_samples (int): LLM latencies observed before hedging starts.
+        - classifier, detector, fused (AgentSettings): Deployment, timeout, max tokens and concurrency
+          of the classification, detection and fused agents.
+        - detector_cascade (Optional[CascadeSettings]): Screening deployment and escalation rules of the
+          detection cascade, None when the cascade is disabled.
+        - warmup_llm_probe (bool): Send a one-token completion to each deployment during warmup.
+        - warmup_retry_seconds (float): Delay between warmup passes until the service is ready.
+        - warmup_timeout_seconds (float): Timeout of each warmup call.
+        - cache_backend (str): Result cache backend, "memory", "sqlite" or "redis" ("" disables caching).
+        - cache_ttl_seconds (float): Lifetime of cached results (0 = no expiry).
+        - cache_max_entries (int): Entries kept by the memory and SQLite backends.
+        - cache_max_entry_bytes (int): Encoded results larger than this are not cached.
+        - cache_sqlite_path (str): Database file shared by the workers of a host.
+        - cache_redis_url (str): Redis-protocol server shared by the nodes of the fleet.
+        - corpus_index_path (str): SQLite file of the corpus of approved documents ("" disables the corpus).
+        - corpus_candidates_per_sentence (int): Corpus sentences retrieved per sentence of a checked document.
+        - corpus_max_candidates_per_category (int): Corpus sentences sent to the detector per category.
+        - embeddings_deployment (str): Azure OpenAI embeddings deployment ("" disables the embeddings stage).
+        - embeddings_batch_size (int): Sentences sent per embeddings call.
+        - embeddings_min_similarity (float): Cosine similarity from which a corpus sentence is a vector candidate.
+        - llm_replay_mode (str): "record", "replay" or "replay-fast" to record or replay the agents' LLM calls
+          ("" for live calls).
+        - llm_replay_path (str): JSON Lines file of the recorded LLM calls.
+        - live_debounce_ms (float): Quiet period after the last edit before a live analysis is updated.
     """
 
     def __init__(self):
@@ -36,6 +147,42 @@ class AppSettings:
             - AZURE_OPENAI_API_VERSION
             - AZURE_OPENAI_DEPLOYMENT_NAME
             - CORS_ORIGINS (a comma-separated list of allowed origins for CORS)
+            - TRACING_EXPORTER, TRACING_JSONL_PATH, TRACING_OTLP_ENDPOINT, TRACING_SERVICE_NAME (optional)
+            - FUSED_MODE_MAX_SENTENCES (optional, defaults to 30)
+            - COST_BUDGET_PER_REQUEST, CLASSIFICATION_CHUNK_SIZE, DETECTION_BLOCK_SIZE, ANALYSIS_MAX_WORKERS,
+              PLANNER_CALL_LATENCY_MS, PLANNER_OUTPUT_TOKEN_MS (optional planner settings)
+            - PIPELINED_DETECTION (optional, defaults to true)
+            - COMPRESSION_MIN_SIZE (optional, defaults to 1024), MAX_REQUEST_BODY_BYTES (optional, defaults to 10 MB)
+            - MAX_CONCURRENT_ANALYSES, MAX_QUEUED_ANALYSES, MAX_QUEUE_WAIT_SECONDS, MAX_SENTENCES_PER_REQUEST,
+              MAX_TEXT_BYTES_PER_REQUEST (optional admission control limits)
+            - LLM_MAX_CONCURRENT_CALLS, LLM_MAX_CALLS_PER_REQUEST (optional LLM scheduler limits)
+            - PRIORITY_WEIGHTS (optional JSON, defaults to {"interactive": 8, "bulk": 1}),
+              DEFAULT_PRIORITY (optional, defaults to interactive),
+              API_KEY_PRIORITIES (optional JSON mapping client API keys to priority classes)
+            - AZURE_OPENAI_DEPLOYMENTS (optional JSON list of {"endpoint", "api_key", "deployment",
+              "api_version", "name"} objects; replaces the single deployment above, missing fields default to it)
+            - ROUTER_FAILOVER_ATTEMPTS (optional, defaults to 3), ROUTER_COOLDOWN_SECONDS (optional, defaults to 10)
+            - HEDGE_AFTER_PERCENTILE (optional, defaults to 0 = disabled), HEDGE_BUDGET_RATIO (optional,
+              defaults to 0.05), HEDGE_MIN_SAMPLES (optional, defaults to 20)
+            - {CLASSIFIER,DETECTOR,FUSED}_DEPLOYMENT, _TIMEOUT_SECONDS, _MAX_TOKENS, _MAX_CONCURRENCY
+              (optional per-agent settings; the deployment defaults to AZURE_OPENAI_DEPLOYMENT_NAME)
+            - DETECTOR_CASCADE_DEPLOYMENT (optional, enables the detection cascade),
+              DETECTOR_CASCADE_CONFIDENCE (optional, defaults to 0.8),
+              DETECTOR_CASCADE_ESCALATE_SEVERE (optional, defaults to true)
+            - WARMUP_LLM_PROBE (optional, defaults to false), WARMUP_RETRY_SECONDS (optional, defaults to 10),
+              WARMUP_TIMEOUT_SECONDS (optional, defaults to 5)
+            - CACHE_BACKEND (optional: memory, sqlite or redis; disabled by default), CACHE_TTL_SECONDS (optional,
+              defaults to 86400), CACHE_MAX_ENTRIES (optional, defaults to 10000), CACHE_MAX_ENTRY_BYTES (optional,
+              defaults to 1 MB), CACHE_SQLITE_PATH (optional, defaults to cache.sqlite3),
+              CACHE_REDIS_URL (optional, defaults to redis://localhost:6379/0)
+            - CORPUS_INDEX_PATH (optional, enables the corpus endpoints), CORPUS_CANDIDATES_PER_SENTENCE
+              (optional, defaults to 5), CORPUS_MAX_CANDIDATES_PER_CATEGORY (optional, defaults to 20)
+            - EMBEDDINGS_DEPLOYMENT (optional, enables the embeddings stage), EMBEDDINGS_BATCH_SIZE
+              (optional, defaults to 256), EMBEDDINGS_MIN_SIMILARITY (optional, defaults to 0.5)
+            - LLM_REPLAY_MODE (optional: record, replay or replay-fast), LLM_REPLAY_PATH (optional,
+              defaults to llm_calls.jsonl)
+            - LIVE_DEBOUNCE_MS (optional, defaults to 300)
+            - LLM_PRICES (optional JSON, e.g. {"gpt-4o": {"prompt": 0.0025, "completion": 0.01, "cached": 0.00125}})
 
         Raises:
             ConfigurationException: If any required environment variable is missing.
@@ -53,8 +200,326 @@ class AppSettings:
         self.api_version: str = os.getenv("AZURE_OPENAI_API_VERSION", "")
         self.model: str = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "")
 
+        self.tracing_exporter: str = os.getenv("TRACING_EXPORTER", "").strip().lower()
+        self.tracing_jsonl_path: str = os.getenv("TRACING_JSONL_PATH", "traces.jsonl")
+        self.tracing_otlp_endpoint: str = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318")
+        self.tracing_service_name: str = os.getenv("TRACING_SERVICE_NAME", "text-contradiction-api")
+
+        self.llm_prices = AppSettings._parse_llm_prices(os.getenv("LLM_PRICES", ""))
+        self.fused_max_sentences: int = AppSettings._parse_int("FUSED_MODE_MAX_SENTENCES", 30)
+
+        self.cost_budget_per_request: float = AppSettings._parse_float("COST_BUDGET_PER_REQUEST", 0.0)
+        self.classification_chunk_size: int = AppSettings._parse_int("CLASSIFICATION_CHUNK_SIZE", 150)
+        self.detection_block_size: int = AppSettings._parse_int("DETECTION_BLOCK_SIZE", 40)
+        self.analysis_max_workers: int = AppSettings._parse_int("ANALYSIS_MAX_WORKERS", 4)
+        self.planner_call_latency_ms: float = AppSettings._parse_float("PLANNER_CALL_LATENCY_MS", 400.0)
+        self.planner_output_token_ms: float = AppSettings._parse_float("PLANNER_OUTPUT_TOKEN_MS", 20.0)
+        self.pipelined_detection: bool = AppSettings._parse_bool("PIPELINED_DETECTION", True)
+
+        self.compression_min_size: int = AppSettings._parse_int("COMPRESSION_MIN_SIZE", 1024)
+        self.max_request_body_bytes: int = AppSettings._parse_int("MAX_REQUEST_BODY_BYTES", 10 * 1024 * 1024)
+
+        self.max_concurrent_analyses: int = AppSettings._parse_int("MAX_CONCURRENT_ANALYSES", 8)
+        self.max_queued_analyses: int = AppSettings._parse_int("MAX_QUEUED_ANALYSES", 32)
+        self.max_queue_wait_seconds: float = AppSettings._parse_float("MAX_QUEUE_WAIT_SECONDS", 10.0)
+        self.max_sentences_per_request: int = AppSettings._parse_int("MAX_SENTENCES_PER_REQUEST", 5000)
+        self.max_text_bytes_per_request: int = AppSettings._parse_int("MAX_TEXT_BYTES_PER_REQUEST", 2 * 1024 * 1024)
+
+        self.llm_max_concurrent_calls: int = AppSettings._parse_int("LLM_MAX_CONCURRENT_CALLS", 16)
+        self.llm_max_calls_per_request: int = AppSettings._parse_int("LLM_MAX_CALLS_PER_REQUEST", 4)
+        self.priority_weights: Dict[str, float] = AppSettings._parse_priority_weights(
+            os.getenv("PRIORITY_WEIGHTS", "")
+        )
+        self.default_priority: str = os.getenv("DEFAULT_PRIORITY", "").strip() or "interactive"
+        self.api_key_priorities: Dict[str, str] = AppSettings._parse_api_key_priorities(
+            os.getenv("API_KEY_PRIORITIES", "")
+        )
+
+        self.deployments: List[DeploymentSettings] = self._parse_deployments(
+            os.getenv("AZURE_OPENAI_DEPLOYMENTS", "")
+        )
+        if self.deployments:
+            first = self.deployments[0]
+            self.endpoint = self.endpoint or first.endpoint
+            self.api_key = self.api_key or first.api_key
+            self.api_version = self.api_version or first.api_version
+            self.model = self.model or first.deployment
+        self.router_failover_attempts: int = AppSettings._parse_int("ROUTER_FAILOVER_ATTEMPTS", 3)
+        self.router_cooldown_seconds: float = AppSettings._parse_float("ROUTER_COOLDOWN_SECONDS", 10.0)
+        self.hedge_after_percentile: float = AppSettings._parse_float("HEDGE_AFTER_PERCENTILE", 0.0)
+        self.hedge_budget_ratio: float = AppSettings._parse_float("HEDGE_BUDGET_RATIO", 0.05)
+        self.hedge_min_samples: int = AppSettings._parse_int("HEDGE_MIN_SAMPLES", 20)
+
+        self.warmup_llm_probe: bool = AppSettings._parse_bool("WARMUP_LLM_PROBE", False)
+        self.warmup_retry_seconds: float = AppSettings._parse_float("WARMUP_RETRY_SECONDS", 10.0)
+        self.warmup_timeout_seconds: float = AppSettings._parse_float("WARMUP_TIMEOUT_SECONDS", 5.0)
+
+        self.cache_backend: str = os.getenv("CACHE_BACKEND", "").strip().lower()
+        self.cache_ttl_seconds: float = AppSettings._parse_float("CACHE_TTL_SECONDS", 86400.0)
+        self.cache_max_entries: int = AppSettings._parse_int("CACHE_MAX_ENTRIES", 10000)
+        self.cache_max_entry_bytes: int = AppSettings._parse_int("CACHE_MAX_ENTRY_BYTES", 1024 * 1024)
+        self.cache_sqlite_path: str = os.getenv("CACHE_SQLITE_PATH", "cache.sqlite3")
+        self.cache_redis_url: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+        self.corpus_index_path: str = os.getenv("CORPUS_INDEX_PATH", "").strip()
+        self.corpus_candidates_per_sentence: int = AppSettings._parse_int("CORPUS_CANDIDATES_PER_SENTENCE", 5)
+        self.corpus_max_candidates_per_category: int = AppSettings._parse_int(
+            "CORPUS_MAX_CANDIDATES_PER_CATEGORY", 20
+        )
+
+        self.embeddings_deployment: str = os.getenv("EMBEDDINGS_DEPLOYMENT", "").strip()
+        self.embeddings_batch_size: int = AppSettings._parse_int("EMBEDDINGS_BATCH_SIZE", 256)
+        self.embeddings_min_similarity: float = AppSettings._parse_float("EMBEDDINGS_MIN_SIMILARITY", 0.5)
+
+        self.llm_replay_mode: str = os.getenv("LLM_REPLAY_MODE", "").strip().lower()
+        self.llm_replay_path: str = os.getenv("LLM_REPLAY_PATH", "llm_calls.jsonl")
+
+        self.live_debounce_ms: float = AppSettings._parse_float("LIVE_DEBOUNCE_MS", 300.0)
+
         self._validate()
 
+        self.classifier: AgentSettings = self._parse_agent_settings("CLASSIFIER", default_max_tokens=1024)
+        self.detector: AgentSettings = self._parse_agent_settings("DETECTOR", default_max_tokens=1024)
+        self.fused: AgentSettings = self._parse_agent_settings("FUSED", default_max_tokens=2048)
+
+        cascade_deployment = os.getenv("DETECTOR_CASCADE_DEPLOYMENT", "").strip()
+        self.detector_cascade: Optional[CascadeSettings] = None
+        if cascade_deployment:
+            confidence_threshold = AppSettings._parse_float("DETECTOR_CASCADE_CONFIDENCE", 0.8)
+            if confidence_threshold > 1:
+                raise ConfigurationException(
+                    f"DETECTOR_CASCADE_CONFIDENCE must be between 0 and 1, got {confidence_threshold}"
+                )
+            self.detector_cascade = CascadeSettings(
+                deployment=cascade_deployment,
+                confidence_threshold=confidence_threshold,
+                escalate_severe=AppSettings._parse_bool("DETECTOR_CASCADE_ESCALATE_SEVERE", True)
+            )
+
+        if not self.deployments:
+            self.deployments = [DeploymentSettings(
+                name=self.model,
+                endpoint=self.endpoint,
+                api_key=self.api_key,
+                api_version=self.api_version,
+                deployment=self.model
+            )]
+
+    @staticmethod
+    def _parse_int(name: str, default: int) -> int:
+        """
+        Reads a non-negative integer environment variable.
+
+        Args:
+            name (str): Name of the environment variable.
+            default (int): Value used when the variable is not set.
+
+        Returns:
+            int: The parsed value.
+
+        Raises:
+            ConfigurationException: If the value is not a non-negative integer.
+        """
+        raw_value = os.getenv(name, "").strip()
+        if not raw_value:
+            return default
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise ConfigurationException(f"{name} must be an integer, got '{raw_value}'")
+        if value < 0:
+            raise ConfigurationException(f"{name} must not be negative, got {value}")
+        return value
+
+    @staticmethod
+    def _parse_float(name: str, default: float) -> float:
+        """
+        Reads a non-negative float environment variable.
+
+        Args:
+            name (str): Name of the environment variable.
+            default (float): Value used when the variable is not set.
+
+        Returns:
+            float: The parsed value.
+
+        Raises:
+            ConfigurationException: If the value is not a non-negative number.
+        """
+        raw_value = os.getenv(name, "").strip()
+        if not raw_value:
+            return default
+        try:
+            value = float(raw_value)
+        except ValueError:
+            raise ConfigurationException(f"{name} must be a number, got '{raw_value}'")
+        if value < 0:
+            raise ConfigurationException(f"{name} must not be negative, got {value}")
+        return value
+
+    @staticmethod
+    def _parse_bool(name: str, default: bool) -> bool:
+        """
+        Reads a boolean environment variable ("true"/"false", "1"/"0", "yes"/"no").
+
+        Args:
+            name (str): Name of the environment variable.
+            default (bool): Value used when the variable is not set.
+
+        Returns:
+            bool: The parsed value.
+
+        Raises:
+            ConfigurationException: If the value is not a boolean.
+        """
+        raw_value = os.getenv(name, "").strip().lower()
+        if not raw_value:
+            return default
+        if raw_value in ("true", "1", "yes"):
+            return True
+        if raw_value in ("false", "0", "no"):
+            return False
+        raise ConfigurationException(f"{name} must be true or false, got '{raw_value}'")
+
+    @staticmethod
+    def _parse_llm_prices(raw_prices: str):
+        """
+        Parses the per-deployment token prices.
+
+        Args:
+            raw_prices (str): JSON object mapping deployment names to
+                              {"prompt": ..., "completion": ..., "cached": ...} prices per 1,000 tokens.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Parsed prices (empty when not configured).
+
+        Raises:
+            ConfigurationException: If the value is not a valid price mapping.
+        """
+        if not raw_prices.strip():
+            return {}
+        try:
+            prices = json.loads(raw_prices)
+            return {
+                str(deployment): {kind: float(value) for kind, value in deployment_prices.items()}
+                for deployment, deployment_prices in prices.items()
+            }
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise ConfigurationException(f"LLM_PRICES must be a JSON object of deployment prices: {exc}")
+
+    @staticmethod
+    def _parse_priority_weights(raw_weights: str) -> Dict[str, float]:
+        """
+        Parses the share of each priority class of the LLM scheduler.
+
+        Args:
+            raw_weights (str): JSON object mapping priority classes to positive weights.
+
+        Returns:
+            Dict[str, float]: Parsed weights ({"interactive": 8, "bulk": 1} when not configured).
+
+        Raises:
+            ConfigurationException: If the value is not a mapping of positive weights.
+        """
+        if not raw_weights.strip():
+            return {"interactive": 8.0, "bulk": 1.0}
+        try:
+            weights = {str(priority): float(weight) for priority, weight in json.loads(raw_weights).items()}
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise ConfigurationException(f"PRIORITY_WEIGHTS must be a JSON object of class weights: {exc}")
+        if not weights or any(weight <= 0 for weight in weights.values()):
+            raise ConfigurationException("PRIORITY_WEIGHTS must define at least one class, with positive weights")
+        return weights
+
+    @staticmethod
+    def _parse_api_key_priorities(raw_priorities: str) -> Dict[str, str]:
+        """
+        Parses the priority class assigned to each client API key.
+
+        Args:
+            raw_priorities (str): JSON object mapping API keys to priority classes.
+
+        Returns:
+            Dict[str, str]: Parsed mapping (empty when not configured).
+
+        Raises:
+            ConfigurationException: If the value is not a JSON object.
+        """
+        if not raw_priorities.strip():
+            return {}
+        try:
+            return {str(key): str(priority) for key, priority in json.loads(raw_priorities).items()}
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise ConfigurationException(f"API_KEY_PRIORITIES must be a JSON object of API key classes: {exc}")
+
+    def _parse_deployments(self, raw_deployments: str) -> List[DeploymentSettings]:
+        """
+        Parses the list of Azure OpenAI deployments.
+
+        Fields missing from an entry default to the single-deployment variables
+        (AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_KEY, AZURE_OPENAI_API_VERSION, AZURE_OPENAI_DEPLOYMENT_NAME).
+
+        Args:
+            raw_deployments (str): JSON list of deployment objects.
+
+        Returns:
+            List[DeploymentSettings]: Parsed deployments (empty when not configured).
+
+        Raises:
+            ConfigurationException: If the value is not a list of complete deployment objects.
+        """
+        if not raw_deployments.strip():
+            return []
+        try:
+            entries = json.loads(raw_deployments)
+            if not isinstance(entries, list) or not entries:
+                raise ValueError("expected a non-empty list")
+            deployments = []
+            for index, entry in enumerate(entries):
+                endpoint = str(entry.get("endpoint") or self.endpoint)
+                deployment = str(entry.get("deployment") or self.model)
+                deployments.append(DeploymentSettings(
+                    name=str(entry.get("name") or f"{deployment}@{endpoint}"),
+                    endpoint=endpoint,
+                    api_key=str(entry.get("api_key") or self.api_key),
+                    api_version=str(entry.get("api_version") or self.api_version),
+                    deployment=deployment
+                ))
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise ConfigurationException(f"AZURE_OPENAI_DEPLOYMENTS must be a JSON list of deployments: {exc}")
+
+        incomplete = [d.name for d in deployments if not all([d.endpoint, d.api_key, d.api_version, d.deployment])]
+        if incomplete:
+            raise ConfigurationException(
+                f"AZURE_OPENAI_DEPLOYMENTS entries miss an endpoint, api_key, api_version or deployment: "
+                f"{', '.join(incomplete)}"
+            )
+        return deployments
+
+    def _parse_agent_settings(self, prefix: str, default_max_tokens: int) -> AgentSettings:
+        """
+        Reads the settings of one agent from the variables starting with the given prefix.
+
+        Args:
+            prefix (str): Variable prefix of the agent (e.g., "CLASSIFIER").
+            default_max_tokens (int): Maximum completion tokens when <prefix>_MAX_TOKENS is not set.
+
+        Returns:
+            AgentSettings: The agent settings.
+
+        Raises:
+            ConfigurationException: If a value is invalid.
+        """
+        max_tokens = AppSettings._parse_int(f"{prefix}_MAX_TOKENS", default_max_tokens)
+        if max_tokens == 0:
+            raise ConfigurationException(f"{prefix}_MAX_TOKENS must be positive")
+        return AgentSettings(
+            deployment=os.getenv(f"{prefix}_DEPLOYMENT", "").strip() or self.model,
+            timeout_seconds=AppSettings._parse_float(f"{prefix}_TIMEOUT_SECONDS", 0.0),
+            max_tokens=max_tokens,
+            max_concurrency=AppSettings._parse_int(f"{prefix}_MAX_CONCURRENCY", 0)
+        )
+
     def _validate(self):
         """
         Validates that all essential environment variables are present.
@@ -76,3 +541,36 @@ class AppSettings:
             raise ConfigurationException(
                 f"The following environment variables are missing: {', '.join(missing)}"
             )
+
+        if self.tracing_exporter not in ("", "jsonl", "otlp"):
+            raise ConfigurationException(
+                f"TRACING_EXPORTER must be 'jsonl' or 'otlp', got '{self.tracing_exporter}'"
+            )
+
+        unknown = sorted(
+            {self.default_priority, *self.api_key_priorities.values()} - set(self.priority_weights)
+        )
+        if unknown:
+            raise ConfigurationException(
+                f"Priority classes {', '.join(unknown)} are not defined in PRIORITY_WEIGHTS"
+            )
+
+        if self.cache_backend not in ("", "memory", "sqlite", "redis"):
+            raise ConfigurationException(
+                f"CACHE_BACKEND must be 'memory', 'sqlite' or 'redis', got '{self.cache_backend}'"
+            )
+
+        if self.llm_replay_mode not in ("", "record", "replay", "replay-fast"):
+            raise ConfigurationException(
+                f"LLM_REPLAY_MODE must be 'record', 'replay' or 'replay-fast', got '{self.llm_replay_mode}'"
+            )
+
+        if self.embeddings_batch_size < 1:
+            raise ConfigurationException(
+                f"EMBEDDINGS_BATCH_SIZE must be at least 1, got {self.embeddings_batch_size}"
+            )
+
+        if self.hedge_after_percentile >= 100:
+            raise ConfigurationException(
+                f"HEDGE_AFTER_PERCENTILE must be below 100, got {self.hedge_after_percentile}"
+            )
@@ -0,0 +1,70 @@
+"""
+Module: arabic_normalizer
+Description:
+    Normalization and tokenization of Arabic sentences for lexical retrieval.
+    Removes diacritics and tatweel, unifies the letter variants that are written interchangeably
+    (alef forms, alef maqsura, taa marbuta), converts Arabic-Indic digits, strips the definite
+    article and attached conjunctions and prepositions, and drops stop words, so that two
+    phrasings of the same statement share their index terms.
+"""
+
+import re
+from typing import List
+
+_DIACRITICS = re.compile("[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]")
+_TOKEN = re.compile(r"\w+")
+
+_LETTERS = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي",
+    **{chr(0x0660 + digit): str(digit) for digit in range(10)},
+    **{chr(0x06F0 + digit): str(digit) for digit in range(10)},
+})
+
+# Attached prefixes stripped from tokens, longest first. Stripped before the alef variants are
+# unified, so that a word starting with "إل" does not lose its first letters
+_PREFIXES = ("وال", "بال", "كال", "فال", "لل", "ال")
+
+_STOP_WORDS = frozenset(
+    "في من علي الي عن ان او ثم قد لا ما مع كل هذا هذه ذلك تلك التي الذي الذين هو هي هم كان كانت يتم "
+    "بين عند حتي لم لن اذا كما غير بعد قبل اي ايضا و ب ل ف ك".split()
+)
+
+
+def normalize(text: str) -> str:
+    """
+    Returns the normalized form of a sentence: lowercase, without diacritics or tatweel,
+    with unified letter variants and ASCII digits.
+
+    Args:
+        text (str): Sentence to normalize.
+
+    Returns:
+        str: The normalized sentence.
+    """
+    return _DIACRITICS.sub("", text).translate(_LETTERS).lower()
+
+
+def terms(text: str) -> List[str]:
+    """
+    Returns the distinct index terms of a sentence, in order of first occurrence.
+
+    Args:
+        text (str): Sentence, not normalized.
+
+    Returns:
+        List[str]: Terms of at least two characters, without attached prefixes and stop words.
+    """
+    result: List[str] = []
+    seen = set()
+    for token in _TOKEN.findall(_DIACRITICS.sub("", text)):
+        for prefix in _PREFIXES:
+            if token.startswith(prefix) and len(token) - len(prefix) >= 3:
+                token = token[len(prefix):]
+                break
+        token = token.translate(_LETTERS).lower()
+        if len(token) < 2 or token in _STOP_WORDS or token in seen:
+            continue
+        seen.add(token)
+        result.append(token)
+    return result
@@ -0,0 +1,392 @@
+"""
+Module: sqlite_corpus_index
+Description:
+    Corpus index stored in a SQLite database (WAL mode), implementing the CorpusIndexPort.
+    Each sentence is stored with its normalized form and category, and an inverted index maps
+    every term to the sentences containing it, with the document frequency of each term.
+    A query reads the postings of its few rarest terms only, each capped in length, so its
+    cost does not grow with the size of the corpus.
+
+    With an embedding store, sentence vectors are stored too, and searched in memory by
+    cosine similarity; the lexical and vector rankings are fused, so paraphrases sharing
+    no distinctive term are still retrieved.
+"""
+
+import heapq
+import math
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import openai
+
+from src.domain.models.classification_result import ClassificationResult
+from src.domain.models.corpus import CorpusSentence
+from src.domain.ports.input.corpus_index_port import CorpusIndexPort
+from src.insfrastructure.concurrency.thread_connections import ThreadConnections
+from src.insfrastructure.corpus.arabic_normalizer import normalize, terms
+
+if TYPE_CHECKING:
+    from src.insfrastructure.embeddings.embedding_store import EmbeddingStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS corpus_sentences (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    document_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS corpus_sentences_document ON corpus_sentences (document_id);
+CREATE TABLE IF NOT EXISTS corpus_postings (
+    term TEXT NOT NULL,
+    sentence_id INTEGER NOT NULL,
+    PRIMARY KEY (term, sentence_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS corpus_terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS corpus_stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+INSERT OR IGNORE INTO corpus_stats (name, value) VALUES ('sentences', 0);
+CREATE TABLE IF NOT EXISTS corpus_vectors (
+    sentence_id INTEGER PRIMARY KEY,
+    vector BLOB NOT NULL
+);
+"""
+
+# Score multiplier of candidates classified in the category of the query
+SAME_CATEGORY_BOOST = 1.5
+
+# Rank offset of reciprocal rank fusion: a result ranked r in a list scores 1 / (RRF_K + r)
+RRF_K = 60
+
+# Vectors read from the database per query when loading new sentences into memory
+VECTOR_LOAD_BATCH = 10000
+
+
+class SqliteCorpusIndex(CorpusIndexPort):
+    """
+    Inverted index of approved sentences in a SQLite file.
+
+    Retrieval scores stored sentences by the summed IDF of the query terms they share. Terms
+    found in more than max_df_ratio of the sentences carry little signal and are skipped
+    (once the corpus has min_corpus_for_df_cutoff sentences); of the others, only the
+    max_query_terms rarest are read, and at most max_postings sentences per term, newest first.
+
+    With embeddings, the vector_candidates nearest sentences with a cosine similarity of at
+    least min_similarity are merged with the lexical results by reciprocal rank fusion. The
+    vectors of the database are loaded in memory on first search, then incrementally; sentence
+    ids are never reused, so vectors of sentences removed by another process are dropped when
+    the candidates are read.
+    """
+
+    def __init__(
+            self,
+            path: str = "corpus.sqlite3",
+            max_query_terms: int = 8,
+            max_postings: int = 2000,
+            max_df_ratio: float = 0.05,
+            min_corpus_for_df_cutoff: int = 1000,
+            busy_timeout_ms: int = 5000,
+            embeddings: Optional["EmbeddingStore"] = None,
+            vector_candidates: int = 50,
+            min_similarity: float = 0.5
+    ):
+        """
+        Opens (and creates if needed) the corpus database.
+
+        Args:
+            path (str): Path of the database file.
+            max_query_terms (int): Rarest query terms whose postings are read.
+            max_postings (int): Sentences read per query term.
+            max_df_ratio (float): Terms in a larger share of the sentences are skipped.
+            min_corpus_for_df_cutoff (int): Corpus size from which max_df_ratio applies.
+            busy_timeout_ms (int): Time a connection waits for a lock held by another writer.
+            embeddings (Optional[EmbeddingStore]): Store embedding the sentences. Defaults to lexical search only.
+            vector_candidates (int): Nearest sentences retrieved by vector search per query.
+            min_similarity (float): Cosine similarity below which vector results are ignored.
+        """
+        self.path = path
+        self.max_query_terms = max_query_terms
+        self.max_postings = max_postings
+        self.max_df_ratio = max_df_ratio
+        self.min_corpus_for_df_cutoff = min_corpus_for_df_cutoff
+        self.busy_timeout_ms = busy_timeout_ms
+        self.embeddings = embeddings
+        self.vector_candidates = vector_candidates
+        self.min_similarity = min_similarity
+        self._connections = ThreadConnections(self._open_connection, sqlite3.Connection.close)
+
+        self._vectors = None
+        self._loaded_vector_id = 0
+        self._vector_lock = threading.Lock()
+        if embeddings is not None:
+            from src.insfrastructure.embeddings.vector_index import VectorIndex
+            self._vectors = VectorIndex()
+
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        connection.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current thread, opening it on first use.
+        """
+        return self._connections.get()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Opens a connection in WAL mode.
+        """
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return connection
+
+    def add_document(self, document_id: str, sentences: List[str], classification: ClassificationResult) -> int:
+        categories: Dict[int, str] = {}
+        for category in classification.categories:
+            for index in category.indices:
+                categories.setdefault(index, category.name)
+
+        # Embed before the write transaction, so a failing embedding call leaves the corpus unchanged
+        vectors = self.embeddings.embed(sentences) if self.embeddings is not None and sentences else None
+
+        connection = self._connection()
+        with connection:
+            removed = self._remove(connection, document_id)
+            for position, text in enumerate(sentences):
+                normalized = normalize(text)
+                cursor = connection.execute(
+                    "INSERT INTO corpus_sentences (document_id, position, text, normalized, category) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (document_id, position, text, normalized, categories.get(position, ""))
+                )
+                sentence_terms = terms(text)
+                connection.executemany(
+                    "INSERT INTO corpus_postings (term, sentence_id) VALUES (?, ?)",
+                    [(term, cursor.lastrowid) for term in sentence_terms]
+                )
+                connection.executemany(
+                    "INSERT INTO corpus_terms (term, df) VALUES (?, 1) ON CONFLICT (term) DO UPDATE SET df = df + 1",
+                    [(term,) for term in sentence_terms]
+                )
+                if vectors is not None:
+                    connection.execute(
+                        "INSERT INTO corpus_vectors (sentence_id, vector) VALUES (?, ?)",
+                        (cursor.lastrowid, vectors[position].tobytes())
+                    )
+            connection.execute(
+                "UPDATE corpus_stats SET value = value + ? WHERE name = 'sentences'", (len(sentences),)
+            )
+        self._forget(removed)
+        return len(sentences)
+
+    def remove_document(self, document_id: str) -> int:
+        connection = self._connection()
+        with connection:
+            removed = self._remove(connection, document_id)
+        self._forget(removed)
+        return len(removed)
+
+    @staticmethod
+    def _remove(connection: sqlite3.Connection, document_id: str) -> List[int]:
+        """
+        Deletes the sentences of a document, their postings and vectors, inside the caller's
+        transaction, and returns their ids.
+        """
+        rows = connection.execute(
+            "SELECT id, text FROM corpus_sentences WHERE document_id = ?", (document_id,)
+        ).fetchall()
+        for sentence_id, text in rows:
+            sentence_terms = terms(text)
+            connection.executemany(
+                "DELETE FROM corpus_postings WHERE term = ? AND sentence_id = ?",
+                [(term, sentence_id) for term in sentence_terms]
+            )
+            connection.executemany(
+                "UPDATE corpus_terms SET df = df - 1 WHERE term = ?", [(term,) for term in sentence_terms]
+            )
+        if rows:
+            connection.execute("DELETE FROM corpus_terms WHERE df <= 0")
+            connection.executemany(
+                "DELETE FROM corpus_vectors WHERE sentence_id = ?", [(sentence_id,) for sentence_id, _ in rows]
+            )
+            connection.execute("DELETE FROM corpus_sentences WHERE document_id = ?", (document_id,))
+            connection.execute(
+                "UPDATE corpus_stats SET value = value - ? WHERE name = 'sentences'", (len(rows),)
+            )
+        return [sentence_id for sentence_id, _ in rows]
+
+    def _forget(self, sentence_ids: List[int]) -> None:
+        """
+        Drops the in-memory vectors of removed sentences.
+        """
+        if self._vectors is not None and sentence_ids:
+            self._vectors.remove(sentence_ids)
+
+    def search(
+            self,
+            sentence: str,
+            limit: int,
+            category: Optional[str] = None,
+            exclude_document: Optional[str] = None
+    ) -> List[CorpusSentence]:
+        return self.search_many([sentence], limit, category=category, exclude_document=exclude_document)[0]
+
+    def search_many(
+            self,
+            sentences: List[str],
+            limit: int,
+            category: Optional[str] = None,
+            exclude_document: Optional[str] = None
+    ) -> List[List[CorpusSentence]]:
+        corpus_size = self.size()
+        if corpus_size == 0 or limit <= 0:
+            return [[] for _ in sentences]
+
+        connection = self._connection()
+        # The excluded document is dropped before the shortlist is cut, so its sentences cannot fill it
+        excluded = set()
+        if exclude_document is not None:
+            excluded = {sentence_id for (sentence_id,) in connection.execute(
+                "SELECT id FROM corpus_sentences WHERE document_id = ?", (exclude_document,)
+            )}
+        results: List[List[CorpusSentence]] = []
+        for sentence, similarities in zip(sentences, self._vector_search(sentences)):
+            scores = self._lexical_scores(connection, sentence, corpus_size)
+            if similarities:
+                scores = SqliteCorpusIndex._fuse(scores, similarities)
+            if excluded:
+                scores = {sentence_id: score for sentence_id, score in scores.items() if sentence_id not in excluded}
+            results.append(self._rank(connection, scores, limit, category, exclude_document))
+        return results
+
+    def _lexical_scores(self, connection: sqlite3.Connection, sentence: str, corpus_size: int) -> Dict[int, float]:
+        """
+        Scores the sentences sharing terms with a query by the summed IDF of the shared terms.
+        """
+        query_terms = terms(sentence)
+        if not query_terms:
+            return {}
+
+        placeholders = ",".join("?" * len(query_terms))
+        frequencies = connection.execute(
+            f"SELECT term, df FROM corpus_terms WHERE term IN ({placeholders})", query_terms
+        ).fetchall()
+
+        max_df = corpus_size
+        if corpus_size >= self.min_corpus_for_df_cutoff:
+            max_df = max(int(corpus_size * self.max_df_ratio), 1)
+        selected = sorted((df, term) for term, df in frequencies if df <= max_df)[:self.max_query_terms]
+
+        scores: Dict[int, float] = {}
+        for df, term in selected:
+            idf = math.log(1 + corpus_size / df)
+            for (sentence_id,) in connection.execute(
+                    "SELECT sentence_id FROM corpus_postings WHERE term = ? ORDER BY sentence_id DESC LIMIT ?",
+                    (term, self.max_postings)
+            ):
+                scores[sentence_id] = scores.get(sentence_id, 0.0) + idf
+        return scores
+
+    def _vector_search(self, sentences: List[str]) -> List[Dict[int, float]]:
+        """
+        Returns, for each query, the cosine similarity of its nearest stored sentences.
+
+        Without embeddings, or when the queries cannot be embedded, every query gets no
+        vector results and the search is lexical only.
+        """
+        if self.embeddings is None or not sentences:
+            return [{} for _ in sentences]
+        try:
+            queries = self.embeddings.embed(sentences)
+        except openai.OpenAIError:
+            return [{} for _ in sentences]
+
+        self._load_vectors()
+        return [
+            {sentence_id: similarity for sentence_id, similarity in ranking if similarity >= self.min_similarity}
+            for ranking in self._vectors.search(queries, self.vector_candidates)
+        ]
+
+    def _load_vectors(self) -> None:
+        """
+        Loads into memory the vectors stored since the last load.
+        """
+        import numpy as np
+
+        with self._vector_lock:
+            connection = self._connection()
+            while True:
+                rows = connection.execute(
+                    "SELECT sentence_id, vector FROM corpus_vectors WHERE sentence_id > ? ORDER BY sentence_id LIMIT ?",
+                    (self._loaded_vector_id, VECTOR_LOAD_BATCH)
+                ).fetchall()
+                if not rows:
+                    return
+                vectors = np.frombuffer(b"".join(vector for _, vector in rows), dtype=np.float32)
+                self._vectors.add([sentence_id for sentence_id, _ in rows], vectors.reshape(len(rows), -1))
+                self._loaded_vector_id = rows[-1][0]
+
+    @staticmethod
+    def _fuse(lexical: Dict[int, float], similarities: Dict[int, float]) -> Dict[int, float]:
+        """
+        Merges the lexical and vector rankings by reciprocal rank fusion.
+        """
+        fused: Dict[int, float] = {}
+        for scores in (lexical, similarities):
+            ranking = sorted(scores, key=lambda sentence_id: (-scores[sentence_id], -sentence_id))
+            for rank, sentence_id in enumerate(ranking, start=1):
+                fused[sentence_id] = fused.get(sentence_id, 0.0) + 1.0 / (RRF_K + rank)
+        return fused
+
+    @staticmethod
+    def _rank(
+            connection: sqlite3.Connection,
+            scores: Dict[int, float],
+            limit: int,
+            category: Optional[str],
+            exclude_document: Optional[str]
+    ) -> List[CorpusSentence]:
+        """
+        Reads the best scored sentences, boosting the query's category and skipping the excluded document.
+        """
+        if not scores:
+            return []
+
+        # Fetch a few more than needed: the category boost reorders them. Sentences of the excluded
+        # document are already left out of the scores; the check below covers a concurrent re-add
+        shortlist = heapq.nlargest(limit * 4, scores.items(), key=lambda item: item[1])
+        placeholders = ",".join("?" * len(shortlist))
+        rows = connection.execute(
+            f"SELECT id, document_id, text, category FROM corpus_sentences WHERE id IN ({placeholders})",
+            [sentence_id for sentence_id, _ in shortlist]
+        ).fetchall()
+
+        ranked = []
+        for sentence_id, document_id, text, sentence_category in rows:
+            if exclude_document is not None and document_id == exclude_document:
+                continue
+            score = scores[sentence_id]
+            if category and sentence_category == category:
+                score *= SAME_CATEGORY_BOOST
+            ranked.append((score, sentence_id, CorpusSentence(sentence_id, document_id, text, sentence_category)))
+        ranked.sort(key=lambda item: (-item[0], -item[1]))
+        return [candidate for _, _, candidate in ranked[:limit]]
+
+    def size(self) -> int:
+        row = self._connection().execute("SELECT value FROM corpus_stats WHERE name = 'sentences'").fetchone()
+        return row[0] if row else 0
+
+    def close(self) -> None:
+        """
+        Closes the connections of every thread; the last one checkpoints the WAL into the database.
+        """
+        self._connections.close_all()
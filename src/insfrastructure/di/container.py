@@ -6,13 +6,42 @@ Description:
     and dependency injection principles.
 """
 
+import hashlib
+import json
+from dataclasses import replace
+from typing import TYPE_CHECKING, Optional, Tuple
+
 from src.application.use_cases.analyse_text_use_case import AnalyzeTextUseCase
+from src.application.use_cases.corpus_use_case import CorpusUseCase
+from src.application.use_cases.live_analysis_use_case import LiveAnalysisUseCase
+from src.domain.services.corpus_check_service import CorpusCheckService
+from src.domain.services.strategy_planner import CostModel, StrategyPlanner
 from src.domain.services.text_analysis_service import TextAnalysisService
 from src.insfrastructure.agents.contradiction_detector_agent import ContradictionDetector
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.agents.fused_analyzer_agent import FusedAnalyzer
+from src.insfrastructure.agents.llm_recorder import LlmCallStore, LlmRecorder
 from src.insfrastructure.agents.sentence_classifier_agent import SentenceClassifier
+from src.insfrastructure.cache.cache_backend import CacheBackend
+from src.insfrastructure.cache.caching_agents import CachingClassifierAgent, CachingDetectorAgent
+from src.insfrastructure.cache.memory_cache import MemoryCacheBackend
+from src.insfrastructure.cache.redis_cache import RedisCacheBackend
+from src.insfrastructure.cache.result_cache import ResultCache
+from src.insfrastructure.cache.sqlite_cache import SqliteCacheBackend
+from src.insfrastructure.concurrency.admission_controller import AdmissionController
+from src.insfrastructure.concurrency.llm_scheduler import LlmScheduler
 from src.insfrastructure.config.app_settings import AppSettings
+from src.insfrastructure.corpus.sqlite_corpus_index import SqliteCorpusIndex
+from src.insfrastructure.di.warmup import Warmup
+from src.insfrastructure.observability.span_exporters import JsonLinesSpanExporter, OtlpHttpSpanExporter
+from src.insfrastructure.observability.tracer import Tracer
+from src.insfrastructure.observability.usage_tracker import UsageTracker
 from src.insfrastructure.prompts.prompt_loader import PromptyLoader
 
+if TYPE_CHECKING:
+    from src.insfrastructure.embeddings.embedding_store import EmbeddingStore
+    from src.insfrastructure.embeddings.semantic_grouper import SemanticSentenceGrouper
+
 
 class Container:
     """
@@ -28,24 +57,356 @@ class Container:
 
         Attributes:
             app_settings (AppSettings): Application configuration and environment variables.
+            tracer (Tracer): Request tracer shared by the use case, service, agents and prompt provider.
+            usage_tracker (UsageTracker): Per-request token and cost accounting fed by the agents.
+            llm_scheduler (LlmScheduler): Shares the LLM call slots between priority classes and requests.
+            deployment_router (DeploymentRouter): Balances LLM calls across the configured deployments.
+                                                  Agents using another deployment name get a router of their own.
             prompt_provider (PromptyLoader): Provides prompts to agents.
+            llm_recorder (Optional[LlmRecorder]): Records or replays the agents' LLM calls,
+                                                  None when LLM_REPLAY_MODE is not set.
             classifier_agent (SentenceClassifier): Agent responsible for sentence classification.
             detector_agent (ContradictionDetector): Agent responsible for contradiction detection.
+            fused_agent (FusedAnalyzer): Agent classifying and detecting in one call for small inputs.
+            planner (StrategyPlanner): Chooses the execution strategy of each analysis.
+            cache_backend (Optional[CacheBackend]): Storage of the result cache and of the embeddings,
+                                                    None when CACHE_BACKEND is not set.
+            result_cache (Optional[ResultCache]): Cache of analysis, classification and detection results,
+                                                  None when CACHE_BACKEND is not set.
+            embedding_store (Optional[EmbeddingStore]): Cached sentence embeddings grouping the sentences
+                                                        of large analyses and retrieving corpus paraphrases,
+                                                        None when EMBEDDINGS_DEPLOYMENT is not set.
             text_analysis_service (TextAnalysisService): Domain service orchestrating classification and detection.
             analyze_text_use_case (AnalyzeTextUseCase): Application use case for text analysis.
+            corpus_index (Optional[SqliteCorpusIndex]): Index of the approved documents,
+                                                        None when CORPUS_INDEX_PATH is not set.
+            corpus_use_case (Optional[CorpusUseCase]): Adds approved documents to the corpus and checks new
+                                                       documents against it, None when CORPUS_INDEX_PATH is not set.
+            live_analysis_use_case (LiveAnalysisUseCase): Opens the sessions of the live analysis WebSocket.
+            admission_controller (AdmissionController): Limits request size, concurrency and queueing of analyses.
+            warmup (Warmup): Compiles prompts and warms the deployment connections before traffic.
         """
         # Load application configuration
         self.app_settings = AppSettings()
 
+        # Initialize tracing
+        self.tracer = Tracer(exporters=self._build_span_exporters())
+        self.usage_tracker = UsageTracker(prices=self.app_settings.llm_prices)
+
+        # Initialize LLM call scheduling
+        self.llm_scheduler = LlmScheduler(
+            max_concurrent_calls=self.app_settings.llm_max_concurrent_calls,
+            max_calls_per_request=self.app_settings.llm_max_calls_per_request,
+            weights=self.app_settings.priority_weights,
+            default_priority=self.app_settings.default_priority,
+            tracer=self.tracer
+        )
+
+        # Initialize deployment routing
+        self._routers = {}
+        self.deployment_router = self._build_router(self.app_settings.model)
+
         # Initialize prompt provider
-        self.prompt_provider = PromptyLoader()
+        self.prompt_provider = PromptyLoader(tracer=self.tracer)
 
         # Initialize agents
-        self.classifier_agent = SentenceClassifier(self.app_settings, self.prompt_provider)
-        self.detector_agent = ContradictionDetector(self.app_settings, self.prompt_provider)
+        self.llm_recorder: Optional[LlmRecorder] = None
+        if self.app_settings.llm_replay_mode:
+            self.llm_recorder = LlmRecorder(
+                LlmCallStore(self.app_settings.llm_replay_path), self.app_settings.llm_replay_mode
+            )
+        self.classifier_agent = SentenceClassifier(
+            self.app_settings, self.prompt_provider, tracer=self.tracer,
+            usage_tracker=self.usage_tracker, scheduler=self.llm_scheduler,
+            router=self._build_router(self.app_settings.classifier.deployment),
+            agent_settings=self.app_settings.classifier,
+            recorder=self.llm_recorder
+        )
+        self.detector_agent = ContradictionDetector(
+            self.app_settings, self.prompt_provider, tracer=self.tracer,
+            usage_tracker=self.usage_tracker, scheduler=self.llm_scheduler,
+            router=self._build_router(self.app_settings.detector.deployment),
+            agent_settings=self.app_settings.detector,
+            cascade=self.app_settings.detector_cascade,
+            cascade_router=(
+                self._build_router(self.app_settings.detector_cascade.deployment)
+                if self.app_settings.detector_cascade else None
+            ),
+            recorder=self.llm_recorder
+        )
+
+        self.fused_agent = FusedAnalyzer(
+            self.app_settings, self.prompt_provider, tracer=self.tracer,
+            usage_tracker=self.usage_tracker, scheduler=self.llm_scheduler,
+            router=self._build_router(self.app_settings.fused.deployment),
+            agent_settings=self.app_settings.fused,
+            recorder=self.llm_recorder
+        )
 
-        # Initialize domain service
-        self.text_analysis_service = TextAnalysisService(self.classifier_agent, self.detector_agent)
+        # Initialize domain services
+        self.planner = self._build_planner()
+        self.cache_backend = self._build_cache_backend()
+        self.result_cache = self._build_result_cache(self.cache_backend)
+        self.embedding_store = self._build_embedding_store(self.cache_backend)
+        classifier_agent = self.classifier_agent
+        detector_agent = self.detector_agent
+        if self.result_cache is not None:
+            classifier_agent = CachingClassifierAgent(classifier_agent, self.result_cache)
+            detector_agent = CachingDetectorAgent(detector_agent, self.result_cache)
+        self.text_analysis_service = TextAnalysisService(
+            classifier_agent,
+            detector_agent,
+            tracer=self.tracer,
+            fused_agent=self.fused_agent,
+            planner=self.planner,
+            cache=self.result_cache,
+            grouper=self._build_sentence_grouper()
+        )
 
         # Initialize use case
-        self.analyze_text_use_case = AnalyzeTextUseCase(self.text_analysis_service)
+        self.analyze_text_use_case = AnalyzeTextUseCase(
+            self.text_analysis_service,
+            tracer=self.tracer,
+            usage_tracker=self.usage_tracker,
+            default_cost_budget=self.app_settings.cost_budget_per_request or None
+        )
+
+        self.corpus_use_case: Optional[CorpusUseCase] = None
+        self.corpus_index: Optional[SqliteCorpusIndex] = None
+        if self.app_settings.corpus_index_path:
+            self.corpus_index = SqliteCorpusIndex(
+                self.app_settings.corpus_index_path,
+                embeddings=self.embedding_store,
+                min_similarity=self.app_settings.embeddings_min_similarity
+            )
+            corpus_check_service = CorpusCheckService(
+                classifier_agent,
+                detector_agent,
+                self.corpus_index,
+                tracer=self.tracer,
+                candidates_per_sentence=self.app_settings.corpus_candidates_per_sentence,
+                max_candidates_per_category=self.app_settings.corpus_max_candidates_per_category,
+                max_workers=self.app_settings.analysis_max_workers
+            )
+            self.corpus_use_case = CorpusUseCase(corpus_check_service, tracer=self.tracer)
+
+        # Initialize the live analysis use case
+        self.live_analysis_use_case = LiveAnalysisUseCase(
+            classifier_agent,
+            detector_agent,
+            tracer=self.tracer,
+            max_workers=self.app_settings.analysis_max_workers
+        )
+
+        # Initialize admission control
+        self.admission_controller = AdmissionController(
+            max_concurrent=self.app_settings.max_concurrent_analyses,
+            max_queue=self.app_settings.max_queued_analyses,
+            max_wait_seconds=self.app_settings.max_queue_wait_seconds,
+            max_sentences=self.app_settings.max_sentences_per_request,
+            max_text_bytes=self.app_settings.max_text_bytes_per_request
+        )
+
+        # Initialize warmup (run by the API lifespan); replayed calls need no reachable deployment
+        replaying = self.llm_recorder is not None and self.llm_recorder.replaying
+        self.warmup = Warmup(
+            self.prompt_provider,
+            [] if replaying else list(self._routers.values()),
+            llm_probe=self.app_settings.warmup_llm_probe,
+            timeout_seconds=self.app_settings.warmup_timeout_seconds
+        )
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the container: flushes the span exporters, then closes
+        the connections of the cache backend and the corpus index on every thread. Called once
+        the application stops serving.
+        """
+        self.tracer.shutdown()
+        if self.cache_backend is not None:
+            self.cache_backend.close()
+        if self.corpus_index is not None:
+            self.corpus_index.close()
+
+    def _build_router(self, deployment: str, embeddings: bool = False) -> DeploymentRouter:
+        """
+        Returns the router sending calls to the given deployment name on every configured endpoint.
+
+        Routers are shared by the agents using the same deployment, so their balancing sees all the
+        traffic of that deployment. The default deployment keeps the names of AZURE_OPENAI_DEPLOYMENTS.
+
+        Args:
+            deployment (str): Deployment name.
+            embeddings (bool): Whether the deployment serves embeddings rather than chat completions.
+
+        Returns:
+            DeploymentRouter: The router of the deployment.
+        """
+        if deployment not in self._routers:
+            deployments = self.app_settings.deployments
+            if deployment != self.app_settings.model:
+                deployments = [
+                    replace(entry, name=f"{deployment}@{entry.endpoint}", deployment=deployment)
+                    for entry in deployments
+                ]
+            self._routers[deployment] = DeploymentRouter(
+                deployments,
+                failover_attempts=self.app_settings.router_failover_attempts,
+                cooldown_seconds=self.app_settings.router_cooldown_seconds,
+                tracer=self.tracer,
+                hedge_percentile=self.app_settings.hedge_after_percentile,
+                hedge_budget_ratio=self.app_settings.hedge_budget_ratio,
+                hedge_min_samples=self.app_settings.hedge_min_samples,
+                embeddings=embeddings
+            )
+        return self._routers[deployment]
+
+    def _build_planner(self) -> StrategyPlanner:
+        """
+        Creates the strategy planner from the planner settings and the deployment prices.
+
+        Each stage is priced with the deployment serving it. With a detector cascade, every group is
+        screened and may be escalated, so detection is priced as both calls (an upper bound).
+
+        Returns:
+            StrategyPlanner: The configured planner.
+        """
+        settings = self.app_settings
+
+        def prices(deployment: str) -> Tuple[float, float]:
+            entry = settings.llm_prices.get(deployment, {})
+            return entry.get("prompt", 0.0), entry.get("completion", 0.0)
+
+        detection = prices(settings.detector.deployment)
+        if settings.detector_cascade:
+            screening = prices(settings.detector_cascade.deployment)
+            detection = (detection[0] + screening[0], detection[1] + screening[1])
+        default_prompt, default_completion = prices(settings.model)
+        cost_model = CostModel(
+            call_latency_ms=settings.planner_call_latency_ms,
+            output_token_ms=settings.planner_output_token_ms,
+            prompt_price_per_1k=default_prompt,
+            completion_price_per_1k=default_completion,
+            stage_prices={
+                "classification": prices(settings.classifier.deployment),
+                "detection": detection,
+                "fused": prices(settings.fused.deployment),
+            }
+        )
+        return StrategyPlanner(
+            cost_model,
+            fused_max_sentences=self.app_settings.fused_max_sentences,
+            classification_chunk_size=self.app_settings.classification_chunk_size,
+            detection_block_size=self.app_settings.detection_block_size,
+            max_workers=self.app_settings.analysis_max_workers,
+            pipelined_detection=self.app_settings.pipelined_detection
+        )
+
+    def _build_cache_backend(self) -> Optional[CacheBackend]:
+        """
+        Creates the cache backend selected by CACHE_BACKEND.
+
+        Returns:
+            Optional[CacheBackend]: The backend, or None when caching is disabled.
+        """
+        settings = self.app_settings
+        if settings.cache_backend == "memory":
+            return MemoryCacheBackend(settings.cache_max_entries, settings.cache_max_entry_bytes)
+        if settings.cache_backend == "sqlite":
+            return SqliteCacheBackend(
+                settings.cache_sqlite_path, settings.cache_max_entries, settings.cache_max_entry_bytes
+            )
+        if settings.cache_backend == "redis":
+            return RedisCacheBackend(settings.cache_redis_url, settings.cache_max_entry_bytes)
+        return None
+
+    def _build_result_cache(self, backend: Optional[CacheBackend]) -> Optional[ResultCache]:
+        """
+        Creates the result cache on the configured cache backend.
+
+        The key namespace is a digest of the prompt templates and of the settings changing the
+        results (deployments, cascade and planner limits), so workers only share results computed
+        with the same configuration, and a new prompt or model starts from an empty cache.
+
+        Args:
+            backend (Optional[CacheBackend]): Storage of the results.
+
+        Returns:
+            Optional[ResultCache]: The cache, or None when caching is disabled.
+        """
+        if backend is None:
+            return None
+        settings = self.app_settings
+
+        digest = hashlib.sha256()
+        for path in sorted(self.prompt_provider.templates_dir.glob("*.prompty")):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+        digest.update(json.dumps([
+            settings.classifier.deployment, settings.detector.deployment, settings.fused.deployment,
+            repr(settings.detector_cascade), settings.fused_max_sentences, settings.classification_chunk_size,
+            settings.detection_block_size, settings.embeddings_deployment
+        ]).encode("utf-8"))
+        return ResultCache(backend, namespace=digest.hexdigest()[:16], ttl_seconds=settings.cache_ttl_seconds)
+
+    def _build_embedding_store(self, backend: Optional[CacheBackend]) -> Optional["EmbeddingStore"]:
+        """
+        Creates the embedding store of the deployment selected by EMBEDDINGS_DEPLOYMENT.
+
+        Vectors are cached on the configured cache backend, shared like the results, or in an
+        in-process LRU when caching is disabled. The embeddings modules, and NumPy, are only
+        imported when embeddings are enabled.
+
+        Args:
+            backend (Optional[CacheBackend]): Storage of the vectors.
+
+        Returns:
+            Optional[EmbeddingStore]: The store, or None when embeddings are disabled.
+        """
+        settings = self.app_settings
+        if not settings.embeddings_deployment:
+            return None
+
+        from src.insfrastructure.agents.embedding_agent import AzureEmbeddingAgent
+        from src.insfrastructure.embeddings.embedding_store import EmbeddingStore
+
+        agent = AzureEmbeddingAgent(
+            settings, settings.embeddings_deployment, tracer=self.tracer,
+            usage_tracker=self.usage_tracker, scheduler=self.llm_scheduler,
+            router=self._build_router(settings.embeddings_deployment, embeddings=True),
+            batch_size=settings.embeddings_batch_size
+        )
+        return EmbeddingStore(
+            agent, backend, namespace=settings.embeddings_deployment, ttl_seconds=settings.cache_ttl_seconds
+        )
+
+    def _build_sentence_grouper(self) -> Optional["SemanticSentenceGrouper"]:
+        """
+        Creates the grouper forming classification chunks and detection blocks.
+
+        Returns:
+            Optional[SemanticSentenceGrouper]: A grouper by embedding similarity, or None (positional
+                                               grouping) when embeddings are disabled.
+        """
+        if self.embedding_store is None:
+            return None
+
+        from src.insfrastructure.embeddings.semantic_grouper import SemanticSentenceGrouper
+
+        return SemanticSentenceGrouper(self.embedding_store, tracer=self.tracer)
+
+    def _build_span_exporters(self):
+        """
+        Creates the span exporters selected by TRACING_EXPORTER.
+
+        Returns:
+            list: The configured exporters (empty when tracing export is disabled).
+        """
+        if self.app_settings.tracing_exporter == "jsonl":
+            return [JsonLinesSpanExporter(self.app_settings.tracing_jsonl_path)]
+        if self.app_settings.tracing_exporter == "otlp":
+            return [OtlpHttpSpanExporter(
+                self.app_settings.tracing_otlp_endpoint,
+                service_name=self.app_settings.tracing_service_name
+            )]
+        return []
@@ -0,0 +1,104 @@
+"""
+Module: warmup
+Description:
+    Warmup of the application before it receives traffic.
+    Compiles the prompt templates and opens the connections to the LLM deployments
+    (optionally with a one-token probe), and tracks the readiness reported by /ready.
+    Prompts are compiled while the deployments are probed, and routers are probed in parallel,
+    so the time to ready is that of the slowest step rather than their sum.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.prompts.prompt_loader import PromptyLoader
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """
+    Warms the prompt provider and the deployment routers, and records whether the service is ready.
+
+    The service is ready once the prompts are compiled and every router has at least one
+    reachable deployment.
+    """
+
+    def __init__(
+            self,
+            prompt_provider: PromptyLoader,
+            routers: List[DeploymentRouter],
+            llm_probe: bool = False,
+            timeout_seconds: float = 5.0
+    ):
+        """
+        Initializes the warmup.
+
+        Args:
+            prompt_provider (PromptyLoader): Prompt provider whose templates are compiled.
+            routers (List[DeploymentRouter]): Routers whose deployments are warmed.
+            llm_probe (bool): Whether to send a one-token completion to each deployment.
+            timeout_seconds (float): Timeout of each warmup call.
+        """
+        self.prompt_provider = prompt_provider
+        self.routers = routers
+        self.llm_probe = llm_probe
+        self.timeout_seconds = timeout_seconds
+
+        self.ready = False
+        self.prompts: List[str] = []
+        self.deployments: Dict[str, bool] = {}
+        self.error: Optional[str] = None
+
+    def run(self) -> bool:
+        """
+        Runs one warmup pass. Prompts are compiled by the first successful pass only.
+
+        Returns:
+            bool: Whether the service is ready.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=len(self.routers) + 1) as executor:
+                preload = executor.submit(self.prompt_provider.preload) if not self.prompts else None
+                probes = [
+                    executor.submit(router.warm_up, llm_probe=self.llm_probe, timeout_seconds=self.timeout_seconds)
+                    for router in self.routers
+                ]
+
+                deployments: Dict[str, bool] = {}
+                router_ready = []
+                for probe in probes:
+                    reachable = probe.result()
+                    deployments.update(reachable)
+                    router_ready.append(any(reachable.values()))
+                self.deployments = deployments
+                if preload is not None:
+                    self.prompts = preload.result()
+
+            self.ready = all(router_ready)
+            self.error = None if self.ready else "No reachable deployment"
+        except Exception as exc:
+            self.ready = False
+            self.error = f"{type(exc).__name__}: {exc}"
+
+        if not self.ready:
+            logger.warning("Warmup incomplete: %s (deployments: %s)", self.error, self.deployments)
+        return self.ready
+
+    def status(self) -> dict:
+        """
+        Describes the warmup state.
+
+        Returns:
+            dict: Readiness, compiled prompts, reachability of each deployment and the last error.
+        """
+        status = {
+            "status": "ready" if self.ready else "starting",
+            "prompts": len(self.prompts),
+            "deployments": self.deployments,
+        }
+        if self.error:
+            status["error"] = self.error
+        return status
@@ -0,0 +1,117 @@
+"""
+Module: embedding_store
+Description:
+    Embeds sentences as unit-norm NumPy vectors through an embedding agent, caching each
+    vector under the hash of its sentence in a cache backend. Repeated sentences, within a
+    call or across requests and documents, are embedded once; the sentences missing from
+    the cache are sent to the agent in one batched call.
+"""
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Sequence
+
+from src.domain.exceptions.configuration_exception import ConfigurationException
+from src.domain.ports.input.embedding_agent_port import EmbeddingAgentPort
+from src.insfrastructure.cache.cache_backend import CacheBackend
+from src.insfrastructure.cache.memory_cache import MemoryCacheBackend
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class EmbeddingStore:
+    """
+    Cached, batched access to sentence embeddings.
+
+    Vectors are normalized to unit length, so the dot product of two vectors is their cosine
+    similarity, and stored as float32 bytes under "<namespace>:emb:<sha256 of the sentence>".
+    hits and misses count the distinct sentences found in, and missing from, the cache.
+    """
+
+    def __init__(
+            self,
+            agent: EmbeddingAgentPort,
+            backend: Optional[CacheBackend] = None,
+            namespace: str = "default",
+            ttl_seconds: float = 0.0
+    ):
+        """
+        Initializes the store.
+
+        Args:
+            agent (EmbeddingAgentPort): Agent computing the vectors of uncached sentences.
+            backend (Optional[CacheBackend]): Storage of the vectors. Defaults to an in-process LRU
+                                              of 100,000 vectors.
+            namespace (str): Key prefix, e.g. identifying the embeddings deployment.
+            ttl_seconds (float): Lifetime of the cached vectors (0 = no expiry).
+
+        Raises:
+            ConfigurationException: If NumPy is not installed.
+        """
+        if np is None:
+            raise ConfigurationException("Embeddings require NumPy: pip install numpy")
+        self.agent = agent
+        self.backend = backend or MemoryCacheBackend(max_entries=100_000, max_entry_bytes=0)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def embed(self, sentences: Sequence[str]) -> "numpy.ndarray":
+        """
+        Returns the unit-norm vectors of the sentences.
+
+        Args:
+            sentences (Sequence[str]): Sentences to embed.
+
+        Returns:
+            numpy.ndarray: float32 matrix with one row per sentence, in the order of the sentences.
+        """
+        keys = [self._key(sentence) for sentence in sentences]
+        vectors: Dict[str, "numpy.ndarray"] = {}
+        missing: Dict[str, str] = {}
+        for key, sentence in zip(keys, sentences):
+            if key in vectors or key in missing:
+                continue
+            raw = self.backend.get(key)
+            if raw is not None:
+                vectors[key] = np.frombuffer(raw, dtype=np.float32)
+            else:
+                missing[key] = sentence
+
+        with self._lock:
+            self.hits += len(vectors)
+            self.misses += len(missing)
+
+        if missing:
+            embedded = self.agent.embed_sentences(list(missing.values()))
+            for key, values in zip(missing, embedded):
+                vector = EmbeddingStore._normalize(np.asarray(values, dtype=np.float32))
+                self.backend.set(key, vector.tobytes(), self.ttl_seconds)
+                vectors[key] = vector
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack([vectors[key] for key in keys])
+
+    def _key(self, sentence: str) -> str:
+        """
+        Returns the cache key of a sentence.
+        """
+        return f"{self.namespace}:emb:{hashlib.sha256(sentence.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def _normalize(vector: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Scales a vector to unit length; a zero vector is returned unchanged.
+        """
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
@@ -0,0 +1,76 @@
+"""
+Module: semantic_grouper
+Description:
+    Sentence grouper keeping semantically close sentences together, implementing the
+    SentenceGrouperPort with sentence embeddings. Chunks classified in parallel then hold
+    sentences of the same domains, and the blocks of a large category hold the sentences
+    most likely to contradict each other, so prompts stay small without splitting the
+    pairs worth comparing.
+"""
+
+from typing import List, Optional, Sequence
+
+import openai
+
+from src.domain.ports.input.sentence_grouper_port import PositionalSentenceGrouper, SentenceGrouperPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+from src.insfrastructure.embeddings.embedding_store import EmbeddingStore, np
+
+
+class SemanticSentenceGrouper(SentenceGrouperPort):
+    """
+    Greedy nearest-neighbour grouping of sentence embeddings.
+
+    Each group is seeded with the first ungrouped sentence and filled with the ungrouped
+    sentences most similar to it. When the embeddings cannot be computed, sentences are
+    grouped by position.
+    """
+
+    def __init__(self, store: EmbeddingStore, tracer: Optional[TracerPort] = None):
+        """
+        Initializes the grouper.
+
+        Args:
+            store (EmbeddingStore): Source of the sentence vectors.
+            tracer (Optional[TracerPort]): Tracer recording a span per grouping. Defaults to no tracing.
+        """
+        self.store = store
+        self.tracer = tracer or NullTracer()
+        self.fallback = PositionalSentenceGrouper()
+
+    def group(self, sentences: Sequence[str], max_group_size: int) -> List[List[int]]:
+        """
+        Partitions sentences into groups of at most max_group_size semantically close sentences.
+
+        Args:
+            sentences (Sequence[str]): Sentences to partition.
+            max_group_size (int): Maximum number of sentences per group.
+
+        Returns:
+            List[List[int]]: Positions of the sentences of each group, in ascending order.
+        """
+        size = max(max_group_size, 1)
+        if len(sentences) <= size:
+            return self.fallback.group(sentences, size)
+
+        with self.tracer.span("grouper.group", sentence_count=len(sentences)) as span:
+            try:
+                vectors = self.store.embed(sentences)
+            except openai.OpenAIError as exc:
+                span.set_attribute("fallback", type(exc).__name__)
+                return self.fallback.group(sentences, size)
+
+            groups: List[List[int]] = []
+            remaining = np.arange(len(sentences))
+            while len(remaining) > size:
+                scores = vectors[remaining] @ vectors[remaining[0]]
+                # Keep the seed in its own group even when exact duplicates tie with it
+                scores[0] = np.inf
+                nearest = np.argpartition(-scores, size - 1)[:size]
+                groups.append(sorted(int(position) for position in remaining[nearest]))
+                remaining = np.delete(remaining, nearest)
+            if len(remaining):
+                groups.append([int(position) for position in remaining])
+            span.set_attribute("group_count", len(groups))
+
+        return groups
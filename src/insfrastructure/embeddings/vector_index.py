@@ -0,0 +1,164 @@
+"""
+Module: vector_index
+Description:
+    Exact top-k cosine search over a NumPy matrix of unit-norm vectors.
+    Rows are appended into a matrix grown by doubling; removed rows are zeroed and
+    skipped by searches, and the matrix is compacted once they exceed a quarter of its rows,
+    so replacing documents does not grow memory or search cost. A search multiplies the
+    matrix by all the query vectors at once, in chunks of rows, and keeps the best rows of
+    each chunk with a partial sort, so memory stays bounded whatever the number of rows.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    import numpy
+
+# Rows scored per matrix product
+CHUNK_ROWS = 65536
+
+# Share of removed rows above which the matrix is compacted
+COMPACT_DEAD_RATIO = 0.25
+
+
+class VectorIndex:
+    """
+    In-memory index of unit-norm vectors identified by integer ids.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        """
+        Initializes an empty index. The dimension is set by the first vectors added.
+
+        Args:
+            initial_capacity (int): Rows allocated before the matrix first grows.
+        """
+        self.initial_capacity = max(1, initial_capacity)
+        self._matrix: Optional["numpy.ndarray"] = None
+        self._ids: Optional["numpy.ndarray"] = None
+        self._rows: Dict[int, int] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, ids: Sequence[int], vectors: "numpy.ndarray") -> None:
+        """
+        Adds vectors; an id already present gets the new vector.
+
+        Args:
+            ids (Sequence[int]): Id of each vector.
+            vectors (numpy.ndarray): Unit-norm vectors, one row per id.
+        """
+        if not len(ids):
+            return
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.initial_capacity, vectors.shape[1]), dtype=np.float32)
+                self._ids = np.full(self.initial_capacity, -1, dtype=np.int64)
+            for vector_id, vector in zip(ids, vectors):
+                row = self._rows.get(vector_id)
+                if row is None:
+                    if self._count == len(self._matrix):
+                        self._grow()
+                    row = self._count
+                    self._count += 1
+                    self._rows[vector_id] = row
+                self._matrix[row] = vector
+                self._ids[row] = vector_id
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """
+        Removes vectors; unknown ids are ignored.
+
+        Args:
+            ids (Iterable[int]): Ids of the vectors to remove.
+        """
+        with self._lock:
+            for vector_id in ids:
+                row = self._rows.pop(vector_id, None)
+                if row is not None:
+                    self._matrix[row] = 0
+                    self._ids[row] = -1
+            if self._count - len(self._rows) > self._count * COMPACT_DEAD_RATIO:
+                self._compact()
+
+    def search(self, queries: "numpy.ndarray", k: int) -> List[List[Tuple[int, float]]]:
+        """
+        Returns the k vectors most similar to each query.
+
+        Args:
+            queries (numpy.ndarray): Unit-norm query vectors, one per row.
+            k (int): Results per query.
+
+        Returns:
+            List[List[Tuple[int, float]]]: For each query, (id, cosine similarity) pairs, most similar first.
+        """
+        if self._matrix is None or k <= 0 or not len(queries):
+            return [[] for _ in range(len(queries))]
+
+        with self._lock:
+            matrix = self._matrix[:self._count]
+            ids = self._ids[:self._count]
+
+        best_scores: List["numpy.ndarray"] = []
+        best_rows: List["numpy.ndarray"] = []
+        for start in range(0, len(matrix), CHUNK_ROWS):
+            scores = matrix[start:start + CHUNK_ROWS] @ queries.T
+            if len(scores) > k:
+                top = np.argpartition(-scores, k - 1, axis=0)[:k]
+                scores = np.take_along_axis(scores, top, axis=0)
+            else:
+                top = np.broadcast_to(np.arange(len(scores))[:, None], scores.shape)
+            best_scores.append(scores)
+            best_rows.append(top + start)
+
+        scores = np.concatenate(best_scores)
+        rows = np.concatenate(best_rows)
+        results: List[List[Tuple[int, float]]] = []
+        for column in range(len(queries)):
+            order = np.argsort(-scores[:, column], kind="stable")
+            ranked = [
+                (int(ids[rows[position, column]]), float(scores[position, column]))
+                for position in order
+                if ids[rows[position, column]] >= 0
+            ]
+            results.append(ranked[:k])
+        return results
+
+    def _grow(self) -> None:
+        """
+        Doubles the capacity of the matrix, inside the caller's lock.
+        """
+        capacity = len(self._matrix) * 2
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:len(self._matrix)] = self._matrix
+        ids = np.full(capacity, -1, dtype=np.int64)
+        ids[:len(self._ids)] = self._ids
+        self._matrix = matrix
+        self._ids = ids
+
+    def _compact(self) -> None:
+        """
+        Moves the live rows to new arrays without the removed rows, inside the caller's lock.
+
+        New arrays are built rather than rows moved in place, so searches running on the
+        previous arrays are not affected.
+        """
+        live = np.flatnonzero(self._ids[:self._count] >= 0)
+        capacity = max(self.initial_capacity, len(live))
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:len(live)] = self._matrix[live]
+        ids = np.full(capacity, -1, dtype=np.int64)
+        ids[:len(live)] = self._ids[live]
+        self._matrix = matrix
+        self._ids = ids
+        self._rows = {int(vector_id): row for row, vector_id in enumerate(ids[:len(live)])}
+        self._count = len(live)
@@ -23,6 +23,17 @@ class FastAPIExceptionHandler:
         - Generic unhandled exceptions (Exception)
     """
 
+    # HTTP status of application error codes; other codes are client errors (400)
+    STATUS_BY_CODE = {
+        "CONFIG_ERROR": 500,
+        "REQUEST_TOO_LARGE": 413,
+        "QUEUE_FULL": 429,
+        "QUEUE_TIMEOUT": 503,
+        "SERVER_OVERLOADED": 503,
+        "CORPUS_DISABLED": 404,
+        "REPLAY_MISS": 500,
+    }
+
     @staticmethod
     async def handle_app_exception(request: Request, exc: AppException):
         """
@@ -34,16 +45,25 @@ class FastAPIExceptionHandler:
 
         Returns:
             JSONResponse: Response containing the error code and message.
-                          HTTP status is 400 by default, or 500 for configuration errors.
+                          HTTP status is 400 by default, 500 for configuration errors,
+                          413 for oversized requests, 404 when the corpus is not configured,
+                          and 429/503 when the service is saturated,
+                          with a Retry-After header when the exception provides one.
         """
+        headers = None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            headers = {"Retry-After": str(retry_after)}
+
         return JSONResponse(
-            status_code=400 if exc.code != "CONFIG_ERROR" else 500,
+            status_code=FastAPIExceptionHandler.STATUS_BY_CODE.get(exc.code, 400),
             content={
                 "error": {
                     "code": exc.code,
                     "message": exc.message
                 }
-            }
+            },
+            headers=headers
         )
 
     @staticmethod
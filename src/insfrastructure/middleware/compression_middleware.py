@@ -0,0 +1,263 @@
+"""
+Module: compression_middleware
+Description:
+    ASGI middleware compressing HTTP bodies in both directions.
+        - Requests sent with "Content-Encoding: gzip" are decompressed chunk by chunk as they
+          arrive, and rejected as soon as the decompressed size exceeds a cap.
+        - Responses of at least a minimum size are compressed with brotli (when the optional
+          brotli package is installed and the client accepts it) or gzip.
+"""
+
+import json
+import zlib
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+def _error_response(status: int, code: str, message: str) -> Tuple[dict, dict]:
+    """
+    Builds the ASGI messages of an error response in the API's error format.
+
+    Args:
+        status (int): HTTP status code.
+        code (str): Error code.
+        message (str): Error message.
+
+    Returns:
+        Tuple[dict, dict]: The http.response.start and http.response.body messages.
+    """
+    body = json.dumps({"error": {"code": code, "message": message}}, ensure_ascii=False).encode("utf-8")
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+class _BodyTooLarge(Exception):
+    """Raised when a decompressed request body exceeds the size cap."""
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware for gzip request bodies and gzip/brotli response bodies.
+    """
+
+    def __init__(
+            self,
+            app,
+            minimum_size: int = 1024,
+            max_request_size: int = 10 * 1024 * 1024,
+            gzip_level: int = 6,
+            brotli_quality: int = 5
+    ):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            minimum_size (int): Responses smaller than this many bytes are sent uncompressed.
+            max_request_size (int): Maximum decompressed size of a compressed request body, in bytes.
+            gzip_level (int): gzip compression level (1-9).
+            brotli_quality (int): brotli compression quality (0-11).
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.max_request_size = max_request_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.lower(): value for name, value in scope["headers"]}
+
+        content_encoding = headers.get(b"content-encoding", b"").strip().lower()
+        if content_encoding and content_encoding != b"identity":
+            if content_encoding != b"gzip":
+                await self._send_error(send, 415, "UNSUPPORTED_CONTENT_ENCODING",
+                                       "Only gzip-encoded request bodies are supported.")
+                return
+            scope, receive = await self._decompress_request(scope, receive, send)
+            if receive is None:
+                return
+
+        encoding = self._negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingSender(send, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, responder)
+
+    async def _decompress_request(self, scope, receive, send):
+        """
+        Reads and decompresses a gzip request body as its chunks arrive.
+
+        Returns:
+            tuple: The scope without the content-encoding header and a receive callable
+                   replaying the decompressed body, or (scope, None) if an error response was sent.
+        """
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks: List[bytes] = []
+        size = 0
+
+        try:
+            more_body = True
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return scope, None
+                more_body = message.get("more_body", False)
+                data = message.get("body", b"")
+                while data:
+                    chunk = decompressor.decompress(data, self.max_request_size - size + 1)
+                    size += len(chunk)
+                    if size > self.max_request_size:
+                        raise _BodyTooLarge()
+                    chunks.append(chunk)
+                    data = decompressor.unconsumed_tail
+            chunks.append(decompressor.flush())
+        except _BodyTooLarge:
+            await self._send_error(send, 413, "REQUEST_TOO_LARGE",
+                                   f"The decompressed request body exceeds {self.max_request_size} bytes.")
+            return scope, None
+        except zlib.error:
+            await self._send_error(send, 400, "INVALID_CONTENT_ENCODING", "The request body is not valid gzip.")
+            return scope, None
+
+        body = b"".join(chunks)
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"]
+            if name.lower() not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        sent = False
+
+        async def replay():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return scope, replay
+
+    @staticmethod
+    async def _send_error(send, status: int, code: str, message: str) -> None:
+        start, body = _error_response(status, code, message)
+        await send(start)
+        await send(body)
+
+    @staticmethod
+    def _negotiate(accept_encoding: str) -> Optional[str]:
+        """
+        Chooses the response encoding from the Accept-Encoding header.
+
+        Args:
+            accept_encoding (str): Value of the Accept-Encoding header.
+
+        Returns:
+            Optional[str]: "br", "gzip" or None when no supported encoding is accepted.
+        """
+        accepted = set()
+        for part in accept_encoding.split(","):
+            token, _, params = part.strip().partition(";")
+            if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(token.strip().lower())
+
+        if brotli is not None and ("br" in accepted or "*" in accepted):
+            return "br"
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        return None
+
+
+class _CompressingSender:
+    """
+    ASGI send wrapper compressing the response body.
+
+    A response sent in one message is compressed only if it reaches the minimum size.
+    A streamed response is compressed incrementally, flushing after every chunk so that
+    streamed content is not delayed.
+    """
+
+    def __init__(self, send: Callable, encoding: str, minimum_size: int, gzip_level: int, brotli_quality: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.start_message: Optional[dict] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, message: dict) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = {name.lower() for name, _ in message.get("headers", [])}
+            # Already-encoded bodies are sent unchanged
+            self.passthrough = b"content-encoding" in headers
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            if not more_body and len(body) < self.minimum_size:
+                await self.send(self.start_message)
+                self.start_message = None
+                await self.send(message)
+                self.passthrough = True
+                return
+
+            self.compressor = self._new_compressor()
+            await self.send(self._compressed_start(self.start_message))
+            self.start_message = None
+
+        await self.send({
+            "type": "http.response.body",
+            "body": self._compress(body, final=not more_body),
+            "more_body": more_body,
+        })
+
+    def _new_compressor(self):
+        if self.encoding == "br":
+            return brotli.Compressor(quality=self.brotli_quality)
+        return zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def _compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self.compressor.process(data) if data else b""
+            return out + (self.compressor.finish() if final else self.compressor.flush())
+        out = self.compressor.compress(data)
+        return out + self.compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+    def _compressed_start(self, message: dict) -> dict:
+        headers: Headers = [
+            (name, value) for name, value in message.get("headers", [])
+            if name.lower() not in (b"content-length", b"vary")
+        ]
+        vary = b", ".join(value for name, value in message.get("headers", []) if name.lower() == b"vary")
+        if b"accept-encoding" not in vary.lower():
+            vary = vary + b", Accept-Encoding" if vary else b"Accept-Encoding"
+        headers += [(b"content-encoding", self.encoding.encode()), (b"vary", vary)]
+        return {**message, "headers": headers}
@@ -0,0 +1,79 @@
+"""
+Module: deferred_middleware
+Description:
+    ASGI middleware whose configuration is only known once the application has started.
+    Middleware must be registered before startup, while the settings they depend on are
+    loaded by the lifespan hook; the wrapped middleware is built on the first request.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+ASGIApp = Callable[..., Any]
+
+# Error returned to requests received before the lifespan hook has run
+NOT_STARTED_ERROR = {
+    "error": {
+        "code": "SERVICE_NOT_STARTED",
+        "message": "The service has not started: the application lifespan has not run."
+    }
+}
+
+
+class DeferredMiddleware:
+    """
+    Builds a middleware with a factory on the first HTTP or WebSocket request.
+
+    Lifespan events are passed through unchanged, so the lifespan hook can create the
+    configuration the factory reads. Requests received while it is not available (before startup,
+    after shutdown, or when the application is served without its lifespan) get 503 instead of a
+    factory error.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            factory: Callable[[ASGIApp], ASGIApp],
+            is_started: Callable[[], bool] = lambda: True
+    ):
+        """
+        Initializes the deferred middleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+            factory (Callable[[ASGIApp], ASGIApp]): Builds the middleware around the wrapped application.
+            is_started (Callable[[], bool]): Whether the configuration read by the factory exists.
+                                             Defaults to always.
+        """
+        self.app = app
+        self.factory = factory
+        self.is_started = is_started
+        self._middleware: Optional[ASGIApp] = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.app(scope, receive, send)
+            return
+        if not self.is_started():
+            await DeferredMiddleware._reject(scope, send)
+            return
+        if self._middleware is None:
+            self._middleware = self.factory(self.app)
+        await self._middleware(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope, send) -> None:
+        """
+        Answers a request received while the application is not started: 503 for HTTP, close code 1013 (try again later)
+        for WebSocket.
+        """
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": 1013})
+            return
+        body = json.dumps(NOT_STARTED_ERROR).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,234 @@
+"""
+Module: span_exporters
+Description:
+    Exporters for finished traces.
+    Provides:
+        - JsonLinesSpanExporter: appends one JSON object per span to a local file in the background.
+        - OtlpHttpSpanExporter: sends spans to an OTLP/HTTP (JSON) collector in the background.
+"""
+
+import json
+import logging
+import queue
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from src.insfrastructure.observability.tracer import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(ABC):
+    """
+    Abstract interface for span exporters.
+    """
+
+    @abstractmethod
+    def export(self, spans: List["Span"]) -> None:
+        """
+        Exports the spans of a finished trace.
+
+        Args:
+            spans (List[Span]): Finished spans of one trace.
+        """
+        pass
+
+    def shutdown(self) -> None:
+        """
+        Flushes pending spans and releases resources. Does nothing by default.
+        """
+        return None
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """
+    Writes each span as one JSON line to a local file.
+
+    Writing happens on a background thread, like the OTLP export, so a trace ending on the event
+    loop does not block it on file I/O. Traces beyond the queue size are dropped.
+    """
+
+    def __init__(self, file_path: str, max_queue_size: int = 1024):
+        """
+        Initializes the exporter and starts its writer thread.
+
+        Args:
+            file_path (str): Path of the JSON-lines file. Parent directories are created.
+            max_queue_size (int): Maximum number of pending traces; extra traces are dropped.
+        """
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="jsonl-span-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, spans: List["Span"]) -> None:
+        """
+        Queues the spans for writing.
+
+        Args:
+            spans (List[Span]): Finished spans of one trace.
+        """
+        try:
+            self._queue.put_nowait([span.to_dict() for span in spans])
+        except queue.Full:
+            logger.warning("JSON-lines export queue is full, dropping %d spans", len(spans))
+
+    def shutdown(self) -> None:
+        """
+        Writes the pending spans and stops the writer thread.
+        """
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        """
+        Writer loop appending queued traces to the file.
+        """
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(span, ensure_ascii=False, default=str) + "\n" for span in spans))
+            except OSError as exc:
+                logger.warning("Span export to %s failed: %s", self.file_path, exc)
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Sends spans to an OTLP-compatible collector using the OTLP/HTTP JSON encoding.
+
+    Export happens on a background thread so request latency is not affected.
+    Failed exports are logged and dropped.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0, max_queue_size: int = 1024):
+        """
+        Initializes the exporter and starts its worker thread.
+
+        Args:
+            endpoint (str): Collector base URL (e.g., "http://localhost:4318").
+                            "/v1/traces" is appended when missing.
+            service_name (str): Value of the "service.name" resource attribute.
+            timeout (float): HTTP timeout in seconds.
+            max_queue_size (int): Maximum number of pending traces; extra traces are dropped.
+        """
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+        self._queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="otlp-span-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, spans: List["Span"]) -> None:
+        """
+        Queues the spans for export.
+
+        Args:
+            spans (List[Span]): Finished spans of one trace.
+        """
+        try:
+            self._queue.put_nowait([self._to_otlp_span(span) for span in spans])
+        except queue.Full:
+            logger.warning("OTLP export queue is full, dropping %d spans", len(spans))
+
+    def shutdown(self) -> None:
+        """
+        Sends the pending spans and stops the worker thread.
+        """
+        self._queue.put(None)
+        self._worker.join(timeout=self.timeout)
+
+    def _run(self) -> None:
+        """
+        Worker loop posting queued traces to the collector.
+        """
+        while True:
+            otlp_spans = self._queue.get()
+            if otlp_spans is None:
+                return
+            try:
+                self._post(otlp_spans)
+            except Exception as exc:
+                logger.warning("OTLP span export to %s failed: %s", self.url, exc)
+
+    def _post(self, otlp_spans: List[Dict[str, Any]]) -> None:
+        """
+        Posts one batch of spans to the collector.
+
+        Args:
+            otlp_spans (List[Dict[str, Any]]): Spans in OTLP JSON form.
+        """
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [self._to_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "text-contradiction-detector"},
+                    "spans": otlp_spans,
+                }],
+            }]
+        }
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    @classmethod
+    def _to_otlp_span(cls, span: "Span") -> Dict[str, Any]:
+        """
+        Converts a span to the OTLP JSON representation.
+
+        Args:
+            span (Span): The finished span.
+
+        Returns:
+            Dict[str, Any]: OTLP span object.
+        """
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+            "attributes": [
+                cls._to_otlp_attribute(key, value)
+                for key, value in span.attributes.items()
+            ],
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return otlp_span
+
+    @staticmethod
+    def _to_otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+        """
+        Converts an attribute to an OTLP key/value pair.
+
+        Args:
+            key (str): Attribute name.
+            value (Any): Attribute value.
+
+        Returns:
+            Dict[str, Any]: OTLP attribute object.
+        """
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+        return {"key": key, "value": otlp_value}
@@ -0,0 +1,248 @@
+"""
+Module: tracer
+Description:
+    Lightweight in-process tracer implementing the TracerPort.
+    Spans are grouped per request in a Trace held in a context variable, so nested calls
+    (use case -> service -> agents -> prompt loader) are linked as parent/child spans.
+    Finished traces are handed to the configured span exporters and can be summarized
+    as a Server-Timing header value.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.domain.ports.input.tracer_port import SpanPort, TracerPort
+from src.insfrastructure.observability.span_exporters import SpanExporter
+
+
+class Span(SpanPort):
+    """
+    A timed unit of work inside a trace.
+
+    Attributes:
+        name (str): Name of the span.
+        trace_id (str): Identifier of the trace (32 hex characters).
+        span_id (str): Identifier of the span (16 hex characters).
+        parent_id (Optional[str]): Identifier of the parent span, if any.
+        attributes (Dict[str, Any]): Attributes attached to the span.
+        start_time_ns (int): Wall-clock start time in nanoseconds since the epoch.
+        end_time_ns (Optional[int]): Wall-clock end time, set when the span ends.
+        thread_name (str): Name of the thread that opened the span.
+    """
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.thread_name = threading.current_thread().name
+        self._start_perf_ns = time.perf_counter_ns()
+        self._duration_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Attaches an attribute to the span. None values are ignored.
+
+        Args:
+            key (str): Attribute name.
+            value (Any): Attribute value.
+        """
+        if value is not None:
+            self.attributes[key] = value
+
+    def end(self) -> None:
+        """
+        Ends the span and freezes its duration.
+        """
+        if self._duration_ns is None:
+            self._duration_ns = time.perf_counter_ns() - self._start_perf_ns
+            self.end_time_ns = self.start_time_ns + self._duration_ns
+
+    @property
+    def duration_ms(self) -> float:
+        """
+        Duration of the span in milliseconds (elapsed so far if still open).
+        """
+        duration_ns = self._duration_ns
+        if duration_ns is None:
+            duration_ns = time.perf_counter_ns() - self._start_perf_ns
+        return duration_ns / 1_000_000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the span to a JSON-compatible dictionary.
+
+        Returns:
+            Dict[str, Any]: Span fields and attributes.
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "thread": self.thread_name,
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """
+    Collection of spans belonging to one request.
+
+    Attributes:
+        trace_id (str): Identifier shared by every span of the trace.
+        spans (List[Span]): Finished spans, in completion order.
+    """
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        """
+        Records a finished span. Safe to call from worker threads.
+
+        Args:
+            span (Span): The finished span.
+        """
+        with self._lock:
+            self.spans.append(span)
+
+    def server_timing(self) -> str:
+        """
+        Builds a Server-Timing header value with the total duration per span name.
+
+        Spans sharing a name (e.g., one detection call per category) are summed and
+        their count is reported in the description, so overlapping calls show up as a
+        stage duration larger than the request's wall-clock time.
+
+        Returns:
+            str: Header value such as 'classifier.classify;dur=812.4;desc="1 call"'.
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_time_ns)
+
+        totals: Dict[str, List[float]] = {}
+        for span in spans:
+            entry = totals.setdefault(span.name, [0.0, 0])
+            entry[0] += span.duration_ms
+            entry[1] += 1
+
+        metrics = []
+        for name, (duration_ms, count) in totals.items():
+            label = "call" if count == 1 else "calls"
+            metrics.append(f'{name};dur={duration_ms:.1f};desc="{count} {label}"')
+        return ", ".join(metrics)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer(TracerPort):
+    """
+    Tracer that records spans per request and exports them when the trace ends.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        """
+        Initializes the tracer.
+
+        Args:
+            exporters (Optional[List[SpanExporter]]): Exporters receiving finished traces.
+                                                      Defaults to no export.
+        """
+        self.exporters: List[SpanExporter] = list(exporters or [])
+
+    @staticmethod
+    def current_trace() -> Optional[Trace]:
+        """
+        Returns the trace of the current request, if any.
+
+        Returns:
+            Optional[Trace]: The active trace or None.
+        """
+        return _current_trace.get()
+
+    @contextmanager
+    def start_trace(self, name: str, **attributes: Any) -> Iterator[Trace]:
+        """
+        Starts a new trace with a root span. Spans opened inside the block are attached to it.
+
+        Args:
+            name (str): Name of the root span (e.g., "POST /analyze").
+            **attributes: Attributes of the root span.
+
+        Yields:
+            Trace: The new trace.
+        """
+        trace = Trace()
+        trace_token = _current_trace.set(trace)
+        try:
+            with self.span(name, **attributes):
+                yield trace
+        finally:
+            _current_trace.reset(trace_token)
+            self._export(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Opens a span as a child of the current span.
+
+        When no trace is active (e.g., a direct call outside the API), the span starts
+        its own trace, which is exported when the span closes.
+
+        Args:
+            name (str): Name of the span.
+            **attributes: Initial attributes of the span.
+
+        Yields:
+            Span: The open span.
+        """
+        trace = _current_trace.get()
+        if trace is None:
+            with self.start_trace(name, **attributes):
+                yield _current_span.get()
+            return
+
+        parent = _current_span.get()
+        span = Span(name, trace.trace_id, parent.span_id if parent else None, attributes)
+        span_token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.set_attribute("error", type(exc).__name__)
+            raise
+        finally:
+            span.end()
+            _current_span.reset(span_token)
+            trace.add(span)
+
+    def _export(self, trace: Trace) -> None:
+        """
+        Sends the spans of a finished trace to every exporter.
+
+        Args:
+            trace (Trace): The finished trace.
+        """
+        for exporter in self.exporters:
+            exporter.export(trace.spans)
+
+    def shutdown(self) -> None:
+        """
+        Flushes and stops every exporter.
+        """
+        for exporter in self.exporters:
+            exporter.shutdown()
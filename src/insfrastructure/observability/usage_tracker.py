@@ -0,0 +1,146 @@
+"""
+Module: usage_tracker
+Description:
+    Per-request LLM token accounting implementing the UsageTrackerPort.
+    The report of the current request is held in a context variable, so agents only
+    have to record each call. Costs are estimated from per-deployment prices and the
+    request totals are logged when tracking ends.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from src.domain.models.token_usage import TokenUsage, UsageReport
+from src.domain.ports.input.usage_tracker_port import UsageTrackerPort
+
+logger = logging.getLogger(__name__)
+
+_current_report: ContextVar[Optional[UsageReport]] = ContextVar("current_usage_report", default=None)
+
+
+def usage_from_completion(completion: Any) -> TokenUsage:
+    """
+    Extracts the token counts of an Azure OpenAI completion.
+
+    Missing or non-numeric fields (e.g., an API version that does not report cached
+    tokens) are counted as zero.
+
+    Args:
+        completion (Any): Completion returned by the Azure OpenAI client.
+
+    Returns:
+        TokenUsage: Usage of the call.
+    """
+    usage = getattr(completion, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+
+    def _count(source: Any, name: str) -> int:
+        value = getattr(source, name, 0)
+        return value if isinstance(value, int) else 0
+
+    return TokenUsage(
+        prompt_tokens=_count(usage, "prompt_tokens"),
+        completion_tokens=_count(usage, "completion_tokens"),
+        cached_tokens=_count(details, "cached_tokens"),
+        calls=1,
+    )
+
+
+class UsageTracker(UsageTrackerPort):
+    """
+    Collects token usage per request and per stage and estimates its cost.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Initializes the usage tracker.
+
+        Args:
+            prices (Optional[Dict[str, Dict[str, float]]]): Prices per 1,000 tokens keyed by
+                deployment name, e.g. {"gpt-4o": {"prompt": 0.0025, "completion": 0.01, "cached": 0.00125}}.
+                Cached tokens default to the prompt price. Deployments without prices cost 0.
+        """
+        self.prices = prices or {}
+
+    @contextmanager
+    def track(self) -> Iterator[UsageReport]:
+        """
+        Collects the usage of every LLM call made inside the block, then logs the totals.
+
+        Yields:
+            UsageReport: The report of the current request.
+        """
+        report = UsageReport()
+        token = _current_report.set(report)
+        try:
+            yield report
+        finally:
+            _current_report.reset(token)
+            if report.total.calls:
+                UsageTracker._log_report(report)
+
+    def record(self, stage: str, model: str, usage: TokenUsage) -> None:
+        """
+        Records the usage of one LLM call in the current report, if any.
+
+        Args:
+            stage (str): Stage that made the call (e.g., "classification").
+            model (str): Deployment used for the call.
+            usage (TokenUsage): Token counts of the call.
+        """
+        report = _current_report.get()
+        if report is None:
+            return
+        usage.estimated_cost = self.estimate_cost(model, usage)
+        report.add(stage, usage)
+
+    def estimate_cost(self, model: str, usage: TokenUsage) -> float:
+        """
+        Estimates the cost of a usage with the prices of a deployment.
+
+        Args:
+            model (str): Deployment name.
+            usage (TokenUsage): Token counts.
+
+        Returns:
+            float: Estimated cost, 0 when the deployment has no configured price.
+        """
+        price = self.prices.get(model)
+        if not price:
+            return 0.0
+
+        prompt_price = price.get("prompt", 0.0)
+        cached_price = price.get("cached", prompt_price)
+        completion_price = price.get("completion", 0.0)
+        uncached_tokens = max(usage.prompt_tokens - usage.cached_tokens, 0)
+
+        return (
+            uncached_tokens * prompt_price
+            + usage.cached_tokens * cached_price
+            + usage.completion_tokens * completion_price
+        ) / 1000
+
+    @staticmethod
+    def _log_report(report: UsageReport) -> None:
+        """
+        Logs the totals and the per-stage breakdown of a request.
+
+        Args:
+            report (UsageReport): The finished report.
+        """
+        stages = ", ".join(
+            f"{stage}={usage.calls} calls/{usage.prompt_tokens}p/{usage.completion_tokens}c/{usage.cached_tokens}cached"
+            for stage, usage in report.stages.items()
+        )
+        logger.info(
+            "LLM usage: %d calls, %d prompt tokens, %d completion tokens, %d cached tokens, "
+            "estimated cost %.6f [%s]",
+            report.total.calls,
+            report.total.prompt_tokens,
+            report.total.completion_tokens,
+            report.total.cached_tokens,
+            report.total.estimated_cost,
+            stages,
+        )
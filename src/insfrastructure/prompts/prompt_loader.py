@@ -3,14 +3,18 @@ Module: prompty_loader
 Description:
     Implementation of a YAML-based .prompty file loader.
     Supports system and user sections and renders prompts using Jinja2 templates.
+    Each file is parsed and compiled once, on first use or by preload().
+    yaml and jinja2 are imported on the first compilation (during warmup), not at import time.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
-from jinja2 import Template
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from src.domain.ports.input.prompt_provider_port import PromptProviderPort
+from src.domain.ports.input.tracer_port import NullTracer, TracerPort
+
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 
 class PromptyLoader(PromptProviderPort):
@@ -19,14 +23,17 @@ class PromptyLoader(PromptProviderPort):
     Provides methods to fetch and render prompts using Jinja2 templates.
     """
 
-    def __init__(self, templates_dir: Optional[str] = None):
+    def __init__(self, templates_dir: Optional[str] = None, tracer: Optional[TracerPort] = None):
         """
         Initializes the prompt loader.
 
         Args:
             templates_dir (Optional[str]): Path to the directory containing prompt templates.
                                            Defaults to a 'templates' folder next to this file.
+            tracer (Optional[TracerPort]): Tracer used to record a span per render. Defaults to no tracing.
         """
+        self.tracer = tracer or NullTracer()
+
         if templates_dir is None:
             current_dir = Path(__file__).parent
             self.templates_dir = current_dir / "templates"
@@ -36,6 +43,53 @@ class PromptyLoader(PromptProviderPort):
         if not self.templates_dir.exists():
             raise ValueError(f"Templates directory not found: {self.templates_dir}")
 
+        # Compiled sections and required inputs, keyed by prompt name
+        self._compiled: Dict[str, Tuple[Dict[str, "Template"], set]] = {}
+
+    def preload(self) -> List[str]:
+        """
+        Parses and compiles every prompt of the templates directory, so requests do not pay for it.
+
+        Returns:
+            List[str]: Names of the compiled prompts.
+
+        Raises:
+            ValueError: If a prompt file is invalid.
+        """
+        names = sorted(path.stem for path in self.templates_dir.glob("*.prompty"))
+        for name in names:
+            self._compile(name)
+        return names
+
+    def _compile(self, prompt_name: str) -> Tuple[Dict[str, "Template"], set]:
+        """
+        Returns the compiled sections and required inputs of a prompt, parsing the file on first use.
+
+        Args:
+            prompt_name (str): Name of the prompt file (without extension).
+
+        Returns:
+            Tuple[Dict[str, Template], set]: Jinja2 template of each section and the required inputs.
+        """
+        compiled = self._compiled.get(prompt_name)
+        if compiled is not None:
+            return compiled
+
+        file_path = self.templates_dir / f"{prompt_name}.prompty"
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Prompt file not found: {file_path}")
+
+        from jinja2 import Template
+
+        prompty_data = self._parse_prompty_file(file_path)
+        templates = {section: Template(content) for section, content in prompty_data['content'].items()}
+        required_inputs = set((prompty_data['metadata'] or {}).get('inputs', {}).keys())
+
+        compiled = (templates, required_inputs)
+        self._compiled[prompt_name] = compiled
+        return compiled
+
     @staticmethod
     def _parse_prompty_file(file_path: Path) -> Dict[str, Any]:
         """
@@ -47,6 +101,8 @@ class PromptyLoader(PromptProviderPort):
         Returns:
             Dict[str, Any]: Dictionary containing metadata and prompt sections ('system', 'user').
         """
+        import yaml
+
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
@@ -72,7 +128,7 @@ class PromptyLoader(PromptProviderPort):
 
     def _load_prompt(self, prompt_name: str, section: str = "system", **kwargs: Any) -> str:
         """
-        Loads and renders a prompt for a given section using Jinja2.
+        Loads and renders a prompt for a given section using Jinja2, inside a "prompt.render" span.
 
         Args:
             prompt_name (str): Name of the prompt file (without extension).
@@ -82,36 +138,38 @@ class PromptyLoader(PromptProviderPort):
         Returns:
             str: The formatted prompt.
         """
-        file_path = self.templates_dir / f"{prompt_name}.prompty"
+        with self.tracer.span("prompt.render", prompt_name=prompt_name, section=section) as span:
+            formatted_prompt = self._render_prompt(prompt_name, section, **kwargs)
+            span.set_attribute("prompt_chars", len(formatted_prompt))
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {file_path}")
+        return formatted_prompt
 
-        prompty_data = self._parse_prompty_file(file_path)
-        prompt_sections = prompty_data['content']
+    def _render_prompt(self, prompt_name: str, section: str, **kwargs: Any) -> str:
+        """
+        Renders the requested section of the compiled prompt.
 
-        if section not in prompt_sections:
-            raise ValueError(f"Section '{section}' not found in prompt '{prompt_name}'")
+        Args:
+            prompt_name (str): Name of the prompt file (without extension).
+            section (str): Section of the prompt to fetch ('system' or 'user').
+            **kwargs: Variables to render in the Jinja2 template.
 
-        prompt_content = prompt_sections[section]
+        Returns:
+            str: The formatted prompt.
+        """
+        templates, required_inputs = self._compile(prompt_name)
 
-        # Validate inputs defined in metadata
-        metadata = prompty_data['metadata']
-        if 'inputs' in metadata:
-            required_inputs = set(metadata['inputs'].keys())
-            provided_inputs = set(kwargs.keys())
-            missing_inputs = required_inputs - provided_inputs
+        if section not in templates:
+            raise ValueError(f"Section '{section}' not found in prompt '{prompt_name}'")
 
-            if missing_inputs:
-                raise ValueError(
-                    f"Missing required inputs for {prompt_name}: {missing_inputs}"
-                )
+        # Validate inputs defined in metadata
+        missing_inputs = required_inputs - set(kwargs.keys())
+        if missing_inputs:
+            raise ValueError(
+                f"Missing required inputs for {prompt_name}: {missing_inputs}"
+            )
 
         # Render the template with Jinja2
-        template = Template(prompt_content)
-        formatted_prompt = template.render(**kwargs)
-
-        return formatted_prompt
+        return templates[section].render(**kwargs)
 
     def get_system_prompt(self, prompt_name: str, **kwargs: Any) -> str:
         """
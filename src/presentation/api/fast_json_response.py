@@ -0,0 +1,46 @@
+"""
+Module: fast_json_response
+Description:
+    JSON response class serializing Pydantic DTOs in a single pass.
+    Returning it from an endpoint bypasses FastAPI's response_model handling, which
+    dumps the DTO to a dict, validates it again and encodes it with the standard
+    json module. DTOs are encoded directly to UTF-8 JSON by pydantic-core; other
+    content is encoded with orjson when installed, or the standard json module otherwise.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response for trusted DTOs and plain JSON-compatible content.
+
+    None fields of DTOs are omitted, matching response_model_exclude_none=True.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Encodes the content to UTF-8 JSON.
+
+        Args:
+            content (Any): A Pydantic model, or JSON-compatible Python data.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, exclude_none=True)
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
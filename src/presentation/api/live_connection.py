@@ -0,0 +1,186 @@
+"""
+Module: live_connection
+Description:
+    Serves one connection of the live analysis WebSocket.
+
+    Edits received from the client accumulate until no edit has arrived for the debounce
+    period; the accumulated batch is then applied to the connection's session on a worker
+    thread and the changed categories are pushed back. An edit arriving while a batch is being
+    applied cancels that batch: it stops at its next stage (an LLM call already sent runs to
+    completion, but no further call is made and its result is not applied) and its edits are
+    applied again with the newer ones after the next debounce period. A batch that fails is
+    retried after a growing delay, a few times, then waits for the next edit.
+"""
+
+import asyncio
+import json
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ValidationError
+
+from src.application.dto.live_dto import LiveEditRequest, LiveErrorDTO, LiveErrorResponse, LiveUpdateResponse
+from src.domain.exceptions.app_exception import AppException
+from src.domain.services.live_analysis_service import CancellationToken, LiveAnalysisSession
+
+# Runs a batch of edits on a session, under the caller's admission and scheduling policies
+ApplyBatch = Callable[
+    [LiveAnalysisSession, Dict[str, Optional[str]], CancellationToken],
+    Awaitable[Optional[LiveUpdateResponse]]
+]
+
+
+class LiveConnection:
+    """
+    Debounces the edits of one WebSocket client and applies them to its session.
+    """
+
+    def __init__(
+            self,
+            websocket: WebSocket,
+            session: LiveAnalysisSession,
+            apply_batch: ApplyBatch,
+            debounce_seconds: float,
+            retry_delay_seconds: float = 0.5,
+            max_retries: int = 3
+    ):
+        """
+        Initializes the connection.
+
+        Args:
+            websocket (WebSocket): The accepted WebSocket.
+            session (LiveAnalysisSession): Analysis state of the client.
+            apply_batch (ApplyBatch): Coroutine applying a batch of edits to the session.
+            debounce_seconds (float): Quiet period after the last edit before a batch is applied.
+            retry_delay_seconds (float): Delay before the first retry of a failed batch, doubled at each
+                                         further failure.
+            max_retries (int): Retries of failed batches before their edits wait for the next edit.
+        """
+        self.websocket = websocket
+        self.session = session
+        self.apply_batch = apply_batch
+        self.debounce_seconds = debounce_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_retries = max_retries
+
+        # Edits not applied yet, by sentence id
+        self.pending: Dict[str, Optional[str]] = {}
+        self._debounce_task: Optional[asyncio.Task] = None
+        # Token and edits of the batch being applied
+        self._running: Optional[Tuple[CancellationToken, Dict[str, Optional[str]]]] = None
+        self._tasks: Set[asyncio.Task] = set()
+        # Consecutive failed batches, reset when a batch succeeds
+        self._failures = 0
+
+    async def serve(self) -> None:
+        """
+        Receives edits until the client disconnects, then cancels the outstanding work.
+        """
+        try:
+            while True:
+                message = await self.websocket.receive_text()
+                try:
+                    edits = LiveEditRequest.model_validate(json.loads(message)).sentences
+                except (ValueError, ValidationError) as exc:
+                    await self._send(LiveErrorResponse(error=LiveErrorDTO(
+                        code="INVALID_MESSAGE",
+                        message=f'Expected {{"sentences": {{"<id>": "<text or null>"}}}}: {exc}'
+                    )))
+                    continue
+                self.on_edits(edits)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._cancel_running()
+            if self._debounce_task is not None:
+                self._debounce_task.cancel()
+            for task in list(self._tasks):
+                task.cancel()
+
+    def on_edits(self, edits: Dict[str, Optional[str]]) -> None:
+        """
+        Queues edits, cancels the batch being applied and restarts the debounce period and the retries.
+
+        Args:
+            edits (Dict[str, Optional[str]]): New text of each edited sentence id; None or "" removes it.
+        """
+        self.pending.update(edits)
+        self._failures = 0
+        self._cancel_running()
+        if self._debounce_task is not None:
+            self._debounce_task.cancel()
+        self._debounce_task = asyncio.create_task(self._debounce())
+
+    def _cancel_running(self) -> None:
+        """
+        Cancels the batch being applied; edits of a batch that will not be applied are queued again.
+        """
+        if self._running is None:
+            return
+        token, batch = self._running
+        self._running = None
+        if self.session.cancel(token):
+            self.pending = {**batch, **self.pending}
+
+    async def _debounce(self, delay: Optional[float] = None) -> None:
+        """
+        Waits for the debounce period (or the given delay), then starts applying the pending edits.
+        """
+        await asyncio.sleep(self.debounce_seconds if delay is None else delay)
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, {}
+        token = CancellationToken()
+        self._running = (token, batch)
+        # The batch runs in a task of its own: newer edits cancel it through its token, which
+        # stops the worker thread, instead of only abandoning the await
+        task = asyncio.create_task(self._apply(token, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _apply(self, token: CancellationToken, batch: Dict[str, Optional[str]]) -> None:
+        """
+        Applies a batch and pushes its update, or the error that prevented it.
+        """
+        try:
+            update = await self.apply_batch(self.session, batch, token)
+        except Exception as exc:
+            if self._running is not None and self._running[0] is token:
+                # Not applied: the edits are queued again and retried, with the next ones if any arrive
+                self._cancel_running()
+                self._schedule_retry()
+            if isinstance(exc, AppException):
+                error = LiveErrorDTO(code=exc.code, message=exc.message)
+            else:
+                error = LiveErrorDTO(code="INTERNAL_SERVER_ERROR", message=str(exc))
+            await self._send(LiveErrorResponse(error=error))
+            return
+        finally:
+            if self._running is not None and self._running[0] is token:
+                self._running = None
+
+        self._failures = 0
+        if update is not None:
+            await self._send(update)
+
+    def _schedule_retry(self) -> None:
+        """
+        Starts the delay before retrying the pending edits, unless a debounce period is already running
+        or the retries are exhausted.
+        """
+        self._failures += 1
+        if not self.pending or self._failures > self.max_retries:
+            return
+        if self._debounce_task is not None and not self._debounce_task.done():
+            return
+        delay = self.retry_delay_seconds * 2 ** (self._failures - 1)
+        self._debounce_task = asyncio.create_task(self._debounce(delay))
+
+    async def _send(self, message: BaseModel) -> None:
+        """
+        Sends a DTO as a JSON text frame; a client that has gone away is ignored.
+        """
+        try:
+            await self.websocket.send_text(message.model_dump_json(exclude_none=True))
+        except (WebSocketDisconnect, RuntimeError):
+            pass
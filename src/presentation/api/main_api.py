@@ -4,68 +4,364 @@ Description:
     FastAPI application exposing endpoints for text analysis and contradiction detection.
     Provides:
         - POST /analyze: Analyze sentences, classify them, and detect contradictions.
-        - GET /health: Health check endpoint.
+        - POST /corpus/documents: Add an approved document to the corpus.
+        - POST /corpus/check: Detect contradictions between a new document and the corpus.
+        - WebSocket /analyze/live: Incremental analysis of a document being edited.
+        - GET /health: Liveness check endpoint.
+        - GET /ready: Readiness check endpoint, ready once the warmup has completed.
+    The container is built by the lifespan hook, which then warms the service in the background.
+    The container, and with it the agents and the openai, jinja2, yaml and dotenv packages, is only
+    imported by the lifespan hook, so importing this module stays cheap.
 """
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional, Union
+
+from fastapi import FastAPI, Header, Query, Request, WebSocket
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from src.application.dto.analysis_request import AnalysisRequest
-from src.application.dto.analysis_response import AnalysisResponse
+from src.application.dto.analysis_response import AnalysisResponse, CompactAnalysisResponse
+from src.application.dto.corpus_dto import (
+    CorpusCheckRequest, CorpusCheckResponse, CorpusDocumentRequest, CorpusDocumentResponse
+)
+from src.application.dto.live_dto import LiveErrorDTO, LiveErrorResponse
 from src.domain.exceptions.app_exception import AppException
-from src.insfrastructure.di.container import Container
 from src.insfrastructure.handlers.exception_handler import FastAPIExceptionHandler
+from src.insfrastructure.middleware.compression_middleware import CompressionMiddleware
+from src.insfrastructure.middleware.deferred_middleware import DeferredMiddleware
+from src.presentation.api.fast_json_response import FastJSONResponse
+from src.presentation.api.live_connection import LiveConnection
+
+if TYPE_CHECKING:
+    from src.insfrastructure.di.container import Container
+
+# === APP CONFIGURATION, AGENTS AND SERVICES (built by the lifespan hook) ===
+container: Optional["Container"] = None
+
+
+async def _warm_up(app_container: "Container"):
+    """
+    Runs warmup passes until the service is ready.
+
+    Args:
+        app_container (Container): The application container.
+    """
+    while not await run_in_threadpool(app_container.warmup.run):
+        await asyncio.sleep(app_container.app_settings.warmup_retry_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the container at startup and warms the service in the background.
+
+    Configuration errors fail the startup instead of the module import. /health answers
+    as soon as the startup completes; /ready once the warmup has succeeded. At shutdown, the
+    queued spans are flushed and the cache and corpus connections are closed.
+    """
+    from src.insfrastructure.di.container import Container
+
+    global container
+    container = Container()
+    app.state.container = container
+
+    warmup_task = asyncio.create_task(_warm_up(container))
+    try:
+        yield
+    finally:
+        warmup_task.cancel()
+        # Flushing the exporters may wait on the network
+        await run_in_threadpool(container.close)
+        container = None
+
 
 # === FASTAPI INITIALIZATION ===
-app = FastAPI(title="Text Contradiction API")
+app = FastAPI(title="Text Contradiction API", lifespan=lifespan)
+
+def _started() -> bool:
+    """
+    Returns whether the lifespan hook has built the container.
+    """
+    return container is not None
+
 
-# === INIT AGENTS AND SERVICES AND APP CONFIGURATION ===
-container = Container()
+# Enable CORS
+app.add_middleware(
+    DeferredMiddleware,
+    is_started=_started,
+    factory=lambda inner: CORSMiddleware(
+        inner,
+        allow_origins=container.app_settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    ),
+)
 
-# Enable CORS 
+# gzip request bodies, gzip/brotli response bodies
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=container.app_settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    DeferredMiddleware,
+    is_started=_started,
+    factory=lambda inner: CompressionMiddleware(
+        inner,
+        minimum_size=container.app_settings.compression_min_size,
+        max_request_size=container.app_settings.max_request_body_bytes,
+    ),
 )
 
+
+# Request tracing: one trace per request, stage breakdown returned in the Server-Timing header
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    if container is None:
+        # Not started: the deferred middleware answers 503
+        return await call_next(request)
+    with container.tracer.start_trace("request", method=request.method, path=request.url.path) as trace:
+        response = await call_next(request)
+    response.headers["Server-Timing"] = trace.server_timing()
+    return response
+
+
 # Handlers
 app.add_exception_handler(AppException, FastAPIExceptionHandler.handle_app_exception)
 app.add_exception_handler(RequestValidationError, FastAPIExceptionHandler.handle_validation_exception)
 app.add_exception_handler(Exception, FastAPIExceptionHandler.handle_generic_exception)
 
 
+# Media type selecting the compact response format
+COMPACT_MEDIA_TYPE = "application/vnd.contradiction.compact+json"
+
+
 # === POST ENDPOINT FOR TEXT ANALYSIS ===
-@app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_text(request: AnalysisRequest):
+@app.post(
+    "/analyze",
+    response_model=Union[AnalysisResponse, CompactAnalysisResponse],
+    response_model_exclude_none=True
+)
+async def analyze_text(
+        request: AnalysisRequest,
+        response_format: str = Query("full", alias="format", pattern="^(full|compact)$"),
+        accept: Optional[str] = Header(None),
+        x_priority: Optional[str] = Header(None),
+        x_api_key: Optional[str] = Header(None)
+):
     """
     Analyze a set of sentences:
         - Classification
         - Contradiction detection
-    Returns the list of detected contradictions.
+    Returns the list of detected contradictions, and the LLM token usage when
+    "include_usage" is set in the request.
+
+    Requests above the size limits get 413; when all analysis slots are busy the request waits
+    in a bounded queue, and gets 429 (queue full) or 503 (waited too long) with Retry-After.
+
+    The compact format (?format=compact, or "Accept: application/vnd.contradiction.compact+json")
+    references sentences by their id in "sentence_ids", or by their 0-based index, instead of
+    repeating their text.
+
+    LLM capacity is shared between priority classes by weighted fair queuing. The class is the
+    one configured for the client's X-API-Key, else the X-Priority header, else the default class.
 
     Args:
         request (AnalysisRequest): Request containing sentences to analyze.
+        response_format (str): "full" (default) or "compact".
+        accept (Optional[str]): Accept header of the request.
+        x_priority (Optional[str]): Requested priority class (e.g., "interactive" or "bulk").
+        x_api_key (Optional[str]): Client API key, mapped to a priority class by API_KEY_PRIORITIES.
 
     Returns:
-        AnalysisResponse: DTO containing detected contradictions.
+        Union[AnalysisResponse, CompactAnalysisResponse]: DTO containing detected contradictions.
     """
     if not request.sentences:
         raise AppException("The list of sentences is empty.", code="EMPTY_TEXT")
 
-    return container.analyze_text_use_case.execute(request)
+    compact = response_format == "compact" or COMPACT_MEDIA_TYPE in (accept or "")
+    priority = _resolve_priority(x_priority, x_api_key)
+
+    container.admission_controller.check_request(request)
+    async with container.admission_controller.admit():
+        # The analysis blocks on LLM calls: run it on a worker thread to keep the event loop free.
+        # The worker runs a copy of this context, so its LLM calls belong to the request's flow.
+        with container.llm_scheduler.flow(priority):
+            response = await run_in_threadpool(container.analyze_text_use_case.execute, request, compact=compact)
+
+    # The response_model above documents the endpoint; the DTO built by the use case is
+    # trusted and serialized in one pass instead of being re-validated by FastAPI.
+    return FastJSONResponse(response)
+
+
+# === WEBSOCKET ENDPOINT FOR LIVE ANALYSIS ===
+@app.websocket("/analyze/live")
+async def analyze_live(
+        websocket: WebSocket,
+        priority: Optional[str] = Query(None),
+        x_priority: Optional[str] = Header(None),
+        x_api_key: Optional[str] = Header(None)
+):
+    """
+    Live analysis of a document being edited.
+
+    The client sends batches of edits, {"sentences": {"<id>": "<text>", "<id>": null}}, where null
+    or "" removes a sentence. Once no edit has arrived for LIVE_DEBOUNCE_MS, the edited sentences
+    are classified into the existing categories and only the categories that changed are checked
+    again. The server then pushes {"type": "update", "version": ..., "categories": [...],
+    "removed_categories": [...]}, each changed category in full with sentences referenced by id.
+    Edits arriving meanwhile cancel the work in flight and are applied together with its edits.
+
+    Errors are pushed as {"type": "error", "error": {"code": ..., "message": ...}}; the edits
+    that failed are retried with the next ones. Updates go through the same size limits,
+    admission control and priority classes as /analyze. Browsers, which cannot set headers on
+    a WebSocket, can pass the priority class in the "priority" query parameter.
+
+    Args:
+        websocket (WebSocket): The WebSocket connection.
+        priority (Optional[str]): Requested priority class, when X-Priority cannot be sent.
+        x_priority (Optional[str]): Requested priority class (e.g., "interactive" or "bulk").
+        x_api_key (Optional[str]): Client API key, mapped to a priority class by API_KEY_PRIORITIES.
+    """
+    await websocket.accept()
+    try:
+        flow_priority = _resolve_priority(x_priority or priority, x_api_key)
+    except AppException as exc:
+        error = LiveErrorResponse(error=LiveErrorDTO(code=exc.code, message=exc.message))
+        await websocket.send_text(error.model_dump_json())
+        await websocket.close(code=1008)
+        return
+
+    use_case = container.live_analysis_use_case
+
+    async def apply_batch(session, edits, token):
+        container.admission_controller.check_request(
+            AnalysisRequest.model_construct(sentences=session.texts_after(edits))
+        )
+        async with container.admission_controller.admit():
+            with container.tracer.start_trace("live_update", path=websocket.url.path):
+                with container.llm_scheduler.flow(flow_priority):
+                    return await run_in_threadpool(use_case.apply, session, edits, token)
+
+    connection = LiveConnection(
+        websocket, use_case.open_session(), apply_batch, container.app_settings.live_debounce_ms / 1000
+    )
+    await connection.serve()
+
+
+def _resolve_priority(x_priority: Optional[str], x_api_key: Optional[str]) -> str:
+    """
+    Resolves the priority class of a request.
+
+    Args:
+        x_priority (Optional[str]): Priority class requested by the client.
+        x_api_key (Optional[str]): Client API key; its configured class takes precedence.
+
+    Returns:
+        str: The priority class.
+
+    Raises:
+        AppException: If the requested class is unknown.
+    """
+    key_priority = container.app_settings.api_key_priorities.get(x_api_key or "")
+    if key_priority:
+        return key_priority
+    if not x_priority:
+        return container.llm_scheduler.default_priority
+
+    priority = x_priority.strip().lower()
+    if priority not in container.llm_scheduler.priorities:
+        raise AppException(
+            f"Unknown priority '{x_priority}', expected one of: {', '.join(container.llm_scheduler.priorities)}",
+            code="INVALID_PRIORITY"
+        )
+    return priority
+
+
+# === CORPUS ENDPOINTS ===
+@app.post("/corpus/documents", response_model=CorpusDocumentResponse)
+async def add_corpus_document(request: CorpusDocumentRequest, x_priority: Optional[str] = Header(None),
+                              x_api_key: Optional[str] = Header(None)):
+    """
+    Classifies an approved document and adds its sentences to the corpus, replacing any
+    document with the same id.
+
+    Args:
+        request (CorpusDocumentRequest): Id and sentences of the approved document.
+        x_priority (Optional[str]): Requested priority class.
+        x_api_key (Optional[str]): Client API key, mapped to a priority class by API_KEY_PRIORITIES.
+
+    Returns:
+        CorpusDocumentResponse: Number of sentences stored and size of the corpus.
+    """
+    use_case = _corpus_use_case()
+    return await _run_admitted(request, x_priority, x_api_key, use_case.add_document, request)
+
+
+@app.post("/corpus/check", response_model=CorpusCheckResponse)
+async def check_corpus(request: CorpusCheckRequest, x_priority: Optional[str] = Header(None),
+                       x_api_key: Optional[str] = Header(None)):
+    """
+    Detects contradictions between the sentences of a new document and the approved sentences
+    of the corpus. Only the corpus sentences retrieved for each sentence are sent to the LLM.
+
+    Args:
+        request (CorpusCheckRequest): Sentences of the document to check.
+        x_priority (Optional[str]): Requested priority class.
+        x_api_key (Optional[str]): Client API key, mapped to a priority class by API_KEY_PRIORITIES.
+
+    Returns:
+        CorpusCheckResponse: Contradictions between the document and corpus sentences.
+    """
+    use_case = _corpus_use_case()
+    return await _run_admitted(request, x_priority, x_api_key, use_case.check, request)
+
+
+def _corpus_use_case():
+    """
+    Returns the corpus use case.
+
+    Raises:
+        AppException: CORPUS_DISABLED if CORPUS_INDEX_PATH is not configured.
+    """
+    if container.corpus_use_case is None:
+        raise AppException("The corpus is not configured (CORPUS_INDEX_PATH).", code="CORPUS_DISABLED")
+    return container.corpus_use_case
+
+
+async def _run_admitted(request, x_priority: Optional[str], x_api_key: Optional[str], func, *args):
+    """
+    Runs a blocking use case on a worker thread, under admission control and in the request's priority flow.
+    """
+    priority = _resolve_priority(x_priority, x_api_key)
+    container.admission_controller.check_request(request)
+    async with container.admission_controller.admit():
+        with container.llm_scheduler.flow(priority):
+            response = await run_in_threadpool(func, *args)
+    return FastJSONResponse(response)
 
 
 # === HEALTH CHECK ENDPOINT ===
 @app.get("/health")
 async def health():
     """
-    Health check endpoint.
+    Liveness check endpoint. Does not depend on the warmup or the LLM deployments.
 
     Returns:
         dict: {"status": "ok"} if service is running.
     """
     return {"status": "ok"}
+
+
+# === READINESS CHECK ENDPOINT ===
+@app.get("/ready")
+async def ready():
+    """
+    Readiness check endpoint.
+
+    Returns:
+        FastJSONResponse: 200 with {"status": "ready", ...} once the prompts are compiled and a
+                          deployment is reachable, 503 with {"status": "starting", ...} before.
+    """
+    status = container.warmup.status()
+    return FastJSONResponse(status, status_code=200 if container.warmup.ready else 503)
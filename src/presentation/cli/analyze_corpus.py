@@ -0,0 +1,124 @@
+"""
+Module: analyze_corpus
+Description:
+    Command-line entry point analyzing a JSONL or CSV corpus without the HTTP server.
+    Documents are streamed from the memory-mapped corpus through the analysis use case with
+    configurable concurrency, results are appended to a JSONL file as they complete, and an
+    interrupted run resumes from its checkpoint with --resume.
+
+Usage:
+    python -m src.presentation.cli.analyze_corpus corpus.jsonl results.jsonl [--concurrency 8] [--resume]
+    python -m src.presentation.cli.analyze_corpus corpus.csv results.jsonl --id-field doc --text-field sentence
+"""
+
+import argparse
+import logging
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from src.presentation.cli.bulk_analyzer import BulkAnalyzer, Checkpoint
+from src.presentation.cli.corpus_reader import CorpusDocument, read_csv, read_jsonl
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Analyze a JSONL or CSV corpus for contradictions.")
+    parser.add_argument("corpus", help="JSONL file (one document per line) or CSV file (one sentence per row)")
+    parser.add_argument("output", help="JSONL file receiving one result line per document")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="corpus format (defaults to the file extension)")
+    parser.add_argument("--id-field", default="id", help="field or column holding the document id")
+    parser.add_argument("--text-field", default=None,
+                        help="field holding the sentence list (JSONL, default 'sentences') "
+                             "or column holding the sentence (CSV, default 'sentence')")
+    parser.add_argument("--concurrency", type=int, default=8, help="documents analyzed at the same time")
+    parser.add_argument("--priority", default="bulk",
+                        help="LLM scheduling priority class (defaults to 'bulk', or the default class if undefined)")
+    parser.add_argument("--compact", action="store_true", help="reference sentences by id or index in the results")
+    parser.add_argument("--include-usage", action="store_true", help="include the LLM token usage of each document")
+    parser.add_argument("--explain", action="store_true", help="include the execution plan of each document")
+    parser.add_argument("--max-cost", type=float, default=None, help="maximum estimated LLM cost per document")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (defaults to OUTPUT.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="resume an interrupted run from its checkpoint")
+    return parser.parse_args(argv)
+
+
+def read_corpus(args: argparse.Namespace, checkpoint: Checkpoint) -> Iterator[CorpusDocument]:
+    """
+    Streams the documents of the corpus from the checkpoint position.
+    """
+    corpus_format = args.format or ("csv" if args.corpus.lower().endswith(".csv") else "jsonl")
+    if corpus_format == "csv":
+        return read_csv(
+            args.corpus, checkpoint.input_offset, checkpoint.input_line,
+            id_field=args.id_field, sentence_field=args.text_field or "sentence"
+        )
+    return read_jsonl(
+        args.corpus, checkpoint.input_offset, checkpoint.input_line,
+        id_field=args.id_field, sentences_field=args.text_field or "sentences"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the bulk analysis.
+
+    Returns:
+        int: Exit status, 0 when every document was analyzed, 1 when some failed.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    # Imported here so that --help answers without loading the agents
+    from src.insfrastructure.di.container import Container
+
+    container = Container()
+    warmup = container.warmup
+    if not warmup.run():
+        logging.warning("Warmup incomplete, starting anyway: %s", warmup.status())
+
+    scheduler = container.llm_scheduler
+    priority = args.priority if args.priority in scheduler.priorities else scheduler.default_priority
+
+    @contextmanager
+    def task_context(document: CorpusDocument):
+        with container.tracer.start_trace("document", document_id=document.doc_id), scheduler.flow(priority):
+            yield
+
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    checkpoint = Checkpoint.load(checkpoint_path) if args.resume else Checkpoint()
+
+    request_defaults = {"include_usage": args.include_usage, "explain": args.explain}
+    if args.max_cost is not None:
+        request_defaults["max_cost"] = args.max_cost
+
+    analyzer = BulkAnalyzer(
+        container.analyze_text_use_case,
+        concurrency=args.concurrency,
+        compact=args.compact,
+        request_defaults=request_defaults,
+        task_context=task_context
+    )
+    try:
+        stats = analyzer.run(
+            read_corpus(args, checkpoint), args.output, checkpoint_path,
+            resume_from=checkpoint if args.resume else None
+        )
+    except KeyboardInterrupt:
+        print(f"Interrupted; resume with --resume (checkpoint: {checkpoint_path})", file=sys.stderr)
+        return 130
+    finally:
+        container.close()
+
+    print(
+        f"analyzed: {stats.analyzed}, failed: {stats.failed}, skipped: {stats.skipped}, "
+        f"{stats.seconds:.1f} s ({stats.documents_per_second:.1f} documents/s)",
+        file=sys.stderr
+    )
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+"""
+Module: bulk_analyzer
+Description:
+    Runs the documents of a corpus through the analysis use case with bounded concurrency,
+    writing one JSONL result line per document as soon as it completes, and checkpointing
+    progress so that an interrupted run resumes without re-analyzing finished documents.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, ContextManager, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+
+from src.application.dto.analysis_request import AnalysisRequest
+from src.domain.exceptions.app_exception import AppException
+from src.domain.ports.output.analyze_text_port import AnalyzeTextPort
+from src.presentation.cli.corpus_reader import CorpusDocument
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of a bulk run.
+
+    Every document starting before input_offset is finished and its result is in the output
+    before output_offset. Documents finished after the watermark are listed in done_ids.
+
+    Attributes:
+        input_offset (int): Byte offset in the corpus of the first unfinished document.
+        input_line (int): Line number at input_offset.
+        output_offset (int): Size of the output when the checkpoint was saved.
+        done_ids (List[str]): Ids of the documents after input_offset that are finished.
+    """
+    input_offset: int = 0
+    input_line: int = 1
+    output_offset: int = 0
+    done_ids: List[str] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """
+        Reads a checkpoint, or returns an empty one when the file does not exist.
+        """
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as file:
+            return cls(**json.load(file))
+
+    def save(self, path: str) -> None:
+        """
+        Writes the checkpoint atomically.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.__dict__, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+
+@dataclass
+class BulkStats:
+    """
+    Counters of a bulk run.
+
+    Attributes:
+        analyzed (int): Documents analyzed successfully.
+        failed (int): Documents whose analysis failed; their error is written to the output.
+        skipped (int): Documents finished by a previous run.
+        seconds (float): Duration of the run.
+    """
+    analyzed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        """
+        float: Documents analyzed or failed per second.
+        """
+        return (self.analyzed + self.failed) / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class _Entry:
+    """
+    A document read from the corpus and not yet behind the watermark.
+    """
+    document: CorpusDocument
+    done: bool = False
+
+
+class BulkAnalyzer:
+    """
+    Analyzes corpus documents concurrently and writes their results to a JSONL file.
+
+    Each output line is {"id": ..., "result": <analysis response>} or {"id": ..., "error":
+    {"code": ..., "message": ...}}, in completion order. Every document gets exactly one line:
+    failed documents are finished too, and are not analyzed again by a resumed run.
+    """
+
+    def __init__(
+            self,
+            use_case: AnalyzeTextPort,
+            concurrency: int = 8,
+            compact: bool = False,
+            request_defaults: Optional[Dict[str, Any]] = None,
+            task_context: Optional[Callable[[CorpusDocument], ContextManager]] = None,
+            checkpoint_interval_seconds: float = 1.0
+    ):
+        """
+        Initializes the bulk analyzer.
+
+        Args:
+            use_case (AnalyzeTextPort): Use case analyzing each document.
+            concurrency (int): Documents analyzed at the same time.
+            compact (bool): Whether to write compact results (sentences referenced by id or index).
+            request_defaults (Optional[Dict[str, Any]]): Request fields applied to every document
+                                                         (e.g. include_usage), overridden by the document's fields.
+            task_context (Optional[Callable[[CorpusDocument], ContextManager]]): Context entered around the
+                analysis of each document (e.g. a trace or a priority flow). Defaults to none.
+            checkpoint_interval_seconds (float): Minimum time between two checkpoint saves.
+        """
+        self.use_case = use_case
+        self.concurrency = max(concurrency, 1)
+        self.compact = compact
+        self.request_defaults = request_defaults or {}
+        self.task_context = task_context or (lambda document: nullcontext())
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
+
+        # Reentrant: an interruption inside _complete must still be able to save the checkpoint
+        self._lock = threading.RLock()
+        self._pending: Deque[_Entry] = deque()
+        self._checkpoint = Checkpoint()
+        self._saved_at = 0.0
+
+    def run(
+            self,
+            documents: Iterable[CorpusDocument],
+            output_path: str,
+            checkpoint_path: str,
+            resume_from: Optional[Checkpoint] = None
+    ) -> BulkStats:
+        """
+        Analyzes the documents and writes their results to the output.
+
+        Args:
+            documents (Iterable[CorpusDocument]): Documents, read from resume_from.input_offset when resuming.
+            output_path (str): JSONL output; appended to when resuming, overwritten otherwise.
+            checkpoint_path (str): File where progress is saved.
+            resume_from (Optional[Checkpoint]): Checkpoint of the interrupted run, None to start over.
+
+        Returns:
+            BulkStats: Counters of the run.
+        """
+        started = time.perf_counter()
+        stats = BulkStats()
+        self._pending.clear()
+        self._checkpoint = resume_from or Checkpoint()
+        done = set(self._checkpoint.done_ids)
+
+        mode = "r+b" if resume_from is not None and os.path.exists(output_path) else "w+b"
+        with open(output_path, mode) as output:
+            if resume_from is not None:
+                done |= self._recover_output(output, self._checkpoint.output_offset)
+            output.seek(0, os.SEEK_END)
+
+            slots = threading.BoundedSemaphore(self.concurrency)
+            executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            try:
+                for document in documents:
+                    entry = _Entry(document)
+                    with self._lock:
+                        self._pending.append(entry)
+                    if document.doc_id in done:
+                        stats.skipped += 1
+                        self._complete(entry, None, output, checkpoint_path, stats)
+                        continue
+
+                    slots.acquire()
+                    future = executor.submit(contextvars.copy_context().run, self._analyze, document)
+                    future.add_done_callback(
+                        lambda f, entry=entry: self._on_done(f, entry, output, checkpoint_path, stats, slots)
+                    )
+            except BaseException:
+                # On interruption, documents not started are dropped; those in progress are finished
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
+                with self._lock:
+                    self._save_checkpoint(output, checkpoint_path)
+                stats.seconds = time.perf_counter() - started
+
+        return stats
+
+    def _analyze(self, document: CorpusDocument) -> Tuple[bytes, bool]:
+        """
+        Analyzes a document.
+
+        Returns:
+            Tuple[bytes, bool]: The output line of the document, and whether the analysis failed.
+        """
+        doc_id = json.dumps(document.doc_id, ensure_ascii=False).encode("utf-8")
+        try:
+            if document.error:
+                raise AppException(document.error, code="INVALID_DOCUMENT")
+            request = AnalysisRequest(**{**self.request_defaults, **document.fields, "sentences": document.sentences})
+            with self.task_context(document):
+                response = self.use_case.execute(request, compact=self.compact)
+        except ValidationError as error:
+            return self._error_line(doc_id, "INVALID_DOCUMENT", str(error)), True
+        except AppException as error:
+            return self._error_line(doc_id, error.code, error.message), True
+        except Exception as error:
+            logger.exception("Analysis of document %s failed", document.doc_id)
+            return self._error_line(doc_id, "INTERNAL_ERROR", f"{type(error).__name__}: {error}"), True
+
+        result = response.__pydantic_serializer__.to_json(response, exclude_none=True)
+        return b'{"id":' + doc_id + b',"result":' + result + b'}\n', False
+
+    @staticmethod
+    def _error_line(doc_id: bytes, code: str, message: str) -> bytes:
+        """
+        Builds the output line of a failed document.
+        """
+        error = json.dumps(
+            {"code": code, "message": message}, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return b'{"id":' + doc_id + b',"error":' + error + b'}\n'
+
+    def _on_done(
+            self,
+            future: Future,
+            entry: _Entry,
+            output: BinaryIO,
+            checkpoint_path: str,
+            stats: BulkStats,
+            slots: threading.BoundedSemaphore
+    ) -> None:
+        """
+        Writes the result of a finished analysis and frees its slot. Cancelled analyses stay pending.
+        """
+        try:
+            if not future.cancelled():
+                self._complete(entry, future.result(), output, checkpoint_path, stats)
+        finally:
+            slots.release()
+
+    def _complete(
+            self,
+            entry: _Entry,
+            result: Optional[Tuple[bytes, bool]],
+            output: BinaryIO,
+            checkpoint_path: str,
+            stats: BulkStats
+    ) -> None:
+        """
+        Appends the output line of a document, advances the watermark past the completed
+        documents and saves the checkpoint when due.
+
+        Args:
+            entry (_Entry): The completed document.
+            result (Optional[Tuple[bytes, bool]]): Output line and failure flag, None for a skipped document.
+            output (BinaryIO): The output file.
+            checkpoint_path (str): File where progress is saved.
+            stats (BulkStats): Counters of the run.
+        """
+        with self._lock:
+            if result is not None:
+                line, failed = result
+                output.write(line)
+                if failed:
+                    stats.failed += 1
+                else:
+                    stats.analyzed += 1
+            entry.done = True
+
+            while self._pending and self._pending[0].done:
+                head = self._pending.popleft().document
+                self._checkpoint.input_offset, self._checkpoint.input_line = head.end, head.next_line
+            if self._pending:
+                head = self._pending[0].document
+                self._checkpoint.input_offset, self._checkpoint.input_line = head.start, head.line
+
+            if time.monotonic() - self._saved_at >= self.checkpoint_interval_seconds:
+                self._save_checkpoint(output, checkpoint_path)
+
+    def _save_checkpoint(self, output: BinaryIO, checkpoint_path: str) -> None:
+        """
+        Flushes the output and saves the checkpoint. Must be called with the lock held.
+        """
+        output.flush()
+        os.fsync(output.fileno())
+        self._checkpoint.output_offset = output.tell()
+        self._checkpoint.done_ids = [entry.document.doc_id for entry in self._pending if entry.done]
+        self._checkpoint.save(checkpoint_path)
+        self._saved_at = time.monotonic()
+
+    @staticmethod
+    def _recover_output(output: BinaryIO, offset: int) -> Set[str]:
+        """
+        Truncates a partially written last line and returns the ids of the documents written
+        after the given offset.
+        """
+        output.seek(0, os.SEEK_END)
+        size = output.tell()
+        if size:
+            # Drop the incomplete line left by a crash during a write
+            chunk_start = max(size - 1024 * 1024, 0)
+            output.seek(chunk_start)
+            last_newline = output.read().rfind(b"\n")
+            valid_size = chunk_start + last_newline + 1 if last_newline >= 0 else chunk_start
+            if valid_size < size:
+                output.truncate(valid_size)
+                size = valid_size
+
+        finished: Set[str] = set()
+        output.seek(min(offset, size))
+        for line in output:
+            try:
+                finished.add(str(json.loads(line)["id"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return finished
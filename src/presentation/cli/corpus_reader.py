@@ -0,0 +1,182 @@
+"""
+Module: corpus_reader
+Description:
+    Streaming readers of the documents of a JSONL or CSV corpus.
+    Files are memory-mapped and scanned line by line, so multi-GB corpora are read without
+    loading them in memory, and reading can resume at the byte offset of any document.
+"""
+
+import csv
+import io
+import json
+import mmap
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusDocument:
+    """
+    A document of the corpus.
+
+    Attributes:
+        doc_id (str): Id of the document, from the id field or its 1-based line number.
+        sentences (List[str]): Sentences to analyze.
+        start (int): Byte offset of the first line of the document.
+        end (int): Byte offset just after the last line of the document.
+        line (int): Line number of the first line of the document.
+        next_line (int): Line number of the line following the document.
+        fields (Dict[str, Any]): Other request fields of the document (e.g. sentence_ids, max_cost).
+        error (Optional[str]): Why the document could not be read, None when it was read.
+    """
+    doc_id: str
+    sentences: List[str]
+    start: int
+    end: int
+    line: int
+    next_line: int
+    fields: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[bytes]:
+    """
+    Memory-maps a file for reading. Empty files map to empty bytes.
+    """
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def _iter_lines(mapped, start: int) -> Iterator[Tuple[int, int, bytes]]:
+    """
+    Yields the start offset, end offset and content (newline included) of each line from start.
+    """
+    size = len(mapped)
+    position = start
+    while position < size:
+        newline = mapped.find(b"\n", position)
+        end = size if newline < 0 else newline + 1
+        yield position, end, mapped[position:end]
+        position = end
+
+
+def read_jsonl(
+        path: str,
+        start: int = 0,
+        start_line: int = 1,
+        id_field: str = "id",
+        sentences_field: str = "sentences"
+) -> Iterator[CorpusDocument]:
+    """
+    Reads a JSONL corpus with one document object per line.
+
+    Blank lines are skipped. Lines that are not a JSON object with a list of sentences are
+    yielded with an error so that they appear in the output instead of stopping the run.
+
+    Args:
+        path (str): Path of the corpus.
+        start (int): Byte offset to start reading at (the start of a line).
+        start_line (int): Line number of the line at start.
+        id_field (str): Field holding the document id. Documents without it are named by line number.
+        sentences_field (str): Field holding the list of sentences.
+
+    Yields:
+        CorpusDocument: The documents, in file order.
+    """
+    with _mapped(path) as mapped:
+        line_number = start_line
+        for line_start, line_end, line in _iter_lines(mapped, start):
+            current_line, line_number = line_number, line_number + 1
+            if not line.strip():
+                continue
+
+            doc_id = str(current_line)
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("the line is not a JSON object")
+                doc_id = str(record.pop(id_field, doc_id))
+                sentences = record.pop(sentences_field, None)
+                if not isinstance(sentences, list):
+                    raise ValueError(f"'{sentences_field}' must be a list of sentences")
+            except ValueError as error:
+                yield CorpusDocument(doc_id, [], line_start, line_end, current_line, line_number, error=str(error))
+                continue
+
+            yield CorpusDocument(doc_id, sentences, line_start, line_end, current_line, line_number, fields=record)
+
+
+def read_csv(
+        path: str,
+        start: int = 0,
+        start_line: int = 1,
+        id_field: str = "id",
+        sentence_field: str = "sentence"
+) -> Iterator[CorpusDocument]:
+    """
+    Reads a CSV corpus with a header row and one sentence per row.
+
+    Consecutive rows with the same document id form one document, in row order. Quoted fields
+    may span several lines.
+
+    Args:
+        path (str): Path of the corpus.
+        start (int): Byte offset to start reading at (the start of a document), 0 for the beginning.
+        start_line (int): Line number of the line at start.
+        id_field (str): Column holding the document id.
+        sentence_field (str): Column holding the sentence.
+
+    Yields:
+        CorpusDocument: The documents, in file order.
+
+    Raises:
+        ValueError: If the header lacks the id or sentence column.
+    """
+    with _mapped(path) as mapped:
+        lines = _iter_lines(mapped, 0)
+        header_line = next(lines, None)
+        if header_line is None:
+            return
+        header = next(csv.reader(io.StringIO(header_line[2].decode("utf-8-sig"))))
+        for column in (id_field, sentence_field):
+            if column not in header:
+                raise ValueError(f"CSV column '{column}' not found in the header: {', '.join(header)}")
+        id_column, sentence_column = header.index(id_field), header.index(sentence_field)
+
+        if start < header_line[1]:
+            start, start_line = header_line[1], 2
+        position = {"offset": start, "line": start_line}
+
+        def decoded_lines() -> Iterator[str]:
+            for _, line_end, line in _iter_lines(mapped, start):
+                position["offset"], position["line"] = line_end, position["line"] + 1
+                yield line.decode("utf-8")
+
+        doc_id, sentences = "", []
+        doc_start = doc_end = row_start = start
+        doc_line = doc_next_line = row_line = start_line
+        for row in csv.reader(decoded_lines()):
+            if row:
+                row_id = row[id_column] if id_column < len(row) else ""
+                if sentences and row_id != doc_id:
+                    yield CorpusDocument(doc_id, sentences, doc_start, doc_end, doc_line, doc_next_line)
+                    sentences = []
+                if not sentences:
+                    doc_id, doc_start, doc_line = row_id, row_start, row_line
+                sentences.append(row[sentence_column] if sentence_column < len(row) else "")
+                doc_end, doc_next_line = position["offset"], position["line"]
+            row_start, row_line = position["offset"], position["line"]
+
+        if sentences:
+            yield CorpusDocument(doc_id, sentences, doc_start, doc_end, doc_line, doc_next_line)
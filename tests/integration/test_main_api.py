@@ -5,11 +5,21 @@ Description:
     Tests API endpoints for text analysis, contradiction detection, and health checks.
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from fastapi.testclient import TestClient
+
+from benchmarks.stub_deployment import create_server
 from src.presentation.api.main_api import app
 
+# Optional features left out of the tested configuration
+UNSET_VARIABLES = (
+    "AZURE_OPENAI_DEPLOYMENTS", "CACHE_BACKEND", "CORPUS_INDEX_PATH", "EMBEDDINGS_DEPLOYMENT",
+    "LLM_REPLAY_MODE", "TRACING_EXPORTER"
+)
+
 
 class TestMainAPI:
     """
@@ -17,9 +27,25 @@ class TestMainAPI:
     """
 
     @pytest.fixture
-    def client(self):
-        """FastAPI test client."""
-        return TestClient(app)
+    def stub_deployment(self, monkeypatch):
+        """Local Azure OpenAI stub the application is configured to call."""
+        server = create_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", f"http://127.0.0.1:{server.server_address[1]}/")
+        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "stub-key")
+        monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
+        monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "stub")
+        for name in UNSET_VARIABLES:
+            monkeypatch.delenv(name, raising=False)
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def client(self, stub_deployment):
+        """FastAPI test client running the application lifespan."""
+        with TestClient(app) as client:
+            yield client
 
     @pytest.fixture
     def mock_analyse_text_use_case(self):
@@ -233,3 +259,32 @@ class TestMainAPI:
         data = response.json()
         assert "error" in data
         assert data["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_requests_before_startup_return_503(self, stub_deployment):
+        """
+        Test that a request served without the application lifespan gets a clean 503 error.
+        """
+        # Arrange
+        client = TestClient(app)
+
+        # Act
+        response = client.post("/analyze", json={"sentences": ["a"]})
+
+        # Assert
+        assert response.status_code == 503
+        assert response.json()["error"]["code"] == "SERVICE_NOT_STARTED"
+
+    def test_shutdown_closes_the_container(self, stub_deployment):
+        """
+        Test that stopping the application flushes the tracer and closes the container's backends.
+        """
+        # Arrange
+        from src.insfrastructure.di.container import Container
+
+        # Act
+        with patch.object(Container, "close", autospec=True) as close:
+            with TestClient(app) as client:
+                client.get("/health")
+
+        # Assert
+        close.assert_called_once()
@@ -0,0 +1,109 @@
+"""
+Module: test_admission_controller
+Description:
+    Unit tests for the AdmissionController.
+    Tests request size limits, bounded concurrency, queue overflow and queue timeouts.
+"""
+
+import asyncio
+import pytest
+from src.application.dto.analysis_request import AnalysisRequest
+from src.domain.exceptions.overload_exception import OverloadException, RequestTooLargeException
+from src.insfrastructure.concurrency.admission_controller import AdmissionController
+
+
+class TestAdmissionController:
+    """
+    Unit tests for AdmissionController.
+    """
+
+    def test_rejects_too_many_sentences(self):
+        """
+        Test that requests above the sentence limit are rejected.
+        """
+        # Arrange
+        controller = AdmissionController(max_sentences=2)
+
+        # Act & Assert
+        with pytest.raises(RequestTooLargeException):
+            controller.check_request(AnalysisRequest(sentences=["a", "b", "c"]))
+
+    def test_rejects_too_much_text(self):
+        """
+        Test that the text limit counts UTF-8 bytes.
+        """
+        # Arrange
+        controller = AdmissionController(max_text_bytes=10)
+
+        # Act & Assert
+        controller.check_request(AnalysisRequest(sentences=["جملة"]))
+        with pytest.raises(RequestTooLargeException):
+            controller.check_request(AnalysisRequest(sentences=["جملة طويلة"]))
+
+    def test_waiting_request_gets_released_slot(self):
+        """
+        Test that a queued request runs once a running one finishes.
+        """
+        # Arrange
+        controller = AdmissionController(max_concurrent=1, max_queue=1, max_wait_seconds=1)
+        order = []
+
+        async def analysis(name, duration):
+            async with controller.admit():
+                order.append(f"{name} start")
+                await asyncio.sleep(duration)
+                order.append(f"{name} end")
+
+        async def scenario():
+            await asyncio.gather(analysis("first", 0.05), analysis("second", 0))
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert order == ["first start", "first end", "second start", "second end"]
+        assert controller.active == 0
+
+    def test_full_queue_is_rejected_with_retry_after(self):
+        """
+        Test that requests arriving when the queue is full are shed immediately.
+        """
+        # Arrange
+        controller = AdmissionController(max_concurrent=1, max_queue=0, max_wait_seconds=1)
+
+        async def scenario():
+            async with controller.admit():
+                with pytest.raises(OverloadException) as exc_info:
+                    async with controller.admit():
+                        pass
+                return exc_info.value
+
+        # Act
+        exc = asyncio.run(scenario())
+
+        # Assert
+        assert exc.code == "QUEUE_FULL"
+        assert exc.retry_after >= 1
+        assert controller.active == 0
+
+    def test_queue_wait_times_out(self):
+        """
+        Test that a request waiting longer than the maximum wait is rejected.
+        """
+        # Arrange
+        controller = AdmissionController(max_concurrent=1, max_queue=1, max_wait_seconds=0.01)
+
+        async def scenario():
+            async with controller.admit():
+                with pytest.raises(OverloadException) as exc_info:
+                    async with controller.admit():
+                        pass
+                return exc_info.value
+
+        # Act
+        exc = asyncio.run(scenario())
+
+        # Assert
+        assert exc.code == "QUEUE_TIMEOUT"
+        assert controller.queued == 0
+        assert controller.active == 0
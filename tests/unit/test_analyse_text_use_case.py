@@ -10,6 +10,7 @@ from unittest.mock import Mock, MagicMock, patch
 from src.application.use_cases.analyse_text_use_case import AnalyzeTextUseCase
 from src.application.dto.analysis_request import AnalysisRequest
 from src.application.dto.analysis_response import AnalysisResponse
+from src.domain.exceptions.app_exception import AppException
 
 
 class TestAnalyzeTextUseCase:
@@ -47,7 +48,7 @@ class TestAnalyzeTextUseCase:
 
         # Assert
         assert result is not None
-        mock_text_analysis_service.analyze_text.assert_called_once_with(sample_sentences)
+        mock_text_analysis_service.analyze_text.assert_called_once_with(sample_sentences, cost_budget=None)
 
     def test_execute_with_empty_sentences(self, analyse_use_case, mock_text_analysis_service):
         """
@@ -147,3 +148,147 @@ class TestAnalyzeTextUseCase:
         # Assert
         assert result is not None
         assert len(result.categories[0].contradictions) == 0
+
+    def test_execute_includes_usage_when_requested(self, mock_text_analysis_service, sample_sentences):
+        """
+        Test that the usage block is returned when the request asks for it.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        from src.domain.models.token_usage import TokenUsage
+        from src.insfrastructure.observability.usage_tracker import UsageTracker
+
+        usage_tracker = UsageTracker(prices={"gpt-4": {"prompt": 0.01, "completion": 0.03}})
+
+        def analyze_text(sentences, cost_budget=None):
+            usage_tracker.record("classification", "gpt-4", TokenUsage(prompt_tokens=1000, completion_tokens=100, calls=1))
+            return AnalysisContradictionResult(categories=[])
+
+        mock_text_analysis_service.analyze_text.side_effect = analyze_text
+        use_case = AnalyzeTextUseCase(text_analysis_service=mock_text_analysis_service, usage_tracker=usage_tracker)
+
+        # Act
+        result = use_case.execute(AnalysisRequest(sentences=sample_sentences, include_usage=True))
+
+        # Assert
+        assert result.usage.llm_calls == 1
+        assert result.usage.total_tokens == 1100
+        assert result.usage.stages["classification"].estimated_cost == pytest.approx(0.013)
+
+    def test_execute_omits_usage_by_default(self, analyse_use_case, sample_sentences, mock_text_analysis_service):
+        """
+        Test that the usage block is not returned unless requested.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        mock_text_analysis_service.analyze_text.return_value = AnalysisContradictionResult(categories=[])
+
+        # Act
+        result = analyse_use_case.execute(AnalysisRequest(sentences=sample_sentences))
+
+        # Assert
+        assert result.usage is None
+
+    def test_execute_includes_plan_when_explain_requested(self, mock_text_analysis_service, sample_sentences):
+        """
+        Test that the execution plan is returned when the request asks for an explanation,
+        and that the request budget is passed to the service.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        from src.domain.models.execution_plan import ExecutionPlan, ExecutionStrategy, StrategyEstimate
+
+        plan = ExecutionPlan(
+            strategy=ExecutionStrategy.TWO_STAGE,
+            estimates=[
+                StrategyEstimate(ExecutionStrategy.FUSED, 1, 700, 100, 2400.0, 0.002, False, "fused mode disabled"),
+                StrategyEstimate(ExecutionStrategy.TWO_STAGE, 3, 1500, 200, 5200.0, 0.004),
+            ],
+            cost_budget=0.01,
+            actual_latency_ms=4800.0
+        )
+        result_with_plan = AnalysisContradictionResult(categories=[])
+        result_with_plan.plan = plan
+        mock_text_analysis_service.analyze_text.return_value = result_with_plan
+        use_case = AnalyzeTextUseCase(text_analysis_service=mock_text_analysis_service, default_cost_budget=0.05)
+
+        # Act
+        result = use_case.execute(AnalysisRequest(sentences=sample_sentences, max_cost=0.01, explain=True))
+
+        # Assert
+        mock_text_analysis_service.analyze_text.assert_called_once_with(sample_sentences, cost_budget=0.01)
+        assert result.plan.strategy == "two_stage"
+        assert result.plan.predicted_llm_calls == 3
+        assert result.plan.actual_latency_ms == 4800.0
+        assert [c.strategy for c in result.plan.candidates] == ["fused", "two_stage"]
+        assert result.plan.candidates[0].feasible is False
+
+    def test_execute_uses_default_cost_budget(self, mock_text_analysis_service, sample_sentences):
+        """
+        Test that the server budget applies when the request sets none, and that no plan is returned by default.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        mock_text_analysis_service.analyze_text.return_value = AnalysisContradictionResult(categories=[])
+        use_case = AnalyzeTextUseCase(text_analysis_service=mock_text_analysis_service, default_cost_budget=0.05)
+
+        # Act
+        result = use_case.execute(AnalysisRequest(sentences=sample_sentences))
+
+        # Assert
+        mock_text_analysis_service.analyze_text.assert_called_once_with(sample_sentences, cost_budget=0.05)
+        assert result.plan is None
+
+    def test_execute_compact_references_client_ids(self, analyse_use_case, mock_text_analysis_service):
+        """
+        Test that the compact format references sentences by client id instead of repeating them.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import (
+            AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+        )
+        from src.domain.models.sentence_table import SentenceTable
+
+        table = SentenceTable.of(["s1", "s2", "s3"])
+        mock_text_analysis_service.analyze_text.return_value = AnalysisContradictionResult(categories=[
+            CategoryContradictionResult("test", (0, 2), (Contradiction((0, 2), "حاد", "c", table),), table),
+            CategoryContradictionResult("other", (1,), (), table),
+        ])
+        request = AnalysisRequest(sentences=["s1", "s2", "s3"], sentence_ids=["a", "b", "c"])
+
+        # Act
+        result = analyse_use_case.execute(request, compact=True)
+
+        # Assert
+        assert result.categories[0].statement_ids == ["a", "c"]
+        assert result.categories[0].contradictions[0].statement_ids == ["a", "c"]
+        assert result.categories[1].statement_ids == ["b"]
+
+    def test_execute_compact_defaults_to_indices(self, analyse_use_case, mock_text_analysis_service):
+        """
+        Test that the compact format uses 0-based indices when no ids are sent.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
+        from src.domain.models.sentence_table import SentenceTable
+
+        table = SentenceTable.of(["s1", "s2"])
+        mock_text_analysis_service.analyze_text.return_value = AnalysisContradictionResult(categories=[
+            CategoryContradictionResult("test", (1, 0), (), table)
+        ])
+
+        # Act
+        result = analyse_use_case.execute(AnalysisRequest(sentences=["s1", "s2"]), compact=True)
+
+        # Assert
+        assert result.categories[0].statement_ids == [1, 0]
+
+    @pytest.mark.parametrize("sentence_ids", [["a"], ["a", "a"]])
+    def test_execute_rejects_invalid_sentence_ids(self, analyse_use_case, sentence_ids):
+        """
+        Test that sentence ids must be unique and match the sentences one to one.
+        """
+        # Act & Assert
+        with pytest.raises(AppException) as exc_info:
+            analyse_use_case.execute(AnalysisRequest(sentences=["s1", "s2"], sentence_ids=sentence_ids))
+        assert exc_info.value.code == "INVALID_SENTENCE_IDS"
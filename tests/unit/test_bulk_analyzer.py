@@ -0,0 +1,170 @@
+"""
+Module: test_bulk_analyzer
+Description:
+    Unit tests for the corpus readers and the BulkAnalyzer of the command-line interface.
+    Tests JSONL and CSV reading from offsets, incremental output and resuming from a checkpoint.
+"""
+
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+from src.application.dto.analysis_response import AnalysisResponse
+from src.domain.exceptions.app_exception import AppException
+from src.presentation.cli.bulk_analyzer import BulkAnalyzer, Checkpoint
+from src.presentation.cli.corpus_reader import read_csv, read_jsonl
+
+
+def read_output(path):
+    """Output records keyed by document id."""
+    with open(path, encoding="utf-8") as file:
+        return {record["id"]: record for record in map(json.loads, file)}
+
+
+class TestCorpusReader:
+    """
+    Unit tests for read_jsonl and read_csv.
+    """
+
+    def test_jsonl_documents_and_offsets(self, tmp_path):
+        """
+        Test that JSONL documents carry their fields and offsets, and reading resumes at an offset.
+        """
+        # Arrange
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(
+            '{"id": "a", "sentences": ["أ", "ب"], "max_cost": 0.1}\n'
+            '\n'
+            '{"sentences": ["ج"]}\n'
+            'not json\n',
+            encoding="utf-8"
+        )
+
+        # Act
+        documents = list(read_jsonl(str(corpus)))
+        resumed = list(read_jsonl(str(corpus), documents[1].start, documents[1].line))
+
+        # Assert
+        assert [d.doc_id for d in documents] == ["a", "3", "4"]
+        assert documents[0].sentences == ["أ", "ب"]
+        assert documents[0].fields == {"max_cost": 0.1}
+        assert documents[2].error is not None
+        assert [d.doc_id for d in resumed] == ["3", "4"]
+
+    def test_csv_groups_consecutive_rows(self, tmp_path):
+        """
+        Test that consecutive CSV rows of a document are grouped, including multi-line quoted sentences.
+        """
+        # Arrange
+        corpus = tmp_path / "corpus.csv"
+        corpus.write_text('doc,sentence\nd1,أ\nd1,"ب\nسطر"\nd2,ج\n', encoding="utf-8")
+
+        # Act
+        documents = list(read_csv(str(corpus), id_field="doc"))
+        resumed = list(read_csv(str(corpus), documents[1].start, documents[1].line, id_field="doc"))
+
+        # Assert
+        assert [(d.doc_id, d.sentences) for d in documents] == [("d1", ["أ", "ب\nسطر"]), ("d2", ["ج"])]
+        assert documents[0].next_line == documents[1].line == 5
+        assert [(d.doc_id, d.sentences) for d in resumed] == [("d2", ["ج"])]
+
+    def test_csv_missing_column(self, tmp_path):
+        """
+        Test that a CSV without the sentence column is rejected.
+        """
+        # Arrange
+        corpus = tmp_path / "corpus.csv"
+        corpus.write_text("id,text\n1,أ\n", encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            list(read_csv(str(corpus)))
+
+
+class TestBulkAnalyzer:
+    """
+    Unit tests for BulkAnalyzer.
+    """
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        """JSONL corpus of 20 documents, the 5th one empty."""
+        path = tmp_path / "corpus.jsonl"
+        path.write_text("".join(
+            json.dumps({"id": f"doc{i}", "sentences": [] if i == 4 else [f"جملة {i}"]}, ensure_ascii=False) + "\n"
+            for i in range(20)
+        ), encoding="utf-8")
+        return str(path)
+
+    @pytest.fixture
+    def use_case(self):
+        """Use case answering an empty analysis, and rejecting empty documents."""
+        def execute(request, compact=False):
+            if not request.sentences:
+                raise AppException("The list of sentences is empty.", code="EMPTY_TEXT")
+            return AnalysisResponse(categories=[])
+
+        use_case = Mock()
+        use_case.execute.side_effect = execute
+        return use_case
+
+    def test_writes_one_line_per_document(self, corpus, use_case, tmp_path):
+        """
+        Test that each document gets a result or an error line.
+        """
+        # Arrange
+        output = str(tmp_path / "results.jsonl")
+        analyzer = BulkAnalyzer(use_case, concurrency=4, request_defaults={"include_usage": True})
+
+        # Act
+        stats = analyzer.run(read_jsonl(corpus), output, output + ".checkpoint")
+
+        # Assert
+        records = read_output(output)
+        assert len(records) == 20
+        assert records["doc0"]["result"] == {"categories": []}
+        assert records["doc4"]["error"]["code"] == "EMPTY_TEXT"
+        assert (stats.analyzed, stats.failed, stats.skipped) == (19, 1, 0)
+        assert use_case.execute.call_args[0][0].include_usage is True
+        checkpoint = Checkpoint.load(output + ".checkpoint")
+        assert checkpoint.done_ids == []
+        assert checkpoint.input_line == 21
+
+    def test_resume_skips_finished_documents(self, corpus, use_case, tmp_path):
+        """
+        Test that a run interrupted mid-way resumes without analyzing finished documents again.
+        """
+        # Arrange
+        output = str(tmp_path / "results.jsonl")
+        checkpoint_path = output + ".checkpoint"
+        interrupted = threading.Event()
+
+        def interrupted_corpus():
+            for document in read_jsonl(corpus):
+                if document.doc_id == "doc12":
+                    interrupted.set()
+                    raise KeyboardInterrupt
+                yield document
+
+        first = BulkAnalyzer(use_case, concurrency=3, checkpoint_interval_seconds=0)
+        with pytest.raises(KeyboardInterrupt):
+            first.run(interrupted_corpus(), output, checkpoint_path)
+        with open(output, "ab") as file:
+            file.write(b'{"id":"doc12","res')  # write cut by the crash
+        first_calls = use_case.execute.call_count
+        checkpoint = Checkpoint.load(checkpoint_path)
+
+        # Act
+        stats = BulkAnalyzer(use_case, concurrency=3).run(
+            read_jsonl(corpus, checkpoint.input_offset, checkpoint.input_line),
+            output, checkpoint_path, resume_from=checkpoint
+        )
+
+        # Assert
+        records = read_output(output)
+        assert interrupted.is_set()
+        assert sorted(records) == sorted(f"doc{i}" for i in range(20))
+        assert use_case.execute.call_count == 20
+        assert stats.analyzed + stats.failed == 20 - first_calls
+        assert stats.skipped == 0
@@ -0,0 +1,40 @@
+"""
+Module: test_cold_start
+Description:
+    Unit tests for the cold start of the API.
+    Tests that importing the API module leaves the heavy packages to the lifespan hook.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_startup import DEFERRED_MODULES
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestColdStart:
+    """
+    Unit tests for the imports of the API module.
+    """
+
+    def test_importing_the_api_defers_heavy_packages(self):
+        """
+        Test that importing main_api does not load the container, openai, jinja2, yaml or dotenv.
+        """
+        # Arrange
+        script = (
+            "import sys\n"
+            "import src.presentation.api.main_api\n"
+            f"print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))\n"
+        )
+
+        # Act
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, timeout=60
+        )
+
+        # Assert
+        assert output.returncode == 0, output.stderr
+        assert output.stdout.strip() == ""
@@ -0,0 +1,116 @@
+"""
+Module: test_compression_middleware
+Description:
+    Unit tests for the CompressionMiddleware.
+    Tests response compression, the size threshold and gzip request decompression with a size cap.
+"""
+
+import gzip
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.insfrastructure.middleware.compression_middleware import CompressionMiddleware
+
+
+class TestCompressionMiddleware:
+    """
+    Unit tests for CompressionMiddleware.
+    """
+
+    @pytest.fixture
+    def client(self):
+        """Test client of an app echoing request bodies, behind the middleware."""
+        app = FastAPI()
+
+        @app.post("/echo")
+        async def echo(request: Request):
+            return PlainTextResponse(await request.body())
+
+        @app.get("/stream")
+        async def stream():
+            return StreamingResponse(iter([b"a" * 100, b"b" * 100]), media_type="text/plain")
+
+        app.add_middleware(CompressionMiddleware, minimum_size=500, max_request_size=1000)
+        return TestClient(app)
+
+    def test_large_response_is_gzipped(self, client):
+        """
+        Test that a response above the threshold is compressed with gzip.
+        """
+        # Act
+        response = client.post("/echo", content=b"x" * 600, headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.content == b"x" * 600
+
+    def test_small_response_is_not_compressed(self, client):
+        """
+        Test that a response below the threshold is sent unchanged.
+        """
+        # Act
+        response = client.post("/echo", content=b"x" * 100, headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.content == b"x" * 100
+
+    def test_response_not_compressed_without_accept_encoding(self, client):
+        """
+        Test that clients not accepting a supported encoding get an uncompressed body.
+        """
+        # Act
+        response = client.post("/echo", content=b"x" * 600, headers={"Accept-Encoding": "identity"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+
+    def test_streamed_response_is_compressed(self, client):
+        """
+        Test that streamed responses are compressed chunk by chunk.
+        """
+        # Act
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == b"a" * 100 + b"b" * 100
+
+    def test_gzip_request_is_decompressed(self, client):
+        """
+        Test that a gzip request body reaches the application decompressed.
+        """
+        # Act
+        response = client.post(
+            "/echo", content=gzip.compress("نص عربي".encode("utf-8")),
+            headers={"Content-Encoding": "gzip", "Accept-Encoding": "identity"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.text == "نص عربي"
+
+    def test_gzip_request_above_cap_is_rejected(self, client):
+        """
+        Test that a request body decompressing above the cap is rejected.
+        """
+        # Act
+        response = client.post("/echo", content=gzip.compress(b"x" * 5000), headers={"Content-Encoding": "gzip"})
+
+        # Assert
+        assert response.status_code == 413
+        assert response.json()["error"]["code"] == "REQUEST_TOO_LARGE"
+
+    @pytest.mark.parametrize("encoding, status", [("gzip", 400), ("deflate", 415)])
+    def test_invalid_request_encoding_is_rejected(self, client, encoding, status):
+        """
+        Test that corrupt gzip bodies and unsupported encodings are rejected.
+        """
+        # Act
+        response = client.post("/echo", content=b"not compressed", headers={"Content-Encoding": encoding})
+
+        # Assert
+        assert response.status_code == status
@@ -60,7 +60,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="test", phrases=contradictory_sentences)]
+                categories=[Category.from_phrases(name="test", phrases=contradictory_sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
@@ -87,7 +87,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="test", phrases=non_contradictory_sentences)]
+                categories=[Category.from_phrases(name="test", phrases=non_contradictory_sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
@@ -123,7 +123,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="test", phrases=sentences)]
+                categories=[Category.from_phrases(name="test", phrases=sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
@@ -150,7 +150,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="test", phrases=sample_sentences)]
+                categories=[Category.from_phrases(name="test", phrases=sample_sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
@@ -169,7 +169,7 @@ class TestContradictionDetector:
         # Act
         from src.domain.models.classification_result import ClassificationResult, Category
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=[sample_single_sentence])]
+            categories=[Category.from_phrases(name="test", phrases=[sample_single_sentence])]
         )
         result = detector_agent.detect_contradiction(classification_result)
 
@@ -212,7 +212,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="test", phrases=contradictory_sentences)]
+                categories=[Category.from_phrases(name="test", phrases=contradictory_sentences)]
             )
             # Act
             detector_agent.detect_contradiction(classification_result)
@@ -242,7 +242,7 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="energy", phrases=energy_sentences)]
+                categories=[Category.from_phrases(name="energy", phrases=energy_sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
@@ -273,10 +273,164 @@ class TestContradictionDetector:
         with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
             from src.domain.models.classification_result import ClassificationResult, Category
             classification_result = ClassificationResult(
-                categories=[Category(name="duration", phrases=duration_sentences)]
+                categories=[Category.from_phrases(name="duration", phrases=duration_sentences)]
             )
             # Act
             result = detector_agent.detect_contradiction(classification_result)
 
         # Assert
         assert result is not None
+
+    def test_contradiction_indices_refer_to_the_shared_table(self, detector_agent, mock_prompt_provider,
+                                                             sample_sentences):
+        """
+        Test that sentence numbers returned for a category are translated to indices in the shared table.
+        """
+        # Arrange
+        from unittest.mock import MagicMock
+        from src.domain.models.classification_result import ClassificationResult, Category
+        from src.domain.models.contradiction_llm_response import ContradictionLLMResponse, ContradictionLLM
+        from src.domain.models.sentence_table import SentenceTable
+
+        mock_prompt_provider.get_system_prompt.return_value = "Contradiction prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Find contradictions"
+        table = SentenceTable.of(sample_sentences)
+        category = Category("test", (1, 3, 4), table)
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.parsed = ContradictionLLMResponse(
+            contradictions=[ContradictionLLM(statements=[1, 3], severity_level="حاد", comment="c")]
+        )
+
+        with patch.object(detector_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            result = detector_agent.detect_contradiction(ClassificationResult(categories=[category]))
+
+        # Assert
+        assert result.categories[0].indices == (1, 3, 4)
+        assert result.categories[0].contradictions[0].indices == (1, 4)
+        assert result.categories[0].contradictions[0].table is table
+
+    def test_agent_settings_drive_llm_calls(self, mock_azure_settings, mock_prompt_provider, contradictory_sentences):
+        """
+        Test that the agent's own deployment, max tokens and timeout are used for its calls.
+        """
+        # Arrange
+        from unittest.mock import MagicMock
+        from src.domain.models.classification_result import ClassificationResult, Category
+        from src.domain.models.contradiction_llm_response import ContradictionLLMResponse
+        from src.insfrastructure.config.app_settings import AgentSettings
+
+        mock_prompt_provider.get_system_prompt.return_value = "Contradiction prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Find contradictions"
+        agent = ContradictionDetector(
+            azure_settings=mock_azure_settings,
+            prompt_provider=mock_prompt_provider,
+            agent_settings=AgentSettings(deployment="gpt-4o", timeout_seconds=20, max_tokens=512, max_concurrency=2)
+        )
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.parsed = ContradictionLLMResponse(contradictions=[])
+
+        with patch.object(agent.client.beta.chat.completions, 'parse', return_value=mock_response) as parse:
+            # Act
+            agent.detect_contradiction(ClassificationResult(categories=[
+                Category.from_phrases("test", contradictory_sentences)
+            ]))
+
+        # Assert
+        kwargs = parse.call_args.kwargs
+        assert (kwargs["model"], kwargs["max_tokens"], kwargs["timeout"]) == ("gpt-4o", 512, 20)
+        assert agent.model == "gpt-4o"
+
+
+class TestContradictionDetectorCascade:
+    """
+    Unit tests for the cascade mode of the ContradictionDetector agent.
+    """
+
+    @pytest.fixture
+    def cascade_agent(self):
+        """Detector screening categories with a cheap deployment before the strong one."""
+        from src.insfrastructure.config.app_settings import AgentSettings, CascadeSettings
+
+        settings = Mock()
+        settings.endpoint = "https://test.openai.azure.com/"
+        settings.api_key = "test-key"
+        settings.api_version = "2024-01-01"
+        settings.model = "gpt-4o"
+        prompt_provider = Mock()
+        prompt_provider.get_system_prompt.return_value = "Contradiction prompt"
+        prompt_provider.get_user_prompt.return_value = "Find contradictions"
+        return ContradictionDetector(
+            azure_settings=settings,
+            prompt_provider=prompt_provider,
+            agent_settings=AgentSettings(deployment="gpt-4o"),
+            cascade=CascadeSettings(deployment="gpt-4o-mini", confidence_threshold=0.8)
+        )
+
+    @staticmethod
+    def respond(screening, detection=None):
+        """Returns a parse side effect answering screening and detection calls."""
+        from unittest.mock import MagicMock
+        from src.domain.models.contradiction_llm_response import ContradictionLLMResponse, ScreeningLLMResponse
+
+        def parse(**kwargs):
+            completion = MagicMock()
+            completion.choices = [MagicMock()]
+            if kwargs["response_format"] is ScreeningLLMResponse:
+                completion.choices[0].message.parsed = ScreeningLLMResponse.model_validate(screening)
+            else:
+                completion.choices[0].message.parsed = ContradictionLLMResponse.model_validate(detection)
+            return completion
+        return parse
+
+    def test_confident_screening_is_not_escalated(self, cascade_agent, contradictory_sentences):
+        """
+        Test that a confident screening without severe contradictions is the final answer.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult, Category
+        screening = {"contradictions": [{"statements": [1, 2], "severity_level": "متوسط", "comment": "c"}],
+                     "confidence": 0.95}
+
+        with patch.object(cascade_agent.client.beta.chat.completions, 'parse',
+                          side_effect=self.respond(screening)) as parse:
+            # Act
+            result = cascade_agent.detect_contradiction(ClassificationResult(categories=[
+                Category.from_phrases("test", contradictory_sentences)
+            ]))
+
+        # Assert
+        assert [call.kwargs["model"] for call in parse.call_args_list] == ["gpt-4o-mini"]
+        assert len(result.categories[0].contradictions) == 1
+        assert cascade_agent.cascade_stats.escalation_rate == 0.0
+
+    @pytest.mark.parametrize("screening, reason", [
+        ({"contradictions": [], "confidence": 0.4}, "low_confidence"),
+        ({"contradictions": [{"statements": [1, 2], "severity_level": "حاد", "comment": "c"}], "confidence": 0.99},
+         "severe"),
+    ])
+    def test_uncertain_or_severe_screening_is_escalated(self, cascade_agent, contradictory_sentences,
+                                                        screening, reason):
+        """
+        Test that low-confidence and severe screenings are re-detected by the strong deployment.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult, Category
+        detection = {"contradictions": [{"statements": [1, 2], "severity_level": "حاد", "comment": "strong"}]}
+
+        with patch.object(cascade_agent.client.beta.chat.completions, 'parse',
+                          side_effect=self.respond(screening, detection)) as parse:
+            # Act
+            result = cascade_agent.detect_contradiction(ClassificationResult(categories=[
+                Category.from_phrases("test", contradictory_sentences)
+            ]))
+
+        # Assert
+        assert [call.kwargs["model"] for call in parse.call_args_list] == ["gpt-4o-mini", "gpt-4o"]
+        assert result.categories[0].contradictions[0].comment == "strong"
+        assert cascade_agent.cascade_stats.escalated == 1
+        assert getattr(cascade_agent.cascade_stats, reason) == 1
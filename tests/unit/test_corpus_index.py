@@ -0,0 +1,274 @@
+"""
+Module: test_corpus_index
+Description:
+    Unit tests for the corpus index and the CorpusCheckService.
+    Tests the Arabic normalization, candidate retrieval from the SQLite index and the
+    mapping of detected contradictions back to document and corpus sentences.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.services.corpus_check_service import CorpusCheckService
+from src.insfrastructure.corpus.arabic_normalizer import normalize, terms
+from src.insfrastructure.corpus.sqlite_corpus_index import SqliteCorpusIndex
+
+
+def classify(sentences, name="عقود"):
+    """Classification putting every sentence in one category."""
+    return ClassificationResult(categories=[
+        Category(name, tuple(range(len(sentences))), SentenceTable.of(sentences))
+    ])
+
+
+class TestArabicNormalizer:
+    """
+    Unit tests for the Arabic normalizer.
+    """
+
+    def test_normalize_removes_diacritics_and_unifies_letters(self):
+        """
+        Test that diacritics are removed and letter variants unified.
+        """
+        # Act
+        result = normalize("أَحْمَد إلى المدرسةِ")
+
+        # Assert
+        assert result == "احمد الي المدرسه"
+
+    def test_terms_strip_prefixes_and_stop_words(self):
+        """
+        Test that attached prefixes and stop words are not index terms.
+        """
+        # Act
+        result = terms("يتم إلغاء العقد في حالة التأخير والعقد")
+
+        # Assert
+        assert result == ["الغاء", "عقد", "حاله", "تاخير"]
+
+
+class TestSqliteCorpusIndex:
+    """
+    Unit tests for SqliteCorpusIndex.
+    """
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Empty index in a temporary database."""
+        corpus_index = SqliteCorpusIndex(str(tmp_path / "corpus.sqlite3"))
+        yield corpus_index
+        corpus_index.close()
+
+    def test_search_ranks_sentences_sharing_rare_terms_first(self, index):
+        """
+        Test that the sentence sharing the most informative terms comes first.
+        """
+        # Arrange
+        sentences = ["مدة العقد سنة واحدة", "يدفع الإيجار شهريا", "مدة الإيجار سنتان"]
+        index.add_document("doc-1", sentences, classify(sentences))
+
+        # Act
+        result = index.search("مدة العقد ثلاث سنوات", limit=2)
+
+        # Assert
+        assert [candidate.text for candidate in result] == ["مدة العقد سنة واحدة", "مدة الإيجار سنتان"]
+        assert result[0].document_id == "doc-1"
+        assert result[0].category == "عقود"
+
+    def test_add_document_replaces_previous_version(self, index):
+        """
+        Test that adding a document again replaces its sentences.
+        """
+        # Arrange
+        index.add_document("doc-1", ["مدة العقد سنة"], classify(["مدة العقد سنة"]))
+
+        # Act
+        index.add_document("doc-1", ["يدفع الإيجار شهريا"], classify(["يدفع الإيجار شهريا"]))
+
+        # Assert
+        assert index.size() == 1
+        assert index.search("مدة العقد", limit=5) == []
+        assert len(index.search("الإيجار", limit=5)) == 1
+
+    def test_remove_document(self, index):
+        """
+        Test that a removed document is no longer retrieved.
+        """
+        # Arrange
+        index.add_document("doc-1", ["مدة العقد سنة"], classify(["مدة العقد سنة"]))
+
+        # Act
+        removed = index.remove_document("doc-1")
+
+        # Assert
+        assert removed == 1
+        assert index.size() == 0
+        assert index.search("مدة العقد", limit=5) == []
+
+    def test_search_excludes_document(self, index):
+        """
+        Test that the excluded document is not returned.
+        """
+        # Arrange
+        index.add_document("doc-1", ["مدة العقد سنة"], classify(["مدة العقد سنة"]))
+        index.add_document("doc-2", ["مدة العقد سنتان"], classify(["مدة العقد سنتان"]))
+
+        # Act
+        result = index.search("مدة العقد", limit=5, exclude_document="doc-1")
+
+        # Assert
+        assert [candidate.document_id for candidate in result] == ["doc-2"]
+
+    def test_search_excludes_document_with_many_matches(self, index):
+        """
+        Test that an excluded document matching more sentences than the shortlist does not hide the others.
+        """
+        # Arrange
+        revision = [f"ميزانية المشروع مليون ريال للمرحلة {i}" for i in range(40)]
+        index.add_document("doc-v1", revision, classify(revision))
+        index.add_document("other", ["ميزانية المشروع مليونان"], classify(["ميزانية المشروع مليونان"]))
+
+        # Act
+        result = index.search("ميزانية المشروع مليون ريال", limit=5, exclude_document="doc-v1")
+
+        # Assert
+        assert [candidate.document_id for candidate in result] == ["other"]
+
+    def test_search_boosts_same_category(self, index):
+        """
+        Test that, at equal score, sentences of the requested category come first.
+        """
+        # Arrange
+        index.add_document("doc-1", ["مدة العقد سنة"], classify(["مدة العقد سنة"], name="مدة"))
+        index.add_document("doc-2", ["مدة العقد سنتان"], classify(["مدة العقد سنتان"], name="دفع"))
+
+        # Act
+        result = index.search("مدة العقد", limit=2, category="مدة")
+
+        # Assert
+        assert [candidate.document_id for candidate in result] == ["doc-1", "doc-2"]
+
+    def test_frequent_terms_are_skipped_in_large_corpora(self, tmp_path):
+        """
+        Test that terms above the document frequency cutoff do not retrieve anything.
+        """
+        # Arrange
+        index = SqliteCorpusIndex(str(tmp_path / "corpus.sqlite3"), max_df_ratio=0.5, min_corpus_for_df_cutoff=2)
+        sentences = ["العقد الأول", "العقد الثاني", "الملحق الثالث"]
+        index.add_document("doc-1", sentences, classify(sentences))
+
+        # Act
+        result = index.search("العقد", limit=5)
+
+        # Assert
+        assert result == []
+        index.close()
+
+
+class TestCorpusCheckService:
+    """
+    Unit tests for CorpusCheckService.
+    """
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Index holding one approved document."""
+        corpus_index = SqliteCorpusIndex(str(tmp_path / "corpus.sqlite3"))
+        approved = ["مدة العقد سنة واحدة", "يدفع الإيجار شهريا"]
+        corpus_index.add_document("approved", approved, classify(approved))
+        yield corpus_index
+        corpus_index.close()
+
+    @pytest.fixture
+    def classifier(self):
+        """Classifier putting every sentence in one category."""
+        classifier_agent = Mock()
+        classifier_agent.classify_sentences.side_effect = classify
+        return classifier_agent
+
+    def test_check_reports_contradictions_with_corpus_sentences(self, index, classifier):
+        """
+        Test that contradictions are mapped to document indices and corpus sentences,
+        and that contradictions within the new document are dropped.
+        """
+        # Arrange
+        def detect(classification):
+            group = classification.categories[0]
+            contradictions = (
+                Contradiction((0, 2), "high", "مدة مختلفة", group.table),
+                Contradiction((0, 1), "low", "داخل المستند", group.table),
+            )
+            return AnalysisContradictionResult(categories=[
+                CategoryContradictionResult(group.name, group.indices, contradictions, group.table)
+            ])
+
+        detector = Mock()
+        detector.detect_contradiction.side_effect = detect
+        service = CorpusCheckService(classifier, detector, index)
+
+        # Act
+        result = service.check(["مدة العقد سنتان", "يبدأ العقد في يناير"])
+
+        # Assert
+        assert result.corpus_size == 2
+        assert detector.detect_contradiction.call_count == 1
+        sent_group = detector.detect_contradiction.call_args[0][0].categories[0]
+        assert sent_group.phrases[:2] == ["مدة العقد سنتان", "يبدأ العقد في يناير"]
+        assert sent_group.phrases[2] == "مدة العقد سنة واحدة"
+        assert len(result.contradictions) == 1
+        contradiction = result.contradictions[0]
+        assert contradiction.indices == (0,)
+        assert [match.text for match in contradiction.matches] == ["مدة العقد سنة واحدة"]
+        assert contradiction.severity == "high"
+
+    def test_check_with_empty_corpus_skips_llm(self, tmp_path, classifier):
+        """
+        Test that no LLM call is made when the corpus is empty.
+        """
+        # Arrange
+        detector = Mock()
+        service = CorpusCheckService(classifier, detector, SqliteCorpusIndex(str(tmp_path / "empty.sqlite3")))
+
+        # Act
+        result = service.check(["مدة العقد سنتان"])
+
+        # Assert
+        assert result.contradictions == []
+        classifier.classify_sentences.assert_not_called()
+        detector.detect_contradiction.assert_not_called()
+
+    def test_check_without_candidates_skips_detection(self, index, classifier):
+        """
+        Test that categories without any candidate are not sent to the detector.
+        """
+        # Arrange
+        detector = Mock()
+        service = CorpusCheckService(classifier, detector, index)
+
+        # Act
+        result = service.check(["تسليم البضاعة خلال أسبوع"])
+
+        # Assert
+        assert result.candidate_count == 0
+        detector.detect_contradiction.assert_not_called()
+
+    def test_add_document_classifies_and_stores(self, index, classifier):
+        """
+        Test that approved documents are classified before being stored.
+        """
+        # Arrange
+        service = CorpusCheckService(classifier, Mock(), index)
+
+        # Act
+        stored = service.add_document("new", ["تسليم البضاعة خلال أسبوع"])
+
+        # Assert
+        assert stored == 1
+        assert index.size() == 3
+        assert index.search("تسليم البضاعة", limit=1)[0].category == "عقود"
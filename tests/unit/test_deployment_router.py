@@ -0,0 +1,210 @@
+"""
+Module: test_deployment_router
+Description:
+    Unit tests for the DeploymentRouter.
+    Tests least-outstanding balancing, latency awareness, cooldown after throttling and
+    failover between deployments, for parsed and streamed calls.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import httpx2
+import openai
+import pytest
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.config.app_settings import DeploymentSettings
+
+
+def make_deployment(name):
+    """Deployment settings named after its deployment."""
+    return DeploymentSettings(
+        name=name, endpoint=f"https://{name}.openai.azure.com/", api_key="key", api_version="2024-01-01", deployment=name
+    )
+
+
+def rate_limit_error(retry_after=None):
+    """429 error as raised by the OpenAI client."""
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    response = httpx2.Response(429, headers=headers, request=httpx2.Request("POST", "https://test"))
+    return openai.RateLimitError("Too many requests", response=response, body=None)
+
+
+class TestDeploymentRouter:
+    """
+    Unit tests for DeploymentRouter.
+    """
+
+    @pytest.fixture
+    def router(self):
+        """Router over two deployments with mocked clients."""
+        return DeploymentRouter(
+            [make_deployment("east"), make_deployment("west")],
+            cooldown_seconds=30,
+            client_factory=lambda settings: MagicMock(name=settings.name)
+        )
+
+    def test_parse_sends_deployment_as_model(self, router):
+        """
+        Test that routed calls use the deployment name of the chosen deployment as model.
+        """
+        # Arrange
+        east_client = router.deployments[0].client
+
+        # Act
+        router.client.beta.chat.completions.parse(model="ignored", messages=[])
+
+        # Assert
+        east_client.beta.chat.completions.parse.assert_called_once_with(model="east", messages=[])
+
+    def test_balances_on_outstanding_calls(self, router):
+        """
+        Test that a deployment busy with a call is not chosen while another one is idle.
+        """
+        # Arrange
+        chosen = []
+
+        def outer(client, deployment):
+            chosen.append(deployment)
+            router.call(lambda inner_client, inner_deployment: chosen.append(inner_deployment))
+
+        # Act
+        router.call(outer)
+
+        # Assert
+        assert chosen == ["east", "west"]
+        assert [d.outstanding for d in router.deployments] == [0, 0]
+
+    def test_prefers_faster_deployment(self, router):
+        """
+        Test that the deployment with the lower observed latency gets idle traffic.
+        """
+        # Arrange
+        router.deployments[0].latency_ms = 900.0
+        router.deployments[1].latency_ms = 300.0
+
+        # Act
+        deployment = router.call(lambda client, deployment: deployment)
+
+        # Assert
+        assert deployment == "west"
+
+    def test_fails_over_and_cools_down_throttled_deployment(self, router):
+        """
+        Test that a 429 moves the call to another deployment and keeps traffic away for Retry-After.
+        """
+        # Arrange
+        attempts = []
+
+        def operation(client, deployment):
+            attempts.append(deployment)
+            if deployment == "east":
+                raise rate_limit_error(retry_after="20")
+            return "ok"
+
+        # Act
+        first = router.call(operation)
+        second = router.call(operation)
+
+        # Assert
+        assert first == second == "ok"
+        assert attempts == ["east", "west", "west"]
+        assert router.deployments[0].cooldown_until > router.deployments[1].cooldown_until
+
+    def test_raises_when_all_attempts_fail(self, router):
+        """
+        Test that the last error is raised once every deployment failed.
+        """
+        # Arrange
+        def operation(client, deployment):
+            raise rate_limit_error()
+
+        # Act & Assert
+        with pytest.raises(openai.RateLimitError):
+            router.call(operation)
+        assert [d.outstanding for d in router.deployments] == [0, 0]
+
+    def test_does_not_fail_over_on_client_errors(self, router):
+        """
+        Test that errors another deployment would also return are raised at once.
+        """
+        # Arrange
+        attempts = []
+
+        def operation(client, deployment):
+            attempts.append(deployment)
+            raise ValueError("invalid request")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            router.call(operation)
+        assert attempts == ["east"]
+
+    def test_stream_fails_over_when_opening(self, router):
+        """
+        Test that a stream rejected when opened is reopened on another deployment.
+        """
+        # Arrange
+        router.deployments[0].client.beta.chat.completions.stream.return_value.__enter__.side_effect = (
+            rate_limit_error()
+        )
+        west_stream = router.deployments[1].client.beta.chat.completions.stream.return_value.__enter__.return_value
+
+        # Act
+        with router.client.beta.chat.completions.stream(model="ignored", messages=[]) as stream:
+            outstanding = [d.outstanding for d in router.deployments]
+
+        # Assert
+        assert stream is west_stream
+        assert outstanding == [0, 1]
+        assert router.deployments[1].latency_ms is not None
+
+    def test_hedges_slow_call_on_other_deployment(self):
+        """
+        Test that a call slower than the hedging delay is duplicated and the faster answer wins.
+        """
+        # Arrange
+        router = DeploymentRouter(
+            [make_deployment("east"), make_deployment("west")],
+            client_factory=lambda settings: MagicMock(name=settings.name),
+            hedge_percentile=90, hedge_budget_ratio=1.0, hedge_min_samples=5
+        )
+        router._latencies.extend([10.0] * 5)
+
+        def operation(client, deployment):
+            if deployment == "east":
+                time.sleep(0.5)
+            return deployment
+
+        # Act
+        result = router.call(operation)
+
+        # Assert
+        assert result == "west"
+        assert (router.hedge_stats.hedged, router.hedge_stats.hedge_wins) == (1, 1)
+
+    def test_hedging_respects_budget(self):
+        """
+        Test that no duplicate is sent once the hedging budget is spent.
+        """
+        # Arrange
+        router = DeploymentRouter(
+            [make_deployment("east"), make_deployment("west")],
+            client_factory=lambda settings: MagicMock(name=settings.name),
+            hedge_percentile=90, hedge_budget_ratio=0.0, hedge_min_samples=5
+        )
+        router._latencies.extend([1.0] * 5)
+        router._hedge_tokens = 0.0
+        calls = []
+
+        def operation(client, deployment):
+            calls.append(deployment)
+            time.sleep(0.05)
+            return deployment
+
+        # Act
+        router.call(operation)
+
+        # Assert
+        assert len(calls) == 1
+        assert router.hedge_stats.budget_denied == 1
@@ -0,0 +1,58 @@
+"""
+Module: test_domain_models
+Description:
+    Unit tests for the index-based domain models.
+    Tests sentence table sharing, text materialization and immutability.
+"""
+
+import dataclasses
+import pytest
+from src.domain.models.classification_result import Category
+from src.domain.models.contradiction_result import CategoryContradictionResult, Contradiction
+from src.domain.models.sentence_table import SentenceTable
+
+
+class TestDomainModels:
+    """
+    Unit tests for SentenceTable, Category and contradiction results.
+    """
+
+    def test_table_of_reuses_existing_table(self, sample_sentences):
+        """
+        Test that building a table from a table returns the same object.
+        """
+        # Arrange
+        table = SentenceTable.of(sample_sentences)
+
+        # Act & Assert
+        assert SentenceTable.of(table) is table
+        assert len(table) == len(sample_sentences)
+
+    def test_models_share_the_table(self, sample_sentences):
+        """
+        Test that categories and contradictions reference the sentences of one table.
+        """
+        # Arrange
+        table = SentenceTable.of(sample_sentences)
+
+        # Act
+        category = Category("الإخلاء", (2, 0), table)
+        contradiction = Contradiction((0, 2), "حاد", "", table)
+        result = CategoryContradictionResult(category.name, category.indices, (contradiction,), table)
+
+        # Assert
+        assert category.phrases == [sample_sentences[2], sample_sentences[0]]
+        assert result.statements == category.phrases
+        assert result.contradictions[0].statements[0] is table.sentences[0]
+
+    def test_models_are_immutable(self, sample_sentences):
+        """
+        Test that domain models cannot be modified once built.
+        """
+        # Arrange
+        category = Category.from_phrases("الإخلاء", sample_sentences)
+
+        # Act & Assert
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            category.name = "other"
+        assert not hasattr(category, "__dict__")
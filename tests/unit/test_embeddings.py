@@ -0,0 +1,282 @@
+"""
+Module: test_embeddings
+Description:
+    Unit tests for the embeddings stage.
+    Tests the Azure embedding agent, the cached embedding store, the vector index, the
+    semantic sentence grouper and the vector retrieval of the corpus index, with a local
+    stand-in for the embeddings deployment.
+"""
+
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import Mock
+
+import numpy as np
+import openai
+import pytest
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.ports.input.embedding_agent_port import EmbeddingAgentPort
+from src.insfrastructure.agents.embedding_agent import AzureEmbeddingAgent
+from src.insfrastructure.corpus.sqlite_corpus_index import SqliteCorpusIndex
+from src.insfrastructure.embeddings import vector_index
+from src.insfrastructure.embeddings.embedding_store import EmbeddingStore
+from src.insfrastructure.embeddings.semantic_grouper import SemanticSentenceGrouper
+from src.insfrastructure.embeddings.vector_index import VectorIndex
+
+# Words of each topic of the stand-in embedder; synonyms share a dimension
+TOPICS = [
+    {"الإيجار", "الأجرة", "يدفع", "تسدد"},
+    {"التسليم", "تسليم", "البضاعة", "الشحنة"},
+    {"العقد", "الاتفاق", "مدة", "سنة", "سنتان"},
+]
+
+
+class TopicEmbeddingAgent(EmbeddingAgentPort):
+    """
+    Local stand-in of an embeddings deployment: counts the words of each topic.
+    """
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def embed_sentences(self, sentences: List[str]) -> List[List[float]]:
+        self.calls.append(list(sentences))
+        return [
+            [float(sum(word in topic for word in sentence.split())) for topic in TOPICS] + [0.1]
+            for sentence in sentences
+        ]
+
+
+def classify(sentences, name="عقود"):
+    """Classification putting every sentence in one category."""
+    return ClassificationResult(categories=[
+        Category(name, tuple(range(len(sentences))), SentenceTable.of(sentences))
+    ])
+
+
+class TestAzureEmbeddingAgent:
+    """
+    Unit tests for AzureEmbeddingAgent.
+    """
+
+    def test_embed_sentences_batches_and_orders_vectors(self):
+        """
+        Test that sentences are sent in batches and vectors are returned in input order.
+        """
+        # Arrange
+        client = Mock()
+        # The vectors come back in reverse order, each with its input position
+        client.embeddings.create.side_effect = lambda model, input: SimpleNamespace(
+            data=[SimpleNamespace(index=i, embedding=[float(len(input[i]))]) for i in reversed(range(len(input)))],
+            usage=SimpleNamespace(prompt_tokens=len(input), total_tokens=len(input))
+        )
+        router = Mock()
+        router.call.side_effect = lambda operation: operation(client, "embeddings-deployment")
+        usage_tracker = Mock()
+        agent = AzureEmbeddingAgent(
+            Mock(), "embeddings-deployment", router=router, usage_tracker=usage_tracker, batch_size=2
+        )
+
+        # Act
+        vectors = agent.embed_sentences(["a", "bb", "ccc"])
+
+        # Assert
+        assert vectors == [[1.0], [2.0], [3.0]]
+        assert client.embeddings.create.call_count == 2
+        first_call = client.embeddings.create.call_args_list[0].kwargs
+        assert first_call == {"model": "embeddings-deployment", "input": ["a", "bb"]}
+        assert usage_tracker.record.call_count == 2
+        assert usage_tracker.record.call_args[0][0] == "embedding"
+
+
+class TestEmbeddingStore:
+    """
+    Unit tests for EmbeddingStore.
+    """
+
+    def test_embed_returns_unit_vectors_and_caches_them(self):
+        """
+        Test that vectors are normalized, duplicates embedded once and repeated sentences cached.
+        """
+        # Arrange
+        agent = TopicEmbeddingAgent()
+        store = EmbeddingStore(agent)
+
+        # Act
+        first = store.embed(["يدفع الإيجار", "تسليم البضاعة", "يدفع الإيجار"])
+        second = store.embed(["تسليم البضاعة", "مدة العقد"])
+
+        # Assert
+        assert first.shape == (3, 4)
+        assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+        assert np.array_equal(first[0], first[2])
+        assert np.array_equal(first[1], second[0])
+        assert agent.calls == [["يدفع الإيجار", "تسليم البضاعة"], ["مدة العقد"]]
+        assert (store.hits, store.misses) == (1, 3)
+
+
+class TestVectorIndex:
+    """
+    Unit tests for VectorIndex.
+    """
+
+    @pytest.fixture
+    def vectors(self):
+        """Random unit vectors."""
+        rng = np.random.default_rng(7)
+        matrix = rng.normal(size=(300, 16)).astype(np.float32)
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    def test_search_matches_brute_force_across_chunks(self, vectors, monkeypatch):
+        """
+        Test that the chunked top-k search returns the exact nearest vectors.
+        """
+        # Arrange
+        monkeypatch.setattr(vector_index, "CHUNK_ROWS", 64)
+        index = VectorIndex(initial_capacity=8)
+        index.add(list(range(1000, 1300)), vectors)
+        queries = vectors[:3]
+
+        # Act
+        results = index.search(queries, k=5)
+
+        # Assert
+        expected = np.argsort(-(vectors @ queries.T), axis=0)[:5].T
+        assert [[vector_id for vector_id, _ in ranking] for ranking in results] == (expected + 1000).tolist()
+        assert results[0][0][1] == pytest.approx(1.0)
+
+    def test_removed_vectors_are_not_returned(self, vectors):
+        """
+        Test that removed ids are skipped by searches.
+        """
+        # Arrange
+        index = VectorIndex()
+        index.add([1, 2, 3], vectors[:3])
+
+        # Act
+        index.remove([1])
+        results = index.search(vectors[:1], k=3)
+
+        # Assert
+        assert len(index) == 2
+        assert {vector_id for vector_id, _ in results[0]} == {2, 3}
+
+
+    def test_removed_rows_are_reclaimed(self, vectors):
+        """
+        Test that the matrix is compacted once removed rows dominate, and searches stay exact.
+        """
+        # Arrange
+        index = VectorIndex(initial_capacity=8)
+        index.add(list(range(300)), vectors)
+
+        # Act
+        index.remove(range(100, 300))
+        compacted_rows = index._count
+        index.remove(range(100))
+        emptied_rows = index._count
+        index.add([500, 501], vectors[:2])
+        results = index.search(vectors[1:2], k=1)
+
+        # Assert
+        assert compacted_rows == 100
+        assert emptied_rows == 0
+        assert len(index) == 2
+        assert results[0][0][0] == 501
+
+
+class TestSemanticSentenceGrouper:
+    """
+    Unit tests for SemanticSentenceGrouper.
+    """
+
+    def test_group_keeps_similar_sentences_together(self):
+        """
+        Test that sentences of the same topic form a group.
+        """
+        # Arrange
+        sentences = ["يدفع الإيجار", "تسليم البضاعة", "تسدد الأجرة", "الشحنة تسليم", "مدة العقد", "الاتفاق سنة"]
+        grouper = SemanticSentenceGrouper(EmbeddingStore(TopicEmbeddingAgent()))
+
+        # Act
+        groups = grouper.group(sentences, 2)
+
+        # Assert
+        assert groups == [[0, 2], [1, 3], [4, 5]]
+
+    def test_group_falls_back_to_positions_when_embeddings_fail(self):
+        """
+        Test that sentences are grouped by position when the embeddings call fails.
+        """
+        # Arrange
+        store = Mock()
+        store.embed.side_effect = openai.APIConnectionError(request=Mock())
+        grouper = SemanticSentenceGrouper(store)
+
+        # Act
+        groups = grouper.group(["a", "b", "c"], 2)
+
+        # Assert
+        assert groups == [[0, 1], [2]]
+
+
+class TestCorpusVectorRetrieval:
+    """
+    Unit tests for the vector retrieval of SqliteCorpusIndex.
+    """
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Index with embeddings holding one approved document."""
+        corpus_index = SqliteCorpusIndex(
+            str(tmp_path / "corpus.sqlite3"), embeddings=EmbeddingStore(TopicEmbeddingAgent()), min_similarity=0.8
+        )
+        approved = ["يدفع الإيجار كل شهر", "تسليم البضاعة خلال أسبوع"]
+        corpus_index.add_document("approved", approved, classify(approved))
+        yield corpus_index
+        corpus_index.close()
+
+    def test_search_retrieves_paraphrases_without_shared_terms(self, index):
+        """
+        Test that a paraphrase sharing no term with the stored sentence is retrieved.
+        """
+        # Act
+        result = index.search("تسدد الأجرة سنويا", limit=5)
+
+        # Assert
+        assert [candidate.text for candidate in result] == ["يدفع الإيجار كل شهر"]
+
+    def test_vectors_survive_reopening_and_removal(self, index, tmp_path):
+        """
+        Test that stored vectors are loaded by a new index and dropped with their document.
+        """
+        # Arrange
+        reopened = SqliteCorpusIndex(
+            str(tmp_path / "corpus.sqlite3"), embeddings=EmbeddingStore(TopicEmbeddingAgent()), min_similarity=0.8
+        )
+
+        # Act
+        before = reopened.search("الشحنة", limit=5)
+        reopened.remove_document("approved")
+        after = reopened.search("الشحنة", limit=5)
+
+        # Assert
+        assert [candidate.text for candidate in before] == ["تسليم البضاعة خلال أسبوع"]
+        assert after == []
+        reopened.close()
+
+    def test_search_is_lexical_when_embeddings_fail(self, index):
+        """
+        Test that a failing embeddings call falls back to lexical retrieval.
+        """
+        # Arrange
+        index.embeddings = Mock()
+        index.embeddings.embed.side_effect = openai.APIConnectionError(request=Mock())
+
+        # Act
+        result = index.search("تسليم البضاعة", limit=5)
+
+        # Assert
+        assert [candidate.text for candidate in result] == ["تسليم البضاعة خلال أسبوع"]
@@ -0,0 +1,45 @@
+"""
+Module: test_fast_json_response
+Description:
+    Unit tests for the FastJSONResponse.
+    Tests single-pass encoding of trusted DTOs and plain content.
+"""
+
+import json
+from src.application.dto.analysis_response import AnalysisResponse, CategoryContradictionDTO
+from src.presentation.api.fast_json_response import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """
+    Unit tests for FastJSONResponse.
+    """
+
+    def test_renders_constructed_dto_without_none_fields(self):
+        """
+        Test that a DTO built with model_construct is encoded without its None fields.
+        """
+        # Arrange
+        dto = AnalysisResponse.model_construct(categories=[
+            CategoryContradictionDTO.model_construct(category_name="الطاقة", statements=["جملة"], contradictions=[])
+        ])
+
+        # Act
+        response = FastJSONResponse(dto)
+
+        # Assert
+        assert json.loads(response.body) == {
+            "categories": [{"category_name": "الطاقة", "statements": ["جملة"], "contradictions": []}]
+        }
+        assert "الطاقة".encode("utf-8") in response.body
+        assert response.media_type == "application/json"
+
+    def test_renders_plain_content(self):
+        """
+        Test that plain JSON-compatible content is encoded.
+        """
+        # Act
+        response = FastJSONResponse({"status": "ok"})
+
+        # Assert
+        assert json.loads(response.body) == {"status": "ok"}
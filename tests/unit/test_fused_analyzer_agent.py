@@ -0,0 +1,180 @@
+"""
+Module: test_fused_analyzer_agent
+Description:
+    Unit tests for the FusedAnalyzer agent.
+    Tests single-call classification and contradiction detection and domain model mapping.
+"""
+
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+from src.domain.models.fused_analysis_llm_response import FusedAnalysisLLMResponse
+from src.domain.services.text_analysis_service import UNNAMED_CATEGORY
+from src.insfrastructure.agents.fused_analyzer_agent import FusedAnalyzer
+
+
+class TestFusedAnalyzer:
+    """
+    Unit tests for the FusedAnalyzer agent.
+    """
+
+    @pytest.fixture
+    def mock_azure_settings(self):
+        """Mock of Azure settings."""
+        mock_settings = Mock()
+        mock_settings.endpoint = "https://test.openai.azure.com/"
+        mock_settings.api_key = "test-key"
+        mock_settings.api_version = "2024-01-01"
+        mock_settings.model = "gpt-4"
+        return mock_settings
+
+    @pytest.fixture
+    def mock_prompt_provider(self):
+        """Mock of the prompt provider."""
+        provider = Mock()
+        provider.get_system_prompt.return_value = "Classify and detect"
+        provider.get_user_prompt.return_value = "Sentences"
+        return provider
+
+    @pytest.fixture
+    def fused_agent(self, mock_azure_settings, mock_prompt_provider):
+        """Instance of the fused analyzer agent."""
+        return FusedAnalyzer(azure_settings=mock_azure_settings, prompt_provider=mock_prompt_provider)
+
+    @staticmethod
+    def _mock_completion(payload):
+        """Builds a mocked completion carrying the parsed fused response."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.parsed = FusedAnalysisLLMResponse.model_validate(payload)
+        return mock_response
+
+    def test_analyze_maps_categories_and_contradictions(self, fused_agent, sample_sentences):
+        """
+        Test that one call returns categories and their contradictions with full sentences.
+        """
+        # Arrange
+        mock_response = self._mock_completion({
+            "categories": [
+                {
+                    "name": "المقترح",
+                    "phrases": [1, 2, 3],
+                    "التناقضات": [{"إفادات": [1, 2], "مستوى_التعارض": "حاد", "تعليق": "تعارض"}]
+                },
+                {"name": "الطاقة", "phrases": [9, 10], "التناقضات": []}
+            ]
+        })
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response) as mock_parse:
+            # Act
+            result = fused_agent.analyze_sentences(sample_sentences)
+
+        # Assert
+        mock_parse.assert_called_once()
+        assert [c.category_name for c in result.categories] == ["المقترح", "الطاقة", UNNAMED_CATEGORY]
+        assert result.categories[0].statements == sample_sentences[:3]
+        assert result.categories[0].contradictions[0].statements == sample_sentences[:2]
+        assert result.categories[0].contradictions[0].severity == "حاد"
+        assert result.categories[1].contradictions == ()
+
+    def test_analyze_discards_out_of_range_indices(self, fused_agent, contradictory_sentences):
+        """
+        Test that indices outside the input are ignored.
+        """
+        # Arrange
+        mock_response = self._mock_completion({
+            "categories": [{
+                "name": "المقترح",
+                "phrases": [1, 2, 7],
+                "التناقضات": [{"إفادات": [1, 2, 7], "مستوى_التعارض": "متوسط", "تعليق": "تعارض"}]
+            }]
+        })
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            result = fused_agent.analyze_sentences(contradictory_sentences)
+
+        # Assert
+        assert result.categories[0].statements == contradictory_sentences
+        assert result.categories[0].contradictions[0].statements == contradictory_sentences
+
+    def test_analyze_assigns_each_sentence_to_one_category(self, fused_agent, sample_sentences):
+        """
+        Test that duplicated sentences stay in their first category and left out ones go to the unnamed category.
+        """
+        # Arrange
+        mock_response = self._mock_completion({
+            "categories": [
+                {"name": "المقترح", "phrases": [1, 2, 2], "التناقضات": []},
+                {"name": "الطاقة", "phrases": [2, 3], "التناقضات": []},
+                {"name": "المقترح", "phrases": [4], "التناقضات": []}
+            ]
+        })
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            result = fused_agent.analyze_sentences(sample_sentences[:5])
+
+        # Assert
+        assert [(c.category_name, c.indices) for c in result.categories] == [
+            ("المقترح", (0, 1, 3)), ("الطاقة", (2,)), (UNNAMED_CATEGORY, (4,))
+        ]
+
+    def test_analyze_keeps_contradictions_within_their_category(self, fused_agent, sample_sentences):
+        """
+        Test that contradictions only cite sentences of their category and need two distinct ones.
+        """
+        # Arrange
+        mock_response = self._mock_completion({
+            "categories": [
+                {
+                    "name": "المقترح",
+                    "phrases": [1, 2, 3],
+                    "التناقضات": [
+                        {"إفادات": [1, 1, 4, 3], "مستوى_التعارض": "حاد", "تعليق": "تعارض"},
+                        {"إفادات": [2, 4], "مستوى_التعارض": "متوسط", "تعليق": "خارج الفئة"}
+                    ]
+                },
+                {"name": "الطاقة", "phrases": [4], "التناقضات": []}
+            ]
+        })
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            result = fused_agent.analyze_sentences(sample_sentences[:4])
+
+        # Assert
+        assert [c.indices for c in result.categories[0].contradictions] == [(0, 2)]
+
+    def test_analyze_drops_contradictions_of_single_sentence_category(self, fused_agent, sample_single_sentence):
+        """
+        Test that a category with one sentence never reports contradictions.
+        """
+        # Arrange
+        mock_response = self._mock_completion({
+            "categories": [{
+                "name": "المقترح",
+                "phrases": [1],
+                "التناقضات": [{"إفادات": [1], "مستوى_التعارض": "متوسط", "تعليق": "تعارض"}]
+            }]
+        })
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            result = fused_agent.analyze_sentences([sample_single_sentence])
+
+        # Assert
+        assert result.categories[0].contradictions == ()
+
+    def test_analyze_uses_fused_prompt(self, fused_agent, contradictory_sentences, mock_prompt_provider):
+        """
+        Test that the fused prompt is requested from the prompt provider.
+        """
+        # Arrange
+        mock_response = self._mock_completion({"categories": []})
+
+        with patch.object(fused_agent.client.beta.chat.completions, 'parse', return_value=mock_response):
+            # Act
+            fused_agent.analyze_sentences(contradictory_sentences)
+
+        # Assert
+        mock_prompt_provider.get_system_prompt.assert_called_with(prompt_name="prompt_fused_analysis")
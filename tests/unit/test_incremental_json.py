@@ -0,0 +1,73 @@
+"""
+Module: test_incremental_json
+Description:
+    Unit tests for the ArrayObjectScanner.
+    Tests extraction of array objects from a JSON document streamed in fragments.
+"""
+
+import json
+from src.insfrastructure.agents.incremental_json import ArrayObjectScanner
+
+
+class TestArrayObjectScanner:
+    """
+    Unit tests for ArrayObjectScanner.
+    """
+
+    def test_objects_returned_as_they_close(self):
+        """
+        Test that each object is returned by the fragment that closes it.
+        """
+        # Arrange
+        scanner = ArrayObjectScanner()
+
+        # Act
+        first = scanner.feed('{"categories": [{"name": "a", "phrases": [1, 2]}, {"na')
+        second = scanner.feed('me": "b", "phrases": [3]}]}')
+
+        # Assert
+        assert first == [{"name": "a", "phrases": [1, 2]}]
+        assert second == [{"name": "b", "phrases": [3]}]
+
+    def test_character_by_character(self):
+        """
+        Test that feeding one character at a time yields every object.
+        """
+        # Arrange
+        document = json.dumps(
+            {"categories": [{"name": "الإخلاء", "phrases": [1]}, {"name": "الإسعاف", "phrases": [2, 3]}]},
+            ensure_ascii=False
+        )
+        scanner = ArrayObjectScanner()
+
+        # Act
+        objects = [obj for char in document for obj in scanner.feed(char)]
+
+        # Assert
+        assert [obj["name"] for obj in objects] == ["الإخلاء", "الإسعاف"]
+
+    def test_braces_inside_strings_are_ignored(self):
+        """
+        Test that braces, brackets and escaped quotes inside strings do not end an object.
+        """
+        # Arrange
+        scanner = ArrayObjectScanner()
+
+        # Act
+        objects = scanner.feed('{"categories": [{"name": "x } ] \\" {", "phrases": []}]}')
+
+        # Assert
+        assert objects == [{"name": 'x } ] " {', "phrases": []}]
+
+    def test_nested_objects_are_not_returned_separately(self):
+        """
+        Test that only objects directly inside the array are returned.
+        """
+        # Arrange
+        scanner = ArrayObjectScanner()
+
+        # Act
+        objects = scanner.feed('{"items": [{"inner": {"a": 1}}]}')
+
+        # Assert
+        assert objects == [{"inner": {"a": 1}}]
@@ -0,0 +1,291 @@
+"""
+Module: test_live_analysis
+Description:
+    Unit tests for the live analysis of a document being edited.
+    Tests the incremental session (partial re-classification and re-detection, cancellation)
+    and the debouncing and cancellation of the WebSocket connection.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.sentence_table import SentenceTable
+from src.domain.services.live_analysis_service import CancellationToken, LiveAnalysisSession
+from src.presentation.api.live_connection import LiveConnection
+
+
+def classify_by_topic(sentences, category_names=None):
+    """Classification putting each sentence in the category named by its first word."""
+    table = SentenceTable.of(sentences)
+    indices = {}
+    for i, sentence in enumerate(sentences):
+        indices.setdefault(sentence.split()[0], []).append(i)
+    return ClassificationResult(categories=[Category(name, tuple(group), table) for name, group in indices.items()])
+
+
+def detect_first_pair(classification_result):
+    """Detection reporting a contradiction between the first two sentences of each category."""
+    return AnalysisContradictionResult(categories=[
+        CategoryContradictionResult(
+            category.name,
+            category.indices,
+            (Contradiction(category.indices[:2], "حاد", "c", category.table),) if len(category.indices) >= 2 else (),
+            category.table
+        )
+        for category in classification_result.categories
+    ])
+
+
+class TestLiveAnalysisSession:
+    """
+    Unit tests for LiveAnalysisSession.
+    """
+
+    @pytest.fixture
+    def classifier(self):
+        """Classifier grouping sentences by their first word."""
+        classifier = Mock()
+        classifier.assign_sentences.side_effect = classify_by_topic
+        return classifier
+
+    @pytest.fixture
+    def detector(self):
+        """Detector reporting the first pair of each category."""
+        detector = Mock()
+        detector.detect_contradiction.side_effect = detect_first_pair
+        return detector
+
+    @pytest.fixture
+    def session(self, classifier, detector):
+        """Session holding two rent sentences and one delivery sentence."""
+        live_session = LiveAnalysisSession(classifier, detector)
+        live_session.apply({"r1": "rent monthly", "r2": "rent yearly", "d1": "delivery weekly"})
+        classifier.reset_mock()
+        detector.reset_mock()
+        return live_session
+
+    def test_first_batch_classifies_and_detects_everything(self, classifier, detector):
+        """
+        Test that the first batch classifies all sentences without existing categories.
+        """
+        # Arrange
+        session = LiveAnalysisSession(classifier, detector)
+
+        # Act
+        update = session.apply({"r1": "rent monthly", "r2": "rent yearly", "d1": "delivery weekly"})
+
+        # Assert
+        assert classifier.assign_sentences.call_args.args == (["rent monthly", "rent yearly", "delivery weekly"], [])
+        assert update.version == 1
+        assert [(c.name, c.sentence_ids) for c in update.categories] == [("rent", ("r1", "r2")), ("delivery", ("d1",))]
+        assert update.categories[0].contradictions[0].sentence_ids == ("r1", "r2")
+
+    def test_edit_reclassifies_and_redetects_only_affected_categories(self, session, classifier, detector):
+        """
+        Test that only the edited sentence is classified and only its old and new categories are detected.
+        """
+        # Act
+        update = session.apply({"r2": "delivery daily"})
+
+        # Assert
+        assert classifier.assign_sentences.call_args.args == (["delivery daily"], ["rent", "delivery"])
+        detected = [call.args[0].categories[0].phrases for call in detector.detect_contradiction.call_args_list]
+        assert sorted(detected) == [["delivery weekly", "delivery daily"], ["rent monthly"]]
+        assert [(c.name, c.sentence_ids) for c in update.categories] == [("rent", ("r1",)), ("delivery", ("d1", "r2"))]
+        assert [c.name for c in session.categories()] == ["rent", "delivery"]
+
+    def test_removing_last_sentence_removes_category(self, session, classifier, detector):
+        """
+        Test that a category left without sentences is reported as removed, without any LLM call.
+        """
+        # Act
+        update = session.apply({"d1": None})
+
+        # Assert
+        assert update.removed_categories == ["delivery"]
+        assert update.categories == []
+        classifier.assign_sentences.assert_not_called()
+        detector.detect_contradiction.assert_not_called()
+        assert [c.name for c in session.categories()] == ["rent"]
+
+    def test_cancelled_batch_is_not_applied(self, session, detector):
+        """
+        Test that a batch cancelled during detection leaves the session unchanged.
+        """
+        # Arrange
+        token = CancellationToken()
+
+        def cancel_then_detect(classification_result):
+            session.cancel(token)
+            return detect_first_pair(classification_result)
+
+        detector.detect_contradiction.side_effect = cancel_then_detect
+
+        # Act
+        update = session.apply({"r3": "rent weekly"}, token)
+
+        # Assert
+        assert update is None
+        assert session.version == 1
+        assert [c.sentence_ids for c in session.categories()] == [("r1", "r2"), ("d1",)]
+
+    def test_cancel_after_commit_returns_false(self, session):
+        """
+        Test that a batch already applied cannot be cancelled.
+        """
+        # Arrange
+        token = CancellationToken()
+        session.apply({"r3": "rent weekly"}, token)
+
+        # Act & Assert
+        assert session.cancel(token) is False
+
+
+class TestLiveConnection:
+    """
+    Unit tests for LiveConnection.
+    """
+
+    @staticmethod
+    def _connection(apply_batch, debounce_seconds=0.02, **kwargs):
+        """Connection over a WebSocket stand-in collecting the sent messages."""
+        websocket = Mock()
+        sent = []
+
+        async def send_text(text):
+            sent.append(json.loads(text))
+
+        websocket.send_text.side_effect = send_text
+        session = Mock()
+
+        def cancel(token):
+            token.cancelled = not token.committed
+            return token.cancelled
+
+        session.cancel.side_effect = cancel
+        return LiveConnection(websocket, session, apply_batch, debounce_seconds, **kwargs), sent
+
+    def test_edits_within_debounce_period_form_one_batch(self):
+        """
+        Test that edits arriving within the debounce period are applied in one batch.
+        """
+        # Arrange
+        batches = []
+
+        async def apply_batch(session, edits, token):
+            batches.append(dict(edits))
+            token.committed = True
+            return None
+
+        connection, _ = self._connection(apply_batch)
+
+        async def scenario():
+            connection.on_edits({"a": "one"})
+            await asyncio.sleep(0.005)
+            connection.on_edits({"b": "two", "a": "uno"})
+            await asyncio.sleep(0.08)
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert batches == [{"a": "uno", "b": "two"}]
+
+    def test_newer_edits_cancel_batch_in_flight(self):
+        """
+        Test that an edit during a batch cancels it and its edits are applied with the newer ones.
+        """
+        # Arrange
+        batches = []
+        tokens = []
+        released = asyncio.Event()
+
+        async def apply_batch(session, edits, token):
+            batches.append(dict(edits))
+            tokens.append(token)
+            if len(batches) == 1:
+                while not token.cancelled:
+                    await asyncio.sleep(0.005)
+                released.set()
+                return None
+            token.committed = True
+            return None
+
+        connection, _ = self._connection(apply_batch)
+
+        async def scenario():
+            connection.on_edits({"a": "one"})
+            await asyncio.sleep(0.05)
+            connection.on_edits({"b": "two"})
+            await asyncio.sleep(0.08)
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert released.is_set()
+        assert tokens[0].cancelled
+        assert batches == [{"a": "one"}, {"a": "one", "b": "two"}]
+
+    def test_failed_batch_sends_error_and_keeps_edits(self):
+        """
+        Test that a failing batch pushes an error and its edits are retried with the next ones.
+        """
+        # Arrange
+        from src.domain.exceptions.app_exception import AppException
+        batches = []
+
+        async def apply_batch(session, edits, token):
+            batches.append(dict(edits))
+            if len(batches) == 1:
+                raise AppException("All analysis slots are busy.", code="QUEUE_FULL")
+            token.committed = True
+            return None
+
+        connection, sent = self._connection(apply_batch)
+
+        async def scenario():
+            connection.on_edits({"a": "one"})
+            await asyncio.sleep(0.05)
+            connection.on_edits({"b": "two"})
+            await asyncio.sleep(0.05)
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert sent == [{"type": "error", "error": {"code": "QUEUE_FULL", "message": "All analysis slots are busy."}}]
+        assert batches == [{"a": "one"}, {"a": "one", "b": "two"}]
+
+    def test_failed_batch_is_retried_without_new_edits(self):
+        """
+        Test that a failing batch is retried after the retry delay, up to max_retries times.
+        """
+        # Arrange
+        from src.domain.exceptions.app_exception import AppException
+        batches = []
+
+        async def apply_batch(session, edits, token):
+            batches.append(dict(edits))
+            raise AppException("All analysis slots are busy.", code="QUEUE_FULL")
+
+        connection, sent = self._connection(apply_batch, retry_delay_seconds=0.01, max_retries=2)
+
+        async def scenario():
+            connection.on_edits({"a": "one"})
+            await asyncio.sleep(0.15)
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert batches == [{"a": "one"}] * 3
+        assert len(sent) == 3
+        assert connection.pending == {"a": "one"}
@@ -0,0 +1,183 @@
+"""
+Module: test_llm_recorder
+Description:
+    Unit tests for the record/replay layer of the agents' LLM calls.
+    Tests recording parsed and streamed completions to a JSON Lines store and replaying
+    them with and without the recorded latencies.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from openai.types.chat import ParsedChatCompletion
+
+from src.domain.exceptions.app_exception import AppException
+from src.domain.models.classification_llm_response import ClassificationLLMResponse
+from src.insfrastructure.agents.llm_recorder import LlmCallStore, LlmRecorder
+
+CONTENT = '{"categories":[{"name":"الإيجار","phrases":[1,2]}]}'
+
+
+def completion():
+    """Parsed completion as returned by the SDK."""
+    return ParsedChatCompletion[ClassificationLLMResponse].model_validate({
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {
+                "role": "assistant",
+                "content": CONTENT,
+                "parsed": ClassificationLLMResponse.model_validate_json(CONTENT),
+            },
+        }],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    })
+
+
+def request(**params):
+    """Arguments of a classification call."""
+    return dict(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "1. يدفع الإيجار\n2. تسدد الأجرة"}],
+        response_format=ClassificationLLMResponse,
+        **params
+    )
+
+
+class FakeStream:
+    """Live stream yielding the content in two deltas."""
+
+    def __iter__(self):
+        yield SimpleNamespace(type="content.delta", delta=CONTENT[:10])
+        yield SimpleNamespace(type="chunk", delta=None)
+        yield SimpleNamespace(type="content.delta", delta=CONTENT[10:])
+
+    def get_final_completion(self):
+        return completion()
+
+
+class TestLlmRecorder:
+    """
+    Unit tests for LlmRecorder.
+    """
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Path of the call store."""
+        return str(tmp_path / "calls.jsonl")
+
+    @pytest.fixture
+    def live_client(self):
+        """Live client returning a parsed completion or a two-delta stream."""
+        client = Mock()
+        client.beta.chat.completions.parse.return_value = completion()
+
+        @contextmanager
+        def stream(**kwargs):
+            yield FakeStream()
+
+        client.beta.chat.completions.stream.side_effect = stream
+        return client
+
+    def test_replay_returns_the_recorded_parse(self, path, live_client):
+        """
+        Test that a recorded parse call is replayed from a new store without the live client.
+        """
+        # Arrange
+        recording = LlmRecorder(LlmCallStore(path), "record").wrap(live_client)
+        recording.beta.chat.completions.parse(**request(temperature=0.0))
+        offline_client = Mock()
+        replaying = LlmRecorder(LlmCallStore(path), "replay-fast").wrap(offline_client)
+
+        # Act
+        replayed = replaying.beta.chat.completions.parse(**request(temperature=0.0, timeout=30))
+
+        # Assert
+        assert replayed.choices[0].message.parsed == completion().choices[0].message.parsed
+        assert replayed.usage.total_tokens == 15
+        offline_client.beta.chat.completions.parse.assert_not_called()
+
+    def test_replay_streams_the_recorded_deltas(self, path, live_client):
+        """
+        Test that a recorded stream is replayed delta by delta with its final completion.
+        """
+        # Arrange
+        recording = LlmRecorder(LlmCallStore(path), "record").wrap(live_client)
+        with recording.beta.chat.completions.stream(**request()) as stream:
+            live_deltas = [event.delta for event in stream if event.type == "content.delta"]
+        replaying = LlmRecorder(LlmCallStore(path), "replay-fast").wrap(Mock())
+
+        # Act
+        with replaying.beta.chat.completions.stream(**request()) as stream:
+            deltas = [event.delta for event in stream if event.type == "content.delta"]
+            final = stream.get_final_completion()
+
+        # Assert
+        assert deltas == live_deltas == [CONTENT[:10], CONTENT[10:]]
+        assert final.choices[0].message.parsed.categories[0].phrases == [1, 2]
+
+    def test_replay_miss_raises(self, path, live_client):
+        """
+        Test that a request differing from the recorded ones raises REPLAY_MISS.
+        """
+        # Arrange
+        LlmRecorder(LlmCallStore(path), "record").wrap(live_client).beta.chat.completions.parse(**request())
+        replaying = LlmRecorder(LlmCallStore(path), "replay-fast").wrap(Mock())
+
+        # Act & Assert
+        with pytest.raises(AppException) as exc_info:
+            replaying.beta.chat.completions.parse(**request(temperature=0.7))
+        assert exc_info.value.code == "REPLAY_MISS"
+
+    def test_truncated_last_line_is_skipped(self, path, live_client):
+        """
+        Test that a last line cut by a killed recording is skipped, then removed by the next record.
+        """
+        # Arrange
+        LlmRecorder(LlmCallStore(path), "record").wrap(live_client).beta.chat.completions.parse(**request())
+        with open(path, "a", encoding="utf-8") as file:
+            file.write('{"fingerprint": "cut')
+
+        # Act
+        store = LlmCallStore(path)
+        LlmRecorder(store, "record").wrap(live_client).beta.chat.completions.parse(**request(temperature=0.5))
+        reloaded = LlmCallStore(path)
+
+        # Assert
+        assert len(store) == 2
+        assert len(reloaded) == 2
+
+    @pytest.mark.parametrize("mode, waits", [("replay", True), ("replay-fast", False)])
+    def test_replay_waits_recorded_latency_unless_fast(self, path, mode, waits):
+        """
+        Test that replay sleeps for the recorded latency and replay-fast does not.
+        """
+        # Arrange
+        store = LlmCallStore(path)
+        recorder = LlmRecorder(store, "record")
+        recorder.record(request(), "parse", 250.0, completion())
+        replaying = LlmRecorder(LlmCallStore(path), mode).wrap(Mock())
+
+        # Act
+        with patch("src.insfrastructure.agents.llm_recorder.time.sleep") as sleep:
+            replaying.beta.chat.completions.parse(**request())
+
+        # Assert
+        if waits:
+            sleep.assert_called_once_with(0.25)
+        else:
+            sleep.assert_not_called()
+
+    def test_unknown_mode_raises(self, path):
+        """
+        Test that an unknown mode is rejected.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError):
+            LlmRecorder(LlmCallStore(path), "rewind")
@@ -0,0 +1,161 @@
+"""
+Module: test_llm_scheduler
+Description:
+    Unit tests for the LlmScheduler.
+    Tests the global and per-request slot limits, the weighted share between priority
+    classes and the round-robin between requests of the same class.
+"""
+
+import threading
+import time
+from contextvars import copy_context
+
+import pytest
+from src.insfrastructure.concurrency.llm_scheduler import LlmScheduler, _Flow, _current_flow
+
+
+@pytest.fixture
+def scheduler():
+    """
+    Scheduler with a single slot, so every grant is observable.
+    """
+    return LlmScheduler(max_concurrent_calls=1, max_calls_per_request=0, weights={"interactive": 3, "bulk": 1})
+
+
+def grant_order(scheduler, holder, waiting):
+    """
+    Releases the held slot repeatedly and returns the names of the calls in grant order.
+
+    Args:
+        scheduler (LlmScheduler): Scheduler whose only slot is held by holder.
+        holder (_Flow): Flow holding the slot.
+        waiting (list): (name, flow, event) of the queued calls.
+    """
+    order = []
+    current = holder
+    while len(order) < len(waiting):
+        scheduler._release(current)
+        name, current, _ = next(item for item in waiting if item[2].is_set() and item[0] not in order)
+        order.append(name)
+    return order
+
+
+class TestLlmScheduler:
+    """
+    Unit tests for LlmScheduler.
+    """
+
+    def test_limits_concurrent_calls(self):
+        """
+        Test that no more than max_concurrent_calls calls hold a slot at the same time.
+        """
+        # Arrange
+        scheduler = LlmScheduler(max_concurrent_calls=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            with scheduler.slot():
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.02)
+                with lock:
+                    running.pop()
+
+        # Act
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert max(peak) == 2
+        assert len(peak) == 6
+
+    def test_limits_calls_per_request(self):
+        """
+        Test that one request never holds more than max_calls_per_request slots.
+        """
+        # Arrange
+        scheduler = LlmScheduler(max_concurrent_calls=10, max_calls_per_request=2)
+        flow = _Flow(flow_id=1, priority="interactive")
+
+        # Act
+        events = [scheduler._enqueue(flow) for _ in range(4)]
+
+        # Assert
+        assert [event.is_set() for event in events] == [True, True, False, False]
+        scheduler._release(flow)
+        assert [event.is_set() for event in events] == [True, True, True, False]
+
+    def test_weighted_share_between_classes(self, scheduler):
+        """
+        Test that under contention classes are served in proportion to their weights.
+        """
+        # Arrange
+        holder = _Flow(flow_id=0, priority="interactive")
+        scheduler._enqueue(holder)
+        interactive = _Flow(flow_id=1, priority="interactive")
+        bulk = _Flow(flow_id=2, priority="bulk")
+        waiting = [(f"bulk{i}", bulk, scheduler._enqueue(bulk)) for i in range(4)]
+        waiting += [(f"interactive{i}", interactive, scheduler._enqueue(interactive)) for i in range(12)]
+
+        # Act
+        order = grant_order(scheduler, holder, waiting)
+
+        # Assert
+        first_eight = [name.rstrip("0123456789") for name in order[:8]]
+        assert first_eight.count("interactive") == 6
+        assert first_eight.count("bulk") == 2
+
+    def test_round_robin_between_requests(self, scheduler):
+        """
+        Test that requests of the same class take turns instead of being served in arrival order.
+        """
+        # Arrange
+        holder = _Flow(flow_id=0, priority="interactive")
+        scheduler._enqueue(holder)
+        large = _Flow(flow_id=1, priority="interactive")
+        small = _Flow(flow_id=2, priority="interactive")
+        waiting = [(f"large{i}", large, scheduler._enqueue(large)) for i in range(3)]
+        waiting += [("small0", small, scheduler._enqueue(small))]
+
+        # Act
+        order = grant_order(scheduler, holder, waiting)
+
+        # Assert
+        assert order == ["large0", "small0", "large1", "large2"]
+
+    def test_flow_is_shared_with_worker_contexts(self):
+        """
+        Test that calls made from a copy of the request context count against the same request.
+        """
+        # Arrange
+        scheduler = LlmScheduler(max_concurrent_calls=10, max_calls_per_request=1)
+        acquired = []
+
+        def call():
+            acquired.append(scheduler._enqueue(_current_flow.get()).is_set())
+
+        # Act
+        with scheduler.flow("bulk"):
+            copy_context().run(call)
+            copy_context().run(call)
+
+        # Assert
+        assert acquired == [True, False]
+
+    def test_unknown_priority(self):
+        """
+        Test that an unknown priority class is rejected.
+        """
+        # Arrange
+        scheduler = LlmScheduler()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            with scheduler.flow("urgent"):
+                pass
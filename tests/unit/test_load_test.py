@@ -0,0 +1,121 @@
+"""
+Module: test_load_test
+Description:
+    Unit tests for the load generator benchmark.
+    Tests the document mix, the step statistics and the detection of the saturation point.
+"""
+
+import random
+
+import pytest
+
+from benchmarks.load_test import Sample, find_saturation, make_document, parse_mix, percentile, summarize
+from benchmarks.stub_deployment import completion_content, sentence_count
+
+
+def step(load, throughput, p95_ms=100.0, violations=()):
+    """Step report with the given load, throughput and p95 latency."""
+    report = summarize(load, [Sample(p95_ms / 1000, "200", 1)], 1.0)
+    report.throughput = throughput
+    report.slo_violations = list(violations)
+    return report
+
+
+class TestLoadTest:
+    """
+    Unit tests for the load generator functions.
+    """
+
+    def test_parse_mix_defaults_weight_and_rejects_non_positive_sizes(self):
+        """
+        Test that a size without weight weighs 1 and a zero size is rejected.
+        """
+        # Act & Assert
+        assert parse_mix("5:6, 30") == [(5, 6.0), (30, 1.0)]
+        with pytest.raises(ValueError):
+            parse_mix("0:1")
+
+    def test_documents_are_distinct_per_serial(self):
+        """
+        Test that two requests never send the same sentences, so none is answered from the cache.
+        """
+        # Act
+        first = make_document(random.Random(0), 3, serial=1)
+        second = make_document(random.Random(0), 3, serial=2)
+
+        # Assert
+        assert len(first) == 3
+        assert not set(first) & set(second)
+
+    def test_summarize_computes_percentiles_on_successes_and_checks_slo(self):
+        """
+        Test that latency percentiles exclude failed requests and SLO violations are reported.
+        """
+        # Arrange
+        samples = [Sample(i / 1000, "200", 5) for i in range(1, 101)] + [Sample(5.0, "429", 5)] * 5
+
+        # Act
+        report = summarize(4, samples, 2.0, slo_p95_ms=90, slo_error_rate=0.01)
+
+        # Assert
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+        assert report.latency_ms["p95"] == pytest.approx(95)
+        assert report.latency_ms["max"] == pytest.approx(100)
+        assert report.errors == {"429": 5}
+        assert report.throughput == 50
+        assert report.sentences_per_second == 250
+        assert len(report.slo_violations) == 2
+
+    def test_closed_loop_saturates_when_throughput_stops_growing(self):
+        """
+        Test that a higher concurrency gaining less than 10% throughput is the saturation point.
+        """
+        # Arrange
+        steps = [step(1, 10), step(2, 19), step(4, 20), step(8, 30)]
+
+        # Act
+        saturation = find_saturation(steps, open_loop=False)
+
+        # Assert
+        assert saturation[0] == 2
+
+    def test_open_loop_saturates_on_slo_or_unmet_rate(self):
+        """
+        Test that an open loop step saturates when it violates the SLO or falls behind the offered rate.
+        """
+        # Act & Assert
+        assert find_saturation([step(5, 5), step(10, 8)], open_loop=True)[0] == 1
+        assert find_saturation([step(5, 5), step(10, 10, violations=["p95"])], open_loop=True)[0] == 1
+        assert find_saturation([step(5, 5), step(10, 9.5)], open_loop=True) is None
+
+
+class TestStubDeployment:
+    """
+    Unit tests for the stub deployment responses.
+    """
+
+    def test_responses_are_valid_for_the_requested_format(self):
+        """
+        Test that the generated classification and detection responses parse into the agents' models.
+        """
+        # Arrange
+        from src.domain.models.classification_llm_response import ClassificationLLMResponse
+        from src.domain.models.contradiction_llm_response import ScreeningLLMResponse
+        from src.domain.models.fused_analysis_llm_response import FusedAnalysisLLMResponse
+        count = sentence_count([
+            {"role": "system", "content": "1. Read the sentences."},
+            {"role": "user", "content": "Sentences:\n\n" + "\n".join(f"{i}. s{i}" for i in range(1, 9))}
+        ])
+
+        # Act
+        classification = ClassificationLLMResponse.model_validate_json(
+            completion_content("ClassificationLLMResponse", count))
+        screening = ScreeningLLMResponse.model_validate_json(completion_content("ScreeningLLMResponse", count))
+        fused = FusedAnalysisLLMResponse.model_validate_json(completion_content("FusedAnalysisLLMResponse", count))
+
+        # Assert
+        assert count == 8
+        assert [category.phrases for category in classification.categories] == [[1, 2, 3, 4, 5, 6], [7, 8]]
+        assert screening.contradictions[0].statements == [1, 2]
+        assert [len(category.contradictions) for category in fused.categories] == [1, 1]
+        assert completion_content(None, count) == "pong"
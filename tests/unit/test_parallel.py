@@ -0,0 +1,47 @@
+"""
+Module: test_parallel
+Description:
+    Unit tests for the map_parallel helper shared by the analysis services.
+"""
+
+import threading
+from contextvars import ContextVar
+
+from src.domain.services.parallel import map_parallel
+
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="")
+
+
+class TestMapParallel:
+    """
+    Unit tests for map_parallel.
+    """
+
+    def test_results_keep_item_order_and_caller_context(self):
+        """
+        Test that results follow the item order and every task sees the caller's context.
+        """
+        # Arrange
+        REQUEST_ID.set("req-1")
+        threads = set()
+
+        def work(item):
+            threads.add(threading.get_ident())
+            return item * 2, REQUEST_ID.get()
+
+        # Act
+        results = map_parallel(work, [3, 1, 2], max_workers=3)
+
+        # Assert
+        assert results == [(6, "req-1"), (2, "req-1"), (4, "req-1")]
+        assert threading.get_ident() not in threads
+
+    def test_single_item_runs_on_the_calling_thread(self):
+        """
+        Test that a single item does not start a thread pool.
+        """
+        # Act
+        result = map_parallel(lambda item: threading.get_ident(), [1], max_workers=4)
+
+        # Assert
+        assert result == [threading.get_ident()]
@@ -0,0 +1,456 @@
+"""
+Module: test_result_cache
+Description:
+    Unit tests for the result cache, its memory, SQLite and Redis-protocol backends and the caching agents.
+    The Redis backend is tested against a minimal in-process RESP server.
+"""
+
+import socketserver
+import sqlite3
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from src.domain.models.classification_result import Category, ClassificationResult
+from src.domain.models.contradiction_result import (
+    AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+)
+from src.domain.models.execution_plan import ExecutionStrategy
+from src.domain.models.sentence_table import SentenceTable
+from src.insfrastructure.cache.caching_agents import CachingClassifierAgent, CachingDetectorAgent
+from src.insfrastructure.cache.memory_cache import MemoryCacheBackend
+from src.insfrastructure.cache.redis_cache import RedisCacheBackend
+from src.insfrastructure.cache.result_cache import ResultCache, ZLIB_PREFIX
+from src.insfrastructure.cache.sqlite_cache import SqliteCacheBackend
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """
+    In-process server answering GET, SET (with PX), AUTH, SELECT and PING like Redis.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password=None):
+        super().__init__(("127.0.0.1", 0), RespHandler)
+        self.password = password
+        self.data = {}
+        self.commands = []
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{host}:{port}/2"
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    """Handles the commands of one connection."""
+
+    def handle(self):
+        authenticated = self.server.password is None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            command = args[0].upper()
+            self.server.commands.append(command)
+
+            if command == b"AUTH":
+                authenticated = args[-1].decode() == self.server.password
+                self.wfile.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+            elif not authenticated:
+                self.wfile.write(b"-NOAUTH Authentication required\r\n")
+            elif command in (b"SELECT", b"PING"):
+                self.wfile.write(b"+OK\r\n")
+            elif command == b"SET":
+                expires_at = time.time() + int(args[4]) / 1000 if len(args) > 3 else None
+                self.server.data[args[1]] = (args[2], expires_at)
+                self.wfile.write(b"+OK\r\n")
+            elif command == b"GET":
+                value, expires_at = self.server.data.get(args[1], (None, None))
+                if value is None or (expires_at and expires_at <= time.time()):
+                    self.wfile.write(b"$-1\r\n")
+                else:
+                    self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+
+
+@pytest.fixture
+def resp_server():
+    """Running RESP stand-in server."""
+    server = RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestCacheBackends:
+    """
+    Unit tests for the memory, SQLite and Redis-protocol backends.
+    """
+
+    @pytest.fixture(params=["memory", "sqlite", "redis"])
+    def backend(self, request, tmp_path, resp_server):
+        """Each backend, with a limit of 3 entries of at most 100 bytes."""
+        if request.param == "memory":
+            backend = MemoryCacheBackend(max_entries=3, max_entry_bytes=100)
+        elif request.param == "sqlite":
+            backend = SqliteCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=3, max_entry_bytes=100)
+        else:
+            backend = RedisCacheBackend(resp_server.url, max_entry_bytes=100)
+        yield backend
+        backend.close()
+
+    def test_round_trip(self, backend):
+        """
+        Test that a stored value is read back and a missing key is a miss.
+        """
+        # Arrange
+        backend.set("key", b"\x00value\r\n", ttl_seconds=60)
+
+        # Act
+        value = backend.get("key")
+        missing = backend.get("other")
+
+        # Assert
+        assert value == b"\x00value\r\n"
+        assert missing is None
+
+    def test_expired_entry_is_a_miss(self, backend):
+        """
+        Test that an entry is not returned after its TTL.
+        """
+        # Arrange
+        backend.set("key", b"value", ttl_seconds=0.05)
+
+        # Act
+        time.sleep(0.1)
+        value = backend.get("key")
+
+        # Assert
+        assert value is None
+
+    def test_oversized_value_is_not_stored(self, backend):
+        """
+        Test that values over the entry size limit are dropped.
+        """
+        # Arrange
+        backend.set("key", b"x" * 101, ttl_seconds=60)
+
+        # Act
+        value = backend.get("key")
+
+        # Assert
+        assert value is None
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        """
+        Test that the memory backend evicts the least recently used entry over max_entries.
+        """
+        # Arrange
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")
+
+        # Act
+        backend.set("c", b"3", 60)
+
+        # Assert
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert len(backend) == 2
+
+    def test_sqlite_backend_is_shared_and_pruned(self, tmp_path):
+        """
+        Test that two backends on the same file share entries, and pruning keeps the newest max_entries.
+        """
+        # Arrange
+        path = str(tmp_path / "cache.sqlite3")
+        writer = SqliteCacheBackend(path, max_entries=2)
+        reader = SqliteCacheBackend(path, max_entries=2)
+        for i in range(3):
+            writer.set(f"key{i}", b"value", 60)
+
+        # Act
+        shared = reader.get("key2")
+        writer.prune()
+
+        # Assert
+        assert shared == b"value"
+        assert reader.get("key0") is None
+        assert reader.get("key1") == b"value"
+
+    def test_redis_backend_authenticates_and_selects_database(self):
+        """
+        Test that the Redis backend sends AUTH and SELECT from the URL before its first command.
+        """
+        # Arrange
+        server = RespStandIn(password="secret")
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        backend = RedisCacheBackend(server.url)
+
+        # Act
+        backend.set("key", b"value", 60)
+        value = backend.get("key")
+        server.shutdown()
+        server.server_close()
+
+        # Assert
+        assert value == b"value"
+        assert server.commands == [b"AUTH", b"SELECT", b"SET", b"GET"]
+
+    def test_redis_backend_outage_is_a_miss(self, resp_server):
+        """
+        Test that an unreachable server makes lookups miss instead of failing.
+        """
+        # Arrange
+        backend = RedisCacheBackend(resp_server.url, timeout_seconds=0.2)
+        resp_server.shutdown()
+        resp_server.server_close()
+
+        # Act
+        backend.set("key", b"value", 60)
+        value = backend.get("key")
+
+        # Assert
+        assert value is None
+
+    def test_redis_backend_skips_server_during_cooldown(self, monkeypatch):
+        """
+        Test that after a connection failure the server is not contacted again until the cooldown ends.
+        """
+        # Arrange
+        connect = Mock(side_effect=ConnectionRefusedError("refused"))
+        monkeypatch.setattr("src.insfrastructure.cache.redis_cache.socket.create_connection", connect)
+        backend = RedisCacheBackend("redis://localhost:6379/0", cooldown_seconds=0.05)
+
+        # Act
+        backend.get("key")
+        backend.set("key", b"value", 60)
+        during_cooldown = backend.get("key")
+        time.sleep(0.06)
+        backend.get("key")
+
+        # Assert
+        assert during_cooldown is None
+        assert connect.call_count == 2
+
+    def test_close_releases_the_connections_of_every_thread(self, tmp_path, resp_server):
+        """
+        Test that close() on one thread closes the connections opened by other threads.
+        """
+        # Arrange
+        sqlite_backend = SqliteCacheBackend(str(tmp_path / "cache.sqlite3"))
+        redis_backend = RedisCacheBackend(resp_server.url)
+        opened = []
+
+        def work():
+            redis_backend.set("key", b"value", 60)
+            opened.append((sqlite_backend._connection(), redis_backend._connections.get()[0]))
+
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+        # Act
+        sqlite_backend.close()
+        redis_backend.close()
+
+        # Assert
+        sqlite_connection, redis_socket = opened[0]
+        with pytest.raises(sqlite3.ProgrammingError):
+            sqlite_connection.execute("SELECT 1")
+        assert redis_socket.fileno() == -1
+        assert redis_backend.get("key") == b"value"
+
+
+class TestResultCache:
+    """
+    Unit tests for ResultCache.
+    """
+
+    @pytest.fixture
+    def cache(self):
+        """Result cache on a memory backend."""
+        return ResultCache(MemoryCacheBackend(), namespace="test")
+
+    def test_classification_is_rebuilt_on_the_caller_table(self, cache):
+        """
+        Test that a cached classification references the sentences of the lookup.
+        """
+        # Arrange
+        sentences = ["أ", "ب", "ج"]
+        table = SentenceTable.of(sentences)
+        cache.put_classification(sentences, ClassificationResult(categories=[
+            Category("مالية", (0, 2), table), Category("موارد", (1,), table)
+        ]))
+
+        # Act
+        result = cache.get_classification(list(sentences))
+
+        # Assert
+        assert [(c.name, c.indices, c.phrases) for c in result.categories] == [
+            ("مالية", (0, 2), ["أ", "ج"]), ("موارد", (1,), ["ب"])
+        ]
+        assert cache.get_classification(["أ", "ب"]) is None
+        assert cache.stats.hits == {"classification": 1}
+        assert cache.stats.misses == {"classification": 1}
+
+    def test_detection_is_shared_by_categories_with_the_same_sentences(self, cache):
+        """
+        Test that a detection cached for a category is a hit for another category with the same sentences.
+        """
+        # Arrange
+        first = SentenceTable.of(["x", "أ", "ب"])
+        cache.put_detection(CategoryContradictionResult(
+            "مالية", (1, 2), (Contradiction((2, 1), "حاد", "تعارض", first),), first
+        ))
+        second = SentenceTable.of(["أ", "y", "z", "ب"])
+
+        # Act
+        result = cache.get_detection(Category("أخرى", (0, 3), second))
+
+        # Assert
+        assert result.category_name == "أخرى"
+        assert result.contradictions[0].indices == (3, 0)
+        assert result.contradictions[0].statements == ["ب", "أ"]
+        assert result.contradictions[0].severity == "حاد"
+
+    def test_analysis_is_keyed_by_strategy_and_compressed(self, cache):
+        """
+        Test that analyses are cached per strategy and large values are compressed.
+        """
+        # Arrange
+        sentences = [f"جملة رقم {i}" for i in range(100)]
+        table = SentenceTable.of(sentences)
+        result = AnalysisContradictionResult(categories=[CategoryContradictionResult(
+            "عام", tuple(range(100)), (Contradiction((3, 7), "متوسط", "تعليق " * 50, table),), table
+        )])
+
+        # Act
+        cache.put_analysis(sentences, ExecutionStrategy.TWO_STAGE, result)
+        hit = cache.get_analysis(sentences, ExecutionStrategy.TWO_STAGE)
+        miss = cache.get_analysis(sentences, ExecutionStrategy.FUSED)
+
+        # Assert
+        assert hit.categories[0].contradictions[0].statements == ["جملة رقم 3", "جملة رقم 7"]
+        assert hit.categories[0].indices == tuple(range(100))
+        assert miss is None
+        stored = cache.backend.get(cache.key("analysis.two_stage", sentences))
+        assert stored.startswith(ZLIB_PREFIX)
+
+    def test_unreadable_entry_is_a_miss(self, cache):
+        """
+        Test that a corrupted entry is treated as a miss.
+        """
+        # Arrange
+        cache.backend.set(cache.key("classification", ["أ"]), b"zgarbage", 60)
+
+        # Act
+        result = cache.get_classification(["أ"])
+
+        # Assert
+        assert result is None
+
+    def test_entry_of_the_wrong_shape_is_a_miss(self, cache):
+        """
+        Test that valid JSON that does not rebuild into a result, or cites positions out of range, is a miss.
+        """
+        # Arrange
+        table = SentenceTable.of(["أ", "ب"])
+        category = Category("فئة", (0, 1), table)
+        cache.backend.set(cache.key("classification", ["أ"]), cache.encode({"not": "a list"}), 60)
+        cache.backend.set(cache.key("detection", ["أ", "ب"]), cache.encode([[[0, 5], "حاد", "c"]]), 60)
+        cache.backend.set(
+            cache.key("analysis.two_stage", ["أ"]), cache.encode([["فئة", [0], [[[0, -1], "حاد", "c"]]]]), 60
+        )
+
+        # Act
+        classification = cache.get_classification(["أ"])
+        detection = cache.get_detection(category)
+        analysis = cache.get_analysis(["أ"], ExecutionStrategy.TWO_STAGE)
+
+        # Assert
+        assert classification is None and detection is None and analysis is None
+        assert cache.stats.misses == {"classification": 1, "detection": 1, "analysis": 1}
+
+    def test_namespaces_are_isolated(self):
+        """
+        Test that caches with different namespaces do not read each other's entries.
+        """
+        # Arrange
+        backend = MemoryCacheBackend()
+        ResultCache(backend, namespace="v1").put_classification(["أ"], ClassificationResult(categories=[]))
+
+        # Act
+        result = ResultCache(backend, namespace="v2").get_classification(["أ"])
+
+        # Assert
+        assert result is None
+
+
+class TestCachingAgents:
+    """
+    Unit tests for CachingClassifierAgent and CachingDetectorAgent.
+    """
+
+    @pytest.fixture
+    def cache(self):
+        """Result cache on a memory backend."""
+        return ResultCache(MemoryCacheBackend())
+
+    def test_classifier_calls_inner_agent_once(self, cache):
+        """
+        Test that the second classification of the same sentences is served from the cache, streamed or not.
+        """
+        # Arrange
+        sentences = ["أ", "ب"]
+        inner = Mock()
+        inner.iter_categories.return_value = iter([Category("عام", (0, 1), SentenceTable.of(sentences))])
+        agent = CachingClassifierAgent(inner, cache)
+
+        # Act
+        streamed = list(agent.iter_categories(sentences))
+        classified = agent.classify_sentences(sentences)
+        restreamed = list(agent.iter_categories(sentences))
+
+        # Assert
+        assert inner.iter_categories.call_count == 1
+        inner.classify_sentences.assert_not_called()
+        assert [c.indices for c in classified.categories] == [c.indices for c in streamed] == [(0, 1)]
+        assert [c.name for c in restreamed] == ["عام"]
+
+    def test_detector_only_sends_missed_categories(self, cache):
+        """
+        Test that cached categories are not sent to the inner agent and results keep the category order.
+        """
+        # Arrange
+        table = SentenceTable.of(["أ", "ب", "ج", "د"])
+        cached = Category("أولى", (0, 1), table)
+        missed = Category("ثانية", (2, 3), table)
+        cache.put_detection(CategoryContradictionResult("أولى", (0, 1), (), table))
+        inner = Mock()
+        inner.detect_contradiction.return_value = AnalysisContradictionResult(categories=[
+            CategoryContradictionResult("ثانية", (2, 3), (Contradiction((2, 3), "حاد", "تعارض", table),), table)
+        ])
+        agent = CachingDetectorAgent(inner, cache)
+
+        # Act
+        result = agent.detect_contradiction(ClassificationResult(categories=[cached, missed]))
+        again = agent.detect_contradiction(ClassificationResult(categories=[missed]))
+
+        # Assert
+        sent = inner.detect_contradiction.call_args[0][0]
+        assert sent.categories == [missed]
+        assert inner.detect_contradiction.call_count == 1
+        assert [c.category_name for c in result.categories] == ["أولى", "ثانية"]
+        assert again.categories[0].contradictions[0].indices == (2, 3)
@@ -235,3 +235,160 @@ class TestSentenceClassifier:
 
         # Assert
         assert result is not None
+
+    def test_iter_categories_yields_while_streaming(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that categories are yielded as soon as their JSON object is streamed.
+        """
+        # Arrange
+        from unittest.mock import MagicMock
+        mock_prompt_provider.get_system_prompt.return_value = "Classification prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Classify these"
+
+        streamed = []
+        content = '{"categories": [{"name": "الإخلاء", "phrases": [1, 3]}, {"name": "الإسعاف", "phrases": [2, 9]}]}'
+
+        def events():
+            for i in range(0, len(content), 10):
+                streamed.append(i)
+                yield Mock(type="content.delta", delta=content[i:i + 10])
+            yield Mock(type="content.done")
+
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        stream.__iter__.side_effect = lambda: events()
+        stream.get_final_completion.return_value.usage.prompt_tokens = 120
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'stream', return_value=stream):
+            # Act
+            categories = classifier_agent.iter_categories(["s1", "s2", "s3"])
+            first = next(categories)
+            streamed_at_first = len(streamed)
+            rest = list(categories)
+
+        # Assert
+        assert first.name == "الإخلاء"
+        assert first.phrases == ["s1", "s3"]
+        assert streamed_at_first < len(streamed)
+        assert [c.name for c in rest] == ["الإسعاف"]
+        assert rest[0].phrases == ["s2"]
+        stream.get_final_completion.assert_called_once()
+
+    @staticmethod
+    def _completion(*categories):
+        """Completion whose parsed response holds the given (name, phrases) categories."""
+        from unittest.mock import MagicMock
+        from src.domain.models.classification_llm_response import ClassificationLLMResponse, CategoryLLM
+
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.parsed = ClassificationLLMResponse(
+            categories=[CategoryLLM(name=name, phrases=phrases) for name, phrases in categories]
+        )
+        return completion
+
+    def test_classify_repairs_missing_and_duplicated_sentences(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that unassigned and duplicated sentences are sent alone in a repair call and merged in.
+        """
+        # Arrange
+        mock_prompt_provider.get_system_prompt.return_value = "Classification prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Classify these"
+        responses = [
+            self._completion(("الإيجار", [1, 2]), ("التسليم", [2, 3])),
+            # Repair numbering: 1 = sentence 2 (duplicated), 2 = sentence 4 (missing)
+            self._completion(("الإيجار", [1]), ("الضمان", [2])),
+        ]
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'parse', side_effect=responses) as parse:
+            # Act
+            result = classifier_agent.classify_sentences(["s1", "s2", "s3", "s4"])
+
+        # Assert
+        assert [(c.name, c.phrases) for c in result.categories] == [
+            ("الإيجار", ["s1", "s2"]), ("التسليم", ["s3"]), ("الضمان", ["s4"])
+        ]
+        assert parse.call_count == 2
+        repair_inputs = mock_prompt_provider.get_user_prompt.call_args.kwargs
+        assert repair_inputs["prompt_name"] == "prompt_classification_repair"
+        assert repair_inputs["numbered_sentences"] == "1. s2\n2. s4"
+        assert repair_inputs["category_names"] == "- الإيجار\n- التسليم"
+
+    def test_classify_keeps_sentences_when_repair_fails(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that a failed repair keeps duplicated sentences in their first category
+        and puts missing ones in the unnamed category.
+        """
+        # Arrange
+        import openai
+        mock_prompt_provider.get_system_prompt.return_value = "Classification prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Classify these"
+        responses = [
+            self._completion(("الإيجار", [1, 2]), ("التسليم", [2])),
+            openai.APIConnectionError(request=Mock()),
+        ]
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'parse', side_effect=responses):
+            # Act
+            result = classifier_agent.classify_sentences(["s1", "s2", "s3"])
+
+        # Assert
+        assert [(c.name, c.phrases) for c in result.categories] == [("الإيجار", ["s1", "s2"]), ("بدون اسم", ["s3"])]
+
+    def test_classify_without_gaps_makes_one_call(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that a classification covering every sentence once is not repaired.
+        """
+        # Arrange
+        mock_prompt_provider.get_system_prompt.return_value = "Classification prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Classify these"
+        response = self._completion(("الإيجار", [1, 1, 3]), ("التسليم", [2, 7]))
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'parse', return_value=response) as parse:
+            # Act
+            result = classifier_agent.classify_sentences(["s1", "s2", "s3"])
+
+        # Assert
+        assert [c.indices for c in result.categories] == [(0, 2), (1,)]
+        assert parse.call_count == 1
+
+    def test_iter_categories_repairs_missing_sentences_after_stream(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that streamed duplicates are dropped and sentences left unassigned are yielded last.
+        """
+        # Arrange
+        from unittest.mock import MagicMock
+        mock_prompt_provider.get_system_prompt.return_value = "Classification prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Classify these"
+        content = '{"categories": [{"name": "الإخلاء", "phrases": [1, 2]}, {"name": "الإسعاف", "phrases": [2]}]}'
+
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        stream.__iter__.side_effect = lambda: iter([Mock(type="content.delta", delta=content)])
+        repair = self._completion(("الإخلاء", [1]))
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'stream', return_value=stream), \
+                patch.object(classifier_agent.client.beta.chat.completions, 'parse', return_value=repair):
+            # Act
+            categories = list(classifier_agent.iter_categories(["s1", "s2", "s3"]))
+
+        # Assert
+        assert [(c.name, c.phrases) for c in categories] == [("الإخلاء", ["s1", "s2"]), ("الإخلاء", ["s3"])]
+
+    def test_assign_sentences_uses_existing_category_names(self, classifier_agent, mock_prompt_provider):
+        """
+        Test that sentences are assigned to existing categories in one call, unassigned ones to the unnamed category.
+        """
+        # Arrange
+        mock_prompt_provider.get_system_prompt.return_value = "Repair prompt"
+        mock_prompt_provider.get_user_prompt.return_value = "Assign these"
+        response = self._completion(("الإيجار", [2]))
+
+        with patch.object(classifier_agent.client.beta.chat.completions, 'parse', return_value=response) as parse:
+            # Act
+            result = classifier_agent.assign_sentences(["s1", "s2"], ["الإيجار", "التسليم"])
+
+        # Assert
+        assert [(c.name, c.phrases) for c in result.categories] == [("بدون اسم", ["s1"]), ("الإيجار", ["s2"])]
+        assert parse.call_count == 1
+        assert mock_prompt_provider.get_user_prompt.call_args.kwargs["category_names"] == "- الإيجار\n- التسليم"
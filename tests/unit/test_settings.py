@@ -145,3 +145,170 @@ class TestAppSettings:
         assert len(settings.cors_origins) == 2
         assert 'http://localhost:3000' in settings.cors_origins
         assert 'https://example.com' in settings.cors_origins
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'LLM_PRICES': '{"gpt-4": {"prompt": 0.01, "completion": 0.03}}'
+    })
+    def test_settings_llm_prices_parsing(self):
+        """
+        Test that per-deployment prices are parsed from JSON.
+        """
+        # Act
+        settings = AppSettings()
+
+        # Assert
+        assert settings.llm_prices == {"gpt-4": {"prompt": 0.01, "completion": 0.03}}
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'LLM_PRICES': 'not json'
+    })
+    def test_settings_invalid_llm_prices(self):
+        """
+        Test that invalid prices raise a configuration error.
+        """
+        # Act & Assert
+        from src.domain.exceptions.configuration_exception import ConfigurationException
+        with pytest.raises(ConfigurationException):
+            AppSettings()
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'PRIORITY_WEIGHTS': '{"interactive": 4, "batch": 1}',
+        'API_KEY_PRIORITIES': '{"nightly-job": "batch"}'
+    })
+    def test_settings_priority_parsing(self):
+        """
+        Test that priority weights and API key classes are parsed from JSON.
+        """
+        # Act
+        settings = AppSettings()
+
+        # Assert
+        assert settings.priority_weights == {"interactive": 4.0, "batch": 1.0}
+        assert settings.api_key_priorities == {"nightly-job": "batch"}
+        assert settings.default_priority == "interactive"
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'API_KEY_PRIORITIES': '{"nightly-job": "background"}'
+    })
+    def test_settings_undefined_priority_class(self):
+        """
+        Test that an API key mapped to a class without weight raises a configuration error.
+        """
+        # Act & Assert
+        from src.domain.exceptions.configuration_exception import ConfigurationException
+        with pytest.raises(ConfigurationException):
+            AppSettings()
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': '',
+        'AZURE_OPENAI_API_KEY': 'shared-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'AZURE_OPENAI_DEPLOYMENTS': '[{"name": "east", "endpoint": "https://east.openai.azure.com/"},'
+                                    ' {"name": "west", "endpoint": "https://west.openai.azure.com/", "api_key": "west-key"}]'
+    })
+    def test_settings_deployments_parsing(self):
+        """
+        Test that deployment entries are parsed and default to the single-deployment variables.
+        """
+        # Act
+        settings = AppSettings()
+
+        # Assert
+        assert [d.name for d in settings.deployments] == ["east", "west"]
+        assert [d.api_key for d in settings.deployments] == ["shared-key", "west-key"]
+        assert all(d.deployment == "gpt-4" for d in settings.deployments)
+        assert settings.endpoint == "https://east.openai.azure.com/"
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4o',
+        'CLASSIFIER_DEPLOYMENT': 'gpt-4o-mini',
+        'CLASSIFIER_TIMEOUT_SECONDS': '15',
+        'CLASSIFIER_MAX_CONCURRENCY': '8',
+        'DETECTOR_MAX_TOKENS': '512'
+    })
+    def test_settings_per_agent_parsing(self):
+        """
+        Test that each agent gets its own settings, defaulting to the shared deployment.
+        """
+        # Act
+        settings = AppSettings()
+
+        # Assert
+        assert settings.classifier.deployment == 'gpt-4o-mini'
+        assert settings.classifier.timeout_seconds == 15.0
+        assert settings.classifier.max_concurrency == 8
+        assert settings.detector.deployment == 'gpt-4o'
+        assert settings.detector.max_tokens == 512
+        assert settings.fused.max_tokens == 2048
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'CACHE_BACKEND': 'memcached'
+    })
+    def test_settings_unknown_cache_backend(self):
+        """
+        Test that an unsupported cache backend raises a configuration error.
+        """
+        # Act & Assert
+        from src.domain.exceptions.configuration_exception import ConfigurationException
+        with pytest.raises(ConfigurationException):
+            AppSettings()
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'EMBEDDINGS_DEPLOYMENT': 'text-embedding-3-small',
+        'EMBEDDINGS_MIN_SIMILARITY': '0.7'
+    })
+    def test_settings_embeddings_parsing(self):
+        """
+        Test that the embeddings stage settings are parsed.
+        """
+        # Act
+        settings = AppSettings()
+
+        # Assert
+        assert settings.embeddings_deployment == 'text-embedding-3-small'
+        assert settings.embeddings_batch_size == 256
+        assert settings.embeddings_min_similarity == 0.7
+
+    @patch.dict('os.environ', {
+        'AZURE_OPENAI_ENDPOINT': 'https://test.openai.azure.com/',
+        'AZURE_OPENAI_API_KEY': 'test-key',
+        'AZURE_OPENAI_API_VERSION': '2024-01-01',
+        'AZURE_OPENAI_DEPLOYMENT_NAME': 'gpt-4',
+        'LLM_REPLAY_MODE': 'rewind'
+    })
+    def test_settings_unknown_replay_mode(self):
+        """
+        Test that an unknown record/replay mode raises a configuration error.
+        """
+        # Act & Assert
+        from src.domain.exceptions.configuration_exception import ConfigurationException
+        with pytest.raises(ConfigurationException):
+            AppSettings()
@@ -0,0 +1,132 @@
+"""
+Module: test_strategy_planner
+Description:
+    Unit tests for the StrategyPlanner.
+    Tests the strategy chosen for small, medium and large inputs and under a cost budget.
+"""
+
+import pytest
+from src.domain.models.execution_plan import ExecutionStrategy
+from src.domain.services.strategy_planner import CostModel, StrategyPlanner
+
+
+def make_sentences(count: int):
+    """Builds count Arabic-length sentences."""
+    return [f"جملة رقم {i} تصف إجراء يجب اتباعه في الحالات الطارئة" for i in range(count)]
+
+
+class TestStrategyPlanner:
+    """
+    Unit tests for StrategyPlanner.
+    """
+
+    @pytest.fixture
+    def planner(self):
+        """Planner with the fused mode enabled and priced tokens."""
+        return StrategyPlanner(
+            CostModel(prompt_price_per_1k=0.0025, completion_price_per_1k=0.01),
+            fused_max_sentences=30,
+            classification_chunk_size=150,
+            detection_block_size=40,
+            max_workers=4
+        )
+
+    def test_small_input_uses_fused(self, planner):
+        """
+        Test that inputs under the fused threshold are analyzed in one call.
+        """
+        # Act
+        plan = planner.plan(make_sentences(10))
+
+        # Assert
+        assert plan.strategy == ExecutionStrategy.FUSED
+        assert plan.chosen.llm_calls == 1
+
+    def test_medium_input_uses_two_stage(self, planner):
+        """
+        Test that inputs above the fused threshold without large categories use two stages.
+        """
+        # Act
+        plan = planner.plan(make_sentences(60))
+
+        # Assert
+        assert plan.strategy == ExecutionStrategy.TWO_STAGE
+
+    def test_large_input_uses_parallel_strategy(self, planner):
+        """
+        Test that large inputs are split into parallel calls.
+        """
+        # Act
+        plan = planner.plan(make_sentences(600))
+
+        # Assert
+        assert plan.strategy in (ExecutionStrategy.CHUNKED_CLASSIFICATION, ExecutionStrategy.BLOCKWISE_DETECTION)
+        two_stage = next(e for e in plan.estimates if e.strategy == ExecutionStrategy.TWO_STAGE)
+        assert plan.chosen.predicted_latency_ms < two_stage.predicted_latency_ms
+
+    def test_fused_disabled(self):
+        """
+        Test that the fused strategy is infeasible when disabled.
+        """
+        # Act
+        plan = StrategyPlanner(fused_max_sentences=0).plan(make_sentences(5))
+
+        # Assert
+        assert plan.strategy == ExecutionStrategy.TWO_STAGE
+        assert plan.estimates[0].feasible is False
+
+    def test_budget_excludes_expensive_strategies(self, planner):
+        """
+        Test that a budget below every LLM strategy falls back to local-only.
+        """
+        # Act
+        plan = planner.plan(make_sentences(60), cost_budget=0.000001)
+
+        # Assert
+        assert plan.strategy == ExecutionStrategy.LOCAL_ONLY
+        assert plan.cost_budget == 0.000001
+        assert all(e.reason == "over cost budget" for e in plan.estimates if e.feasible and e.llm_calls)
+
+    def test_empty_input_is_local_only(self, planner):
+        """
+        Test that an empty input needs no LLM call.
+        """
+        # Act
+        plan = planner.plan([])
+
+        # Assert
+        assert plan.strategy == ExecutionStrategy.LOCAL_ONLY
+
+    def test_pipelining_lowers_two_stage_latency(self):
+        """
+        Test that pipelined detection overlaps detections with the classification.
+        """
+        # Arrange
+        sentences = make_sentences(60)
+
+        # Act
+        sequential = StrategyPlanner(pipelined_detection=False).plan(sentences)
+        pipelined = StrategyPlanner(pipelined_detection=True).plan(sentences)
+
+        # Assert
+        assert pipelined.estimates[1].predicted_latency_ms < sequential.estimates[1].predicted_latency_ms
+        assert pipelined.estimates[1].llm_calls == sequential.estimates[1].llm_calls
+
+    def test_stages_are_priced_with_their_deployment(self):
+        """
+        Test that a stage with its own prices is costed with them and other stages with the default prices.
+        """
+        # Arrange
+        sentences = make_sentences(10)
+        default = CostModel(prompt_price_per_1k=0.001, completion_price_per_1k=0.001)
+        priced = CostModel(
+            prompt_price_per_1k=0.001, completion_price_per_1k=0.001, stage_prices={"fused": (0.01, 0.01)}
+        )
+
+        # Act
+        cheap = StrategyPlanner(default, fused_max_sentences=30).plan(sentences)
+        expensive = StrategyPlanner(priced, fused_max_sentences=30).plan(sentences)
+
+        # Assert
+        assert expensive.estimates[0].estimated_cost == pytest.approx(cheap.estimates[0].estimated_cost * 10, rel=1e-3)
+        assert expensive.estimates[1].estimated_cost == cheap.estimates[1].estimated_cost
@@ -41,10 +41,10 @@ class TestTextAnalysisService:
         from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=[sample_single_sentence])]
+            categories=[Category.from_phrases(name="test", phrases=[sample_single_sentence])]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=[sample_single_sentence],
                 contradictions=[]
@@ -71,10 +71,10 @@ class TestTextAnalysisService:
         from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=sample_sentences)]
+            categories=[Category.from_phrases(name="test", phrases=sample_sentences)]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=sample_sentences,
                 contradictions=[]
@@ -100,14 +100,14 @@ class TestTextAnalysisService:
         from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult, Contradiction
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=contradictory_sentences)]
+            categories=[Category.from_phrases(name="test", phrases=contradictory_sentences)]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=contradictory_sentences,
                 contradictions=[
-                    Contradiction(
+                    Contradiction.from_statements(
                         statements=contradictory_sentences,
                         severity="حاد",
                         comment="Test contradiction"
@@ -152,10 +152,10 @@ class TestTextAnalysisService:
         from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=[sample_single_sentence])]
+            categories=[Category.from_phrases(name="test", phrases=[sample_single_sentence])]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=[sample_single_sentence],
                 contradictions=[]
@@ -183,10 +183,10 @@ class TestTextAnalysisService:
         from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=[sample_single_sentence])]
+            categories=[Category.from_phrases(name="test", phrases=[sample_single_sentence])]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=[sample_single_sentence],
                 contradictions=[]
@@ -219,10 +219,10 @@ class TestTextAnalysisService:
         ]
         
         classification_result = ClassificationResult(
-            categories=[Category(name="test", phrases=sentences)]
+            categories=[Category.from_phrases(name="test", phrases=sentences)]
         )
         contradiction_result = AnalysisContradictionResult(
-            categories=[CategoryContradictionResult(
+            categories=[CategoryContradictionResult.from_statements(
                 category_name="test",
                 statements=sentences,
                 contradictions=[]
@@ -237,3 +237,245 @@ class TestTextAnalysisService:
 
         # Assert
         assert result is not None
+
+    def test_small_input_uses_fused_agent(self, mock_classifier_agent_port, mock_detector_agent_port,
+                                          contradictory_sentences):
+        """
+        Test that inputs under the fused threshold are analyzed with a single fused call.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        fused_agent = Mock()
+        fused_agent.analyze_sentences.return_value = AnalysisContradictionResult(categories=[])
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            fused_agent=fused_agent,
+            fused_max_sentences=30
+        )
+
+        # Act
+        result = service.analyze_text(contradictory_sentences)
+
+        # Assert
+        assert result is fused_agent.analyze_sentences.return_value
+        mock_classifier_agent_port.classify_sentences.assert_not_called()
+        mock_detector_agent_port.detect_contradiction.assert_not_called()
+
+    def test_large_input_uses_two_stages(self, mock_classifier_agent_port, mock_detector_agent_port,
+                                         sample_sentences):
+        """
+        Test that inputs above the fused threshold keep the classification + detection path.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        fused_agent = Mock()
+        mock_classifier_agent_port.classify_sentences.return_value = ClassificationResult(categories=[])
+        mock_detector_agent_port.detect_contradiction.return_value = AnalysisContradictionResult(categories=[])
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            fused_agent=fused_agent,
+            fused_max_sentences=5
+        )
+
+        # Act
+        service.analyze_text(sample_sentences)
+
+        # Assert
+        fused_agent.analyze_sentences.assert_not_called()
+        mock_classifier_agent_port.classify_sentences.assert_called_once_with(sample_sentences)
+
+    def test_planner_enabling_fused_mode_requires_a_fused_agent(self, mock_classifier_agent_port,
+                                                                mock_detector_agent_port):
+        """
+        Test that a planner with the fused mode is rejected when no fused agent is given.
+        """
+        # Arrange
+        from src.domain.services.strategy_planner import StrategyPlanner
+        planner = StrategyPlanner(fused_max_sentences=5)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            TextAnalysisService(mock_classifier_agent_port, mock_detector_agent_port, planner=planner)
+        assert planner.fused_max_sentences == 5
+
+    def test_chunked_classification_merges_categories(self, mock_classifier_agent_port, mock_detector_agent_port):
+        """
+        Test that chunks are classified separately and categories sharing a name are merged.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult, Category
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        from src.domain.models.execution_plan import ExecutionStrategy
+        from src.domain.services.strategy_planner import StrategyPlanner
+
+        sentences = [f"جملة {i}" for i in range(4)]
+        mock_classifier_agent_port.classify_sentences.side_effect = lambda chunk: ClassificationResult(
+            categories=[Category.from_phrases(name="الإخلاء", phrases=list(chunk))]
+        )
+        mock_detector_agent_port.detect_contradiction.return_value = AnalysisContradictionResult(categories=[])
+        planner = StrategyPlanner(classification_chunk_size=2)
+        planner.plan = Mock(return_value=Mock(strategy=ExecutionStrategy.CHUNKED_CLASSIFICATION))
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            planner=planner
+        )
+
+        # Act
+        service.analyze_text(sentences)
+
+        # Assert
+        assert mock_classifier_agent_port.classify_sentences.call_count == 2
+        merged = mock_detector_agent_port.detect_contradiction.call_args[0][0]
+        assert len(merged.categories) == 1
+        assert merged.categories[0].phrases == sentences
+
+    def test_grouper_forms_classification_chunks(self, mock_classifier_agent_port, mock_detector_agent_port):
+        """
+        Test that chunks follow the grouper and chunk indices are mapped back to the input.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult, Category
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        from src.domain.models.execution_plan import ExecutionStrategy
+        from src.domain.services.strategy_planner import StrategyPlanner
+
+        sentences = ["الإيجار شهري", "التسليم فوري", "الإيجار سنوي", "التسليم بعد شهر"]
+        grouper = Mock()
+        grouper.group.return_value = [[0, 2], [1, 3]]
+        mock_classifier_agent_port.classify_sentences.side_effect = lambda chunk: ClassificationResult(
+            categories=[Category.from_phrases(name=chunk[0].split()[0], phrases=list(chunk))]
+        )
+        mock_detector_agent_port.detect_contradiction.return_value = AnalysisContradictionResult(categories=[])
+        planner = StrategyPlanner(classification_chunk_size=2)
+        planner.plan = Mock(return_value=Mock(strategy=ExecutionStrategy.CHUNKED_CLASSIFICATION))
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            planner=planner,
+            grouper=grouper
+        )
+
+        # Act
+        service.analyze_text(sentences)
+
+        # Assert
+        grouper.group.assert_called_once_with(sentences, 2)
+        merged = mock_detector_agent_port.detect_contradiction.call_args[0][0]
+        assert [category.indices for category in merged.categories] == [(0, 2), (1, 3)]
+        assert merged.categories[0].phrases == ["الإيجار شهري", "الإيجار سنوي"]
+
+    def test_blockwise_detection_merges_blocks(self, mock_classifier_agent_port, mock_detector_agent_port):
+        """
+        Test that a large category is checked in blocks whose contradictions are merged back.
+        """
+        # Arrange
+        from src.domain.models.classification_result import ClassificationResult, Category
+        from src.domain.models.contradiction_result import (
+            AnalysisContradictionResult, CategoryContradictionResult, Contradiction
+        )
+        from src.domain.models.execution_plan import ExecutionStrategy
+        from src.domain.services.strategy_planner import StrategyPlanner
+
+        sentences = [f"جملة {i}" for i in range(5)]
+        mock_classifier_agent_port.classify_sentences.return_value = ClassificationResult(
+            categories=[Category.from_phrases(name="الإخلاء", phrases=sentences)]
+        )
+
+        def detect(classification):
+            block = classification.categories[0]
+            return AnalysisContradictionResult(categories=[CategoryContradictionResult.from_statements(
+                category_name=block.name,
+                statements=block.phrases,
+                contradictions=[Contradiction.from_statements(statements=block.phrases[:2], severity="حاد", comment="")]
+            )])
+
+        mock_detector_agent_port.detect_contradiction.side_effect = detect
+        planner = StrategyPlanner(detection_block_size=2)
+        planner.plan = Mock(return_value=Mock(strategy=ExecutionStrategy.BLOCKWISE_DETECTION))
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            planner=planner
+        )
+
+        # Act
+        result = service.analyze_text(sentences)
+
+        # Assert
+        assert mock_detector_agent_port.detect_contradiction.call_count == 3
+        assert len(result.categories) == 1
+        assert result.categories[0].statements == sentences
+        assert len(result.categories[0].contradictions) == 3
+
+    def test_pipelined_detection_starts_before_classification_ends(self, mock_classifier_agent_port,
+                                                                   mock_detector_agent_port):
+        """
+        Test that detection of a category is dispatched before the next category is classified.
+        """
+        # Arrange
+        import threading
+        from src.domain.models.classification_result import Category
+        from src.domain.models.contradiction_result import AnalysisContradictionResult, CategoryContradictionResult
+        from src.domain.services.strategy_planner import StrategyPlanner
+
+        first_detected = threading.Event()
+
+        def iter_categories(sentences):
+            yield Category.from_phrases(name="الإخلاء", phrases=["s1", "s2"])
+            assert first_detected.wait(timeout=5)
+            yield Category.from_phrases(name="الإسعاف", phrases=["s3", "s4"])
+
+        def detect(classification):
+            category = classification.categories[0]
+            first_detected.set()
+            return AnalysisContradictionResult(categories=[CategoryContradictionResult.from_statements(
+                category_name=category.name, statements=category.phrases, contradictions=[]
+            )])
+
+        mock_classifier_agent_port.iter_categories.side_effect = iter_categories
+        mock_detector_agent_port.detect_contradiction.side_effect = detect
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            planner=StrategyPlanner(pipelined_detection=True)
+        )
+
+        # Act
+        result = service.analyze_text(["s1", "s2", "s3", "s4"])
+
+        # Assert
+        assert [c.category_name for c in result.categories] == ["الإخلاء", "الإسعاف"]
+        mock_classifier_agent_port.classify_sentences.assert_not_called()
+        assert mock_detector_agent_port.detect_contradiction.call_count == 2
+
+    def test_cached_analysis_skips_the_agents(self, mock_classifier_agent_port, mock_detector_agent_port,
+                                              contradictory_sentences):
+        """
+        Test that a second analysis of the same sentences is served from the cache with a fresh plan.
+        """
+        # Arrange
+        from src.domain.models.contradiction_result import AnalysisContradictionResult
+        from src.insfrastructure.cache.memory_cache import MemoryCacheBackend
+        from src.insfrastructure.cache.result_cache import ResultCache
+        fused_agent = Mock()
+        fused_agent.analyze_sentences.return_value = AnalysisContradictionResult(categories=[])
+        service = TextAnalysisService(
+            classifier_agent=mock_classifier_agent_port,
+            detector_agent=mock_detector_agent_port,
+            fused_agent=fused_agent,
+            fused_max_sentences=30,
+            cache=ResultCache(MemoryCacheBackend())
+        )
+        service.analyze_text(contradictory_sentences)
+
+        # Act
+        result = service.analyze_text(contradictory_sentences)
+
+        # Assert
+        assert fused_agent.analyze_sentences.call_count == 1
+        assert result.categories == []
+        assert result.plan.strategy.value == "fused"
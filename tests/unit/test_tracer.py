@@ -0,0 +1,167 @@
+"""
+Module: test_tracer
+Description:
+    Unit tests for the request Tracer and its span exporters.
+    Tests span nesting, attributes, Server-Timing summaries and JSON-lines / OTLP export.
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+from src.domain.ports.input.tracer_port import NullTracer
+from src.insfrastructure.observability.span_exporters import JsonLinesSpanExporter, OtlpHttpSpanExporter
+from src.insfrastructure.observability.tracer import Tracer
+
+
+class TestTracer:
+    """
+    Unit tests for the Tracer.
+    """
+
+    @pytest.fixture
+    def exporter(self):
+        """Mock span exporter."""
+        return Mock()
+
+    @pytest.fixture
+    def tracer(self, exporter):
+        """Tracer exporting to the mock exporter."""
+        return Tracer(exporters=[exporter])
+
+    def test_nested_spans_share_trace_and_parent(self, tracer):
+        """
+        Test that spans opened inside a trace are linked to their parent span.
+        """
+        # Act
+        with tracer.start_trace("request") as trace:
+            with tracer.span("service.analyze_text", sentence_count=3):
+                with tracer.span("classifier.classify"):
+                    pass
+
+        # Assert
+        spans = {span.name: span for span in trace.spans}
+        assert set(spans) == {"request", "service.analyze_text", "classifier.classify"}
+        assert len({span.trace_id for span in trace.spans}) == 1
+        assert spans["request"].parent_id is None
+        assert spans["service.analyze_text"].parent_id == spans["request"].span_id
+        assert spans["classifier.classify"].parent_id == spans["service.analyze_text"].span_id
+        assert spans["service.analyze_text"].attributes["sentence_count"] == 3
+
+    def test_trace_is_exported_when_it_ends(self, tracer, exporter):
+        """
+        Test that exporters receive every span of a finished trace.
+        """
+        # Act
+        with tracer.start_trace("request"):
+            with tracer.span("use_case.execute"):
+                pass
+
+        # Assert
+        exporter.export.assert_called_once()
+        exported = exporter.export.call_args[0][0]
+        assert [span.name for span in exported] == ["use_case.execute", "request"]
+
+    def test_span_outside_trace_starts_its_own_trace(self, tracer, exporter):
+        """
+        Test that a span opened without an active trace is exported on its own.
+        """
+        # Act
+        with tracer.span("classifier.classify") as span:
+            span.set_attribute("category_count", 2)
+
+        # Assert
+        exported = exporter.export.call_args[0][0]
+        assert len(exported) == 1
+        assert exported[0].attributes["category_count"] == 2
+
+    def test_span_records_error(self, tracer):
+        """
+        Test that an exception raised inside a span is recorded as an attribute.
+        """
+        # Act
+        with pytest.raises(ValueError):
+            with tracer.start_trace("request") as trace:
+                with tracer.span("detector.llm_call"):
+                    raise ValueError("boom")
+
+        # Assert
+        failed = [span for span in trace.spans if span.name == "detector.llm_call"][0]
+        assert failed.attributes["error"] == "ValueError"
+
+    def test_server_timing_sums_spans_by_name(self, tracer):
+        """
+        Test that the Server-Timing value aggregates spans sharing a name.
+        """
+        # Act
+        with tracer.start_trace("request") as trace:
+            for _ in range(3):
+                with tracer.span("detector.detect_category"):
+                    pass
+
+        header = trace.server_timing()
+
+        # Assert
+        assert 'detector.detect_category;dur=' in header
+        assert 'desc="3 calls"' in header
+        assert 'request;dur=' in header
+
+    def test_null_tracer_accepts_attributes(self):
+        """
+        Test that the no-op tracer can be used like a real tracer.
+        """
+        # Act & Assert
+        with NullTracer().span("classifier.classify", sentence_count=1) as span:
+            span.set_attribute("category_count", 1)
+
+
+class TestSpanExporters:
+    """
+    Unit tests for the span exporters.
+    """
+
+    def test_jsonl_exporter_writes_one_line_per_span(self, tmp_path):
+        """
+        Test that the JSON-lines exporter appends one JSON object per span.
+        """
+        # Arrange
+        path = tmp_path / "traces" / "spans.jsonl"
+        tracer = Tracer(exporters=[JsonLinesSpanExporter(str(path))])
+
+        # Act
+        with tracer.start_trace("request"):
+            with tracer.span("prompt.render", prompt_name="prompt_classification"):
+                pass
+        tracer.shutdown()
+
+        # Assert
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["name"] for line in lines] == ["prompt.render", "request"]
+        assert lines[0]["attributes"]["prompt_name"] == "prompt_classification"
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+    def test_otlp_exporter_posts_otlp_json(self):
+        """
+        Test that the OTLP exporter posts spans in the OTLP/HTTP JSON format.
+        """
+        # Arrange
+        exporter = OtlpHttpSpanExporter("http://collector:4318", service_name="test-service")
+        tracer = Tracer(exporters=[exporter])
+
+        with patch("urllib.request.urlopen", return_value=MagicMock()) as mock_urlopen:
+            # Act
+            with tracer.start_trace("request"):
+                with tracer.span("classifier.llm_call", prompt_tokens=120, model="gpt-4"):
+                    pass
+            exporter.shutdown()
+
+        # Assert
+        request = mock_urlopen.call_args[0][0]
+        payload = json.loads(request.data.decode("utf-8"))
+        assert request.full_url == "http://collector:4318/v1/traces"
+        resource_spans = payload["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"]["stringValue"] == "test-service"
+        spans = resource_spans["scopeSpans"][0]["spans"]
+        llm_span = [s for s in spans if s["name"] == "classifier.llm_call"][0]
+        assert {"key": "prompt_tokens", "value": {"intValue": "120"}} in llm_span["attributes"]
+        assert "parentSpanId" in llm_span
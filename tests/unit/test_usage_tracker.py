@@ -0,0 +1,95 @@
+"""
+Module: test_usage_tracker
+Description:
+    Unit tests for the UsageTracker.
+    Tests token extraction from completions, per-stage aggregation and cost estimation.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from src.domain.models.token_usage import TokenUsage
+from src.insfrastructure.observability.usage_tracker import UsageTracker, usage_from_completion
+
+
+class TestUsageTracker:
+    """
+    Unit tests for the UsageTracker.
+    """
+
+    @pytest.fixture
+    def tracker(self):
+        """Usage tracker with prices for one deployment."""
+        return UsageTracker(prices={"gpt-4": {"prompt": 0.01, "completion": 0.03, "cached": 0.005}})
+
+    def test_usage_from_completion(self):
+        """
+        Test extraction of prompt, completion and cached tokens from a completion.
+        """
+        # Arrange
+        completion = MagicMock()
+        completion.usage.prompt_tokens = 1200
+        completion.usage.completion_tokens = 150
+        completion.usage.prompt_tokens_details.cached_tokens = 1024
+
+        # Act
+        usage = usage_from_completion(completion)
+
+        # Assert
+        assert usage == TokenUsage(prompt_tokens=1200, completion_tokens=150, cached_tokens=1024, calls=1)
+
+    def test_usage_from_completion_without_usage(self):
+        """
+        Test that missing usage fields are counted as zero.
+        """
+        # Act
+        usage = usage_from_completion(MagicMock())
+
+        # Assert
+        assert usage.total_tokens == 0
+        assert usage.calls == 1
+
+    def test_track_aggregates_per_stage(self, tracker):
+        """
+        Test that recorded calls are summed per request and per stage.
+        """
+        # Act
+        with tracker.track() as report:
+            tracker.record("classification", "gpt-4", TokenUsage(prompt_tokens=100, completion_tokens=10, calls=1))
+            tracker.record("detection", "gpt-4", TokenUsage(prompt_tokens=50, completion_tokens=20, calls=1))
+            tracker.record("detection", "gpt-4", TokenUsage(prompt_tokens=50, completion_tokens=20, calls=1))
+
+        # Assert
+        assert report.total.calls == 3
+        assert report.total.prompt_tokens == 200
+        assert report.stages["classification"].calls == 1
+        assert report.stages["detection"].completion_tokens == 40
+
+    def test_record_outside_track_is_ignored(self, tracker):
+        """
+        Test that recording without an active report does not fail.
+        """
+        # Act & Assert
+        tracker.record("classification", "gpt-4", TokenUsage(prompt_tokens=100, calls=1))
+
+    def test_estimate_cost_uses_cached_price(self, tracker):
+        """
+        Test that cached prompt tokens are billed at the cached price.
+        """
+        # Arrange
+        usage = TokenUsage(prompt_tokens=2000, completion_tokens=1000, cached_tokens=1000)
+
+        # Act
+        cost = tracker.estimate_cost("gpt-4", usage)
+
+        # Assert
+        assert cost == pytest.approx(1000 * 0.01 / 1000 + 1000 * 0.005 / 1000 + 1000 * 0.03 / 1000)
+
+    def test_estimate_cost_unknown_deployment(self, tracker):
+        """
+        Test that deployments without prices cost nothing.
+        """
+        # Act
+        cost = tracker.estimate_cost("unknown", TokenUsage(prompt_tokens=1000))
+
+        # Assert
+        assert cost == 0.0
@@ -0,0 +1,102 @@
+"""
+Module: test_warmup
+Description:
+    Unit tests for the Warmup and the deployment warmup of the DeploymentRouter.
+    Tests readiness once prompts are compiled and deployments are reachable.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import httpx2
+import openai
+import pytest
+from src.insfrastructure.agents.deployment_router import DeploymentRouter
+from src.insfrastructure.config.app_settings import DeploymentSettings
+from src.insfrastructure.di.warmup import Warmup
+
+
+def connection_error():
+    """Connection error as raised by the OpenAI client."""
+    return openai.APIConnectionError(request=httpx2.Request("GET", "https://test"))
+
+
+class TestWarmup:
+    """
+    Unit tests for Warmup.
+    """
+
+    @pytest.fixture
+    def prompt_provider(self):
+        """Prompt provider compiling two prompts."""
+        provider = Mock()
+        provider.preload.return_value = ["prompt_classification", "prompt_contradiction"]
+        return provider
+
+    def test_ready_when_every_router_reaches_a_deployment(self, prompt_provider):
+        """
+        Test that the service is ready once prompts are compiled and each router has a reachable deployment.
+        """
+        # Arrange
+        router = Mock()
+        router.warm_up.return_value = {"east": False, "west": True}
+        warmup = Warmup(prompt_provider, [router])
+
+        # Act
+        ready = warmup.run()
+
+        # Assert
+        assert ready is True
+        assert warmup.status() == {"status": "ready", "prompts": 2, "deployments": {"east": False, "west": True}}
+
+    def test_not_ready_without_reachable_deployment(self, prompt_provider):
+        """
+        Test that the service stays starting while a router reaches no deployment, then recovers.
+        """
+        # Arrange
+        router = Mock()
+        router.warm_up.side_effect = [{"east": False}, {"east": True}]
+        warmup = Warmup(prompt_provider, [router])
+
+        # Act
+        first = warmup.run()
+        second = warmup.run()
+
+        # Assert
+        assert (first, second) == (False, True)
+        prompt_provider.preload.assert_called_once()
+
+    def test_not_ready_on_invalid_prompt(self, prompt_provider):
+        """
+        Test that a prompt compilation error is reported instead of raised.
+        """
+        # Arrange
+        prompt_provider.preload.side_effect = ValueError("Invalid .prompty file format")
+        warmup = Warmup(prompt_provider, [])
+
+        # Act
+        ready = warmup.run()
+
+        # Assert
+        assert ready is False
+        assert "Invalid .prompty file format" in warmup.status()["error"]
+
+    def test_router_warm_up_cools_down_unreachable_deployment(self):
+        """
+        Test that deployments failing the warmup are reported and put in cooldown.
+        """
+        # Arrange
+        router = DeploymentRouter(
+            [DeploymentSettings("east", "https://east", "key", "v", "gpt-4"),
+             DeploymentSettings("west", "https://west", "key", "v", "gpt-4")],
+            client_factory=lambda settings: MagicMock(name=settings.name)
+        )
+        east_client = router.deployments[0].client.with_options.return_value
+        east_client.models.list.side_effect = connection_error()
+
+        # Act
+        reachable = router.warm_up(llm_probe=True)
+
+        # Assert
+        assert reachable == {"east": False, "west": True}
+        assert router.deployments[0].cooldown_until > 0
+        router.deployments[1].client.with_options.return_value.chat.completions.create.assert_called_once()